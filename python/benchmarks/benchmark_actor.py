@@ -54,6 +54,9 @@ class ActorMethodSuite(object):
         # Block to make sure actor is instantiated
         ray.get(self.actor.get_x.remote())
 
+    def time_submit_method(self):
+        self.actor.set_x.remote(1)
+
     def time_call_method(self):
         ray.get(self.actor.get_x.remote())
 
@@ -0,0 +1,92 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import json
+
+import numpy as np
+
+import ray
+from ray.test.cluster_utils import Cluster
+
+NUM_NODES = 3
+NUM_TASKS = 30
+ARGUMENT_SIZE = 10 * 1024 * 1024
+
+
+def transferred_bytes(object_ids):
+    """Count the bytes that were copied between nodes for the given objects.
+
+    Every location of an object after the first one was created by a
+    transfer, so each transfer adds one entry to the object table.
+    """
+    total = 0
+    for object_id in object_ids:
+        object_info = ray.global_state.object_table(object_id)
+        num_additions = sum(
+            not is_eviction for is_eviction in object_info["IsEviction"])
+        total += object_info["DataSize"] * max(num_additions - 1, 0)
+    return total
+
+
+@ray.remote
+def produce(size):
+    return np.zeros(size, dtype=np.uint8)
+
+
+@ray.remote
+def consume(array):
+    return array.nbytes
+
+
+class LocalitySuite(object):
+    number = 1
+    repeat = 3
+    timeout = 300
+
+    def setup(self, scheduler_locality_min_bytes):
+        internal_config = json.dumps({
+            "scheduler_locality_min_bytes": scheduler_locality_min_bytes
+        })
+        self.cluster = Cluster()
+        # The driver's node has no CPUs, so all tasks are placed on other
+        # nodes by its scheduling policy.
+        self.cluster.add_node(num_cpus=0, _internal_config=internal_config)
+        for i in range(NUM_NODES):
+            self.cluster.add_node(
+                num_cpus=2,
+                resources={"node{}".format(i): NUM_TASKS},
+                object_store_memory=10**9,
+                _internal_config=internal_config)
+        ray.init(redis_address=self.cluster.redis_address)
+
+    def teardown(self, *args):
+        ray.shutdown()
+        self.cluster.shutdown()
+
+    def _run(self):
+        argument_ids = [
+            produce._remote(
+                args=[ARGUMENT_SIZE],
+                resources={"node{}".format(i % NUM_NODES): 1})
+            for i in range(NUM_TASKS)
+        ]
+        # Wait without fetching the arguments to the driver.
+        ray.wait(argument_ids, num_returns=len(argument_ids))
+        ray.get([consume.remote(argument_id) for argument_id in argument_ids])
+        return argument_ids
+
+    def time_consume_remote_arguments(self, scheduler_locality_min_bytes):
+        self._run()
+
+    time_consume_remote_arguments.params = [100 * 1024, -1]
+    time_consume_remote_arguments.param_names = [
+        "scheduler_locality_min_bytes"
+    ]
+
+    def track_transferred_bytes(self, scheduler_locality_min_bytes):
+        return transferred_bytes(self._run())
+
+    track_transferred_bytes.params = [100 * 1024, -1]
+    track_transferred_bytes.param_names = ["scheduler_locality_min_bytes"]
+    track_transferred_bytes.unit = "bytes"
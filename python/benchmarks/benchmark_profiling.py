@@ -0,0 +1,34 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import ray
+
+
+def setup():
+    if not hasattr(setup, "is_initialized"):
+        ray.init(num_cpus=0)
+        setup.is_initialized = True
+
+
+class ProfilingSuite(object):
+    def setup(self):
+        self.profiler = ray.worker.global_worker.profiler
+        self.event_type_id = self.profiler.events.intern_event_type(
+            "benchmark_event")
+
+    def time_profile_span(self):
+        with ray.profile("benchmark_event"):
+            pass
+
+    def time_profile_span_with_extra_data(self):
+        with ray.profile("benchmark_event", extra_data={"name": "value"}):
+            pass
+
+    def time_append_event(self):
+        self.profiler.events.append(self.event_type_id, 0.0, 1.0)
+
+    def time_append_and_flush_1000_events(self):
+        for _ in range(1000):
+            self.profiler.events.append(self.event_type_id, 0.0, 1.0)
+        self.profiler.flush_profile_data()
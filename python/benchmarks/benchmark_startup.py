@@ -0,0 +1,59 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import ray
+import ray.services as services
+
+STARTUP_COMPONENTS = [
+    services.PROCESS_TYPE_REDIS_SERVER, services.PROCESS_TYPE_MONITOR,
+    services.PROCESS_TYPE_PLASMA_STORE, services.PROCESS_TYPE_RAYLET,
+    "wait_for_sockets"
+]
+
+SHUTDOWN_COMPONENTS = [
+    "stop_" + process_type for process_type in services.all_processes
+]
+
+
+class StartupSuite(object):
+    number = 1
+    repeat = 5
+    timeout = 120
+
+    def time_init(self, num_redis_shards):
+        ray.init(num_cpus=4, num_redis_shards=num_redis_shards)
+
+    def teardown(self, *args):
+        ray.shutdown()
+
+    time_init.params = [1, 4]
+    time_init.param_names = ["num_redis_shards"]
+
+    def track_init_component(self, component):
+        ray.init(num_cpus=4)
+        return services.component_durations.get(component, 0)
+
+    track_init_component.params = STARTUP_COMPONENTS
+    track_init_component.param_names = ["component"]
+    track_init_component.unit = "seconds"
+
+
+class ShutdownSuite(object):
+    number = 1
+    repeat = 5
+    timeout = 120
+
+    def setup(self, *args):
+        ray.init(num_cpus=4)
+
+    def time_shutdown(self):
+        ray.shutdown()
+
+    def track_shutdown_component(self, component):
+        ray.shutdown()
+        return services.component_durations.get(component, 0)
+
+    track_shutdown_component.params = SHUTDOWN_COMPONENTS
+    track_shutdown_component.param_names = ["component"]
+    track_shutdown_component.unit = "seconds"
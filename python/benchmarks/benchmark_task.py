@@ -24,6 +24,9 @@ class TaskSuite(object):
     def run_many_tasks(self):
         ray.get([self.square.remote(i) for i in range(100)])
 
+    def map_many_tasks(self):
+        ray.get(self.square.map([(i, ) for i in range(100)]))
+
     def run_task_dependency(self):
         first_oid = self.square.remote(2)
         second_oid = self.square.remote(first_oid)
@@ -44,6 +47,12 @@ class TaskSuite(object):
     def peakmem_run_many_tasks(self):
         self.run_many_tasks()
 
+    def time_map_many_tasks(self):
+        self.map_many_tasks()
+
+    def peakmem_map_many_tasks(self):
+        self.map_many_tasks()
+
     def time_task_dependency(self):
         self.run_task_dependency()
 
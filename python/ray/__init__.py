@@ -51,9 +51,9 @@ sys.path.append(modin_path)
 
 from ray.raylet import ObjectID, _config  # noqa: E402
 from ray.profiling import profile  # noqa: E402
-from ray.worker import (error_info, init, connect, disconnect, get, put, wait,
-                        remote, get_gpu_ids, get_resource_ids, get_webui_url,
-                        register_custom_serializer, shutdown,
+from ray.worker import (error_info, init, connect, disconnect, get, get_iter,
+                        put, wait, remote, get_gpu_ids, get_resource_ids,
+                        get_webui_url, register_custom_serializer, shutdown,
                         is_initialized)  # noqa: E402
 from ray.worker import (SCRIPT_MODE, WORKER_MODE, LOCAL_MODE,
                         PYTHON_MODE)  # noqa: E402
@@ -68,10 +68,10 @@ from ray.actor import method  # noqa: E402
 __version__ = "0.6.1"
 
 __all__ = [
-    "error_info", "init", "connect", "disconnect", "get", "put", "wait",
-    "remote", "profile", "actor", "method", "get_gpu_ids", "get_resource_ids",
-    "get_webui_url", "register_custom_serializer", "shutdown",
-    "is_initialized", "SCRIPT_MODE", "WORKER_MODE", "LOCAL_MODE",
+    "error_info", "init", "connect", "disconnect", "get", "get_iter", "put",
+    "wait", "remote", "profile", "actor", "method", "get_gpu_ids",
+    "get_resource_ids", "get_webui_url", "register_custom_serializer",
+    "shutdown", "is_initialized", "SCRIPT_MODE", "WORKER_MODE", "LOCAL_MODE",
     "PYTHON_MODE", "global_state", "ObjectID", "_config", "__version__",
     "internal"
 ]
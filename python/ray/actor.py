@@ -7,15 +7,17 @@ import hashlib
 import inspect
 import logging
 import sys
+import time
 import traceback
 
 import ray.cloudpickle as pickle
 from ray.function_manager import FunctionDescriptor
+from ray import profiling
 import ray.raylet
 import ray.ray_constants as ray_constants
 import ray.signature as signature
 import ray.worker
-from ray.utils import _random_string
+from ray.utils import _random_string, check_resources
 
 DEFAULT_ACTOR_METHOD_NUM_RETURN_VALS = 1
 
@@ -178,17 +180,56 @@ def method(*args, **kwargs):
 
         _, _ = f.bar.remote()
 
+    A method with a max_batch_size takes a list with the argument tuples of
+    several calls and returns a list with their results. Consecutive calls
+    of the method through the same actor handle are submitted as a single
+    task, but each call still returns its own object ID. A call is held back
+    for at most ray_constants.ACTOR_BATCH_MAX_HOLD_MS milliseconds (the
+    RAY_ACTOR_BATCH_MAX_HOLD_MS environment variable) while the batch fills.
+
+    .. code-block:: python
+
+        @ray.remote
+        class Counter(object):
+            def __init__(self):
+                self.value = 0
+
+            @ray.method(max_batch_size=100)
+            def increment(self, calls):
+                results = []
+                for (amount, ) in calls:
+                    self.value += amount
+                    results.append(self.value)
+                return results
+
+        c = Counter.remote()
+
+        ids = [c.increment.remote(1) for _ in range(1000)]
+
     Args:
         num_return_vals: The number of object IDs that should be returned by
             invocations of this actor method.
+        max_batch_size: The maximum number of calls of this actor method that
+            are submitted as one task.
     """
     assert len(args) == 0
-    assert len(kwargs) == 1
-    assert "num_return_vals" in kwargs
-    num_return_vals = kwargs["num_return_vals"]
+    assert len(kwargs) > 0
+    assert set(kwargs).issubset({"num_return_vals", "max_batch_size"})
+    num_return_vals = kwargs.get("num_return_vals")
+    max_batch_size = kwargs.get("max_batch_size")
+    if max_batch_size is not None:
+        if max_batch_size < 1:
+            raise ValueError("The 'max_batch_size' argument must be "
+                             "positive. Received {}".format(max_batch_size))
+        if num_return_vals not in (None, 1):
+            raise ValueError("Batched actor methods must have exactly one "
+                             "return value per call.")
 
     def annotate_method(method):
-        method.__ray_num_return_vals__ = num_return_vals
+        if num_return_vals is not None:
+            method.__ray_num_return_vals__ = num_return_vals
+        if max_batch_size is not None:
+            method.__ray_max_batch_size__ = max_batch_size
         return method
 
     return annotate_method
@@ -218,9 +259,21 @@ class ActorMethod(object):
             args=args, kwargs=kwargs, num_return_vals=num_return_vals)
 
     def _remote(self, args, kwargs, num_return_vals=None):
+        max_batch_size = self._actor._ray_method_max_batch_sizes.get(
+            self._method_name)
+        if max_batch_size is not None:
+            if num_return_vals is not None:
+                raise ValueError("The number of return values of a batched "
+                                 "actor method cannot be changed.")
+            return self._actor._actor_method_batched_call(
+                self._method_name, args, kwargs, max_batch_size)
+
         if num_return_vals is None:
             num_return_vals = self._num_return_vals
 
+        # Submit the held back calls of batched methods first, so that the
+        # actor executes the calls in order.
+        ray.worker.get_global_worker().flush_actor_batches()
         return self._actor._actor_method_call(
             self._method_name,
             args=args,
@@ -228,6 +281,31 @@ class ActorMethod(object):
             num_return_vals=num_return_vals,
             dependency=self._actor._ray_actor_cursor)
 
+    def map(self, args_list, num_return_vals=None):
+        """Invoke this actor method once for each of the given arguments.
+
+        The method invocations are submitted in order in a single message to
+        the local scheduler, which is much faster than calling remote() for
+        each of them.
+
+        Args:
+            args_list: An iterable of argument tuples. Each tuple holds the
+                positional arguments of one invocation.
+            num_return_vals: The number of return values of each invocation.
+
+        Returns:
+            A list with the result that remote() would return for each
+                invocation.
+        """
+        if self._method_name in self._actor._ray_method_max_batch_sizes:
+            return [self._remote(args, {}) for args in args_list]
+
+        if num_return_vals is None:
+            num_return_vals = self._num_return_vals
+
+        return self._actor._actor_method_calls(
+            self._method_name, args_list, num_return_vals=num_return_vals)
+
 
 class ActorClass(object):
     """An actor class.
@@ -240,6 +318,10 @@ class ActorClass(object):
         _class_id: The ID of this actor class.
         _class_name: The name of this class.
         _checkpoint_interval: The interval at which to checkpoint actor state.
+        _max_concurrency: The maximum number of methods that the actor
+            executes at once.
+        _per_handle_ordering: True if the methods submitted through the same
+            actor handle run one at a time, in submission order.
         _num_cpus: The default number of CPUs required by the actor creation
             task.
         _num_gpus: The default number of GPUs required by the actor creation
@@ -251,18 +333,22 @@ class ActorClass(object):
         _actor_methods: The actor methods.
         _method_signatures: The signatures of the methods.
         _actor_method_names: The names of the actor methods.
+        _actor_method_max_batch_sizes: The maximum batch size of each actor
+            method that batches its calls.
         _actor_method_num_return_vals: The default number of return values for
             each actor method.
     """
 
     def __init__(self, modified_class, class_id, checkpoint_interval,
-                 max_reconstructions, num_cpus, num_gpus, resources,
-                 actor_method_cpus):
+                 max_reconstructions, max_concurrency, per_handle_ordering,
+                 num_cpus, num_gpus, resources, actor_method_cpus):
         self._modified_class = modified_class
         self._class_id = class_id
         self._class_name = modified_class.__name__
         self._checkpoint_interval = checkpoint_interval
         self._max_reconstructions = max_reconstructions
+        self._max_concurrency = max_concurrency
+        self._per_handle_ordering = per_handle_ordering
         self._num_cpus = num_cpus
         self._num_gpus = num_gpus
         self._resources = resources
@@ -293,6 +379,7 @@ class ActorClass(object):
         # arguments.
         self._method_signatures = {}
         self._actor_method_num_return_vals = {}
+        self._actor_method_max_batch_sizes = {}
         for method_name, method in self._actor_methods:
             # Print a warning message if the method signature is not
             # supported. We don't raise an exception because if the actor
@@ -308,6 +395,9 @@ class ActorClass(object):
             else:
                 self._actor_method_num_return_vals[method_name] = (
                     DEFAULT_ACTOR_METHOD_NUM_RETURN_VALS)
+            if hasattr(method, "__ray_max_batch_size__"):
+                self._actor_method_max_batch_sizes[method_name] = (
+                    method.__ray_max_batch_size__)
 
     def __call__(self, *args, **kwargs):
         raise Exception("Actors methods cannot be instantiated directly. "
@@ -389,7 +479,8 @@ class ActorClass(object):
             if not self._exported:
                 worker.function_actor_manager.export_actor_class(
                     self._modified_class, self._actor_method_names,
-                    self._checkpoint_interval)
+                    self._checkpoint_interval, self._max_concurrency,
+                    self._per_handle_ordering)
                 self._exported = True
 
             resources = ray.utils.resources_from_resource_arguments(
@@ -428,7 +519,8 @@ class ActorClass(object):
         actor_handle = ActorHandle(
             actor_id, self._modified_class.__module__, self._class_name,
             actor_cursor, self._actor_method_names, self._method_signatures,
-            self._actor_method_num_return_vals, actor_cursor,
+            self._actor_method_num_return_vals,
+            self._actor_method_max_batch_sizes, actor_cursor,
             self._actor_method_cpus, worker.task_driver_id)
         # We increment the actor counter by 1 to account for the actor creation
         # task.
@@ -474,6 +566,10 @@ class ActorHandle(object):
         _ray_method_signatures: The signatures of the actor methods.
         _ray_method_num_return_vals: The default number of return values for
             each method.
+        _ray_method_max_batch_sizes: The maximum batch size of each method
+            that batches its calls.
+        _ray_pending_batch: The calls of a batched method that were made
+            through this handle but not submitted yet, or None.
         _ray_class_name: The name of the actor class.
         _ray_actor_forks: The number of times this handle has been forked.
         _ray_actor_creation_dummy_object_id: The dummy object ID from the actor
@@ -489,6 +585,10 @@ class ActorHandle(object):
             this handle since the last task on this handle was submitted. This
             is used to garbage-collect dummy objects that are no longer
             necessary in the backend.
+        _ray_function_descriptors: A cache of the function descriptor of
+            each actor method that has been called through this handle.
+        _ray_actor_method_resources: The resource requirements of actor
+            method tasks.
     """
 
     def __init__(self,
@@ -499,6 +599,7 @@ class ActorHandle(object):
                  actor_method_names,
                  method_signatures,
                  method_num_return_vals,
+                 method_max_batch_sizes,
                  actor_creation_dummy_object_id,
                  actor_method_cpus,
                  actor_driver_id,
@@ -518,6 +619,8 @@ class ActorHandle(object):
         self._ray_actor_method_names = actor_method_names
         self._ray_method_signatures = method_signatures
         self._ray_method_num_return_vals = method_num_return_vals
+        self._ray_method_max_batch_sizes = method_max_batch_sizes
+        self._ray_pending_batch = None
         self._ray_class_name = class_name
         self._ray_actor_forks = 0
         self._ray_actor_creation_dummy_object_id = (
@@ -525,6 +628,8 @@ class ActorHandle(object):
         self._ray_actor_method_cpus = actor_method_cpus
         self._ray_actor_driver_id = actor_driver_id
         self._ray_new_actor_handles = []
+        self._ray_function_descriptors = {}
+        self._ray_actor_method_resources = {"CPU": actor_method_cpus}
 
     def _actor_method_call(self,
                            method_name,
@@ -578,8 +683,7 @@ class ActorHandle(object):
 
         is_actor_checkpoint_method = (method_name == "__ray_checkpoint__")
 
-        function_descriptor = FunctionDescriptor(
-            self._ray_module_name, method_name, self._ray_class_name)
+        function_descriptor = self._ray_function_descriptor(method_name)
         object_ids = worker.submit_task(
             function_descriptor,
             args,
@@ -593,7 +697,7 @@ class ActorHandle(object):
             new_actor_handles=self._ray_new_actor_handles,
             # We add one for the dummy return ID.
             num_return_vals=num_return_vals + 1,
-            resources={"CPU": self._ray_actor_method_cpus},
+            resources=self._ray_actor_method_resources,
             placement_resources={},
             driver_id=self._ray_actor_driver_id)
         # Update the actor counter and cursor to reflect the most recent
@@ -613,6 +717,195 @@ class ActorHandle(object):
 
         return object_ids
 
+    def _actor_method_calls(self, method_name, args_list, num_return_vals):
+        """Submit several invocations of an actor method at once.
+
+        Args:
+            method_name: The name of the actor method to execute.
+            args_list: An iterable of lists of arguments for the actor method.
+            num_return_vals: The number of return values of each invocation.
+
+        Returns:
+            A list with the object IDs returned by each invocation, in the
+                same form as returned by _actor_method_call.
+        """
+        worker = ray.worker.get_global_worker()
+
+        worker.check_connected()
+        worker.flush_actor_batches()
+
+        function_signature = self._ray_method_signatures[method_name]
+        args_list = [
+            signature.extend_args(function_signature, args, {})
+            for args in args_list
+        ]
+
+        # Execute functions locally if Ray is run in LOCAL_MODE
+        # Copy args to prevent the function from mutating them.
+        if worker.mode == ray.LOCAL_MODE:
+            method = getattr(worker.actors[self._ray_actor_id], method_name)
+            return [method(*copy.deepcopy(args)) for args in args_list]
+
+        with profiling.profile("submit_tasks", worker=worker):
+            check_resources(self._ray_actor_method_resources)
+            function_descriptor = self._ray_function_descriptor(method_name)
+            is_actor_checkpoint_method = (method_name == "__ray_checkpoint__")
+            task_index = worker._reserve_task_indices(len(args_list))
+            put_cache = {}
+            tasks = []
+            results = []
+            for i, args in enumerate(args_list):
+                # Each invocation depends on the previous one.
+                if self._ray_actor_cursor is None:
+                    execution_dependencies = []
+                else:
+                    execution_dependencies = [self._ray_actor_cursor]
+                task = worker._create_task(
+                    function_descriptor,
+                    args,
+                    actor_id=self._ray_actor_id,
+                    actor_handle_id=self._ray_actor_handle_id,
+                    actor_counter=self._ray_actor_counter,
+                    is_actor_checkpoint_method=is_actor_checkpoint_method,
+                    actor_creation_dummy_object_id=(
+                        self._ray_actor_creation_dummy_object_id),
+                    execution_dependencies=execution_dependencies,
+                    new_actor_handles=self._ray_new_actor_handles,
+                    # We add one for the dummy return ID.
+                    num_return_vals=num_return_vals + 1,
+                    resources=self._ray_actor_method_resources,
+                    placement_resources={},
+                    driver_id=self._ray_actor_driver_id,
+                    task_index=task_index + i,
+                    put_cache=put_cache)
+                tasks.append(task)
+                object_ids = task.returns()
+                # Update the actor counter and cursor as in
+                # _actor_method_call.
+                self._ray_actor_counter += 1
+                self._ray_actor_cursor = object_ids.pop()
+                self._ray_new_actor_handles = []
+                if len(object_ids) == 1:
+                    object_ids = object_ids[0]
+                elif len(object_ids) == 0:
+                    object_ids = None
+                results.append(object_ids)
+            if tasks:
+                worker.raylet_client.submit_tasks(tasks)
+
+        return results
+
+    def _actor_method_batched_call(self, method_name, args, kwargs,
+                                   max_batch_size):
+        """Add a call of a batched actor method to the pending batch.
+
+        The calls are held back until max_batch_size calls were made, until a
+        different method is called through this handle, until the worker
+        flushes its pending batches (e.g., before it blocks in ray.get), or
+        for at most ray_constants.ACTOR_BATCH_MAX_HOLD_MS milliseconds. The
+        calls of a batch are then submitted as one task that returns one
+        object per call. The IDs of these objects are known before the task
+        is submitted, since they only depend on the task's index.
+
+        Args:
+            method_name: The name of the batched actor method.
+            args: The positional arguments of the call.
+            kwargs: The keyword arguments of the call. Batched methods do not
+                accept any.
+            max_batch_size: The maximum number of calls in a batch.
+
+        Returns:
+            The object ID of the result of the call.
+        """
+        worker = ray.worker.get_global_worker()
+
+        worker.check_connected()
+
+        if kwargs:
+            raise TypeError("Batched actor methods do not accept keyword "
+                            "arguments.")
+        args = list(args)
+
+        # Execute functions locally if Ray is run in LOCAL_MODE
+        # Copy args to prevent the function from mutating them.
+        if worker.mode == ray.LOCAL_MODE:
+            method = getattr(worker.actors[self._ray_actor_id], method_name)
+            return method([copy.deepcopy(args)])[0]
+
+        with worker.actor_batches_condition:
+            batch = self._ray_pending_batch
+            if batch is not None and batch.method_name != method_name:
+                self._ray_flush_batch()
+                batch = None
+            if batch is None:
+                task_index = worker._reserve_task_indices(1)
+                return_ids = worker._compute_return_ids(
+                    task_index, max_batch_size, self._ray_actor_driver_id)
+                batch = _ActorMethodBatch(method_name, worker.current_task_id,
+                                          task_index, return_ids)
+                self._ray_pending_batch = batch
+                worker.pending_actor_batches.add(self)
+                worker._schedule_actor_batch_flush()
+
+            object_id = batch.return_ids[len(batch.args_list)]
+            batch.args_list.append(args)
+            if len(batch.args_list) >= max_batch_size:
+                self._ray_flush_batch()
+        return object_id
+
+    def _ray_flush_batch(self):
+        """Submit the pending batch of this handle as one task."""
+        worker = ray.worker.get_global_worker()
+        with worker.actor_batches_condition:
+            worker.pending_actor_batches.discard(self)
+            batch = self._ray_pending_batch
+            if batch is None:
+                return
+            self._ray_pending_batch = None
+
+            # The first argument holds the number of arguments of each call,
+            # so that the executor can split the flattened arguments.
+            args = [[len(call_args) for call_args in batch.args_list]]
+            for call_args in batch.args_list:
+                args.extend(call_args)
+            if self._ray_actor_cursor is None:
+                execution_dependencies = []
+            else:
+                execution_dependencies = [self._ray_actor_cursor]
+
+            with profiling.profile("submit_task", worker=worker):
+                task = worker._create_task(
+                    self._ray_function_descriptor(batch.method_name),
+                    args,
+                    actor_id=self._ray_actor_id,
+                    actor_handle_id=self._ray_actor_handle_id,
+                    actor_counter=self._ray_actor_counter,
+                    actor_creation_dummy_object_id=(
+                        self._ray_actor_creation_dummy_object_id),
+                    execution_dependencies=execution_dependencies,
+                    new_actor_handles=self._ray_new_actor_handles,
+                    # We add one for the dummy return ID.
+                    num_return_vals=len(batch.args_list) + 1,
+                    resources=self._ray_actor_method_resources,
+                    placement_resources={},
+                    driver_id=self._ray_actor_driver_id,
+                    task_index=batch.task_index,
+                    parent_task_id=batch.parent_task_id)
+                worker.raylet_client.submit_task(task)
+            # Update the actor counter and cursor as in _actor_method_call.
+            self._ray_actor_counter += 1
+            self._ray_actor_cursor = task.returns().pop()
+            self._ray_new_actor_handles = []
+
+    def _ray_function_descriptor(self, method_name):
+        """Get the cached function descriptor of an actor method."""
+        function_descriptor = self._ray_function_descriptors.get(method_name)
+        if function_descriptor is None:
+            function_descriptor = FunctionDescriptor(
+                self._ray_module_name, method_name, self._ray_class_name)
+            self._ray_function_descriptors[method_name] = function_descriptor
+        return function_descriptor
+
     # Make tab completion work.
     def __dir__(self):
         return self._ray_actor_method_names
@@ -684,6 +977,9 @@ class ActorHandle(object):
         Returns:
             A dictionary of the information needed to reconstruct the object.
         """
+        # The new handle continues from the cursor of this handle, so the
+        # pending calls must be submitted first.
+        self._ray_flush_batch()
         if ray_forking:
             actor_handle_id = compute_actor_handle_id(
                 self._ray_actor_handle_id, self._ray_actor_forks)
@@ -700,6 +996,7 @@ class ActorHandle(object):
             "actor_method_names": self._ray_actor_method_names,
             "method_signatures": self._ray_method_signatures,
             "method_num_return_vals": self._ray_method_num_return_vals,
+            "method_max_batch_sizes": self._ray_method_max_batch_sizes,
             # Actors in local mode don't have dummy objects.
             "actor_creation_dummy_object_id": self.
             _ray_actor_creation_dummy_object_id.id()
@@ -768,6 +1065,7 @@ class ActorHandle(object):
             state["actor_method_names"],
             state["method_signatures"],
             state["method_num_return_vals"],
+            state["method_max_batch_sizes"],
             ray.ObjectID(state["actor_creation_dummy_object_id"])
             if state["actor_creation_dummy_object_id"] is not None else None,
             state["actor_method_cpus"],
@@ -783,12 +1081,38 @@ class ActorHandle(object):
         return self._deserialization_helper(state, False)
 
 
+class _ActorMethodBatch(object):
+    """The calls of a batched actor method that were not submitted yet.
+
+    Attributes:
+        method_name: The name of the batched actor method.
+        parent_task_id: The ID of the task that made the calls.
+        task_index: The task index that was reserved for the batch's task.
+        return_ids: The return object IDs of the batch's task.
+        args_list: The arguments of each call in the batch.
+        start_time: The time at which the first call was held back.
+    """
+
+    def __init__(self, method_name, parent_task_id, task_index, return_ids):
+        self.method_name = method_name
+        self.parent_task_id = parent_task_id
+        self.task_index = task_index
+        self.return_ids = return_ids
+        self.args_list = []
+        self.start_time = time.time()
+
+
 def make_actor(cls, num_cpus, num_gpus, resources, actor_method_cpus,
-               checkpoint_interval, max_reconstructions):
+               checkpoint_interval, max_reconstructions, max_concurrency,
+               per_handle_ordering):
     if checkpoint_interval is None:
         checkpoint_interval = -1
     if max_reconstructions is None:
         max_reconstructions = 0
+    if max_concurrency is None:
+        max_concurrency = 1
+    if per_handle_ordering is None:
+        per_handle_ordering = False
 
     if checkpoint_interval == 0:
         raise Exception("checkpoint_interval must be greater than 0.")
@@ -797,6 +1121,11 @@ def make_actor(cls, num_cpus, num_gpus, resources, actor_method_cpus,
         raise Exception("max_reconstructions must be in range [%d, %d]." %
                         (ray_constants.NO_RECONSTRUCTION,
                          ray_constants.INFINITE_RECONSTRUCTION))
+    if max_concurrency < 1:
+        raise Exception("max_concurrency must be at least 1.")
+    if max_concurrency > 1 and checkpoint_interval > 0:
+        raise Exception("checkpoint_interval cannot be used with "
+                        "max_concurrency greater than 1.")
 
     # Modify the class to have an additional method that will be used for
     # terminating the worker.
@@ -889,7 +1218,8 @@ def make_actor(cls, num_cpus, num_gpus, resources, actor_method_cpus,
     class_id = _random_string()
 
     return ActorClass(Class, class_id, checkpoint_interval,
-                      max_reconstructions, num_cpus, num_gpus, resources,
+                      max_reconstructions, max_concurrency,
+                      per_handle_ordering, num_cpus, num_gpus, resources,
                       actor_method_cpus)
 
 
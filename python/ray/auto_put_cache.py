@@ -0,0 +1,165 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import collections
+import hashlib
+import logging
+import threading
+import weakref
+
+logger = logging.getLogger(__name__)
+
+# Arguments are always put again.
+MODE_OFF = "off"
+# Arguments are matched by identity.
+MODE_IDENTITY = "identity"
+# Arguments are matched by a hash of their serialized contents.
+MODE_CONTENT = "content"
+
+AUTO_PUT_CACHE_MODES = [MODE_OFF, MODE_IDENTITY, MODE_CONTENT]
+
+
+class AutoPutCache(object):
+    """A cache of the object IDs of task arguments passed by value.
+
+    Task arguments that are passed by value and are not simple values are put
+    in the object store when the task is submitted. If the same value is
+    passed to many tasks, this cache lets the tasks share a single object
+    instead of putting a copy of the value for each task.
+
+    In identity mode, values are matched by identity. Only values that
+    support weak references are cached (e.g., numpy arrays and instances of
+    most classes, but not lists or dicts). Note that a value that is modified
+    in place after it was first passed to a task is not put again, so tasks
+    that are submitted later see the value as it was first passed.
+
+    In content mode, values are matched by a hash of their serialized
+    contents. This is safe for mutable values, but each argument is
+    serialized one more time to compute the hash.
+
+    Values are cached separately for each driver, since objects are
+    serialized in the context of the driver they belong to. Before a cached
+    object ID is reused, the cache checks that the object is still in the
+    local object store, and the value is put again if it is not. Objects that
+    are freed with ray.internal.free are also removed from the cache.
+
+    The least recently used entries are evicted when the cache is full.
+
+    Attributes:
+        mode: One of AUTO_PUT_CACHE_MODES.
+        capacity: The maximum number of cached object IDs.
+        num_hits: The number of arguments that reused a cached object ID.
+        num_misses: The number of arguments that had to be put.
+    """
+
+    def __init__(self, mode=MODE_OFF, capacity=1000, serialize=None):
+        """Initialize an AutoPutCache.
+
+        Args:
+            mode: One of AUTO_PUT_CACHE_MODES.
+            capacity: The maximum number of cached object IDs.
+            serialize: A function that serializes a value to a buffer. It is
+                required in content mode.
+        """
+        if mode not in AUTO_PUT_CACHE_MODES:
+            raise ValueError("The auto put cache mode must be one of {}, got "
+                             "{}.".format(AUTO_PUT_CACHE_MODES, mode))
+        if mode == MODE_CONTENT and serialize is None:
+            raise ValueError("A serialize function is required in content "
+                             "mode.")
+        self.mode = mode
+        self.capacity = capacity
+        self._serialize = serialize
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self.num_hits = 0
+        self.num_misses = 0
+
+    def put(self, value, put_function, driver_id=None, contains=None):
+        """Get an object ID for a value, putting the value if needed.
+
+        Args:
+            value: The argument value.
+            put_function: A function that puts a value in the object store
+                and returns its object ID.
+            driver_id: The ID of the driver that the value belongs to.
+            contains: A function that returns whether an object ID is in the
+                object store. If it is given, a cached object ID is only
+                reused if the object is still in the object store.
+
+        Returns:
+            The object ID of the value.
+        """
+        if self.mode == MODE_OFF or self.capacity <= 0:
+            return put_function(value)
+        key, ref = self._key(value, driver_id)
+        if key is None:
+            return put_function(value)
+
+        with self._lock:
+            entry = self._entries.pop(key, None)
+        # In identity mode, the ID of a value that was garbage collected can
+        # be reused by a new value, so check that the value is alive. The
+        # object may also have been evicted from the object store.
+        if (entry is not None and (entry[1] is None or entry[1]() is value)
+                and (contains is None or contains(entry[0]))):
+            with self._lock:
+                self._entries[key] = entry
+                self.num_hits += 1
+            return entry[0]
+
+        object_id = put_function(value)
+        with self._lock:
+            self.num_misses += 1
+            self._entries[key] = (object_id, ref)
+            while len(self._entries) > self.capacity:
+                self._entries.popitem(last=False)
+        return object_id
+
+    def remove(self, object_ids):
+        """Remove the entries of a list of object IDs from the cache.
+
+        Args:
+            object_ids: The object IDs to remove.
+        """
+        object_ids = set(object_ids)
+        with self._lock:
+            for key in [
+                    key for key, entry in self._entries.items()
+                    if entry[0] in object_ids
+            ]:
+                del self._entries[key]
+
+    def clear(self):
+        """Remove all entries from the cache."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _key(self, value, driver_id):
+        """Compute the cache key of a value.
+
+        Args:
+            value: The argument value.
+            driver_id: The ID of the driver that the value belongs to.
+
+        Returns:
+            The key and, in identity mode, a weak reference to the value. The
+                key is None if the value cannot be cached.
+        """
+        if self.mode == MODE_IDENTITY:
+            try:
+                ref = weakref.ref(value)
+            except TypeError:
+                return None, None
+            return (driver_id, id(value)), ref
+        try:
+            buf = self._serialize(value)
+        except Exception:
+            logger.debug("Failed to serialize a value of type {} to compute "
+                         "its hash.".format(type(value)))
+            return None, None
+        return (driver_id, type(value), hashlib.sha1(buf).digest()), None
@@ -136,11 +136,17 @@ class LoadMetrics(object):
         self.last_heartbeat_time_by_ip = {}
         self.static_resources_by_ip = {}
         self.dynamic_resources_by_ip = {}
+        self.resource_demand_by_ip = {}
         self.local_ip = services.get_node_ip_address()
 
-    def update(self, ip, static_resources, dynamic_resources):
+    def update(self,
+               ip,
+               static_resources,
+               dynamic_resources,
+               resource_demand=None):
         self.static_resources_by_ip[ip] = static_resources
         self.dynamic_resources_by_ip[ip] = dynamic_resources
+        self.resource_demand_by_ip[ip] = resource_demand or {}
         now = time.time()
         if ip not in self.last_used_time_by_ip or \
                 static_resources != dynamic_resources:
@@ -168,10 +174,78 @@ class LoadMetrics(object):
         prune(self.last_used_time_by_ip)
         prune(self.static_resources_by_ip)
         prune(self.dynamic_resources_by_ip)
+        prune(self.resource_demand_by_ip)
 
     def approx_workers_used(self):
         return self._info()["NumNodesUsed"]
 
+    def get_resource_demand(self):
+        """Return the resources requested by tasks queued in the cluster.
+
+        Returns:
+            A dictionary mapping resource name to the total quantity of that
+                resource requested by the tasks that are queued on any node
+                waiting for resources.
+        """
+        return _sum_resources(self.resource_demand_by_ip.values())
+
+    def get_resource_availability(self):
+        """Return the resources currently available in the cluster."""
+        return _sum_resources(self.dynamic_resources_by_ip.values())
+
+    def worker_node_resources(self):
+        """Estimate the resource capacity of a single worker node.
+
+        The capacity is taken to be the largest quantity of each resource
+        reported by any connected worker node. If no worker nodes are
+        connected yet, the capacity of the head node is used instead.
+
+        Returns:
+            A dictionary mapping resource name to quantity.
+        """
+        worker_resources = [
+            resources for ip, resources in self.static_resources_by_ip.items()
+            if ip != self.local_ip
+        ]
+        if not worker_resources:
+            worker_resources = list(self.static_resources_by_ip.values())
+        node_resources = {}
+        for resources in worker_resources:
+            for resource_id, amount in resources.items():
+                node_resources[resource_id] = max(
+                    amount, node_resources.get(resource_id, 0.0))
+        return node_resources
+
+    def approx_workers_needed_for_demand(self):
+        """Estimate how many additional nodes the queued demand requires.
+
+        For each resource, the queued demand that exceeds the resources
+        currently available in the cluster is divided by the capacity of a
+        worker node. Demand for resources that no worker node provides is
+        ignored, since adding nodes cannot satisfy it.
+
+        Returns:
+            The number of additional worker nodes needed to run all queued
+                tasks at once.
+        """
+        demand = self.get_resource_demand()
+        available = self.get_resource_availability()
+        node_resources = self.worker_node_resources()
+        num_nodes = 0
+        for resource_id, amount in demand.items():
+            shortfall = amount - available.get(resource_id, 0.0)
+            if shortfall <= 0:
+                continue
+            capacity = node_resources.get(resource_id, 0.0)
+            if capacity <= 0:
+                logger.debug(
+                    "LoadMetrics: Demand for {} {} cannot be satisfied by "
+                    "adding worker nodes.".format(amount, resource_id))
+                continue
+            num_nodes = max(num_nodes,
+                            int(math.ceil(shortfall / float(capacity))))
+        return num_nodes
+
     def info_string(self):
         return " - {}".format("\n - ".join(
             ["{}: {}".format(k, v) for k, v in sorted(self._info().items())]))
@@ -197,6 +271,7 @@ class LoadMetrics(object):
                     if frac > max_frac:
                         max_frac = frac
             nodes_used += max_frac
+        resource_demand = self.get_resource_demand()
         idle_times = [now - t for t in self.last_used_time_by_ip.values()]
         heartbeat_times = [
             now - t for t in self.last_heartbeat_time_by_ip.values()
@@ -210,6 +285,10 @@ class LoadMetrics(object):
             ]),
             "NumNodesConnected": len(self.static_resources_by_ip),
             "NumNodesUsed": round(nodes_used, 2),
+            "ResourceDemand": ", ".join([
+                "{} {}".format(round(resource_demand[rid], 2), rid)
+                for rid in sorted(resource_demand)
+            ]),
             "NodeIdleSeconds": "Min={} Mean={} Max={}".format(
                 int(np.min(idle_times)) if idle_times else -1,
                 int(np.mean(idle_times)) if idle_times else -1,
@@ -289,9 +368,10 @@ class StandardAutoscaler(object):
     configure the right AWS/Cloud roles automatically.
 
     StandardAutoscaler's `update` method is periodically called by `monitor.py`
-    to add and remove nodes as necessary. Currently, load-based autoscaling is
-    not implemented, so all this class does is try to maintain a constant
-    cluster size.
+    to add and remove nodes as necessary. The target cluster size is derived
+    from the resource utilization reported in heartbeats, and is raised
+    immediately when tasks are queued waiting for more resources than the
+    cluster has available.
 
     StandardAutoscaler is also used to bootstrap clusters (by adding workers
     until the target cluster size is met).
@@ -481,6 +561,16 @@ class StandardAutoscaler(object):
             target_frac = self.config["target_utilization_fraction"]
             cur_used = self.load_metrics.approx_workers_used()
             ideal_num_nodes = int(np.ceil(cur_used / float(target_frac)))
+            # Scale up in one step to satisfy the queued resource demand,
+            # rather than waiting for utilization to catch up over several
+            # updates.
+            num_nodes_needed = (
+                self.load_metrics.approx_workers_needed_for_demand())
+            if num_nodes_needed > 0:
+                num_nodes_connected = len(
+                    self.load_metrics.static_resources_by_ip)
+                ideal_num_nodes = max(ideal_num_nodes,
+                                      num_nodes_connected + num_nodes_needed)
             ideal_num_workers = ideal_num_nodes - 1  # subtract 1 for head node
         return min(self.config["max_workers"],
                    max(self.config["min_workers"], ideal_num_workers))
@@ -595,6 +685,14 @@ class StandardAutoscaler(object):
             self.load_metrics.info_string())
 
 
+def _sum_resources(resource_dicts):
+    total = {}
+    for resources in resource_dicts:
+        for resource_id, amount in resources.items():
+            total[resource_id] = total.get(resource_id, 0.0) + amount
+    return total
+
+
 def typename(v):
     if isinstance(v, type):
         return v.__name__
@@ -11,6 +11,8 @@ from .gcs_flush_policy import (set_flushing_policy, GcsFlushPolicy,
                                SimpleGcsFlushPolicy)
 from .named_actors import get_actor, register_actor
 from .api import get, wait
+from .completion_set import CompletionSet
+from .broadcast import broadcast
 
 __all__ = [
     "TensorFlowVariables", "flush_redis_unsafe",
@@ -18,5 +20,5 @@ __all__ = [
     "flush_evicted_objects_unsafe", "_flush_finished_tasks_unsafe_shard",
     "_flush_evicted_objects_unsafe_shard", "get_actor", "register_actor",
     "get", "wait", "set_flushing_policy", "GcsFlushPolicy",
-    "SimpleGcsFlushPolicy"
+    "SimpleGcsFlushPolicy", "CompletionSet", "broadcast"
 ]
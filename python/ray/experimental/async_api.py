@@ -1,6 +1,8 @@
 # Note: asyncio is only compatible with Python 3
 
 import asyncio
+import time
+
 import ray
 from ray.experimental.async_plasma import PlasmaProtocol, PlasmaEventHandler
 
@@ -48,6 +50,141 @@ def as_future(object_id):
     return handler.as_future(object_id)
 
 
+def as_futures(object_ids):
+    """Turn a list of object_ids into Future objects.
+
+    This is faster than calling as_future() for each object_id, since the
+    objects are checked and fetched in batches.
+
+    Args:
+        object_ids: A list of Ray object_ids.
+
+    Returns:
+        List[PlasmaObjectFuture]: A future object for each object_id.
+    """
+    if handler is None:
+        init()
+    return handler.as_futures(object_ids)
+
+
+async def get(object_ids):
+    """Get a remote object or a list of remote objects asynchronously.
+
+    This is the asyncio version of ray.get(). The event loop is not blocked
+    while the objects are not ready, so many calls can be outstanding at
+    once.
+
+    Args:
+        object_ids: Object ID of the object to get or a list of object IDs to
+            get.
+
+    Returns:
+        A Python object or a list of Python objects.
+
+    Raises:
+        Exception: An exception is raised if the task that created the object
+            or that created one of the objects raised an exception.
+    """
+    await _async_init()
+    is_list = isinstance(object_ids, list)
+    futures = handler.as_futures(object_ids if is_list else [object_ids])
+    values = await asyncio.gather(*futures)
+    for value in values:
+        if isinstance(value, ray.worker.RayTaskError):
+            ray.worker.last_task_error_raise_time = time.time()
+            raise value
+    return values if is_list else values[0]
+
+
+async def wait(object_ids, num_returns=1, timeout=None):
+    """Return a list of IDs that are ready and a list of IDs that are not.
+
+    This is the asyncio version of ray.wait(), and has the same semantics.
+    The objects that become ready are retrieved from the object store.
+
+    Args:
+        object_ids (List[ObjectID]): List of object IDs for objects that may or
+            may not be ready. Note that these IDs must be unique.
+        num_returns (int): The number of object IDs that should be returned.
+        timeout (float): The maximum amount of time in seconds to wait before
+            returning.
+
+    Returns:
+        A list of object IDs that are ready and a list of the remaining object
+        IDs.
+    """
+    if not isinstance(object_ids, list):
+        raise TypeError("wait() expected a list of ObjectID, got {}".format(
+            type(object_ids)))
+    if len(object_ids) != len(set(object_ids)):
+        raise Exception("Wait requires a list of unique object IDs.")
+    if len(object_ids) == 0:
+        return [], []
+    if num_returns <= 0:
+        raise Exception(
+            "Invalid number of objects to return %d." % num_returns)
+    if num_returns > len(object_ids):
+        raise Exception("num_returns cannot be greater than the number "
+                        "of objects provided to wait.")
+    if timeout is not None and timeout < 0:
+        raise ValueError("The 'timeout' argument must be nonnegative. "
+                         "Received {}".format(timeout))
+
+    await _async_init()
+    futures = handler.as_futures(object_ids)
+    enough_ready = asyncio.get_event_loop().create_future()
+    num_ready = 0
+
+    def on_ready(future):
+        nonlocal num_ready
+        if future.cancelled():
+            return
+        num_ready += 1
+        if num_ready >= num_returns and not enough_ready.done():
+            enough_ready.set_result(None)
+
+    for future in futures:
+        if future.done():
+            on_ready(future)
+        else:
+            future.add_done_callback(on_ready)
+    try:
+        await asyncio.wait_for(asyncio.shield(enough_ready), timeout)
+    except asyncio.TimeoutError:
+        pass
+
+    ready_ids, remaining_ids = [], []
+    for object_id, future in zip(object_ids, futures):
+        if (future.done() and not future.cancelled()
+                and len(ready_ids) < num_returns):
+            ready_ids.append(object_id)
+        else:
+            remaining_ids.append(object_id)
+            # Stop waiting for the objects that are not returned as ready.
+            future.cancel()
+    return ready_ids, remaining_ids
+
+
+async def call(remote_method, *args, **kwargs):
+    """Call a remote function or an actor method and wait for its result.
+
+    Examples:
+        >>> counter = Counter.remote()
+        >>> value = await async_api.call(counter.increment, 1)
+
+    Args:
+        remote_method: A remote function or an actor method.
+        args: The positional arguments to pass to the remote method.
+        kwargs: The keyword arguments to pass to the remote method.
+
+    Returns:
+        The return value of the remote method, or a list of them if the
+            method has several return values.
+    """
+    object_ids = remote_method.remote(*args, **kwargs)
+    return await get(object_ids)
+
+
 def shutdown():
     """Manually shutdown the async API.
 
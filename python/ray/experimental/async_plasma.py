@@ -121,21 +121,17 @@ class PlasmaObjectLinkedList(asyncio.Future):
         if future.prev is None:
             assert future is self.head
             self.head = future.next
-            if self.head is None:
-                self.tail = None
-                if not self.cancelled():
-                    self.set_result(None)
-            else:
-                self.head.prev = None
-        elif future.next is None:
+        else:
+            future.prev.next = future.next
+        if future.next is None:
             assert future is self.tail
             self.tail = future.prev
-            if self.tail is None:
-                self.head = None
-                if not self.cancelled():
-                    self.set_result(None)
-            else:
-                self.tail.prev = None
+        else:
+            future.next.prev = future.prev
+        future.prev = None
+        future.next = None
+        if self.head is None and not self.done():
+            self.set_result(None)
 
     def cancel(self, *args, **kwargs):
         """Manually cancel all tasks assigned to this event loop."""
@@ -155,7 +151,8 @@ class PlasmaObjectLinkedList(asyncio.Future):
             # All cancelled futures should have callbacks to removed itself
             # from this linked list. However, these callbacks are scheduled in
             # an event loop, so we could still find them in our list.
-            future.set_result(result)
+            if not future.done():
+                future.set_result(result)
         if not self.done():
             super().set_result(result)
 
@@ -172,20 +169,31 @@ class PlasmaObjectLinkedList(asyncio.Future):
 
 
 class PlasmaEventHandler:
-    """This class is an event handler for Plasma."""
+    """This class is an event handler for Plasma.
+
+    All futures are resolved through the single notification stream of the
+    plasma store. Objects that are not local are fetched in batches, and the
+    fetch is repeated periodically for objects that are still missing, which
+    also triggers their reconstruction if they were lost.
+    """
 
     def __init__(self, loop, worker):
         super().__init__()
         self._loop = loop
         self._worker = worker
         self._waiting_dict = {}
+        self._fetch_handle = None
+        self._blocked_task_id = None
 
     def process_notifications(self, messages):
         """Process notifications."""
+        linked_lists = []
         for object_id, object_size, metadata_size in messages:
             if object_size > 0 and object_id in self._waiting_dict:
                 linked_list = self._waiting_dict[object_id]
-                self._complete_future(linked_list)
+                if not linked_list.done():
+                    linked_lists.append(linked_list)
+        self._complete_futures(linked_lists)
 
     def close(self):
         """Clean up this handler."""
@@ -194,13 +202,73 @@ class PlasmaEventHandler:
         # All cancelled linked lists should have callbacks to removed itself
         # from the waiting dict. However, these callbacks are scheduled in
         # an event loop, so we don't check them now.
+        if self._fetch_handle is not None:
+            self._fetch_handle.cancel()
+            self._fetch_handle = None
 
     def _unregister_callback(self, fut):
         del self._waiting_dict[fut.object_id]
+        if not self._waiting_dict:
+            self._unblock()
+
+    def _complete_futures(self, futures):
+        """Deserialize the objects of several futures and complete them."""
+        if not futures:
+            return
+        objects = self._worker.retrieve_and_deserialize(
+            [fut.object_id for fut in futures], 0)
+        for fut, obj in zip(futures, objects):
+            # The object may have been evicted since the notification was
+            # sent. In that case, it is fetched again later.
+            if obj is not plasma.ObjectNotAvailable:
+                fut.set_result(obj)
+
+    def _fetch(self, object_ids, fetch_only):
+        """Ask the raylet to fetch objects, in batches.
 
-    def _complete_future(self, fut):
-        obj = self._worker.retrieve_and_deserialize([fut.object_id], 0)[0]
-        fut.set_result(obj)
+        Args:
+            object_ids (List[plasma.ObjectID]): The objects to fetch.
+            fetch_only (bool): If false, the objects are also reconstructed
+                if they were lost, and the current task is marked as blocked
+                until all futures are done.
+        """
+        task_id = None
+        if not fetch_only:
+            with self._worker.state_lock:
+                task_id = self._worker.get_current_thread_task_id()
+            self._blocked_task_id = task_id
+        batch_size = ray._config.worker_fetch_request_size()
+        ray_object_ids = [
+            ray.ObjectID(object_id.binary()) for object_id in object_ids
+        ]
+        for i in range(0, len(ray_object_ids), batch_size):
+            batch = ray_object_ids[i:i + batch_size]
+            if fetch_only:
+                self._worker.raylet_client.fetch_or_reconstruct(batch, True)
+            else:
+                self._worker.raylet_client.fetch_or_reconstruct(
+                    batch, False, task_id)
+
+    def _refetch(self):
+        """Fetch the objects that are still missing, and reschedule."""
+        self._fetch_handle = None
+        if not self._waiting_dict:
+            return
+        self._fetch(list(self._waiting_dict), fetch_only=False)
+        self._schedule_refetch()
+
+    def _schedule_refetch(self):
+        if self._fetch_handle is None and self._waiting_dict:
+            self._fetch_handle = self._loop.call_later(
+                ray._config.get_timeout_milliseconds() / 1000, self._refetch)
+
+    def _unblock(self):
+        if self._blocked_task_id is not None:
+            self._worker.raylet_client.notify_unblocked(self._blocked_task_id)
+            self._blocked_task_id = None
+        if self._fetch_handle is not None:
+            self._fetch_handle.cancel()
+            self._fetch_handle = None
 
     def as_future(self, object_id, check_ready=True):
         """Turn an object_id into a Future object.
@@ -212,26 +280,64 @@ class PlasmaEventHandler:
         Returns:
             PlasmaObjectFuture: A future object that waits the object_id.
         """
-        if not isinstance(object_id, ray.ObjectID):
-            raise TypeError("Input should be an ObjectID.")
+        return self.as_futures([object_id], check_ready=check_ready)[0]
 
-        plain_object_id = plasma.ObjectID(object_id.id())
-        fut = PlasmaObjectFuture(loop=self._loop, object_id=plain_object_id)
+    def as_futures(self, object_ids, check_ready=True):
+        """Turn a list of object_ids into Future objects.
 
-        if check_ready:
-            ready, _ = ray.wait([object_id], timeout=0)
-            if ready:
-                if self._loop.get_debug():
-                    logger.debug("%s has been ready.", plain_object_id)
-                self._complete_future(fut)
-                return fut
-
-        if plain_object_id not in self._waiting_dict:
-            linked_list = PlasmaObjectLinkedList(self._loop, plain_object_id)
-            linked_list.add_done_callback(self._unregister_callback)
-            self._waiting_dict[plain_object_id] = linked_list
-        self._waiting_dict[plain_object_id].append(fut)
-        if self._loop.get_debug():
-            logger.debug("%s added to the waiting list.", fut)
+        The objects that are already local are retrieved with a single call
+        to the object store, and the missing objects are fetched in batches.
+
+        Args:
+            object_ids (List[ObjectID]): A list of Ray's object_ids.
+            check_ready (bool): If true, check if the object_ids are ready.
 
-        return fut
+        Returns:
+            List[PlasmaObjectFuture]: Future objects that wait for each of the
+                object_ids.
+        """
+        for object_id in object_ids:
+            if not isinstance(object_id, ray.ObjectID):
+                raise TypeError("Input should be an ObjectID.")
+        # The objects may be results of batched actor method calls that are
+        # still held back.
+        self._worker.flush_actor_batches()
+
+        futures = [
+            PlasmaObjectFuture(
+                loop=self._loop, object_id=plasma.ObjectID(object_id.id()))
+            for object_id in object_ids
+        ]
+
+        pending = futures
+        if check_ready:
+            objects = self._worker.retrieve_and_deserialize(
+                [fut.object_id for fut in futures], 0)
+            pending = []
+            for fut, obj in zip(futures, objects):
+                if obj is plasma.ObjectNotAvailable:
+                    pending.append(fut)
+                else:
+                    if self._loop.get_debug():
+                        logger.debug("%s has been ready.", fut.object_id)
+                    fut.set_result(obj)
+
+        new_object_ids = []
+        for fut in pending:
+            plain_object_id = fut.object_id
+            if plain_object_id not in self._waiting_dict:
+                linked_list = PlasmaObjectLinkedList(self._loop,
+                                                     plain_object_id)
+                linked_list.add_done_callback(self._unregister_callback)
+                self._waiting_dict[plain_object_id] = linked_list
+                new_object_ids.append(plain_object_id)
+            self._waiting_dict[plain_object_id].append(fut)
+            if self._loop.get_debug():
+                logger.debug("%s added to the waiting list.", fut)
+
+        if new_object_ids:
+            # Start pulling the objects that are on other nodes.
+            self._fetch(new_object_ids, fetch_only=True)
+            self._schedule_refetch()
+
+        return futures
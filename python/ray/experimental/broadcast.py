@@ -0,0 +1,187 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import time
+
+import ray
+import ray.gcs_utils
+from ray.utils import binary_to_hex, hex_to_binary
+
+# The interval in seconds at which broadcast() drops the nodes that died and
+# broadcasts the object again if it did not reach any new node.
+_CHECK_INTERVAL_SECONDS = 1.0
+
+
+def broadcast(object_id, client_ids=None, fanout=2, timeout=None, worker=None):
+    """Replicate an object to a set of nodes along a tree.
+
+    When many tasks or actors on different nodes get the same large object
+    (e.g., model weights), they all pull it from the node that created it,
+    whose network link then limits how fast the object is spread. Instead,
+    this replicates the object ahead of time along a tree of object managers:
+    the node that holds the object sends it to fanout nodes, and each node
+    forwards it to fanout more nodes once it has the whole object. The object
+    then reaches N nodes in O(log N) rounds of transfers. If fanout is 1, the
+    object is passed along a chain of nodes.
+
+    Examples:
+        >>> weights_id = ray.put(weights)
+        >>> ray.experimental.broadcast(weights_id)
+        >>> ray.get([actor.set_weights.remote(weights_id)
+        ...          for actor in actors])
+
+    Args:
+        object_id (ObjectID): The object to broadcast.
+        client_ids (List[str]): The client IDs, as hex strings, of the nodes
+            to replicate the object to, as listed by
+            `ray.global_state.client_table()`. If this is None, the object is
+            replicated to every live node.
+        fanout (int): The number of nodes that each node forwards the object
+            to directly.
+        timeout (float): The maximum amount of time in seconds to wait for
+            the object to reach the nodes. If this is None, wait until the
+            object reaches all of the nodes that are alive.
+
+    Returns:
+        A list of the client IDs of the nodes that hold the object and a list
+            of the client IDs of the live nodes that do not hold it yet.
+            Nodes that died are in neither list.
+    """
+    worker = ray.worker.global_worker if worker is None else worker
+    worker.check_connected()
+    if not isinstance(object_id, ray.ObjectID):
+        raise TypeError("broadcast() expected an ObjectID, got {}".format(
+            type(object_id)))
+    if fanout < 1:
+        raise ValueError("The 'fanout' argument must be positive. "
+                         "Received {}".format(fanout))
+    # The object may be the result of a batched actor method call that is
+    # still held back.
+    worker.flush_actor_batches()
+
+    if client_ids is None:
+        client_ids = [
+            client["ClientID"] for client in ray.global_state.client_table()
+            if client["IsInsertion"]
+        ]
+    else:
+        client_ids = list(client_ids)
+    nodes = [
+        ray.ObjectID(hex_to_binary(client_id)) for client_id in client_ids
+    ]
+    worker.raylet_client.broadcast_object(object_id, nodes, fanout)
+
+    # Wait for the object table to list every node as a location. The
+    # locations are tracked with notifications from the object table, and
+    # the state of the nodes and the broadcast are checked periodically.
+    start_time = time.time()
+    remaining = client_ids
+    with _ObjectLocations(object_id) as locations:
+        check_time = start_time
+        num_locations = 0
+        dead_client_ids = set()
+        while True:
+            remaining = [
+                client_id for client_id in remaining
+                if client_id not in locations.get()
+            ]
+            now = time.time()
+            if not remaining or (timeout is not None
+                                 and now - start_time >= timeout):
+                break
+            if now - check_time >= _CHECK_INTERVAL_SECONDS:
+                # Nodes that died will never hold the object.
+                dead_client_ids.update(
+                    client["ClientID"]
+                    for client in ray.global_state.client_table()
+                    if not client["IsInsertion"])
+                remaining = [
+                    client_id for client_id in remaining
+                    if client_id not in dead_client_ids
+                ]
+                if remaining and len(locations.get()) == num_locations:
+                    # The object did not reach any new node since the last
+                    # check, e.g. because a node in the tree failed, so
+                    # broadcast it again to the remaining nodes.
+                    worker.raylet_client.broadcast_object(
+                        object_id, [
+                            ray.ObjectID(hex_to_binary(client_id))
+                            for client_id in remaining
+                        ], fanout)
+                check_time = now
+                num_locations = len(locations.get())
+                continue
+            wait_time = _CHECK_INTERVAL_SECONDS - (now - check_time)
+            if timeout is not None:
+                wait_time = min(wait_time, timeout - (now - start_time))
+            locations.wait(wait_time)
+        ready = [
+            client_id for client_id in client_ids if
+            client_id in locations.get() and client_id not in dead_client_ids
+        ]
+    return ready, remaining
+
+
+class _ObjectLocations(object):
+    """Tracks the locations of an object with object table notifications."""
+
+    def __init__(self, object_id):
+        self._object_id = object_id
+        self._locations = set()
+        self._subscriber_id = ray.utils.random_string()
+        self._channel = (str(ray.gcs_utils.TablePubsub.OBJECT).encode("ascii")
+                         + b":" + self._subscriber_id)
+        redis_clients = ray.worker.global_state.redis_clients
+        redis_client = redis_clients[object_id.redis_shard_hash() %
+                                     len(redis_clients)]
+        self._subscribe_client = redis_client.pubsub(
+            ignore_subscribe_messages=True)
+
+    def __enter__(self):
+        self._subscribe_client.subscribe(self._channel)
+        # Wait for the subscription to be confirmed so that the notification
+        # with the current locations is not missed.
+        self._subscribe_client.parse_response()
+        # The current locations are published right away.
+        self._execute_command("RAY.TABLE_REQUEST_NOTIFICATIONS")
+        return self
+
+    def __exit__(self, *args):
+        self._execute_command("RAY.TABLE_CANCEL_NOTIFICATIONS")
+        self._subscribe_client.close()
+
+    def get(self):
+        """Return the client IDs, as hex strings, of the object's locations."""
+        return self._locations
+
+    def wait(self, timeout):
+        """Process the notifications, waiting for one if there is none.
+
+        Args:
+            timeout (float): The maximum number of seconds to wait.
+        """
+        message = self._subscribe_client.get_message(timeout=max(timeout, 0))
+        while message is not None:
+            if message["channel"] == self._channel:
+                self._process_notification(message["data"])
+            message = self._subscribe_client.get_message()
+
+    def _execute_command(self, command):
+        ray.worker.global_state._execute_command(
+            self._object_id, command,
+            ray.gcs_utils.TablePrefix.OBJECT, ray.gcs_utils.TablePubsub.OBJECT,
+            self._object_id.id(), self._subscriber_id)
+
+    def _process_notification(self, data):
+        gcs_entry = ray.gcs_utils.GcsTableEntry.GetRootAsGcsTableEntry(data, 0)
+        # The entries are the additions and evictions of the object in the
+        # order in which they happened.
+        for i in range(gcs_entry.EntriesLength()):
+            entry = ray.gcs_utils.ObjectTableData.GetRootAsObjectTableData(
+                gcs_entry.Entries(i), 0)
+            client_id = binary_to_hex(entry.Manager())
+            if entry.IsEviction():
+                self._locations.discard(client_id)
+            else:
+                self._locations.add(client_id)
@@ -0,0 +1,255 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import collections
+import time
+
+import ray
+import ray.gcs_utils
+
+
+class CompletionSet(object):
+    """A set of object IDs that reports the objects as they become ready.
+
+    Object IDs are registered once with `add`, and each call to `poll` returns
+    the object IDs that became ready since the previous call. Unlike calling
+    `ray.wait` in a loop, which sends and scans the full list of pending
+    object IDs on every call, the cost of a poll only depends on the number of
+    objects that became ready.
+
+    An object is ready when it is available on some node in the cluster, which
+    is the same condition that `ray.wait` uses. Readiness is tracked by
+    subscribing to notifications from the object table in the GCS, so polling
+    does not fetch the objects to the local node.
+
+    Examples:
+        >>> completion_set = CompletionSet()
+        >>> completion_set.add([f.remote(i) for i in range(1000)])
+        >>> while len(completion_set) > 0:
+        ...     for object_id in completion_set.poll(timeout=None):
+        ...         process(ray.get(object_id))
+    """
+
+    def __init__(self, worker=None):
+        """Create an empty CompletionSet.
+
+        Args:
+            worker: The worker to use. Defaults to the global worker.
+        """
+        # There is a dependency on ray.worker which prevents importing
+        # global_worker at the top of this file
+        self._worker = ray.worker.global_worker if worker is None else worker
+        # The ID used to form the pubsub channel that notifications for this
+        # set are published to.
+        self._client_id = ray.utils.random_string()
+        self._channel = (str(ray.gcs_utils.TablePubsub.OBJECT).encode("ascii")
+                         + b":" + self._client_id)
+        # One pubsub client per Redis shard. These are created when the first
+        # object ID is added.
+        self._subscribe_clients = None
+        # A mapping from the binary ID of each pending object to the object ID
+        # and the set of nodes that the object is available on.
+        self._pending = {}
+        # The object IDs that are ready but were not yet returned by poll.
+        self._ready = collections.OrderedDict()
+
+    def add(self, object_ids):
+        """Start tracking the given object IDs.
+
+        Object IDs that are already in the set are ignored.
+
+        Args:
+            object_ids: An object ID or a list of object IDs.
+        """
+        if isinstance(object_ids, ray.ObjectID):
+            object_ids = [object_ids]
+        self._worker.check_connected()
+        # The objects may be results of batched actor method calls that are
+        # still held back.
+        self._worker.flush_actor_batches()
+        for object_id in object_ids:
+            if not isinstance(object_id, ray.ObjectID):
+                raise TypeError("CompletionSet.add expects object IDs, got "
+                                "{}.".format(type(object_id)))
+            object_id_binary = object_id.id()
+            if (object_id_binary in self._pending
+                    or object_id_binary in self._ready):
+                continue
+            if self._worker.mode == ray.worker.LOCAL_MODE:
+                # In local mode, all objects are ready as soon as they exist.
+                self._ready[object_id_binary] = object_id
+                continue
+            self._subscribe()
+            self._pending[object_id_binary] = (object_id, set())
+            # The current entries of the object are published to this set's
+            # channel right away, so objects that are already available are
+            # reported by the next poll.
+            self._execute_command(object_id, "RAY.TABLE_REQUEST_NOTIFICATIONS",
+                                  ray.gcs_utils.TablePrefix.OBJECT,
+                                  ray.gcs_utils.TablePubsub.OBJECT,
+                                  object_id_binary, self._client_id)
+
+    def remove(self, object_ids):
+        """Stop tracking the given object IDs.
+
+        Object IDs that are not in the set are ignored.
+
+        Args:
+            object_ids: An object ID or a list of object IDs.
+        """
+        if isinstance(object_ids, ray.ObjectID):
+            object_ids = [object_ids]
+        for object_id in object_ids:
+            object_id_binary = object_id.id()
+            self._ready.pop(object_id_binary, None)
+            if self._pending.pop(object_id_binary, None) is not None:
+                self._cancel_notifications(object_id)
+
+    def poll(self, timeout=0, num_returns=None):
+        """Return the object IDs that became ready since the last poll.
+
+        Each object ID is returned once and is then removed from the set.
+
+        Args:
+            timeout (float): The maximum number of seconds to wait for an
+                object to become ready if none is ready yet. If this is None,
+                wait until an object is ready, unless the set is empty.
+            num_returns (int): The maximum number of object IDs to return. The
+                remaining ready object IDs are returned by later polls. If
+                this is None, all ready object IDs are returned.
+
+        Returns:
+            A list of the ready object IDs, in the order in which they became
+                ready.
+        """
+        self._wait_for_ready(timeout)
+        if num_returns is None:
+            num_returns = len(self._ready)
+        ready = []
+        while self._ready and len(ready) < num_returns:
+            ready.append(self._ready.popitem(last=False)[1])
+        return ready
+
+    def peek(self, timeout=0, num_returns=None):
+        """Return the ready object IDs without removing them from the set.
+
+        This is the same as `poll`, except that the returned object IDs stay
+        in the set until they are returned by `poll` or removed with
+        `remove`, so repeated calls return the same object IDs.
+
+        Args:
+            timeout (float): The maximum number of seconds to wait for an
+                object to become ready if none is ready yet. If this is None,
+                wait until an object is ready, unless the set is empty.
+            num_returns (int): The maximum number of object IDs to return. If
+                this is None, all ready object IDs are returned.
+
+        Returns:
+            A list of the ready object IDs, in the order in which they became
+                ready.
+        """
+        self._wait_for_ready(timeout)
+        ready = list(self._ready.values())
+        if num_returns is not None:
+            ready = ready[:num_returns]
+        return ready
+
+    def close(self):
+        """Stop tracking all objects and close the pubsub connections."""
+        for object_id, _ in list(self._pending.values()):
+            self._cancel_notifications(object_id)
+        self._pending.clear()
+        self._ready.clear()
+        if self._subscribe_clients is not None:
+            for subscribe_client in self._subscribe_clients:
+                subscribe_client.close()
+            self._subscribe_clients = None
+
+    def __contains__(self, object_id):
+        object_id_binary = object_id.id()
+        return (object_id_binary in self._pending
+                or object_id_binary in self._ready)
+
+    def __len__(self):
+        """Return the number of object IDs that were not yet returned."""
+        return len(self._pending) + len(self._ready)
+
+    def _subscribe(self):
+        """Subscribe to this set's channel on all Redis shards."""
+        if self._subscribe_clients is not None:
+            return
+        redis_clients = ray.worker.global_state.redis_clients
+        self._subscribe_clients = []
+        for redis_client in redis_clients:
+            subscribe_client = redis_client.pubsub(
+                ignore_subscribe_messages=True)
+            subscribe_client.subscribe(self._channel)
+            # Wait for the subscription to be confirmed so that the initial
+            # notifications for the first object IDs are not missed.
+            subscribe_client.parse_response()
+            self._subscribe_clients.append(subscribe_client)
+
+    def _execute_command(self, object_id, *args):
+        return ray.worker.global_state._execute_command(object_id, *args)
+
+    def _cancel_notifications(self, object_id):
+        self._execute_command(
+            object_id, "RAY.TABLE_CANCEL_NOTIFICATIONS",
+            ray.gcs_utils.TablePrefix.OBJECT, ray.gcs_utils.TablePubsub.OBJECT,
+            object_id.id(), self._client_id)
+
+    def _wait_for_ready(self, timeout):
+        """Process notifications until an object is ready or the timeout.
+
+        Args:
+            timeout (float): The maximum number of seconds to wait. If this is
+                None, wait until an object is ready, unless the set is empty.
+        """
+        self._worker.flush_actor_batches()
+        self._process_notifications(timeout=0)
+        if not self._ready and self._pending and timeout != 0:
+            deadline = None if timeout is None else time.time() + timeout
+            while not self._ready and self._pending:
+                remaining = 0.01
+                if deadline is not None:
+                    remaining = min(remaining, deadline - time.time())
+                    if remaining <= 0:
+                        break
+                self._process_notifications(timeout=remaining)
+
+    def _process_notifications(self, timeout):
+        """Process the pending notifications from all shards.
+
+        Args:
+            timeout (float): The number of seconds to wait for a notification
+                from each shard if there is none.
+        """
+        if self._subscribe_clients is None:
+            return
+        timeout /= len(self._subscribe_clients)
+        for subscribe_client in self._subscribe_clients:
+            message = subscribe_client.get_message(timeout=timeout)
+            while message is not None:
+                if message["channel"] == self._channel:
+                    self._process_notification(message["data"])
+                message = subscribe_client.get_message()
+
+    def _process_notification(self, data):
+        gcs_entry = ray.gcs_utils.GcsTableEntry.GetRootAsGcsTableEntry(data, 0)
+        object_id_binary = gcs_entry.Id()
+        if object_id_binary not in self._pending:
+            # The object was removed or is already ready.
+            return
+        object_id, locations = self._pending[object_id_binary]
+        for i in range(gcs_entry.EntriesLength()):
+            entry = ray.gcs_utils.ObjectTableData.GetRootAsObjectTableData(
+                gcs_entry.Entries(i), 0)
+            if entry.IsEviction():
+                locations.discard(entry.Manager())
+            else:
+                locations.add(entry.Manager())
+        if locations:
+            del self._pending[object_id_binary]
+            self._ready[object_id_binary] = object_id
+            self._cancel_notifications(object_id)
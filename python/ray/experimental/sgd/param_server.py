@@ -20,6 +20,13 @@ class ParameterServer(object):
         self.num_sgd_workers = num_workers
         self.acc_counter = 0
         self.timeline = Timeline(tid)
+        # A separate plasma client that is subscribed to notifications of
+        # the objects that are sealed in the local object store. Notifications
+        # that are not needed are drained and ignored on the next add.
+        store_socket = (
+            ray.worker.global_worker.plasma_client.store_socket_name)
+        self.notification_client = ray.pyarrow.plasma.connect(store_socket)
+        self.notification_client.subscribe()
         # TODO(ekl) get this to work again so we get ray events
         # self.timeline.patch_ray()
 
@@ -35,21 +42,38 @@ class ParameterServer(object):
         self.timeline.end("prefetch")
 
     def add_spinwait(self, grad_shard_ids):
-        """Optimized version of add() that operates on multiple grads."""
+        """Optimized version of add() that operates on multiple grads.
+
+        The grads are added in the order in which they arrive in the local
+        object store. Instead of polling the store, this blocks on object
+        notifications while waiting for grads.
+        """
         self.timeline.start("add_spinwait")
-        plasma_ids = [ray.pyarrow.plasma.ObjectID(x) for x in grad_shard_ids]
-        while plasma_ids:
-            for p in plasma_ids:
-                if ray.worker.global_worker.plasma_client.contains(p):
-                    self.timeline.start("get_buffers")
-                    grads = ray.worker.global_worker.plasma_client.get(p)
-                    self.accumulated += grads
-                    self.acc_counter += 1
-                    self.timeline.end("get_buffers")
-                    plasma_ids.remove(p)
-                    break
+        client = ray.worker.global_worker.plasma_client
+        pending = set()
+        for p in [ray.pyarrow.plasma.ObjectID(x) for x in grad_shard_ids]:
+            if client.contains(p):
+                self._add_buffer(p)
+            else:
+                pending.add(p)
+        while pending:
+            self.timeline.start("wait_for_grads")
+            object_id, data_size, _ = (
+                self.notification_client.get_next_notification())
+            self.timeline.end("wait_for_grads")
+            # The object may have been added before it was checked above.
+            if data_size > 0 and object_id in pending:
+                self._add_buffer(object_id)
+                pending.remove(object_id)
         self.timeline.end("add_spinwait")
 
+    def _add_buffer(self, plasma_id):
+        self.timeline.start("get_buffers")
+        grads = ray.worker.global_worker.plasma_client.get(plasma_id)
+        self.accumulated += grads
+        self.acc_counter += 1
+        self.timeline.end("get_buffers")
+
     def add(self, grad_shard_id):
         """Add the given gradient value to the accumulated gradients."""
         self.timeline.start("add")
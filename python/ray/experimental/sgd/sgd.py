@@ -3,6 +3,7 @@ from __future__ import division
 from __future__ import print_function
 
 import logging
+import math
 import os
 import random
 import time
@@ -19,9 +20,10 @@ logger = logging.getLogger(__name__)
 class DistributedSGD(object):
     """Experimental distributed SGD implementation in Ray.
 
-    This supports two modes:
+    This supports three modes:
         'simple': centralized gradient aggregation
         'ps': sharded parameter-server implementation
+        'ring': ring all-reduce among the workers
 
     To use this class, you'll have to implement model.py:Model.
 
@@ -36,7 +38,8 @@ class DistributedSGD(object):
         strategy (str): Strategy to use for distributed gradient aggregation.
             This only applies if num_workers > 1.
         grad_shard_bytes (int): Fuse gradient tensors into chunks of at most
-            this size (if applicable).
+            this size (if applicable). In 'ring' mode, this is the max size
+            of the gradient chunks that are passed between workers.
         all_reduce_alg (str): TensorFlow strategy to use for gradient
             synchronization within the same worker (if applicable).
             See modified_allreduce.py for options.
@@ -69,19 +72,20 @@ class DistributedSGD(object):
                  grad_shard_bytes=10000000,
                  all_reduce_alg="simple"):
 
-        if num_workers == 1 and strategy == "ps":
+        if num_workers == 1 and strategy in ["ps", "ring"]:
             logger.warning(
-                "The parameter server strategy does not make sense for single "
-                "worker operation, falling back to simple mode.")
+                "The {} strategy does not make sense for single worker "
+                "operation, falling back to simple mode.".format(strategy))
             strategy = "simple"
 
+        ring_chunk_bytes = grad_shard_bytes
         if strategy == "ps":
             use_plasma_op = True
-        elif strategy == "simple":
+        elif strategy in ["simple", "ring"]:
             use_plasma_op = False
             grad_shard_bytes = 0  # tensor fusion doesn't make sense
         else:
-            raise ValueError("strategy must be one of 'ps', 'simple'")
+            raise ValueError("strategy must be one of 'ps', 'simple', 'ring'")
         self.strategy = strategy
 
         self.model_creator = model_creator
@@ -127,6 +131,12 @@ class DistributedSGD(object):
         else:
             self.ps_list = []
 
+        if strategy == "ring":
+            self.num_ring_chunks = _num_ring_chunks(shard_shapes, num_workers,
+                                                    ring_chunk_bytes)
+            logger.info("Using ring all-reduce with {} gradient chunks".format(
+                self.num_ring_chunks))
+
     def foreach_worker(self, fn):
         """Apply the given function to each remote worker.
 
@@ -170,6 +180,9 @@ class DistributedSGD(object):
                 self.ps_list,
                 write_timeline=False,
                 fetch_stats=fetch_stats)
+        elif self.strategy == "ring":
+            return _ring_sgd_step(
+                self.workers, self.num_ring_chunks, fetch_stats=fetch_stats)
         else:
             return _simple_sgd_step(self.workers)
 
@@ -218,6 +231,49 @@ def _simple_sgd_step(actors):
     return {"loss": np.mean(losses)}
 
 
+def _num_ring_chunks(shard_shapes, num_workers, chunk_bytes):
+    """Number of gradient chunks to use for ring all-reduce.
+
+    This is a multiple of the number of workers, so that each worker starts
+    the same number of chunks, and is large enough that chunks are at most
+    chunk_bytes large (assuming float32 gradients).
+    """
+    grad_bytes = 4 * sum(shape.num_elements() for shape in shard_shapes)
+    if not chunk_bytes:
+        return num_workers
+    chunks_per_worker = int(
+        math.ceil(grad_bytes / float(num_workers * chunk_bytes)))
+    return num_workers * max(1, chunks_per_worker)
+
+
+def _ring_sgd_step(actors, num_chunks, fetch_stats):
+    num_workers = len(actors)
+    losses = [a.ring_compute_gradients.remote(num_chunks) for a in actors]
+
+    # The partial sums of chunk c travel around the ring, starting at worker
+    # c % num_workers. Only object IDs pass through the driver; the chunks are
+    # transferred directly between workers. The calls are submitted one ring
+    # step at a time, so that each actor receives the calls of a step after
+    # the calls of the previous step that they depend on.
+    partial_sums = [
+        actors[c % num_workers].ring_chunk.remote(c) for c in range(num_chunks)
+    ]
+    for step in range(1, num_workers):
+        partial_sums = [
+            actors[(c + step) % num_workers].ring_reduce.remote(c, s)
+            for c, s in enumerate(partial_sums)
+        ]
+    logger.debug("Launched all ring reduce ops")
+
+    # Each worker fetches the fully reduced chunks from the workers that
+    # hold them, which spreads the traffic evenly over the workers.
+    ray.get([a.ring_apply.remote(num_workers, *partial_sums) for a in actors])
+    if fetch_stats:
+        return {"loss": np.mean(ray.get(losses))}
+    else:
+        return None
+
+
 def _distributed_sgd_step(actors, ps_list, fetch_stats, write_timeline):
     # Preallocate object ids that actors will write gradient shards to
     grad_shard_oids_list = [[np.random.bytes(20) for _ in ps_list]
@@ -269,6 +325,16 @@ def _distributed_sgd_step(actors, ps_list, fetch_stats, write_timeline):
         # Wait for at least the ps gets to finish
         ray.get(ps_gets)
     if fetch_stats:
-        return {"loss": np.mean(ray.get(losses))}
+        stats = {"loss": np.mean(ray.get(losses))}
+        # Report the average time the parameter servers spent in each part
+        # of this step.
+        durations = [
+            t.durations()
+            for t in ray.get([ps.get_timeline.remote() for ps in ps_list])
+        ]
+        for name in set().union(*durations):
+            stats["ps_{}_time".format(name)] = np.mean(
+                [d.get(name, 0) for d in durations])
+        return stats
     else:
         return None
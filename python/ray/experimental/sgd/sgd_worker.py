@@ -5,6 +5,7 @@ from __future__ import print_function
 import logging
 import time
 
+import numpy as np
 import pyarrow.plasma as plasma
 import tensorflow as tf
 
@@ -223,6 +224,56 @@ class SGDWorker(object):
         self.sess.run(self.apply_op, feed_dict=result)
         logger.debug("Apply grad interior time {}".format(time.time() - start))
 
+    def ring_compute_gradients(self, num_chunks):
+        """Compute gradients and split them into chunks for all-reduce.
+
+        The gradients are flattened into a single vector that is split into
+        num_chunks chunks, which are then summed across workers with
+        ring_chunk() and ring_reduce() and applied with ring_apply().
+
+        Returns:
+            The loss.
+        """
+        loss, grads, _ = self.compute_gradients()
+        self.ring_grad_shapes = [g.shape for g in grads]
+        flat_grads = np.concatenate([np.ravel(g) for g in grads])
+        self.ring_grad_chunks = np.array_split(flat_grads, num_chunks)
+        return loss
+
+    def ring_chunk(self, chunk_index):
+        """Return this worker's gradients for the given chunk."""
+        return self.ring_grad_chunks[chunk_index]
+
+    def ring_reduce(self, chunk_index, partial_sum):
+        """Add this worker's gradients for a chunk to a partial sum.
+
+        Arguments:
+            chunk_index (int): Index of the gradient chunk.
+            partial_sum (np.ndarray): Sum of the chunk over the previous
+                workers in the ring.
+
+        Returns:
+            The partial sum including this worker.
+        """
+        return partial_sum + self.ring_grad_chunks[chunk_index]
+
+    def ring_apply(self, num_workers, *reduced_chunks):
+        """Apply the average of the gradients summed over all workers.
+
+        Arguments:
+            num_workers (int): Number of workers the chunks were summed over.
+            reduced_chunks (list): Gradient chunks summed over all workers.
+        """
+        flat_grads = np.concatenate(reduced_chunks) / num_workers
+        sizes = [int(np.prod(shape)) for shape in self.ring_grad_shapes]
+        split_grads = np.split(flat_grads, np.cumsum(sizes)[:-1])
+        avg_grads = [
+            g.reshape(shape)
+            for g, shape in zip(split_grads, self.ring_grad_shapes)
+        ]
+        self.apply_gradients(avg_grads)
+        self.ring_grad_chunks = None
+
     def compute_apply(self):
         fetches = run_timeline(
             self.sess,
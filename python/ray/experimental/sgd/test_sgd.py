@@ -24,7 +24,10 @@ parser.add_argument("--object-store-memory", default=None, type=int)
 parser.add_argument(
     "--warmup", action="store_true", help="Warm up object store before start.")
 parser.add_argument(
-    "--strategy", default="ps", type=str, help="One of 'simple' or 'ps'")
+    "--strategy",
+    default="ps",
+    type=str,
+    help="One of 'simple', 'ps' or 'ring'")
 parser.add_argument(
     "--gpu", action="store_true", help="Use GPUs for optimization")
 
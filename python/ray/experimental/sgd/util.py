@@ -101,6 +101,22 @@ class Timeline(object):
         self.events.append((self.tid, "B", name, now))
         self.events.append((self.tid, "E", name, now + .0001))
 
+    def durations(self):
+        """Return the total time spent in each kind of span.
+
+        Returns:
+            A dict mapping span names to the total seconds spent in them.
+        """
+        durations = {}
+        starts = {}
+        for tid, ph, name, t in self.events:
+            if ph == "B":
+                starts[(tid, name)] = t
+            elif (tid, name) in starts:
+                start = starts.pop((tid, name))
+                durations[name] = durations.get(name, 0) + t - start
+        return durations
+
     def merge(self, other):
         if other.start_time < self.start_time:
             self.start_time = other.start_time
@@ -11,6 +11,7 @@ import time
 import ray
 from ray.function_manager import FunctionDescriptor
 import ray.gcs_utils
+import ray.profiling
 import ray.ray_constants as ray_constants
 from ray.utils import (decode, binary_to_object_id, binary_to_hex,
                        hex_to_binary)
@@ -270,6 +271,40 @@ class GlobalState(object):
                     self._object_table(binary_to_object_id(object_id_binary)))
             return results
 
+    def object_locations(self, object_id):
+        """Fetch the nodes that currently hold a copy of an object.
+
+        Args:
+            object_id: The ObjectID of the object, or its hex string.
+
+        Returns:
+            A set of the client IDs, as hex strings, of the nodes whose object
+                stores hold the object.
+        """
+        self._check_connected()
+        if not isinstance(object_id, ray.ObjectID):
+            object_id = ray.ObjectID(hex_to_binary(object_id))
+
+        message = self._execute_command(object_id, "RAY.TABLE_LOOKUP",
+                                        ray.gcs_utils.TablePrefix.OBJECT, "",
+                                        object_id.id())
+        locations = set()
+        if message is None:
+            return locations
+        gcs_entry = ray.gcs_utils.GcsTableEntry.GetRootAsGcsTableEntry(
+            message, 0)
+        # The entries are the additions and evictions of the object in the
+        # order in which they happened.
+        for i in range(gcs_entry.EntriesLength()):
+            entry = ray.gcs_utils.ObjectTableData.GetRootAsObjectTableData(
+                gcs_entry.Entries(i), 0)
+            client_id = binary_to_hex(entry.Manager())
+            if entry.IsEviction():
+                locations.discard(client_id)
+            else:
+                locations.add(client_id)
+        return locations
+
     def _task_table(self, task_id):
         """Fetch and parse the task table information for a single task ID.
 
@@ -578,6 +613,11 @@ class GlobalState(object):
                 continue
 
             for event in component_events:
+                # Latency summaries are aggregates, not spans of time.
+                if (event["event_type"] ==
+                        ray.profiling.TASK_LATENCY_SUMMARY_EVENT):
+                    continue
+
                 new_event = {
                     # The category of the event.
                     "cat": event["event_type"],
@@ -617,6 +657,51 @@ class GlobalState(object):
         else:
             return all_events
 
+    def task_latency_histograms(self):
+        """Merge the task latency histograms pushed by all workers.
+
+        Returns:
+            A dictionary mapping function name to a dictionary mapping task
+                phase (one of ray.profiling.TASK_PHASES) to the
+                ray.profiling.LatencyHistogram of that phase across the
+                cluster.
+        """
+        histograms = defaultdict(dict)
+        for component_events in self.profile_table().values():
+            for event in component_events:
+                if (event["event_type"] !=
+                        ray.profiling.TASK_LATENCY_SUMMARY_EVENT):
+                    continue
+                for function_name, phases in event["extra_data"].items():
+                    for phase, data in phases.items():
+                        histogram = ray.profiling.LatencyHistogram.from_dict(
+                            data)
+                        if phase in histograms[function_name]:
+                            histograms[function_name][phase].merge(histogram)
+                        else:
+                            histograms[function_name][phase] = histogram
+        return dict(histograms)
+
+    def task_latency_summary(self):
+        """Summarize the latency of each phase of task execution.
+
+        Workers aggregate the latencies of the tasks they execute into
+        histograms, which are pushed to the profile table and merged here.
+
+        Returns:
+            A dictionary mapping function name to a dictionary mapping task
+                phase to a dictionary with the keys "count", "mean", "min",
+                "max", "p50", "p90" and "p99". Latencies are in seconds.
+        """
+        histograms = self.task_latency_histograms()
+        return {
+            function_name: {
+                phase: histogram.summary()
+                for phase, histogram in phases.items()
+            }
+            for function_name, phases in histograms.items()
+        }
+
     def chrome_tracing_object_transfer_dump(self, filename=None):
         """Return a list of transfer events that can viewed as a timeline.
 
@@ -794,19 +879,14 @@ class GlobalState(object):
             for client in self.client_table() if client["IsInsertion"]
         }
 
-    def available_resources(self):
-        """Get the current available cluster resources.
-
-        This is different from `cluster_resources` in that this will return
-        idle (available) resources rather than total resources.
-
-        Note that this information can grow stale as tasks start and finish.
+    def _latest_heartbeats(self):
+        """Get the latest heartbeat of each live node.
 
         Returns:
-            A dictionary mapping resource name to the total quantity of that
-                resource in the cluster.
+            A dictionary mapping the client ID of each live node to the
+                HeartbeatTableData message of its latest heartbeat.
         """
-        available_resources_by_id = {}
+        heartbeats_by_id = {}
 
         subscribe_clients = [
             redis_client.pubsub(ignore_subscribe_messages=True)
@@ -817,7 +897,7 @@ class GlobalState(object):
 
         client_ids = self._live_client_ids()
 
-        while set(available_resources_by_id.keys()) != client_ids:
+        while set(heartbeats_by_id.keys()) != client_ids:
             for subscribe_client in subscribe_clients:
                 # Parse client message
                 raw_message = subscribe_client.get_message()
@@ -831,34 +911,64 @@ class GlobalState(object):
                 heartbeat_data = gcs_entries.Entries(0)
                 message = (ray.gcs_utils.HeartbeatTableData.
                            GetRootAsHeartbeatTableData(heartbeat_data, 0))
-                # Calculate available resources for this client
-                num_resources = message.ResourcesAvailableLabelLength()
-                dynamic_resources = {}
-                for i in range(num_resources):
-                    resource_id = decode(message.ResourcesAvailableLabel(i))
-                    dynamic_resources[resource_id] = (
-                        message.ResourcesAvailableCapacity(i))
-
-                # Update available resources for this client
                 client_id = ray.utils.binary_to_hex(message.ClientId())
-                available_resources_by_id[client_id] = dynamic_resources
+                heartbeats_by_id[client_id] = message
 
             # Update clients in cluster
             client_ids = self._live_client_ids()
 
             # Remove disconnected clients
-            for client_id in available_resources_by_id.keys():
+            for client_id in list(heartbeats_by_id.keys()):
                 if client_id not in client_ids:
-                    del available_resources_by_id[client_id]
+                    del heartbeats_by_id[client_id]
+
+        for subscribe_client in subscribe_clients:
+            subscribe_client.close()
+
+        return heartbeats_by_id
+
+    def available_resources(self):
+        """Get the current available cluster resources.
+
+        This is different from `cluster_resources` in that this will return
+        idle (available) resources rather than total resources.
+
+        Note that this information can grow stale as tasks start and finish.
 
+        Returns:
+            A dictionary mapping resource name to the total quantity of that
+                resource in the cluster.
+        """
         # Calculate total available resources
         total_available_resources = defaultdict(int)
-        for available_resources in available_resources_by_id.values():
-            for resource_id, num_available in available_resources.items():
-                total_available_resources[resource_id] += num_available
+        for message in self._latest_heartbeats().values():
+            for i in range(message.ResourcesAvailableLabelLength()):
+                resource_id = decode(message.ResourcesAvailableLabel(i))
+                total_available_resources[resource_id] += (
+                    message.ResourcesAvailableCapacity(i))
 
         return dict(total_available_resources)
 
+    def object_spilling_stats(self):
+        """Get the number of bytes that each node spilled to and restored from
+        disk.
+
+        Objects are only spilled if the raylets were started with a positive
+        "object_spilling_threshold_percent" in their internal config.
+
+        Returns:
+            A dictionary mapping the client ID of each live node to a
+                dictionary with the total "SpilledBytes" and "RestoredBytes"
+                of the node.
+        """
+        return {
+            client_id: {
+                "SpilledBytes": message.SpilledBytes(),
+                "RestoredBytes": message.RestoredBytes(),
+            }
+            for client_id, message in self._latest_heartbeats().items()
+        }
+
     def _error_messages(self, job_id):
         """Get the error messages for a specific job.
 
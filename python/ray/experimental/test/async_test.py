@@ -148,3 +148,100 @@ def test_wait_mixup(init):
     ]
     ready, _ = loop.run_until_complete(asyncio.wait(tasks, timeout=4))
     assert set(ready) == {tasks[0], tasks[-1]}
+
+
+def test_async_get(init):
+    loop = asyncio.get_event_loop()
+    tasks = gen_tasks()
+    assert loop.run_until_complete(async_api.get(tasks)) == list(range(5))
+    assert loop.run_until_complete(async_api.get(tasks[2])) == 2
+
+    @ray.remote
+    def g():
+        raise ValueError("error")
+
+    with pytest.raises(ray.worker.RayTaskError):
+        loop.run_until_complete(async_api.get([g.remote()]))
+
+
+def test_async_get_many(init):
+    @ray.remote
+    def f(i):
+        return i
+
+    async def get_all(object_ids):
+        return await asyncio.gather(
+            *[async_api.get(object_id) for object_id in object_ids])
+
+    object_ids = [f.remote(i) for i in range(1000)]
+    results = asyncio.get_event_loop().run_until_complete(get_all(object_ids))
+    assert results == list(range(1000))
+
+
+def test_async_wait(init):
+    loop = asyncio.get_event_loop()
+    tasks = gen_tasks()
+    ready, remaining = loop.run_until_complete(
+        async_api.wait(tasks, num_returns=2))
+    assert ready == tasks[:2]
+    assert remaining == tasks[2:]
+
+    ready, remaining = loop.run_until_complete(
+        async_api.wait(tasks, num_returns=5))
+    assert ready == tasks
+    assert remaining == []
+
+    slow_tasks = gen_tasks(10)
+    ready, remaining = loop.run_until_complete(
+        async_api.wait(slow_tasks, num_returns=3, timeout=2))
+    assert ready == slow_tasks[:1]
+    assert remaining == slow_tasks[1:]
+
+
+def test_async_actor_call(init):
+    @ray.remote
+    class Counter(object):
+        def __init__(self):
+            self.value = 0
+
+        def increment(self, n):
+            time.sleep(0.1)
+            self.value += n
+            return self.value
+
+    counter = Counter.remote()
+    loop = asyncio.get_event_loop()
+    results = loop.run_until_complete(
+        asyncio.gather(
+            *[async_api.call(counter.increment, 1) for _ in range(3)]))
+    assert results == [1, 2, 3]
+
+
+def test_async_batched_actor_call(init, monkeypatch):
+    # Only explicit flushes submit the held back calls.
+    monkeypatch.setattr(ray.ray_constants, "ACTOR_BATCH_MAX_HOLD_MS", 10**6)
+
+    @ray.remote
+    class Counter(object):
+        def __init__(self):
+            self.value = 0
+
+        @ray.method(max_batch_size=10)
+        def increment(self, calls):
+            results = []
+            for (n, ) in calls:
+                self.value += n
+                results.append(self.value)
+            return results
+
+    counter = Counter.remote()
+    loop = asyncio.get_event_loop()
+    assert loop.run_until_complete(async_api.get(
+        counter.increment.remote(1))) == 1
+    assert loop.run_until_complete(
+        async_api.as_future(counter.increment.remote(1))) == 2
+    object_ids = [counter.increment.remote(1) for _ in range(3)]
+    ready, remaining = loop.run_until_complete(
+        async_api.wait(object_ids, num_returns=3, timeout=10))
+    assert ready == object_ids
+    assert remaining == []
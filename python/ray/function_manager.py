@@ -60,6 +60,9 @@ class FunctionDescriptor(object):
         self._function_name = function_name
         self._function_source_hash = function_source_hash
         self._function_id = self._get_function_id()
+        # The descriptor list is passed to the backend with every task, so
+        # it is built once and reused.
+        self._function_descriptor_list = None
 
     def __repr__(self):
         return ("FunctionDescriptor:" + self._module_name + "." +
@@ -239,21 +242,23 @@ class FunctionDescriptor(object):
         """Return a list of bytes representing the function descriptor.
 
         This function is used to pass this function descriptor to backend.
+        The returned list is cached and must not be modified.
 
         Returns:
             A list of bytes.
         """
+        if self._function_descriptor_list is not None:
+            return self._function_descriptor_list
         descriptor_list = []
-        if self.is_for_driver_task:
-            # Driver task returns an empty list.
-            return descriptor_list
-        else:
+        if not self.is_for_driver_task:
             descriptor_list.append(self.module_name.encode("ascii"))
             descriptor_list.append(self.class_name.encode("ascii"))
             descriptor_list.append(self.function_name.encode("ascii"))
             if len(self._function_source_hash) != 0:
                 descriptor_list.append(self._function_source_hash)
-            return descriptor_list
+        # Driver task returns an empty list.
+        self._function_descriptor_list = descriptor_list
+        return descriptor_list
 
 
 class FunctionActorManager(object):
@@ -513,7 +518,8 @@ class FunctionActorManager(object):
         self._worker.redis_client.rpush("Exports", key)
 
     def export_actor_class(self, Class, actor_method_names,
-                           checkpoint_interval):
+                           checkpoint_interval, max_concurrency,
+                           per_handle_ordering):
         function_descriptor = FunctionDescriptor.from_class(Class)
         # `task_driver_id` shouldn't be NIL, unless:
         # 1) This worker isn't an actor;
@@ -531,6 +537,8 @@ class FunctionActorManager(object):
             "module": Class.__module__,
             "class": pickle.dumps(Class),
             "checkpoint_interval": checkpoint_interval,
+            "max_concurrency": max_concurrency,
+            "per_handle_ordering": int(per_handle_ordering),
             "driver_id": driver_id.id(),
             "actor_method_names": json.dumps(list(actor_method_names))
         }
@@ -580,15 +588,19 @@ class FunctionActorManager(object):
         """
         actor_id_str = self._worker.actor_id
         (driver_id, class_name, module, pickled_class, checkpoint_interval,
+         max_concurrency, per_handle_ordering,
          actor_method_names) = self._worker.redis_client.hmget(
              actor_class_key, [
                  "driver_id", "class_name", "module", "class",
-                 "checkpoint_interval", "actor_method_names"
+                 "checkpoint_interval", "max_concurrency",
+                 "per_handle_ordering", "actor_method_names"
              ])
 
         class_name = decode(class_name)
         module = decode(module)
         checkpoint_interval = int(checkpoint_interval)
+        max_concurrency = int(max_concurrency)
+        per_handle_ordering = bool(int(per_handle_ordering))
         actor_method_names = json.loads(decode(actor_method_names))
 
         # In Python 2, json loads strings as unicode, so convert them back to
@@ -608,6 +620,8 @@ class FunctionActorManager(object):
 
         self._worker.actors[actor_id_str] = TemporaryActor()
         self._worker.actor_checkpoint_interval = checkpoint_interval
+        self._worker.actor_max_concurrency = max_concurrency
+        self._worker.actor_per_handle_ordering = per_handle_ordering
 
         def temporary_actor_method(*xs):
             raise Exception(
@@ -725,7 +739,10 @@ class FunctionActorManager(object):
 
             # Execute the assigned method and save a checkpoint if necessary.
             try:
-                if is_class_method(method):
+                if hasattr(method, "__ray_max_batch_size__"):
+                    method_returns = _execute_batched_method(
+                        method, actor, args)
+                elif is_class_method(method):
                     method_returns = method(*args)
                 else:
                     method_returns = method(actor, *args)
@@ -743,3 +760,31 @@ class FunctionActorManager(object):
                 return method_returns
 
         return actor_method_executor
+
+
+def _execute_batched_method(method, actor, args):
+    """Execute a task that holds a batch of calls of an actor method.
+
+    Args:
+        method: The batched actor method.
+        actor: The actor instance.
+        args: The number of arguments of each call, followed by the
+            arguments of all of the calls.
+
+    Returns:
+        A tuple with the result of each call, or the result itself if the
+            batch holds a single call.
+    """
+    args_list = []
+    position = 1
+    for num_args in args[0]:
+        args_list.append(tuple(args[position:position + num_args]))
+        position += num_args
+    results = method(actor, args_list)
+    if (not isinstance(results, (list, tuple))
+            or len(results) != len(args_list)):
+        raise ValueError("The batched actor method {} must return a list "
+                         "with one result per call.".format(method.__name__))
+    if len(results) == 1:
+        return results[0]
+    return tuple(results)
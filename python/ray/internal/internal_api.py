@@ -20,7 +20,9 @@ def free(object_ids, local_only=False, worker=None):
     This method will not return any value to indicate whether the deletion is
     successful or not. This function is an instruction to object store. If
     the some of the objects are in use, object stores will delete them later
-    when the ref count is down to 0.
+    when the ref count is down to 0. The objects are also removed from the
+    deserialized object cache and the auto put cache of this worker, but
+    not from the caches of other workers.
 
     Args:
         object_ids (List[ObjectID]): List of object IDs to delete.
@@ -42,4 +44,7 @@ def free(object_ids, local_only=False, worker=None):
         if len(object_ids) == 0:
             return
 
+        worker.object_cache.remove(
+            [object_id.id() for object_id in object_ids])
+        worker.auto_put_cache.remove(object_ids)
         worker.raylet_client.free_objects(object_ids, local_only)
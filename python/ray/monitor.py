@@ -120,12 +120,18 @@ class Monitor(object):
                 static_resources[static] = (
                     heartbeat_message.ResourcesTotalCapacity(i))
 
+            resource_demand = {}
+            for i in range(heartbeat_message.ResourceDemandLabelLength()):
+                demand = heartbeat_message.ResourceDemandLabel(i)
+                resource_demand[demand] = (
+                    heartbeat_message.ResourceDemandCapacity(i))
+
             # Update the load metrics for this local scheduler.
             client_id = ray.utils.binary_to_hex(heartbeat_message.ClientId())
             ip = self.local_scheduler_id_to_ip_map.get(client_id)
             if ip:
                 self.load_metrics.update(ip, static_resources,
-                                         dynamic_resources)
+                                         dynamic_resources, resource_demand)
             else:
                 print("Warning: could not find ip for client {} in {}.".format(
                     client_id, self.local_scheduler_id_to_ip_map))
@@ -0,0 +1,115 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import collections
+import threading
+
+
+class ObjectCache(object):
+    """A cache of deserialized object values, keyed by object ID.
+
+    Objects are immutable, so a worker that gets the same object ID many
+    times (e.g., the same model weights passed to thousands of tasks) can
+    reuse the value it deserialized the first time instead of getting the
+    object from the object store and deserializing it again. This matters
+    most for values that cannot be deserialized without copying, such as
+    large dicts and pickled objects.
+
+    The size of an entry is the size of the serialized object in the object
+    store. Values that were deserialized without copying (e.g., numpy arrays)
+    keep their object store buffer alive, so the budget also bounds how much
+    of the object store the cache keeps from being evicted. The least
+    recently used entries are evicted when the budget is exceeded, which
+    releases their buffers.
+
+    Note that every get of a cached object returns the same value, so a value
+    that is modified in place is seen modified by later gets on this worker.
+
+    Attributes:
+        capacity_bytes: The maximum total size of the cached objects. If this
+            is 0, nothing is cached.
+        size_bytes: The total size of the cached objects.
+        num_hits: The number of gets that were served from the cache.
+        num_misses: The number of gets that were not served from the cache.
+    """
+
+    def __init__(self, capacity_bytes=0):
+        """Initialize an ObjectCache.
+
+        Args:
+            capacity_bytes: The maximum total size of the cached objects.
+        """
+        self.capacity_bytes = capacity_bytes
+        self.size_bytes = 0
+        self.num_hits = 0
+        self.num_misses = 0
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self):
+        return self.capacity_bytes > 0
+
+    def get(self, object_id, default=None):
+        """Get the cached value of an object.
+
+        Args:
+            object_id: The binary ID of the object.
+            default: The value to return if the object is not cached.
+
+        Returns:
+            The cached value, or default if the object is not cached.
+        """
+        if not self.enabled:
+            return default
+        with self._lock:
+            entry = self._entries.pop(object_id, None)
+            if entry is None:
+                self.num_misses += 1
+                return default
+            self._entries[object_id] = entry
+            self.num_hits += 1
+            return entry[0]
+
+    def put(self, object_id, value, size):
+        """Cache the value of an object.
+
+        Args:
+            object_id: The binary ID of the object.
+            value: The deserialized value of the object.
+            size: The size of the serialized object in bytes.
+        """
+        if size > self.capacity_bytes:
+            return
+        with self._lock:
+            old_entry = self._entries.pop(object_id, None)
+            if old_entry is not None:
+                self.size_bytes -= old_entry[1]
+            self._entries[object_id] = (value, size)
+            self.size_bytes += size
+            while self.size_bytes > self.capacity_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self.size_bytes -= evicted_size
+
+    def remove(self, object_ids):
+        """Remove objects from the cache.
+
+        Args:
+            object_ids: A list of binary object IDs. IDs of objects that are
+                not cached are ignored.
+        """
+        with self._lock:
+            for object_id in object_ids:
+                entry = self._entries.pop(object_id, None)
+                if entry is not None:
+                    self.size_bytes -= entry[1]
+
+    def clear(self):
+        """Remove all entries from the cache."""
+        with self._lock:
+            self._entries.clear()
+            self.size_bytes = 0
+
+    def __len__(self):
+        return len(self._entries)
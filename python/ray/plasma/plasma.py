@@ -26,6 +26,9 @@ def start_plasma_store(plasma_store_memory=DEFAULT_PLASMA_STORE_MEMORY,
                        socket_name=None):
     """Start a plasma store process.
 
+    This does not wait for the plasma store to accept connections. Use
+    ray.services.wait_for_socket to wait for it.
+
     Args:
         use_valgrind (bool): True if the plasma store should be started inside
             of valgrind. If this is True, use_profiler must be False.
@@ -91,5 +94,4 @@ def start_plasma_store(plasma_store_memory=DEFAULT_PLASMA_STORE_MEMORY,
         time.sleep(1.0)
     else:
         pid = subprocess.Popen(command, stdout=stdout_file, stderr=stderr_file)
-        time.sleep(0.1)
     return plasma_store_name, pid
@@ -2,24 +2,36 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
+import itertools
 import json
 import time
 import threading
 import traceback
 
 import ray
+import ray.ray_constants as ray_constants
 
 LOG_POINT = 0
 LOG_SPAN_START = 1
 LOG_SPAN_END = 2
 
+# The event type of the profile events that carry per-function task latency
+# histograms. These events are not shown in the timeline.
+TASK_LATENCY_SUMMARY_EVENT = "task_latency_summary"
+
+# The phases of task execution for which latency histograms are kept.
+TASK_PHASES = ["idle", "deserialize_arguments", "execute", "store_outputs"]
+
 
 class _NullLogSpan(object):
     """A log span context manager that does nothing"""
 
-    def __enter__(self):
+    def set_attribute(self, key, value):
         pass
 
+    def __enter__(self):
+        return self
+
     def __exit__(self, type, value, tb):
         pass
 
@@ -55,11 +67,226 @@ def profile(event_type, extra_data=None, worker=None):
             text displayed on the box in the timeline.
 
     Returns:
-        An object that can profile a span of time via a "with" statement.
+        An object that can profile a span of time via a "with" statement. If
+            the span is not sampled, this object does nothing.
     """
     if worker is None:
         worker = ray.worker.global_worker
-    return RayLogSpanRaylet(worker.profiler, event_type, extra_data=extra_data)
+    profiler = worker.profiler
+    if profiler.sample_period > 1 and not profiler.should_sample():
+        return NULL_LOG_SPAN
+    return RayLogSpanRaylet(profiler, event_type, extra_data=extra_data)
+
+
+class ProfileEventBuffer(object):
+    """A preallocated ring buffer of profile events.
+
+    Event types are interned to small integers, and each event is stored in
+    a slot of parallel preallocated lists, so recording an event does not
+    allocate a dictionary. Appending does not take a lock: each writer claims
+    a slot by drawing the next index from an itertools.count, which is atomic
+    under the GIL, invalidates the slot's sequence number, writes the fields
+    and publishes the slot by writing its index to the sequence list last.
+    The buffer is drained by a single reader at a time, which checks the
+    sequence number again after copying the fields, so an event that was
+    overwritten while it was being read is dropped rather than torn. If
+    writers lap the reader, the oldest events are dropped and counted.
+
+    Attributes:
+        capacity: The number of events that the buffer can hold.
+        num_dropped: The number of events that were overwritten before they
+            were drained.
+    """
+
+    def __init__(self, capacity):
+        if capacity <= 0:
+            raise ValueError("The profile event buffer capacity must be "
+                             "positive, got {}.".format(capacity))
+        self.capacity = capacity
+        self.num_dropped = 0
+        self._event_types = []
+        self._event_type_ids = {}
+        self._intern_lock = threading.Lock()
+        self._counter = itertools.count()
+        self._sequence = [-1] * capacity
+        self._types = [0] * capacity
+        self._start_times = [0.0] * capacity
+        self._end_times = [0.0] * capacity
+        self._extra_data = [None] * capacity
+        self._read_index = 0
+        self._drain_lock = threading.Lock()
+
+    def intern_event_type(self, event_type):
+        """Return the integer ID of an event type, assigning one if needed."""
+        try:
+            return self._event_type_ids[event_type]
+        except KeyError:
+            with self._intern_lock:
+                if event_type not in self._event_type_ids:
+                    self._event_types.append(event_type)
+                    self._event_type_ids[event_type] = (
+                        len(self._event_types) - 1)
+                return self._event_type_ids[event_type]
+
+    def append(self, event_type_id, start_time, end_time, extra_data=None):
+        """Record an event.
+
+        Args:
+            event_type_id: The interned ID of the event type.
+            start_time: The start time of the event in seconds.
+            end_time: The end time of the event in seconds.
+            extra_data: A JSON string of additional information, or None.
+        """
+        index = next(self._counter)
+        slot = index % self.capacity
+        # Invalidate the slot first, so that a reader that is copying the
+        # previous event in this slot notices that it was overwritten.
+        self._sequence[slot] = -1
+        self._types[slot] = event_type_id
+        self._start_times[slot] = start_time
+        self._end_times[slot] = end_time
+        self._extra_data[slot] = extra_data
+        self._sequence[slot] = index
+
+    def drain(self):
+        """Remove and return all of the events published so far.
+
+        Returns:
+            A list of (event_type, start_time, end_time, extra_data) tuples in
+                the order in which the events were recorded.
+        """
+        with self._drain_lock:
+            events = []
+            index = self._read_index
+            while True:
+                slot = index % self.capacity
+                sequence = self._sequence[slot]
+                if sequence < index:
+                    # The slot has not been published yet, or it is being
+                    # written.
+                    break
+                if sequence == index:
+                    event = (self._event_types[self._types[slot]],
+                             self._start_times[slot], self._end_times[slot],
+                             self._extra_data[slot])
+                    # Drop the event if a writer changed the slot while its
+                    # fields were being copied.
+                    sequence = self._sequence[slot]
+                    if sequence == index:
+                        events.append(event)
+                        index += 1
+                        continue
+                # The writers lapped the reader, so every event up to
+                # sequence - capacity has been overwritten.
+                next_index = max(index + 1, sequence - self.capacity + 1)
+                self.num_dropped += next_index - index
+                index = next_index
+            self._read_index = index
+        return events
+
+
+class LatencyHistogram(object):
+    """A histogram of latencies with exponentially sized buckets.
+
+    Bucket 0 counts latencies below one microsecond and bucket i > 0 counts
+    latencies in [2^(i-1), 2^i) microseconds, so percentiles are accurate to
+    within a factor of two while a histogram stays a few dozen integers.
+    Histograms from different workers can be merged by adding their buckets.
+
+    Attributes:
+        count: The number of latencies recorded.
+        total: The sum of the latencies recorded, in seconds.
+        min: The smallest latency recorded, in seconds.
+        max: The largest latency recorded, in seconds.
+        buckets: A dictionary mapping bucket index to the number of latencies
+            in that bucket.
+    """
+
+    NUM_BUCKETS = 48
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.min = float("inf")
+        self.max = 0.0
+        self.buckets = {}
+
+    def record(self, seconds):
+        """Record a latency given in seconds."""
+        bucket = min(int(seconds * 10**6).bit_length(), self.NUM_BUCKETS - 1)
+        self.buckets[bucket] = self.buckets.get(bucket, 0) + 1
+        self.count += 1
+        self.total += seconds
+        if seconds < self.min:
+            self.min = seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def merge(self, other):
+        """Add the latencies recorded in another histogram to this one."""
+        for bucket, count in other.buckets.items():
+            self.buckets[bucket] = self.buckets.get(bucket, 0) + count
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def percentile(self, percent):
+        """Estimate a percentile of the recorded latencies.
+
+        Args:
+            percent: The percentile to compute, between 0 and 100.
+
+        Returns:
+            The upper bound of the bucket containing the percentile, clipped
+                to the range of recorded latencies, in seconds. If no
+                latencies were recorded, this returns None.
+        """
+        if self.count == 0:
+            return None
+        threshold = self.count * percent / 100.0
+        seen = 0
+        for bucket in sorted(self.buckets):
+            seen += self.buckets[bucket]
+            if seen >= threshold:
+                break
+        upper_bound = 2**bucket / float(10**6)
+        return min(max(upper_bound, self.min), self.max)
+
+    def summary(self):
+        """Return a dictionary of summary statistics in seconds."""
+        return {
+            "count": self.count,
+            "mean": self.total / self.count if self.count else None,
+            "min": self.min if self.count else None,
+            "max": self.max if self.count else None,
+            "p50": self.percentile(50),
+            "p90": self.percentile(90),
+            "p99": self.percentile(99),
+        }
+
+    def to_dict(self):
+        """Return a JSON serializable representation of the histogram."""
+        return {
+            "count": self.count,
+            "total": self.total,
+            "min": self.min,
+            "max": self.max,
+            # JSON objects only allow string keys.
+            "buckets": {str(k): v
+                        for k, v in self.buckets.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """Create a histogram from the output of to_dict."""
+        histogram = cls()
+        histogram.count = data["count"]
+        histogram.total = data["total"]
+        histogram.min = data["min"]
+        histogram.max = data["max"]
+        histogram.buckets = {int(k): v for k, v in data["buckets"].items()}
+        return histogram
 
 
 class Profiler(object):
@@ -67,14 +294,50 @@ class Profiler(object):
 
     Attributes:
         worker: the worker to profile.
-        events: the buffer of events.
-        lock: the lock to protect access of events.
+        events: the ring buffer of events.
+        sample_period: only one out of every sample_period spans is recorded.
+        task_latencies: a dictionary mapping function name to a dictionary
+            mapping task phase to the LatencyHistogram of the tasks executed
+            since the last flush.
     """
 
-    def __init__(self, worker):
+    def __init__(self,
+                 worker,
+                 buffer_size=ray_constants.PROFILE_EVENT_BUFFER_SIZE,
+                 sample_period=ray_constants.PROFILE_SAMPLE_PERIOD):
+        if sample_period < 1:
+            raise ValueError("The profiling sample period must be at least "
+                             "1, got {}.".format(sample_period))
         self.worker = worker
-        self.events = []
-        self.lock = threading.Lock()
+        self.events = ProfileEventBuffer(buffer_size)
+        self.sample_period = sample_period
+        self._sample_counter = itertools.count()
+        self.task_latencies = {}
+        self._task_latencies_lock = threading.Lock()
+
+    def record_task_latency(self, function_name, phase, seconds):
+        """Record the latency of one phase of executing a task.
+
+        Unlike profile spans, task latencies are never sampled. They are
+        aggregated into histograms and pushed with the profile events.
+
+        Args:
+            function_name: The name of the function that the task executed.
+            phase: One of TASK_PHASES.
+            seconds: The duration of the phase in seconds.
+        """
+        with self._task_latencies_lock:
+            phases = self.task_latencies.get(function_name)
+            if phases is None:
+                phases = self.task_latencies[function_name] = {}
+            histogram = phases.get(phase)
+            if histogram is None:
+                histogram = phases[phase] = LatencyHistogram()
+            histogram.record(seconds)
+
+    def should_sample(self):
+        """Return True if the next span should be recorded."""
+        return next(self._sample_counter) % self.sample_period == 0
 
     def start_flush_thread(self):
         t = threading.Thread(
@@ -110,9 +373,31 @@ class Profiler(object):
         aalternative, we could start thread in the background on workers that
         calls this automatically.
         """
-        with self.lock:
-            events = self.events
-            self.events = []
+        events = [{
+            "event_type": event_type,
+            "start_time": start_time,
+            "end_time": end_time,
+            "extra_data": extra_data if extra_data is not None else "{}",
+        } for event_type, start_time, end_time, extra_data in
+                  self.events.drain()]
+
+        with self._task_latencies_lock:
+            task_latencies = self.task_latencies
+            self.task_latencies = {}
+        if task_latencies:
+            now = time.time()
+            events.append({
+                "event_type": TASK_LATENCY_SUMMARY_EVENT,
+                "start_time": now,
+                "end_time": now,
+                "extra_data": json.dumps({
+                    function_name: {
+                        phase: histogram.to_dict()
+                        for phase, histogram in phases.items()
+                    }
+                    for function_name, phases in task_latencies.items()
+                }),
+            })
 
         if self.worker.mode == ray.WORKER_MODE:
             component_type = "worker"
@@ -124,8 +409,15 @@ class Profiler(object):
             self.worker.node_ip_address, events)
 
     def add_event(self, event):
-        with self.lock:
-            self.events.append(event)
+        """Record an event given as a dictionary.
+
+        Args:
+            event: A dictionary with the keys "event_type", "start_time",
+                "end_time" and optionally "extra_data".
+        """
+        self.events.append(
+            self.events.intern_event_type(event["event_type"]),
+            event["start_time"], event["end_time"], event.get("extra_data"))
 
 
 class RayLogSpanRaylet(object):
@@ -133,14 +425,24 @@ class RayLogSpanRaylet(object):
 
     Attributes:
         event_type (str): The type of the event being logged.
-        contents: Additional information to log.
+        extra_data: Additional information to log, or None.
     """
 
+    __slots__ = ("profiler", "event_type", "event_type_id", "extra_data",
+                 "start_time")
+
     def __init__(self, profiler, event_type, extra_data=None):
         """Initialize a RayLogSpanRaylet object."""
         self.profiler = profiler
         self.event_type = event_type
-        self.extra_data = extra_data if extra_data is not None else {}
+        self.event_type_id = profiler.events.intern_event_type(event_type)
+        if extra_data is not None:
+            for key, value in extra_data.items():
+                if not isinstance(key, str) or not isinstance(value, str):
+                    raise ValueError("The extra_data argument must be a "
+                                     "dictionary mapping strings to strings. "
+                                     "Instead it is {}.".format(extra_data))
+        self.extra_data = extra_data
 
     def set_attribute(self, key, value):
         """Add a key-value pair to the extra_data dict.
@@ -156,6 +458,8 @@ class RayLogSpanRaylet(object):
             raise ValueError("The arguments 'key' and 'value' must both be "
                              "strings. Instead they are {} and {}.".format(
                                  key, value))
+        if self.extra_data is None:
+            self.extra_data = {}
         self.extra_data[key] = value
 
     def __enter__(self):
@@ -171,26 +475,17 @@ class RayLogSpanRaylet(object):
 
     def __exit__(self, type, value, tb):
         """Log the end of a span event. Log any exception that occurred."""
-        for key, value in self.extra_data.items():
-            if not isinstance(key, str) or not isinstance(value, str):
-                raise ValueError("The extra_data argument must be a "
-                                 "dictionary mapping strings to strings. "
-                                 "Instead it is {}.".format(self.extra_data))
-
+        end_time = time.time()
         if type is not None:
             extra_data = json.dumps({
                 "type": str(type),
                 "value": str(value),
                 "traceback": str(traceback.format_exc()),
             })
-        else:
+        elif self.extra_data:
             extra_data = json.dumps(self.extra_data)
+        else:
+            extra_data = None
 
-        event = {
-            "event_type": self.event_type,
-            "start_time": self.start_time,
-            "end_time": time.time(),
-            "extra_data": extra_data,
-        }
-
-        self.profiler.add_event(event)
+        self.profiler.events.append(self.event_type_id, self.start_time,
+                                    end_time, extra_data)
@@ -29,6 +29,11 @@ DEFAULT_REDIS_MAX_MEMORY_BYTES = 10**10
 # The smallest cap on the memory used by Redis that we allow.
 REDIS_MINIMUM_MEMORY_BYTES = 10**7
 
+# The plasma metadata of objects that the object manager never compresses
+# when it sends them to other nodes. This must match kNoCompressionMetadata
+# in src/ray/object_manager/chunk_compression.h.
+OBJECT_METADATA_NO_COMPRESSION = b"RAY_NO_COMPRESSION"
+
 # If a remote function or actor (or some other export) has serialized size
 # greater than this quantity, print an warning.
 PICKLE_OBJECT_WARNING_SIZE = 10**7
@@ -82,6 +87,49 @@ AUTOSCALER_HEARTBEAT_TIMEOUT_S = env_integer("AUTOSCALER_HEARTBEAT_TIMEOUT_S",
 # Max number of retries to AWS (default is 5, time increases exponentially)
 BOTO_MAX_RETRIES = env_integer("BOTO_MAX_RETRIES", 12)
 
+# The number of profile events that each worker buffers between flushes to
+# the GCS. If more events are recorded than this between two flushes, the
+# oldest events are dropped.
+PROFILE_EVENT_BUFFER_SIZE = env_integer("RAY_PROFILE_EVENT_BUFFER_SIZE",
+                                        100000)
+
+# Only one out of every this many profile spans is recorded. Setting this
+# above 1 reduces the overhead of profiling in production.
+PROFILE_SAMPLE_PERIOD = env_integer("RAY_PROFILE_SAMPLE_PERIOD", 1)
+
+# The max number of milliseconds that the calls of a batched actor method
+# are held back before they are submitted, even if the batch is not full.
+ACTOR_BATCH_MAX_HOLD_MS = env_integer("RAY_ACTOR_BATCH_MAX_HOLD_MS", 10)
+
+# How task arguments that are passed by value are deduplicated when they are
+# put in the object store. One of "off", "identity" (the same object passed
+# to several tasks is put once) and "content" (equal values are put once).
+AUTO_PUT_CACHE_MODE = os.environ.get("RAY_AUTO_PUT_CACHE_MODE", "off")
+
+# The max number of object IDs of task arguments to remember for
+# deduplication.
+AUTO_PUT_CACHE_SIZE = env_integer("RAY_AUTO_PUT_CACHE_SIZE", 1000)
+
+# The max total size in bytes of the deserialized objects that each worker
+# caches, so that getting the same object ID again does not deserialize it
+# again. 0 disables the cache.
+OBJECT_CACHE_SIZE_BYTES = env_integer("RAY_OBJECT_CACHE_SIZE_BYTES", 0)
+
+# A comma-separated list of modules that workers import when they start,
+# before they register with the raylet. Together with the raylet config
+# "min_idle_workers", this keeps a pool of workers that are ready to run
+# tasks that use these modules.
+WORKER_PRELOAD_MODULES = [
+    module
+    for module in os.environ.get("RAY_WORKER_PRELOAD_MODULES", "").split(",")
+    if module
+]
+
+# The max number of seconds to wait for a process started by ray.init() to
+# accept connections.
+PROCESS_STARTUP_TIMEOUT_SECONDS = env_integer(
+    "RAY_PROCESS_STARTUP_TIMEOUT_SECONDS", 60)
+
 # Default logger format: only contains the message.
 LOGGER_FORMAT = "%(message)s"
 LOGGER_FORMAT_HELP = "The logging format. default='%(message)s'"
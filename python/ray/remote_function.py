@@ -36,6 +36,9 @@ class RemoteFunction(object):
         _max_calls: The number of times a worker can execute this function
             before executing.
         _function_signature: The function signature.
+        _default_resources: The resource requirements of invocations that
+            don't override the default resources. This is computed on the
+            first such invocation.
     """
 
     def __init__(self, function, num_cpus, num_gpus, resources,
@@ -56,6 +59,7 @@ class RemoteFunction(object):
         ray.signature.check_signature_supported(self._function)
         self._function_signature = ray.signature.extract_signature(
             self._function)
+        self._default_resources = None
 
         # # Export the function.
         worker = ray.worker.get_global_worker()
@@ -104,9 +108,7 @@ class RemoteFunction(object):
         if num_return_vals is None:
             num_return_vals = self._num_return_vals
 
-        resources = ray.utils.resources_from_resource_arguments(
-            self._num_cpus, self._num_gpus, self._resources, num_cpus,
-            num_gpus, resources)
+        resources = self._get_resources(num_cpus, num_gpus, resources)
         if worker.mode == ray.worker.LOCAL_MODE:
             # In LOCAL_MODE, remote calls simply execute the function.
             # We copy the arguments to prevent the function call from
@@ -123,3 +125,72 @@ class RemoteFunction(object):
             return object_ids[0]
         elif len(object_ids) > 1:
             return object_ids
+
+    def map(self,
+            args_list,
+            num_return_vals=None,
+            num_cpus=None,
+            num_gpus=None,
+            resources=None):
+        """Submit a task for each of the given arguments.
+
+        The tasks are submitted in a single message to the local scheduler,
+        which is much faster than calling remote() for each of them. Argument
+        values that are shared by several tasks and need to be put in the
+        object store are only put once.
+
+        Examples:
+            >>> object_ids = f.map([(1, ), (2, ), (3, )])
+            >>> ray.get(object_ids)
+
+        Args:
+            args_list: An iterable of argument tuples. Each tuple holds the
+                positional arguments of one task.
+            num_return_vals: The number of return values of each task.
+            num_cpus: The number of CPUs each task requires.
+            num_gpus: The number of GPUs each task requires.
+            resources: The custom resources each task requires.
+
+        Returns:
+            A list with the result that remote() would return for each task.
+        """
+        worker = ray.worker.get_global_worker()
+        worker.check_connected()
+        args_list = [
+            ray.signature.extend_args(self._function_signature, args, {})
+            for args in args_list
+        ]
+
+        if num_return_vals is None:
+            num_return_vals = self._num_return_vals
+
+        resources = self._get_resources(num_cpus, num_gpus, resources)
+        if worker.mode == ray.worker.LOCAL_MODE:
+            # In LOCAL_MODE, remote calls simply execute the function.
+            return [self._function(*copy.deepcopy(args)) for args in args_list]
+        results = []
+        for object_ids in worker.submit_tasks(
+                self._function_descriptor,
+                args_list,
+                num_return_vals=num_return_vals,
+                resources=resources):
+            if len(object_ids) == 1:
+                results.append(object_ids[0])
+            elif len(object_ids) > 1:
+                results.append(object_ids)
+            else:
+                results.append(None)
+        return results
+
+    def _get_resources(self, num_cpus, num_gpus, resources):
+        """Get the resource requirements of an invocation."""
+        if num_cpus is None and num_gpus is None and resources is None:
+            if self._default_resources is None:
+                self._default_resources = (
+                    ray.utils.resources_from_resource_arguments(
+                        self._num_cpus, self._num_gpus, self._resources, None,
+                        None, None))
+            return self._default_resources
+        return ray.utils.resources_from_resource_arguments(
+            self._num_cpus, self._num_gpus, self._resources, num_cpus,
+            num_gpus, resources)
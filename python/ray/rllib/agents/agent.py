@@ -13,7 +13,10 @@ import tensorflow as tf
 from types import FunctionType
 
 import ray
-from ray.rllib.offline import NoopOutput, JsonReader, MixedInput, JsonWriter
+from ray.rllib.offline import NoopOutput, MixedInput, JsonWriter, \
+    ColumnarWriter
+from ray.rllib.offline.prefetching_reader import PrefetchingReader, \
+    create_file_reader
 from ray.rllib.models import MODEL_DEFAULTS
 from ray.rllib.evaluation.policy_evaluator import PolicyEvaluator
 from ray.rllib.evaluation.sample_batch import DEFAULT_POLICY_ID
@@ -134,7 +137,8 @@ COMMON_CONFIG = {
     # __sphinx_doc_input_begin__
     # Specify how to generate experiences:
     #  - "sampler": generate experiences via online simulation (default)
-    #  - a local directory or file glob expression (e.g., "/tmp/*.json")
+    #  - a local directory or file glob expression (e.g., "/tmp/*.json").
+    #    Files with the ".columnar" extension are read as columnar files.
     #  - a list of individual file paths/URIs (e.g., ["/tmp/1.json",
     #    "s3://bucket/2.json"])
     #  - a dict with string keys and sampling probabilities as values (e.g.,
@@ -153,6 +157,15 @@ COMMON_CONFIG = {
     # policy, not the *behaviour* policy, which is typically undesirable for
     # on-policy algorithms.
     "postprocess_inputs": False,
+    # Which sample batch columns to read from columnar input files. Other
+    # columns are skipped without being read. None reads all columns.
+    "input_columns": None,
+    # Number of background threads that read and parse offline input files,
+    # each from a different file. Batches from the open files are shuffled
+    # together. Set to 0 to read files synchronously in the sampling thread.
+    "input_reader_threads": 2,
+    # Max number of parsed input batches to buffer ahead of use.
+    "input_max_ready_batches": 16,
     # __sphinx_doc_input_end__
     # __sphinx_doc_output_begin__
     # Specify where experiences should be saved:
@@ -161,7 +174,12 @@ COMMON_CONFIG = {
     #  - a path/URI to save to a custom output directory (e.g., "s3://bucket/")
     #  - a function that returns a rllib.offline.OutputWriter
     "output": None,
-    # What sample batch columns to LZ4 compress in the output data.
+    # Format of the output files:
+    #  - "json": one JSON record per sample batch (default)
+    #  - "columnar": binary columnar records that are memory-mapped on read
+    "output_format": "json",
+    # What sample batch columns to LZ4 compress in the output data. This only
+    # applies to the "json" output format.
     "output_compress_columns": ["obs", "new_obs"],
     # Max output file size before rolling over to a new file.
     "output_max_file_size": 64 * 1024 * 1024,
@@ -323,6 +341,10 @@ class Agent(Trainable):
                 ev.__ray_terminate__.remote()
         if hasattr(self, "optimizer"):
             self.optimizer.stop()
+        if hasattr(self, "local_evaluator"):
+            input_reader = self.local_evaluator.input_reader
+            if isinstance(input_reader, (PrefetchingReader, MixedInput)):
+                input_reader.close()
 
     @override(Trainable)
     def _save(self, checkpoint_dir):
@@ -511,6 +533,10 @@ class Agent(Trainable):
                 and config["input_evaluation"] is not None):
             raise ValueError(
                 "`input_evaluation` should not be set when input=sampler")
+        if config["output_format"] not in ["json", "columnar"]:
+            raise ValueError(
+                "`output_format` must be one of ['json', 'columnar'], got "
+                "{}".format(config["output_format"]))
 
     def _make_evaluator(self, cls, env_creator, policy_graph, worker_index,
                         config):
@@ -527,12 +553,19 @@ class Agent(Trainable):
         elif isinstance(config["input"], dict):
             input_creator = (lambda ioctx: MixedInput(config["input"], ioctx))
         else:
-            input_creator = (lambda ioctx: JsonReader(config["input"], ioctx))
+            input_creator = (
+                lambda ioctx: create_file_reader(config["input"], ioctx))
 
         if isinstance(config["output"], FunctionType):
             output_creator = config["output"]
         elif config["output"] is None:
             output_creator = (lambda ioctx: NoopOutput())
+        elif config["output_format"] == "columnar":
+            output_creator = (lambda ioctx: ColumnarWriter(
+                ioctx.log_dir
+                if config["output"] == "logdir" else config["output"],
+                ioctx,
+                max_file_size=config["output_max_file_size"]))
         elif config["output"] == "logdir":
             output_creator = (lambda ioctx: JsonWriter(
                 ioctx.log_dir,
@@ -5,16 +5,22 @@ from __future__ import print_function
 from ray.rllib.offline.io_context import IOContext
 from ray.rllib.offline.json_reader import JsonReader
 from ray.rllib.offline.json_writer import JsonWriter
+from ray.rllib.offline.columnar_reader import ColumnarReader
+from ray.rllib.offline.columnar_writer import ColumnarWriter
 from ray.rllib.offline.output_writer import OutputWriter, NoopOutput
 from ray.rllib.offline.input_reader import InputReader
 from ray.rllib.offline.mixed_input import MixedInput
+from ray.rllib.offline.prefetching_reader import PrefetchingReader
 
 __all__ = [
     "IOContext",
     "JsonReader",
     "JsonWriter",
+    "ColumnarReader",
+    "ColumnarWriter",
     "NoopOutput",
     "OutputWriter",
     "InputReader",
     "MixedInput",
+    "PrefetchingReader",
 ]
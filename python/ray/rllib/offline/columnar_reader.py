@@ -0,0 +1,172 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import glob
+import json
+import logging
+import numpy as np
+import os
+import pickle
+import six
+import struct
+from six.moves.urllib.parse import urlparse
+
+from ray.rllib.offline.columnar_writer import MAGIC, PICKLE_DTYPE, \
+    HEADER_LENGTH_FORMAT, HEADER_LENGTH_SIZE, align
+from ray.rllib.offline.file_reader import FileReader
+from ray.rllib.evaluation.sample_batch import MultiAgentBatch, SampleBatch
+from ray.rllib.utils.annotations import override
+
+logger = logging.getLogger(__name__)
+
+COLUMNAR_FILE_EXTENSION = ".columnar"
+
+
+def is_columnar_input(inputs):
+    """Return whether the given input paths refer to columnar files.
+
+    Arguments:
+        inputs (str|list): a directory, a glob expression for files, or a list
+            of single file paths or URIs.
+    """
+    if isinstance(inputs, six.string_types):
+        if os.path.isdir(inputs):
+            return bool(
+                glob.glob(os.path.join(inputs, "*" + COLUMNAR_FILE_EXTENSION)))
+        return inputs.endswith(COLUMNAR_FILE_EXTENSION)
+    elif type(inputs) is list:
+        return bool(inputs) and all(
+            path.endswith(COLUMNAR_FILE_EXTENSION) for path in inputs)
+    return False
+
+
+class ColumnarReader(FileReader):
+    """Reader object that loads experiences from columnar files.
+
+    Local files are memory-mapped and the columns of each batch are returned
+    as views into the mapping, so reading a batch does not parse or copy the
+    column data. Only the requested columns are materialized. The mapping is
+    copy-on-write, so the returned arrays can be modified in place without
+    changing the files.
+
+    The input files will be read from in an random order."""
+
+    def __init__(self, inputs, ioctx=None, columns=None):
+        """Initialize a ColumnarReader.
+
+        Arguments:
+            inputs (str|list): either a glob expression for files, e.g.,
+                "/tmp/**/*.columnar", or a list of single file paths or URIs,
+                e.g., ["s3://bucket/file.columnar"].
+            ioctx (IOContext): current IO context object.
+            columns (list): names of the sample batch columns to read. If
+                None, the `input_columns` config is used, and if that is not
+                set either, all columns are read.
+        """
+
+        FileReader.__init__(self, inputs, ioctx, COLUMNAR_FILE_EXTENSION)
+        if columns is None:
+            columns = self.ioctx.config.get("input_columns")
+        self.columns = set(columns) if columns is not None else None
+        self.cur_path = None
+        self.cur_buffer = None
+        self.cur_offset = 0
+
+    @override(FileReader)
+    def _read_next_batch(self):
+        tries = 0
+        while tries < 100:
+            if (self.cur_buffer is None
+                    or self.cur_offset >= len(self.cur_buffer)):
+                self._next_file()
+                if len(self.cur_buffer) <= len(MAGIC):
+                    logger.debug("Ignoring empty file {}".format(
+                        self.cur_path))
+                    tries += 1
+                    continue
+                if bytes(self.cur_buffer[:len(MAGIC)]) != MAGIC:
+                    logger.warning(
+                        "Ignoring {}, which is not a columnar experience "
+                        "file".format(self.cur_path))
+                    self.cur_buffer = None
+                    tries += 1
+                    continue
+            try:
+                batch, self.cur_offset = _read_record(
+                    self.cur_buffer, self.cur_offset, self.columns)
+                return batch
+            except Exception:
+                logger.exception(
+                    "Ignoring corrupt record at offset {} in {}".format(
+                        self.cur_offset, self.cur_path))
+                # Records cannot be located after a corrupt one, so skip the
+                # rest of the file.
+                self.cur_buffer = None
+                tries += 1
+        raise ValueError(
+            "Failed to read valid experience batch from files: {}".format(
+                self.files))
+
+    def _next_file(self):
+        path = self._choose_path()
+        if urlparse(path).scheme:
+            with self._open_uri(path, "rb") as f:
+                buf = np.frombuffer(f.read(), dtype=np.uint8)
+        elif os.path.getsize(path) == 0:
+            buf = np.zeros(0, dtype=np.uint8)
+        else:
+            buf = np.memmap(path, dtype=np.uint8, mode="c")
+        self.cur_path = path
+        self.cur_buffer = buf
+        self.cur_offset = len(MAGIC)
+
+
+def _read_column(buf, data_start, column):
+    start = data_start + column["offset"]
+    data = buf[start:start + column["nbytes"]]
+    if column["dtype"] == PICKLE_DTYPE:
+        return pickle.loads(data.tobytes())
+    return data.view(np.dtype(column["dtype"])).reshape(column["shape"])
+
+
+def _read_record(buf, offset, columns=None):
+    """Read the record at the given offset of a buffer.
+
+    Arguments:
+        buf (np.ndarray): uint8 array holding the file contents.
+        offset (int): offset of the record in the buffer.
+        columns (set): names of the columns to read, or None to read all.
+
+    Returns:
+        The batch read and the offset of the next record.
+    """
+    header_start = offset + HEADER_LENGTH_SIZE
+    header_length, = struct.unpack(HEADER_LENGTH_FORMAT,
+                                   buf[offset:header_start].tobytes())
+    header_end = header_start + header_length
+    header = json.loads(buf[header_start:header_end].tobytes().decode("utf-8"))
+    data_start = align(header_end)
+    next_offset = data_start + header["data_size"]
+    if next_offset > len(buf):
+        raise ValueError("Truncated record")
+
+    policy_data = {}
+    for column in header["columns"]:
+        if columns is not None and column["name"] not in columns:
+            continue
+        data = policy_data.setdefault(column["policy_id"], {})
+        data[column["name"]] = _read_column(buf, data_start, column)
+
+    if header["type"] == "SampleBatch":
+        return SampleBatch(policy_data.get(None, {})), next_offset
+    elif header["type"] == "MultiAgentBatch":
+        policy_batches = {
+            policy_id: SampleBatch(data)
+            for policy_id, data in policy_data.items()
+        }
+        return MultiAgentBatch(policy_batches, header["count"]), next_offset
+    else:
+        raise ValueError(
+            "Type field must be one of ['SampleBatch', 'MultiAgentBatch']",
+            header["type"])
@@ -0,0 +1,174 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+from datetime import datetime
+import json
+import logging
+import numpy as np
+import os
+import pickle
+import struct
+from six.moves.urllib.parse import urlparse
+import time
+
+try:
+    from smart_open import smart_open
+except ImportError:
+    smart_open = None
+
+from ray.rllib.evaluation.sample_batch import MultiAgentBatch
+from ray.rllib.offline.io_context import IOContext
+from ray.rllib.offline.output_writer import OutputWriter
+from ray.rllib.utils.annotations import override
+
+logger = logging.getLogger(__name__)
+
+# Every columnar file starts with these bytes.
+MAGIC = b"RLLIBCOL"
+
+# Column buffers are aligned to this many bytes within a file.
+ALIGNMENT = 64
+
+# The dtype recorded for columns that hold Python objects and are pickled.
+PICKLE_DTYPE = "pickle"
+
+# Format of the header length that precedes each record.
+HEADER_LENGTH_FORMAT = "<Q"
+HEADER_LENGTH_SIZE = struct.calcsize(HEADER_LENGTH_FORMAT)
+
+
+def align(offset):
+    """Round an offset up to the next multiple of ALIGNMENT."""
+    return (offset + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
+
+
+class ColumnarWriter(OutputWriter):
+    """Writer object that saves experiences in binary columnar files.
+
+    Each sample batch is stored as a record consisting of a JSON header that
+    describes its columns, followed by the raw array buffer of each column.
+    Reading a record back only requires memory-mapping the file and creating
+    array views of the needed columns, so no parsing or decompression of the
+    column data is needed. Columns of Python objects are pickled.
+    """
+
+    def __init__(self, path, ioctx=None, max_file_size=64 * 1024 * 1024):
+        """Initialize a ColumnarWriter.
+
+        Arguments:
+            path (str): a path/URI of the output directory to save files in.
+            ioctx (IOContext): current IO context object.
+            max_file_size (int): max size of single files before rolling over.
+        """
+
+        self.path = path
+        self.ioctx = ioctx or IOContext()
+        self.max_file_size = max_file_size
+        if urlparse(path).scheme:
+            self.path_is_uri = True
+        else:
+            # Try to create local dirs if they don't exist
+            try:
+                os.makedirs(path)
+            except OSError:
+                pass  # already exists
+            assert os.path.exists(path), "Failed to create {}".format(path)
+            self.path_is_uri = False
+        self.file_index = 0
+        self.bytes_written = 0
+        self.cur_file = None
+
+    @override(OutputWriter)
+    def write(self, sample_batch):
+        start = time.time()
+        f = self._get_file()
+        size = _write_record(f, sample_batch, self.bytes_written)
+        if hasattr(f, "flush"):
+            f.flush()
+        self.bytes_written += size
+        logger.debug("Wrote {} bytes to {} in {}s".format(
+            size, f,
+            time.time() - start))
+
+    def _get_file(self):
+        if not self.cur_file or self.bytes_written >= self.max_file_size:
+            if self.cur_file:
+                self.cur_file.close()
+            timestr = datetime.today().strftime("%Y-%m-%d_%H-%M-%S")
+            path = os.path.join(
+                self.path, "output-{}_worker-{}_{}.columnar".format(
+                    timestr, self.ioctx.worker_index, self.file_index))
+            if self.path_is_uri:
+                if smart_open is None:
+                    raise ValueError(
+                        "You must install the `smart_open` module to write "
+                        "to URIs like {}".format(path))
+                self.cur_file = smart_open(path, "wb")
+            else:
+                self.cur_file = open(path, "wb")
+            self.cur_file.write(MAGIC)
+            self.file_index += 1
+            self.bytes_written = len(MAGIC)
+            logger.info("Writing to new output file {}".format(self.cur_file))
+        return self.cur_file
+
+
+def _column_buffer(value):
+    """Return the dtype string, shape, buffer and size in bytes of a column."""
+    value = np.asarray(value)
+    if value.dtype.hasobject:
+        buf = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        return PICKLE_DTYPE, None, buf, len(buf)
+    value = np.ascontiguousarray(value)
+    return value.dtype.str, list(value.shape), value.reshape(-1).view(
+        np.uint8), value.nbytes
+
+
+def _write_record(f, batch, position):
+    """Write a sample batch as a record at the given position of a file.
+
+    Returns:
+        The number of bytes written.
+    """
+    if isinstance(batch, MultiAgentBatch):
+        header = {"type": "MultiAgentBatch", "count": batch.count}
+        columns = [(policy_id, k, v)
+                   for policy_id, sub_batch in batch.policy_batches.items()
+                   for k, v in sub_batch.data.items()]
+    else:
+        header = {"type": "SampleBatch", "count": batch.count}
+        columns = [(None, k, v) for k, v in batch.data.items()]
+
+    buffers = []
+    column_headers = []
+    data_size = 0
+    for policy_id, name, value in columns:
+        dtype, shape, buf, nbytes = _column_buffer(value)
+        offset = align(data_size)
+        column_headers.append({
+            "policy_id": policy_id,
+            "name": name,
+            "dtype": dtype,
+            "shape": shape,
+            "offset": offset,
+            "nbytes": nbytes,
+        })
+        buffers.append((offset, buf, nbytes))
+        data_size = offset + nbytes
+    header["columns"] = column_headers
+    header["data_size"] = data_size
+    header_bytes = json.dumps(header).encode("utf-8")
+
+    # Column offsets are relative to the aligned start of the data section.
+    header_end = position + HEADER_LENGTH_SIZE + len(header_bytes)
+    data_start = align(header_end)
+    f.write(struct.pack(HEADER_LENGTH_FORMAT, len(header_bytes)))
+    f.write(header_bytes)
+    f.write(b"\0" * (data_start - header_end))
+    written = 0
+    for offset, buf, nbytes in buffers:
+        f.write(b"\0" * (offset - written))
+        f.write(buf)
+        written = offset + nbytes
+    return data_start + data_size - position
@@ -0,0 +1,98 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import glob
+import logging
+import os
+import random
+import six
+from six.moves.urllib.parse import urlparse
+
+try:
+    from smart_open import smart_open
+except ImportError:
+    smart_open = None
+
+from ray.rllib.offline.input_reader import InputReader
+from ray.rllib.offline.io_context import IOContext
+from ray.rllib.evaluation.sample_batch import SampleBatch, DEFAULT_POLICY_ID
+from ray.rllib.utils.annotations import override
+
+logger = logging.getLogger(__name__)
+
+
+class FileReader(InputReader):
+    """Base class for readers that load experiences from a set of files.
+
+    Subclasses implement _read_next_batch(), which reads the next batch
+    without postprocessing it."""
+
+    def __init__(self, inputs, ioctx, extension):
+        """Initialize a FileReader.
+
+        Arguments:
+            inputs (str|list): either a glob expression for files, a
+                directory, or a list of single file paths or URIs.
+            ioctx (IOContext): current IO context object.
+            extension (str): extension of the files to read from a directory.
+        """
+
+        self.ioctx = ioctx or IOContext()
+        if isinstance(inputs, six.string_types):
+            if os.path.isdir(inputs):
+                inputs = os.path.join(inputs, "*" + extension)
+                logger.warning(
+                    "Treating input directory as glob pattern: {}".format(
+                        inputs))
+            if urlparse(inputs).scheme:
+                raise ValueError(
+                    "Don't know how to glob over `{}`, ".format(inputs) +
+                    "please specify a list of files to read instead.")
+            else:
+                self.files = glob.glob(inputs)
+        elif type(inputs) is list:
+            self.files = inputs
+        else:
+            raise ValueError(
+                "type of inputs must be list or str, not {}".format(inputs))
+        if self.files:
+            logger.info("Found {} input files.".format(len(self.files)))
+        else:
+            raise ValueError("No files found matching {}".format(inputs))
+
+    @override(InputReader)
+    def next(self):
+        return self._postprocess_if_needed(self._read_next_batch())
+
+    def _read_next_batch(self):
+        """Read the next batch without postprocessing it."""
+        raise NotImplementedError
+
+    def _postprocess_if_needed(self, batch):
+        if not self.ioctx.config.get("postprocess_inputs"):
+            return batch
+
+        if isinstance(batch, SampleBatch):
+            out = []
+            for sub_batch in batch.split_by_episode():
+                out.append(self.ioctx.evaluator.policy_map[DEFAULT_POLICY_ID]
+                           .postprocess_trajectory(sub_batch))
+            return SampleBatch.concat_samples(out)
+        else:
+            # TODO(ekl) this is trickier since the alignments between agent
+            # trajectories in the episode are not available any more.
+            raise NotImplementedError(
+                "Postprocessing of multi-agent data not implemented yet.")
+
+    def _choose_path(self):
+        """Return a random input file path."""
+        return random.choice(self.files)
+
+    def _open_uri(self, path, mode):
+        """Open a remote file, e.g., on S3."""
+        if smart_open is None:
+            raise ValueError(
+                "You must install the `smart_open` module to read "
+                "from URIs like {}".format(path))
+        return smart_open(path, mode)
@@ -2,30 +2,19 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
-import glob
 import json
 import logging
-import os
-import random
-import six
 from six.moves.urllib.parse import urlparse
 
-try:
-    from smart_open import smart_open
-except ImportError:
-    smart_open = None
-
-from ray.rllib.offline.input_reader import InputReader
-from ray.rllib.offline.io_context import IOContext
-from ray.rllib.evaluation.sample_batch import MultiAgentBatch, SampleBatch, \
-    DEFAULT_POLICY_ID
+from ray.rllib.offline.file_reader import FileReader
+from ray.rllib.evaluation.sample_batch import MultiAgentBatch, SampleBatch
 from ray.rllib.utils.annotations import override
 from ray.rllib.utils.compression import unpack_if_needed
 
 logger = logging.getLogger(__name__)
 
 
-class JsonReader(InputReader):
+class JsonReader(FileReader):
     """Reader object that loads experiences from JSON file chunks.
 
     The input files will be read from in an random order."""
@@ -40,32 +29,11 @@ class JsonReader(InputReader):
             ioctx (IOContext): current IO context object.
         """
 
-        self.ioctx = ioctx or IOContext()
-        if isinstance(inputs, six.string_types):
-            if os.path.isdir(inputs):
-                inputs = os.path.join(inputs, "*.json")
-                logger.warning(
-                    "Treating input directory as glob pattern: {}".format(
-                        inputs))
-            if urlparse(inputs).scheme:
-                raise ValueError(
-                    "Don't know how to glob over `{}`, ".format(inputs) +
-                    "please specify a list of files to read instead.")
-            else:
-                self.files = glob.glob(inputs)
-        elif type(inputs) is list:
-            self.files = inputs
-        else:
-            raise ValueError(
-                "type of inputs must be list or str, not {}".format(inputs))
-        if self.files:
-            logger.info("Found {} input files.".format(len(self.files)))
-        else:
-            raise ValueError("No files found matching {}".format(inputs))
+        FileReader.__init__(self, inputs, ioctx, ".json")
         self.cur_file = None
 
-    @override(InputReader)
-    def next(self):
+    @override(FileReader)
+    def _read_next_batch(self):
         batch = self._try_parse(self._next_line())
         tries = 0
         while not batch and tries < 100:
@@ -76,23 +44,7 @@ class JsonReader(InputReader):
             raise ValueError(
                 "Failed to read valid experience batch from file: {}".format(
                     self.cur_file))
-        return self._postprocess_if_needed(batch)
-
-    def _postprocess_if_needed(self, batch):
-        if not self.ioctx.config.get("postprocess_inputs"):
-            return batch
-
-        if isinstance(batch, SampleBatch):
-            out = []
-            for sub_batch in batch.split_by_episode():
-                out.append(self.ioctx.evaluator.policy_map[DEFAULT_POLICY_ID]
-                           .postprocess_trajectory(sub_batch))
-            return SampleBatch.concat_samples(out)
-        else:
-            # TODO(ekl) this is trickier since the alignments between agent
-            # trajectories in the episode are not available any more.
-            raise NotImplementedError(
-                "Postprocessing of multi-agent data not implemented yet.")
+        return batch
 
     def _try_parse(self, line):
         line = line.strip()
@@ -124,13 +76,9 @@ class JsonReader(InputReader):
         return line
 
     def _next_file(self):
-        path = random.choice(self.files)
+        path = self._choose_path()
         if urlparse(path).scheme:
-            if smart_open is None:
-                raise ValueError(
-                    "You must install the `smart_open` module to read "
-                    "from URIs like {}".format(path))
-            return smart_open(path, "r")
+            return self._open_uri(path, "r")
         else:
             return open(path, "r")
 
@@ -5,7 +5,8 @@ from __future__ import print_function
 import numpy as np
 
 from ray.rllib.offline.input_reader import InputReader
-from ray.rllib.offline.json_reader import JsonReader
+from ray.rllib.offline.prefetching_reader import PrefetchingReader, \
+    create_file_reader
 from ray.rllib.utils.annotations import override
 
 
@@ -24,8 +25,8 @@ class MixedInput(InputReader):
         """Initialize a MixedInput.
 
         Arguments:
-            dist (dict): dict mapping JSONReader paths or "sampler" to
-                probabilities. The probabilities must sum to 1.0.
+            dist (dict): dict mapping JSONReader or ColumnarReader paths or
+                "sampler" to probabilities. The probabilities must sum to 1.0.
             ioctx (IOContext): current IO context object.
         """
         if sum(dist.values()) != 1.0:
@@ -36,10 +37,16 @@ class MixedInput(InputReader):
             if k == "sampler":
                 self.choices.append(ioctx.default_sampler_input())
             else:
-                self.choices.append(JsonReader(k))
+                self.choices.append(create_file_reader(k, ioctx))
             self.p.append(v)
 
     @override(InputReader)
     def next(self):
         source = np.random.choice(self.choices, p=self.p)
         return source.next()
+
+    def close(self):
+        """Stop the reader threads of the file sources."""
+        for source in self.choices:
+            if isinstance(source, PrefetchingReader):
+                source.close()
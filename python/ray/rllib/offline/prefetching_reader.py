@@ -0,0 +1,146 @@
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import logging
+import random
+import threading
+
+from ray.rllib.offline.columnar_reader import ColumnarReader, \
+    is_columnar_input
+from ray.rllib.offline.input_reader import InputReader
+from ray.rllib.offline.json_reader import JsonReader
+from ray.rllib.utils.annotations import override
+
+logger = logging.getLogger(__name__)
+
+
+def create_file_reader(inputs, ioctx):
+    """Create a reader for offline input files.
+
+    Columnar files are read with a ColumnarReader and all other files with a
+    JsonReader. If the `input_reader_threads` config is positive, the reader
+    is wrapped in a PrefetchingReader.
+
+    Arguments:
+        inputs (str|list): either a directory, a glob expression for files,
+            or a list of single file paths or URIs.
+        ioctx (IOContext): current IO context object.
+    """
+    if is_columnar_input(inputs):
+        reader_cls = ColumnarReader
+    else:
+        reader_cls = JsonReader
+    num_threads = ioctx.config.get("input_reader_threads", 0)
+    if num_threads > 0:
+        return PrefetchingReader(
+            lambda: reader_cls(inputs, ioctx),
+            num_threads=num_threads,
+            max_ready_batches=ioctx.config.get("input_max_ready_batches", 16))
+    return reader_cls(inputs, ioctx)
+
+
+class PrefetchingReader(InputReader):
+    """Reads and parses input batches on background threads.
+
+    Each thread owns a separate file reader, so several files are open at
+    once. Parsed batches are put in a bounded buffer, and each call to next()
+    returns a random one of the ready batches, which shuffles the batches of
+    the open files together. Postprocessing of the batches still happens in
+    the calling thread, since it uses the policy.
+
+    Call close() to stop the threads when the reader is no longer needed.
+
+    Examples:
+        >>> reader = PrefetchingReader(
+        ...     lambda: JsonReader("/tmp/*.json", ioctx), num_threads=4)
+        >>> batch = reader.next()
+        >>> reader.close()
+    """
+
+    def __init__(self, reader_creator, num_threads=2, max_ready_batches=16):
+        """Initialize a PrefetchingReader.
+
+        Arguments:
+            reader_creator (func): function that returns a new JsonReader or
+                ColumnarReader. It is called once per thread.
+            num_threads (int): number of background reader threads.
+            max_ready_batches (int): max number of parsed batches to hold
+                before the reader threads block.
+        """
+        if num_threads < 1:
+            raise ValueError(
+                "num_threads must be positive, got {}".format(num_threads))
+        if max_ready_batches < 1:
+            raise ValueError(
+                "max_ready_batches must be positive, got {}".format(
+                    max_ready_batches))
+        self.readers = [reader_creator() for _ in range(num_threads)]
+        self.max_ready_batches = max_ready_batches
+        # The parsed batches that are ready to be returned. Both the reader
+        # threads and next() access it while holding self.cond.
+        self.ready = []
+        self.errors = []
+        self.cond = threading.Condition()
+        self.closed = False
+        self.threads = None
+
+    @override(InputReader)
+    def next(self):
+        if self.threads is None:
+            self._start_threads()
+        with self.cond:
+            while not self.ready and not self.errors and not self.closed:
+                self.cond.wait()
+            if self.errors:
+                raise self.errors[0]
+            if self.closed:
+                raise ValueError("The reader was closed.")
+            i = random.randrange(len(self.ready))
+            self.ready[i], self.ready[-1] = self.ready[-1], self.ready[i]
+            batch = self.ready.pop()
+            self.cond.notify_all()
+        # All readers share the same IO context, so any of them can
+        # postprocess the batch.
+        return self.readers[0]._postprocess_if_needed(batch)
+
+    def close(self):
+        """Stop the reader threads and drop the ready batches."""
+        with self.cond:
+            self.closed = True
+            self.ready = []
+            self.cond.notify_all()
+        for thread in self.threads or []:
+            thread.join()
+
+    def _start_threads(self):
+        self.threads = []
+        for i, reader in enumerate(self.readers):
+            thread = threading.Thread(
+                target=self._read_loop,
+                args=(reader, ),
+                name="rllib_input_reader_{}".format(i))
+            # Making the thread a daemon causes it to exit when the main
+            # thread exits.
+            thread.daemon = True
+            thread.start()
+            self.threads.append(thread)
+
+    def _read_loop(self, reader):
+        while not self.closed:
+            try:
+                batch = reader._read_next_batch()
+            except Exception as e:
+                logger.exception("Error reading input batches")
+                with self.cond:
+                    self.errors.append(e)
+                    self.cond.notify_all()
+                return
+            with self.cond:
+                while (len(self.ready) >= self.max_ready_batches
+                       and not self.closed):
+                    self.cond.wait()
+                if self.closed:
+                    return
+                self.ready.append(batch)
+                self.cond.notify_all()
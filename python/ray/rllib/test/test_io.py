@@ -17,7 +17,8 @@ import ray
 from ray.rllib.agents.pg import PGAgent
 from ray.rllib.agents.pg.pg_policy_graph import PGPolicyGraph
 from ray.rllib.evaluation import SampleBatch
-from ray.rllib.offline import IOContext, JsonWriter, JsonReader
+from ray.rllib.offline import IOContext, JsonWriter, JsonReader, \
+    ColumnarWriter, ColumnarReader, MixedInput, PrefetchingReader
 from ray.rllib.offline.json_writer import _to_json
 from ray.rllib.test.test_multi_agent_env import MultiCartpole
 from ray.tune.registry import register_env
@@ -75,6 +76,27 @@ class AgentIOTest(unittest.TestCase):
         self.assertEqual(result["timesteps_total"], 250)  # read from input
         self.assertTrue(np.isnan(result["episode_reward_mean"]))
 
+    def testAgentColumnarInputOutput(self):
+        agent = PGAgent(
+            env="CartPole-v0",
+            config={
+                "output": self.test_dir,
+                "output_format": "columnar",
+                "sample_batch_size": 250,
+            })
+        agent.train()
+        self.assertEqual(
+            len(glob.glob(self.test_dir + "/output-*.columnar")), 1)
+        agent = PGAgent(
+            env="CartPole-v0",
+            config={
+                "input": self.test_dir,
+                "input_evaluation": None,
+            })
+        result = agent.train()
+        self.assertEqual(result["timesteps_total"], 250)  # read from input
+        self.assertTrue(np.isnan(result["episode_reward_mean"]))
+
     def testSplitByEpisode(self):
         splits = SAMPLES.split_by_episode()
         self.assertEqual(len(splits), 3)
@@ -319,6 +341,150 @@ class JsonIOTest(unittest.TestCase):
         self.assertRaises(ValueError, lambda: reader.next())
 
 
+class ColumnarIOTest(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def testWritePaginate(self):
+        ioctx = IOContext(self.test_dir, {}, 0, None)
+        writer = ColumnarWriter(self.test_dir, ioctx, max_file_size=5000)
+        self.assertEqual(len(os.listdir(self.test_dir)), 0)
+        for _ in range(100):
+            writer.write(SAMPLES)
+        self.assertGreater(len(os.listdir(self.test_dir)), 1)
+
+    def testReadWrite(self):
+        ioctx = IOContext(self.test_dir, {}, 0, None)
+        writer = ColumnarWriter(self.test_dir, ioctx, max_file_size=5000)
+        for i in range(100):
+            writer.write(make_sample_batch(i))
+        reader = ColumnarReader(self.test_dir + "/*.columnar")
+        seen_a = set()
+        seen_o = set()
+        for i in range(1000):
+            batch = reader.next()
+            seen_a.add(batch["actions"][0])
+            seen_o.add(batch["obs"][0])
+        self.assertGreater(len(seen_a), 90)
+        self.assertLess(len(seen_a), 101)
+        self.assertGreater(len(seen_o), 90)
+        self.assertLess(len(seen_o), 101)
+
+    def testReadWriteObjects(self):
+        ioctx = IOContext(self.test_dir, {}, 0, None)
+        writer = ColumnarWriter(self.test_dir, ioctx)
+        writer.write(
+            SampleBatch({
+                "obs": np.ones((2, 3), dtype=np.float32),
+                "infos": [{
+                    "a": 1
+                }, {
+                    "b": 2
+                }],
+            }))
+        writer.cur_file.close()
+        reader = ColumnarReader(self.test_dir)
+        batch = reader.next()
+        self.assertEqual(batch["obs"].shape, (2, 3))
+        self.assertEqual(batch["obs"].dtype, np.float32)
+        self.assertEqual(list(batch["infos"]), [{"a": 1}, {"b": 2}])
+        # The returned arrays are copy-on-write views of the file.
+        batch["obs"][0, 0] = 5
+        self.assertEqual(reader.next()["obs"][0, 0], 1)
+
+    def testColumnProjection(self):
+        ioctx = IOContext(self.test_dir, {"input_columns": ["actions"]}, 0,
+                          None)
+        writer = ColumnarWriter(self.test_dir, ioctx)
+        writer.write(make_sample_batch(0))
+        writer.cur_file.close()
+        reader = ColumnarReader(self.test_dir, ioctx)
+        self.assertEqual(list(reader.next().keys()), ["actions"])
+
+    def testSkipsOverEmptyFiles(self):
+        open(self.test_dir + "/empty.columnar", "w").close()
+        ioctx = IOContext(self.test_dir, {}, 0, None)
+        writer = ColumnarWriter(self.test_dir, ioctx)
+        writer.write(make_sample_batch(0))
+        writer.cur_file.close()
+        reader = ColumnarReader(self.test_dir)
+        for i in range(10):
+            self.assertEqual(reader.next()["actions"][0], 0)
+
+    def testSkipsOverFilesWithBadMagic(self):
+        with open(self.test_dir + "/corrupt.columnar", "w") as f:
+            f.write("not a columnar experience file")
+        ioctx = IOContext(self.test_dir, {}, 0, None)
+        writer = ColumnarWriter(self.test_dir, ioctx)
+        writer.write(make_sample_batch(0))
+        writer.cur_file.close()
+        reader = ColumnarReader(self.test_dir)
+        for i in range(10):
+            self.assertEqual(reader.next()["actions"][0], 0)
+
+
+class PrefetchingReaderTest(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def testReadWrite(self):
+        ioctx = IOContext(self.test_dir, {}, 0, None)
+        writer = JsonWriter(
+            self.test_dir, ioctx, max_file_size=5000, compress_columns=["obs"])
+        for i in range(100):
+            writer.write(make_sample_batch(i))
+        reader = PrefetchingReader(
+            lambda: JsonReader(self.test_dir + "/*.json"),
+            num_threads=2,
+            max_ready_batches=4)
+        seen_a = set()
+        for i in range(1000):
+            seen_a.add(reader.next()["actions"][0])
+        self.assertGreater(len(seen_a), 90)
+        self.assertLess(len(seen_a), 101)
+
+    def testBoundedBuffer(self):
+        ioctx = IOContext(self.test_dir, {}, 0, None)
+        writer = JsonWriter(self.test_dir, ioctx)
+        for i in range(100):
+            writer.write(make_sample_batch(i))
+        reader = PrefetchingReader(
+            lambda: JsonReader(self.test_dir + "/*.json"),
+            num_threads=2,
+            max_ready_batches=4)
+        reader.next()
+        time.sleep(0.5)
+        self.assertLessEqual(len(reader.ready), 4)
+        reader.close()
+        for thread in reader.threads:
+            self.assertFalse(thread.is_alive())
+        self.assertRaises(ValueError, lambda: reader.next())
+
+    def testMixedInput(self):
+        ioctx = IOContext(self.test_dir, {"input_reader_threads": 2}, 0, None)
+        writer = JsonWriter(self.test_dir, ioctx)
+        for i in range(100):
+            writer.write(make_sample_batch(i))
+        reader = MixedInput({self.test_dir: 1.0}, ioctx)
+        self.assertIsInstance(reader.choices[0], PrefetchingReader)
+        self.assertIn(reader.next()["actions"][0], range(100))
+        reader.close()
+        for thread in reader.choices[0].threads:
+            self.assertFalse(thread.is_alive())
+
+    def testAbortOnAllEmptyInputs(self):
+        open(self.test_dir + "/empty", "w").close()
+        reader = PrefetchingReader(
+            lambda: JsonReader([self.test_dir + "/empty"]), num_threads=2)
+        self.assertRaises(ValueError, lambda: reader.next())
+
+
 if __name__ == "__main__":
     ray.init(num_cpus=1)
     unittest.main(verbosity=2)
@@ -5,6 +5,7 @@ from __future__ import print_function
 import logging
 import os
 import ray
+from ray.experimental import CompletionSet
 
 logger = logging.getLogger(__name__)
 
@@ -16,6 +17,9 @@ class TaskPool(object):
         self._tasks = {}
         self._objects = {}
         self._fetching = []
+        # Tracks the first object ID of each task, so that polling for
+        # completed tasks only costs time proportional to the completed ones.
+        self._completion_set = None
 
     def add(self, worker, all_obj_ids):
         if isinstance(all_obj_ids, list):
@@ -24,20 +28,26 @@ class TaskPool(object):
             obj_id = all_obj_ids
         self._tasks[obj_id] = worker
         self._objects[obj_id] = all_obj_ids
+        if self._completion_set is None:
+            self._completion_set = CompletionSet()
+        self._completion_set.add(obj_id)
 
     def completed(self):
-        pending = list(self._tasks)
-        if pending:
-            ready, _ = ray.wait(
-                pending, num_returns=len(pending), timeout=0.01)
-            for obj_id in ready:
-                yield (self._tasks.pop(obj_id), self._objects.pop(obj_id))
+        if not self._tasks:
+            return []
+        # The completed tasks are removed from the pool before they are
+        # returned, so none are lost if the caller stops iterating early.
+        return [(self._tasks.pop(obj_id), self._objects.pop(obj_id))
+                for obj_id in self._completion_set.poll(timeout=0.01)]
 
     def completed_prefetch(self):
         """Similar to completed but only returns once the object is local.
 
         Assumes obj_id only is one id."""
 
+        # The tasks may be batched actor method calls that are still held
+        # back.
+        ray.worker.global_worker.flush_actor_batches()
         for worker, obj_id in self.completed():
             plasma_id = ray.pyarrow.plasma.ObjectID(obj_id.id())
             (ray.worker.global_worker.raylet_client.fetch_or_reconstruct(
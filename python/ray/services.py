@@ -2,6 +2,7 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
+import functools
 import json
 import logging
 import multiprocessing
@@ -15,6 +16,7 @@ import sys
 import threading
 import time
 from collections import OrderedDict
+from contextlib import contextmanager
 import redis
 
 import pyarrow
@@ -47,6 +49,11 @@ all_processes = OrderedDict(
      (PROCESS_TYPE_PLASMA_STORE, []), (PROCESS_TYPE_REDIS_SERVER, []),
      (PROCESS_TYPE_WEB_UI, [])], )
 
+# The number of seconds that the last calls to start_ray_processes() and
+# cleanup() spent on each component. This is used to benchmark ray.init() and
+# ray.shutdown().
+component_durations = {}
+
 # True if processes are run in the valgrind profiler.
 RUN_RAYLET_PROFILER = False
 RUN_PLASMA_STORE_PROFILER = False
@@ -106,6 +113,111 @@ def new_port():
     return random.randint(10000, 65535)
 
 
+@contextmanager
+def _record_duration(component):
+    start = time.time()
+    try:
+        yield
+    finally:
+        component_durations[component] = time.time() - start
+
+
+def _run_in_parallel(functions):
+    """Call several functions on separate threads.
+
+    Args:
+        functions: A list of functions that take no arguments.
+
+    Returns:
+        A list of the return values of the functions.
+
+    Raises:
+        The first exception raised by any of the functions.
+    """
+    results = [None] * len(functions)
+    errors = []
+
+    def run(i):
+        try:
+            results[i] = functions[i]()
+        except Exception as e:
+            errors.append(e)
+
+    threads = [
+        threading.Thread(target=run, args=(i, ))
+        for i in range(len(functions))
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    if errors:
+        raise errors[0]
+    return results
+
+
+def _wait_until_ready(is_ready, process, description, timeout=None):
+    """Poll a process until it is ready, backing off between attempts.
+
+    Args:
+        is_ready: A function that returns True once the process is ready.
+        process: The process handle. If the process exits, waiting stops.
+        description (str): A description of the process for error messages.
+        timeout (float): The max number of seconds to wait. Defaults to
+            ray_constants.PROCESS_STARTUP_TIMEOUT_SECONDS.
+
+    Returns:
+        True if the process is ready and False if it exited.
+
+    Raises:
+        Exception: An exception is raised if the process is still not ready
+            after the timeout.
+    """
+    if timeout is None:
+        timeout = ray_constants.PROCESS_STARTUP_TIMEOUT_SECONDS
+    deadline = time.time() + timeout
+    delay = 0.001
+    while True:
+        if is_ready():
+            return True
+        if process is not None and process.poll() is not None:
+            return False
+        if time.time() > deadline:
+            raise Exception("Timed out after {} seconds waiting for the {} "
+                            "to start.".format(timeout, description))
+        time.sleep(delay)
+        delay = min(2 * delay, 0.1)
+
+
+def wait_for_socket(socket_name, process=None, description="process"):
+    """Wait for a process to accept connections on a Unix domain socket.
+
+    Args:
+        socket_name (str): The path of the socket.
+        process: The process handle of the process listening on the socket.
+        description (str): A description of the process for error messages.
+
+    Raises:
+        Exception: An exception is raised if the process exits or does not
+            accept connections before the startup timeout.
+    """
+
+    def is_ready():
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.connect(socket_name)
+            return True
+        except socket.error:
+            return False
+        finally:
+            sock.close()
+
+    if not _wait_until_ready(is_ready, process, description):
+        raise Exception("The {} exited with code {} before it accepted "
+                        "connections on {}.".format(
+                            description, process.returncode, socket_name))
+
+
 def kill_process(p):
     """Kill a process.
 
@@ -154,12 +266,19 @@ def cleanup():
     started and disconnected by worker.py.
     """
     successfully_shut_down = True
+    profiling = any([RUN_RAYLET_PROFILER, RUN_PLASMA_STORE_PROFILER])
     # Terminate the processes in reverse order.
     for process_type in all_processes.keys():
-        # Kill all of the processes of a certain type.
-        for p in all_processes[process_type]:
-            success = kill_process(p)
-            successfully_shut_down = successfully_shut_down and success
+        with _record_duration("stop_" + process_type):
+            # Ask all of the processes of a certain type to exit first, so
+            # that they shut down in parallel.
+            for p in all_processes[process_type]:
+                if p.poll() is None and not profiling:
+                    p.terminate()
+            # Kill all of the processes of a certain type.
+            for p in all_processes[process_type]:
+                success = kill_process(p)
+                successfully_shut_down = successfully_shut_down and success
         # Reset the list of processes of this type.
         all_processes[process_type] = []
     if not successfully_shut_down:
@@ -327,6 +446,32 @@ def wait_for_redis_to_start(redis_ip_address,
                         "configured properly.")
 
 
+def _wait_for_redis_process(p, port, password=None):
+    """Wait for a Redis server that was just started to respond.
+
+    Another server may already be listening on the port, so this checks the
+    process ID reported by the server that responds.
+
+    Args:
+        p: The process handle of the Redis server.
+        port (int): The port of the Redis server.
+        password (str): The password of the Redis server.
+
+    Returns:
+        True if the server responds and False if the process exited.
+    """
+    redis_client = redis.StrictRedis(
+        host="127.0.0.1", port=port, password=password)
+
+    def is_ready():
+        try:
+            return redis_client.info("server")["process_id"] == p.pid
+        except redis.RedisError:
+            return False
+
+    return _wait_until_ready(is_ready, p, "Redis server")
+
+
 def _autodetect_num_gpus():
     """Attempt to detect the number of GPUs on this machine.
 
@@ -470,54 +615,6 @@ def start_redis(node_ip_address,
                         "supported in credis. To run Ray with "
                         "password-protected Redis ports, ensure that "
                         "the environment variable `RAY_USE_NEW_GCS=off`.")
-    if not use_credis:
-        assigned_port, _ = _start_redis_instance(
-            node_ip_address=node_ip_address,
-            port=port,
-            redis_max_clients=redis_max_clients,
-            stdout_file=redis_stdout_file,
-            stderr_file=redis_stderr_file,
-            cleanup=cleanup,
-            password=password,
-            # Below we use None to indicate no limit on the memory of the
-            # primary Redis shard.
-            redis_max_memory=None)
-    else:
-        assigned_port, _ = _start_redis_instance(
-            node_ip_address=node_ip_address,
-            port=port,
-            redis_max_clients=redis_max_clients,
-            stdout_file=redis_stdout_file,
-            stderr_file=redis_stderr_file,
-            cleanup=cleanup,
-            executable=CREDIS_EXECUTABLE,
-            # It is important to load the credis module BEFORE the ray module,
-            # as the latter contains an extern declaration that the former
-            # supplies.
-            modules=[CREDIS_MASTER_MODULE, REDIS_MODULE],
-            password=password,
-            # Below we use None to indicate no limit on the memory of the
-            # primary Redis shard.
-            redis_max_memory=None)
-    if port is not None:
-        assert assigned_port == port
-    port = assigned_port
-    redis_address = address(node_ip_address, port)
-
-    # Register the number of Redis shards in the primary shard, so that clients
-    # know how many redis shards to expect under RedisShards.
-    primary_redis_client = redis.StrictRedis(
-        host=node_ip_address, port=port, password=password)
-    primary_redis_client.set("NumRedisShards", str(num_redis_shards))
-
-    # Put the redirect_worker_output bool in the Redis shard so that workers
-    # can access it and know whether or not to redirect their output.
-    primary_redis_client.set("RedirectOutput", 1
-                             if redirect_worker_output else 0)
-
-    # Store version information in the primary Redis shard.
-    _put_version_info_in_redis(primary_redis_client)
-
     # Cap the memory of the other redis shards if no limit is provided.
     redis_max_memory = (redis_max_memory if redis_max_memory is not None else
                         ray_constants.DEFAULT_REDIS_MAX_MEMORY_BYTES)
@@ -526,42 +623,104 @@ def start_redis(node_ip_address,
                          "but the minimum allowed is {} bytes.".format(
                              redis_max_memory,
                              ray_constants.REDIS_MINIMUM_MEMORY_BYTES))
+    if use_credis:
+        assert num_redis_shards == 1, \
+            "For now, RAY_USE_NEW_GCS supports 1 shard, and credis "\
+            "supports 1-node chain for that shard only."
 
-    # Start other Redis shards. Each Redis shard logs to a separate file,
-    # prefixed by "redis-<shard number>".
-    redis_shards = []
-    for i in range(num_redis_shards):
-        redis_stdout_file, redis_stderr_file = new_redis_log_file(
-            redirect_output, shard_number=i)
+    def start_primary():
         if not use_credis:
-            redis_shard_port, _ = _start_redis_instance(
+            return _start_redis_instance(
                 node_ip_address=node_ip_address,
-                port=redis_shard_ports[i],
+                port=port,
                 redis_max_clients=redis_max_clients,
                 stdout_file=redis_stdout_file,
                 stderr_file=redis_stderr_file,
                 cleanup=cleanup,
                 password=password,
-                redis_max_memory=redis_max_memory)
+                # Below we use None to indicate no limit on the memory of the
+                # primary Redis shard.
+                redis_max_memory=None)[0]
         else:
-            assert num_redis_shards == 1, \
-                "For now, RAY_USE_NEW_GCS supports 1 shard, and credis "\
-                "supports 1-node chain for that shard only."
-            redis_shard_port, _ = _start_redis_instance(
+            return _start_redis_instance(
                 node_ip_address=node_ip_address,
-                port=redis_shard_ports[i],
+                port=port,
                 redis_max_clients=redis_max_clients,
                 stdout_file=redis_stdout_file,
                 stderr_file=redis_stderr_file,
                 cleanup=cleanup,
+                executable=CREDIS_EXECUTABLE,
+                # It is important to load the credis module BEFORE the ray
+                # module, as the latter contains an extern declaration that
+                # the former supplies.
+                modules=[CREDIS_MASTER_MODULE, REDIS_MODULE],
+                password=password,
+                # Below we use None to indicate no limit on the memory of the
+                # primary Redis shard.
+                redis_max_memory=None)[0]
+
+    # Each Redis shard logs to a separate file, prefixed by
+    # "redis-<shard number>".
+    shard_log_files = [
+        new_redis_log_file(redirect_output, shard_number=i)
+        for i in range(num_redis_shards)
+    ]
+
+    def start_shard(i):
+        shard_stdout_file, shard_stderr_file = shard_log_files[i]
+        if not use_credis:
+            return _start_redis_instance(
+                node_ip_address=node_ip_address,
+                port=redis_shard_ports[i],
+                redis_max_clients=redis_max_clients,
+                stdout_file=shard_stdout_file,
+                stderr_file=shard_stderr_file,
+                cleanup=cleanup,
+                password=password,
+                redis_max_memory=redis_max_memory)[0]
+        else:
+            return _start_redis_instance(
+                node_ip_address=node_ip_address,
+                port=redis_shard_ports[i],
+                redis_max_clients=redis_max_clients,
+                stdout_file=shard_stdout_file,
+                stderr_file=shard_stderr_file,
+                cleanup=cleanup,
                 password=password,
                 executable=CREDIS_EXECUTABLE,
                 # It is important to load the credis module BEFORE the ray
-                # module, as the latter contains an extern declaration that the
-                # former supplies.
+                # module, as the latter contains an extern declaration that
+                # the former supplies.
                 modules=[CREDIS_MEMBER_MODULE, REDIS_MODULE],
-                redis_max_memory=redis_max_memory)
+                redis_max_memory=redis_max_memory)[0]
+
+    # The Redis servers do not depend on each other, so start the primary
+    # shard and the other shards in parallel.
+    assigned_ports = _run_in_parallel(
+        [start_primary] +
+        [functools.partial(start_shard, i) for i in range(num_redis_shards)])
+    assigned_port = assigned_ports[0]
+    if port is not None:
+        assert assigned_port == port
+    port = assigned_port
+    redis_address = address(node_ip_address, port)
+
+    # Register the number of Redis shards in the primary shard, so that clients
+    # know how many redis shards to expect under RedisShards.
+    primary_redis_client = redis.StrictRedis(
+        host=node_ip_address, port=port, password=password)
+    primary_redis_client.set("NumRedisShards", str(num_redis_shards))
 
+    # Put the redirect_worker_output bool in the Redis shard so that workers
+    # can access it and know whether or not to redirect their output.
+    primary_redis_client.set("RedirectOutput", 1
+                             if redirect_worker_output else 0)
+
+    # Store version information in the primary Redis shard.
+    _put_version_info_in_redis(primary_redis_client)
+
+    redis_shards = []
+    for i, redis_shard_port in enumerate(assigned_ports[1:]):
         if redis_shard_ports[i] is not None:
             assert redis_shard_port == redis_shard_ports[i]
         shard_address = address(node_ip_address, redis_shard_port)
@@ -655,10 +814,9 @@ def _start_redis_instance(node_ip_address="127.0.0.1",
             ["--port", str(port), "--loglevel", "warning"] + load_module_args)
 
         p = subprocess.Popen(command, stdout=stdout_file, stderr=stderr_file)
-        time.sleep(0.1)
-        # Check if Redis successfully started (or at least if it the executable
-        # did not exit within 0.1 seconds).
-        if p.poll() is None:
+        # Wait for Redis to respond. If the port is already in use, the
+        # process exits and another port is tried.
+        if _wait_for_redis_process(p, port, password=password):
             if cleanup:
                 all_processes[PROCESS_TYPE_REDIS_SERVER].append(p)
             break
@@ -671,8 +829,6 @@ def _start_redis_instance(node_ip_address="127.0.0.1",
     # Create a Redis client just for configuring Redis.
     redis_client = redis.StrictRedis(
         host="127.0.0.1", port=port, password=password)
-    # Wait for the Redis server to start.
-    wait_for_redis_to_start("127.0.0.1", port, password=password)
     # Configure Redis to generate keyspace notifications. TODO(rkn): Change
     # this to only generate notifications for the export keys.
     redis_client.config_set("notify-keyspace-events", "Kl")
@@ -1342,39 +1498,42 @@ def start_ray_processes(ray_params, cleanup=True):
     # should address the warnings.
     ray_params.redis_address = ray_params.address_info.get("redis_address")
     ray_params.redis_shards = ray_params.address_info.get("redis_shards", [])
+    component_durations.clear()
     if ray_params.redis_address is None:
-        ray_params.redis_address, ray_params.redis_shards = start_redis(
-            ray_params.node_ip_address,
-            port=ray_params.redis_port,
-            redis_shard_ports=ray_params.redis_shard_ports,
-            num_redis_shards=ray_params.num_redis_shards,
-            redis_max_clients=ray_params.redis_max_clients,
-            redirect_output=True,
-            redirect_worker_output=ray_params.redirect_worker_output,
-            cleanup=cleanup,
-            password=ray_params.redis_password,
-            redis_max_memory=ray_params.redis_max_memory)
+        with _record_duration(PROCESS_TYPE_REDIS_SERVER):
+            ray_params.redis_address, ray_params.redis_shards = start_redis(
+                ray_params.node_ip_address,
+                port=ray_params.redis_port,
+                redis_shard_ports=ray_params.redis_shard_ports,
+                num_redis_shards=ray_params.num_redis_shards,
+                redis_max_clients=ray_params.redis_max_clients,
+                redirect_output=True,
+                redirect_worker_output=ray_params.redirect_worker_output,
+                cleanup=cleanup,
+                password=ray_params.redis_password,
+                redis_max_memory=ray_params.redis_max_memory)
         ray_params.address_info["redis_address"] = ray_params.redis_address
-        time.sleep(0.1)
 
-        # Start monitoring the processes.
-        monitor_stdout_file, monitor_stderr_file = new_monitor_log_file(
-            ray_params.redirect_output)
-        start_monitor(
-            ray_params.redis_address,
-            ray_params.node_ip_address,
-            stdout_file=monitor_stdout_file,
-            stderr_file=monitor_stderr_file,
-            cleanup=cleanup,
-            autoscaling_config=ray_params.autoscaling_config,
-            redis_password=ray_params.redis_password)
-        start_raylet_monitor(
-            ray_params.redis_address,
-            stdout_file=monitor_stdout_file,
-            stderr_file=monitor_stderr_file,
-            cleanup=cleanup,
-            redis_password=ray_params.redis_password,
-            config=config)
+        # Start monitoring the processes. The monitors do not need to be
+        # ready before the other processes start, so they are not waited on.
+        with _record_duration(PROCESS_TYPE_MONITOR):
+            monitor_stdout_file, monitor_stderr_file = new_monitor_log_file(
+                ray_params.redirect_output)
+            start_monitor(
+                ray_params.redis_address,
+                ray_params.node_ip_address,
+                stdout_file=monitor_stdout_file,
+                stderr_file=monitor_stderr_file,
+                cleanup=cleanup,
+                autoscaling_config=ray_params.autoscaling_config,
+                redis_password=ray_params.redis_password)
+            start_raylet_monitor(
+                ray_params.redis_address,
+                stdout_file=monitor_stdout_file,
+                stderr_file=monitor_stderr_file,
+                cleanup=cleanup,
+                redis_password=ray_params.redis_password,
+                config=config)
     if ray_params.redis_shards == []:
         # Get redis shards from primary redis instance.
         redis_ip_address, redis_port = ray_params.redis_address.split(":")
@@ -1390,15 +1549,16 @@ def start_ray_processes(ray_params, cleanup=True):
 
     # Start the log monitor, if necessary.
     if ray_params.include_log_monitor:
-        log_monitor_stdout_file, log_monitor_stderr_file = (
-            new_log_monitor_log_file())
-        start_log_monitor(
-            ray_params.redis_address,
-            ray_params.node_ip_address,
-            stdout_file=log_monitor_stdout_file,
-            stderr_file=log_monitor_stderr_file,
-            cleanup=cleanup,
-            redis_password=ray_params.redis_password)
+        with _record_duration(PROCESS_TYPE_LOG_MONITOR):
+            log_monitor_stdout_file, log_monitor_stderr_file = (
+                new_log_monitor_log_file())
+            start_log_monitor(
+                ray_params.redis_address,
+                ray_params.node_ip_address,
+                stdout_file=log_monitor_stdout_file,
+                stderr_file=log_monitor_stderr_file,
+                cleanup=cleanup,
+                redis_password=ray_params.redis_password)
 
     # Initialize with existing services.
     object_store_address = ray_params.address_info.get("object_store_address")
@@ -1410,43 +1570,58 @@ def start_ray_processes(ray_params, cleanup=True):
     plasma_store_stdout_file, plasma_store_stderr_file = (
         new_plasma_store_log_file(ray_params.redirect_output))
 
-    ray_params.address_info["object_store_address"] = start_plasma_store(
-        ray_params.node_ip_address,
-        ray_params.redis_address,
-        store_stdout_file=plasma_store_stdout_file,
-        store_stderr_file=plasma_store_stderr_file,
-        object_store_memory=ray_params.object_store_memory,
-        cleanup=cleanup,
-        plasma_directory=ray_params.plasma_directory,
-        huge_pages=ray_params.huge_pages,
-        plasma_store_socket_name=ray_params.plasma_store_socket_name,
-        redis_password=ray_params.redis_password)
-    time.sleep(0.1)
-
-    # Start the raylet.
+    with _record_duration(PROCESS_TYPE_PLASMA_STORE):
+        ray_params.address_info["object_store_address"] = start_plasma_store(
+            ray_params.node_ip_address,
+            ray_params.redis_address,
+            store_stdout_file=plasma_store_stdout_file,
+            store_stderr_file=plasma_store_stderr_file,
+            object_store_memory=ray_params.object_store_memory,
+            cleanup=cleanup,
+            plasma_directory=ray_params.plasma_directory,
+            huge_pages=ray_params.huge_pages,
+            plasma_store_socket_name=ray_params.plasma_store_socket_name,
+            redis_password=ray_params.redis_password)
+
+    # Start the raylet. The raylet retries connecting to the object store, so
+    # it is started without waiting for the object store to be ready.
     assert raylet_socket_name is None
-    raylet_stdout_file, raylet_stderr_file = new_raylet_log_file(
-        redirect_output=ray_params.redirect_worker_output)
-    ray_params.address_info["raylet_socket_name"] = start_raylet(
-        ray_params,
-        ray_params.raylet_socket_name or get_raylet_socket_name(),
-        ray_params.address_info["object_store_address"],
-        num_initial_workers=num_initial_workers,
-        stdout_file=raylet_stdout_file,
-        stderr_file=raylet_stderr_file,
-        cleanup=cleanup,
-        config=config)
+    with _record_duration(PROCESS_TYPE_RAYLET):
+        raylet_stdout_file, raylet_stderr_file = new_raylet_log_file(
+            redirect_output=ray_params.redirect_worker_output)
+        ray_params.address_info["raylet_socket_name"] = start_raylet(
+            ray_params,
+            ray_params.raylet_socket_name or get_raylet_socket_name(),
+            ray_params.address_info["object_store_address"],
+            num_initial_workers=num_initial_workers,
+            stdout_file=raylet_stdout_file,
+            stderr_file=raylet_stderr_file,
+            cleanup=cleanup,
+            config=config)
 
     # Try to start the web UI.
     if ray_params.include_webui:
-        ui_stdout_file, ui_stderr_file = new_webui_log_file()
-        ray_params.address_info["webui_url"] = start_ui(
-            ray_params.redis_address,
-            stdout_file=ui_stdout_file,
-            stderr_file=ui_stderr_file,
-            cleanup=cleanup)
+        with _record_duration(PROCESS_TYPE_WEB_UI):
+            ui_stdout_file, ui_stderr_file = new_webui_log_file()
+            ray_params.address_info["webui_url"] = start_ui(
+                ray_params.redis_address,
+                stdout_file=ui_stdout_file,
+                stderr_file=ui_stderr_file,
+                cleanup=cleanup)
     else:
         ray_params.address_info["webui_url"] = ""
+
+    # Wait for the object store and the raylet to accept connections, so that
+    # the driver can connect to them right away.
+    with _record_duration("wait_for_sockets"):
+        wait_for_socket(
+            ray_params.address_info["object_store_address"],
+            all_processes[PROCESS_TYPE_PLASMA_STORE][-1] if cleanup else None,
+            description="object store")
+        wait_for_socket(
+            ray_params.address_info["raylet_socket_name"],
+            all_processes[PROCESS_TYPE_RAYLET][-1] if cleanup else None,
+            description="raylet")
     # Return the addresses of the relevant processes.
     return ray_params.address_info
 
@@ -177,6 +177,11 @@ def extend_args(function_signature, args, kwargs):
             with these arguments.
     """
     arg_names = function_signature.arg_names
+    if not kwargs and len(args) == len(arg_names):
+        # Fast path for the common case where every argument is passed
+        # positionally, so there is nothing to fill in or check.
+        return list(args)
+
     arg_defaults = function_signature.arg_defaults
     arg_is_positionals = function_signature.arg_is_positionals
     keyword_names = function_signature.keyword_names
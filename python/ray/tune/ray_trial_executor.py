@@ -9,6 +9,7 @@ import time
 import traceback
 
 import ray
+from ray.experimental import CompletionSet
 from ray.tune.logger import NoopLogger
 from ray.tune.trial import Trial, Resources, Checkpoint
 from ray.tune.trial_executor import TrialExecutor
@@ -22,6 +23,9 @@ class RayTrialExecutor(TrialExecutor):
     def __init__(self, queue_trials=False):
         super(RayTrialExecutor, self).__init__(queue_trials)
         self._running = {}
+        # Tracks the result IDs in self._running, so that waiting for the next
+        # available trial does not scan all running trials.
+        self._completion_set = None
         # Since trial resume after paused should not run
         # trial.train.remote(), thus no more new remote object id generated.
         # We use self._paused to store paused trials here.
@@ -58,7 +62,17 @@ class RayTrialExecutor(TrialExecutor):
 
         assert trial.status == Trial.RUNNING, trial.status
         remote = trial.runner.train.remote()
-        self._running[remote] = trial
+        self._add_running(remote, trial)
+
+    def _add_running(self, result_id, trial):
+        self._running[result_id] = trial
+        if self._completion_set is None:
+            self._completion_set = CompletionSet()
+        self._completion_set.add(result_id)
+
+    def _pop_running(self, result_id):
+        self._completion_set.remove(result_id)
+        return self._running.pop(result_id)
 
     def _start_trial(self, trial, checkpoint=None):
         """Starts trial and restores last result if trial was paused.
@@ -77,7 +91,7 @@ class RayTrialExecutor(TrialExecutor):
         if (prior_status == Trial.PAUSED and previous_run):
             # If Trial was in flight when paused, self._paused stores result.
             self._paused.pop(previous_run[0])
-            self._running[previous_run[0]] = trial
+            self._add_running(previous_run[0], trial)
         else:
             self._train(trial)
 
@@ -163,7 +177,7 @@ class RayTrialExecutor(TrialExecutor):
             self._return_resources(trial.resources)
             out = self._find_item(self._running, trial)
             for result_id in out:
-                self._running.pop(result_id)
+                self._pop_running(result_id)
 
     def continue_training(self, trial):
         """Continues the training of this trial."""
@@ -207,7 +221,9 @@ class RayTrialExecutor(TrialExecutor):
         return list(self._running.values())
 
     def get_next_available_trial(self):
-        [result_id], _ = ray.wait(list(self._running))
+        # The result ID stays in the completion set until fetch_result is
+        # called for the trial, so calling this again returns the same trial.
+        [result_id] = self._completion_set.peek(timeout=None, num_returns=1)
         return self._running[result_id]
 
     def fetch_result(self, trial):
@@ -218,7 +234,7 @@ class RayTrialExecutor(TrialExecutor):
         trial_future = self._find_item(self._running, trial)
         if not trial_future:
             raise ValueError("Trial was not running.")
-        self._running.pop(trial_future[0])
+        self._pop_running(trial_future[0])
         result = ray.get(trial_future[0])
         return result
 
@@ -325,6 +341,9 @@ class RayTrialExecutor(TrialExecutor):
             value = checkpoint.value
             if checkpoint.storage == Checkpoint.MEMORY:
                 assert type(value) != Checkpoint, type(value)
+                # The value is the object ID returned by save_to_object(). It
+                # is passed to the runner without fetching it, so the state
+                # is transferred between the actors through the object store.
                 ray.get(trial.runner.restore_from_object.remote(value))
             else:
                 ray.get(trial.runner.restore.remote(value))
@@ -228,18 +228,21 @@ class PopulationBasedTraining(FIFOScheduler):
                        "{} (score {}) -> {} (score {})".format(
                            trial_to_clone, new_state.last_score, trial,
                            trial_state.last_score))
-        # TODO(ekl) restarting the trial is expensive. We should implement a
-        # lighter way reset() method that can alter the trial config.
+        # The last checkpoint is the object ID of an in-memory checkpoint of
+        # trial_to_clone, so the target trainable fetches the state directly
+        # from the object store and it never passes through the driver.
+        checkpoint = Checkpoint.from_object(new_state.last_checkpoint)
         new_tag = make_experiment_tag(trial_state.orig_tag, new_config,
                                       self._hyperparam_mutations)
         reset_successful = trial_executor.reset_trial(trial, new_config,
                                                       new_tag)
-        if not reset_successful:
+        if reset_successful:
+            trial_executor.restore(trial, checkpoint)
+        else:
             trial_executor.stop_trial(trial, stop_logger=False)
             trial.config = new_config
             trial.experiment_tag = new_tag
-            trial_executor.start_trial(
-                trial, Checkpoint.from_object(new_state.last_checkpoint))
+            trial_executor.start_trial(trial, checkpoint)
 
         self._num_perturbations += 1
         # Transfer over the last perturbation time as well
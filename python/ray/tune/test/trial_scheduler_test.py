@@ -167,14 +167,22 @@ class _MockTrialExecutor(TrialExecutor):
         if stop_logger:
             trial.logger_running = False
 
+    def __init__(self):
+        super(_MockTrialExecutor, self).__init__()
+        self.reset_successful = False
+
     def restore(self, trial, checkpoint=None):
-        pass
+        if checkpoint is not None:
+            trial.restored_checkpoint = checkpoint.value
 
     def save(self, trial, type=Checkpoint.DISK):
         return trial.trainable_name
 
     def reset_trial(self, trial, new_config, new_experiment_tag):
-        return False
+        if self.reset_successful:
+            trial.config = new_config
+            trial.experiment_tag = new_experiment_tag
+        return self.reset_successful
 
 
 class _MockTrialRunner():
@@ -697,6 +705,19 @@ class PopulationBasedTestingSuite(unittest.TestCase):
         self.assertEqual(type(trials[0].config["int_factor"]), int)
         self.assertEqual(trials[0].config["const_factor"], 3)
 
+    def testPerturbWithReset(self):
+        pbt, runner = self.basicSetup()
+        runner.trial_executor.reset_successful = True
+        trials = runner.get_trials()
+        self.assertEqual(
+            pbt.on_trial_result(runner, trials[0], result(20, -100)),
+            TrialScheduler.CONTINUE)
+        # The trial is not restarted, but the state is still transferred.
+        self.assertEqual(trials[0].status, Trial.RUNNING)
+        self.assertIn(trials[0].restored_checkpoint, ["trial_3", "trial_4"])
+        self.assertTrue("@perturbed" in trials[0].experiment_tag)
+        self.assertEqual(pbt._num_perturbations, 1)
+
     def testPerturbWithResample(self):
         pbt, runner = self.basicSetup(resample_prob=1.0)
         trials = runner.get_trials()
@@ -201,7 +201,9 @@ class TrialExecutor(object):
 
         Return:
             A Python object if storage==Checkpoint.MEMORY otherwise
-            a path to the checkpoint.
+            a path to the checkpoint. Executors may return a handle to the
+            object instead (e.g., an object ID), as long as restore()
+            accepts it.
         """
         raise NotImplementedError("Subclasses of TrialExecutor must provide "
                                   "save() method")
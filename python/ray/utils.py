@@ -281,6 +281,25 @@ def resources_from_resource_arguments(default_num_cpus, default_num_gpus,
     return resources
 
 
+def check_resources(resources):
+    """Check that the quantities in a resources dictionary are valid.
+
+    Args:
+        resources: A dictionary mapping resource names to quantities.
+
+    Raises:
+        ValueError: If a quantity is negative, or is a fractional quantity
+            larger than one.
+    """
+    for value in resources.values():
+        assert (isinstance(value, int) or isinstance(value, float))
+        if value < 0:
+            raise ValueError("Resource quantities must be nonnegative.")
+        if (value >= 1 and isinstance(value, float)
+                and not value.is_integer()):
+            raise ValueError("Resource quantities must all be whole numbers.")
+
+
 # This function is copied and modified from
 # https://github.com/giampaolo/psutil/blob/5bd44f8afcecbfb0db479ce230c790fc2c56569a/psutil/tests/test_linux.py#L132-L138  # noqa: E501
 def vmstat(stat):
@@ -4,6 +4,7 @@ from __future__ import print_function
 
 from contextlib import contextmanager
 import atexit
+import collections
 import colorama
 import faulthandler
 import hashlib
@@ -36,10 +37,13 @@ import ray.plasma
 import ray.ray_constants as ray_constants
 from ray import import_thread
 from ray import profiling
+from ray.auto_put_cache import AutoPutCache
+from ray.object_cache import ObjectCache
 from ray.function_manager import (FunctionActorManager, FunctionDescriptor)
 from ray.parameter import RayParams
 from ray.utils import (
     check_oversized_pickle,
+    check_resources,
     is_cython,
     random_string,
     thread_safe_client,
@@ -129,6 +133,21 @@ class RayTaskError(Exception):
         return "\n".join(out)
 
 
+class TaskContext(object):
+    """The state of the task that a thread executes.
+
+    Attributes:
+        current_task_id: The ID of the task.
+        task_index: The number of tasks that the task submitted so far.
+        put_index: The index of the next object that the task puts.
+    """
+
+    def __init__(self):
+        self.current_task_id = ray.ObjectID(NIL_ID)
+        self.task_index = 0
+        self.put_index = 1
+
+
 class Worker(object):
     """A class used to define the control flow of a worker process.
 
@@ -161,6 +180,18 @@ class Worker(object):
         self.make_actor = None
         self.actors = {}
         self.actor_task_counter = 0
+        # The maximum number of methods that this actor executes at once. If
+        # this is greater than 1, the methods run on a pool of threads.
+        self.actor_max_concurrency = 1
+        self.actor_task_queue = None
+        self.actor_task_slots = None
+        # If this is true, the methods that were submitted through the same
+        # actor handle run one at a time, in submission order. This maps the
+        # ID of each handle with a running method to the queue of methods from
+        # that handle that are waiting for it to finish.
+        self.actor_per_handle_ordering = False
+        self.actor_handle_queues = {}
+        self.actor_handle_queues_lock = threading.Lock()
         # The number of threads Plasma should use when putting an object in the
         # object store.
         self.memcopy_threads = 12
@@ -168,6 +199,16 @@ class Worker(object):
         # CUDA_VISIBLE_DEVICES environment variable.
         self.original_gpu_ids = ray.utils.get_cuda_visible_devices()
         self.profiler = None
+        self.auto_put_cache = None
+        self.object_cache = ObjectCache()
+        # The actor handles that hold back calls of batched actor methods.
+        # Reads/writes to it and to the pending batches of the handles must
+        # be protected by self.actor_batches_condition.
+        self.pending_actor_batches = set()
+        self.actor_batches_condition = threading.Condition(threading.RLock())
+        # The thread that submits the batches that were held back for too
+        # long. It is started when the first batch is held back.
+        self.actor_batch_flusher = None
         self.memory_monitor = memory_monitor.MemoryMonitor()
         self.state_lock = threading.Lock()
         # A dictionary that maps from driver id to SerializationContext
@@ -178,9 +219,45 @@ class Worker(object):
         # self.state_lock.
         # Identity of the driver that this worker is processing.
         self.task_driver_id = ray.ObjectID(NIL_ID)
-        self.current_task_id = ray.ObjectID(NIL_ID)
-        self.task_index = 0
-        self.put_index = 1
+        # The current task ID, task index and put index. The threads that
+        # execute the methods of a threaded actor each have their own task
+        # context. All other threads share this one.
+        self.shared_task_context = TaskContext()
+        self.thread_local = threading.local()
+
+    @property
+    def task_context(self):
+        """The task context of the current thread."""
+        return getattr(self.thread_local, "task_context",
+                       self.shared_task_context)
+
+    def in_threaded_actor_task(self):
+        """Whether this thread executes a method of a threaded actor."""
+        return hasattr(self.thread_local, "task_context")
+
+    @property
+    def current_task_id(self):
+        return self.task_context.current_task_id
+
+    @current_task_id.setter
+    def current_task_id(self, current_task_id):
+        self.task_context.current_task_id = current_task_id
+
+    @property
+    def task_index(self):
+        return self.task_context.task_index
+
+    @task_index.setter
+    def task_index(self, task_index):
+        self.task_context.task_index = task_index
+
+    @property
+    def put_index(self):
+        return self.task_context.put_index
+
+    @put_index.setter
+    def put_index(self, put_index):
+        self.task_context.put_index = put_index
 
     def get_current_thread_task_id(self):
         """Get the current thread's task ID.
@@ -196,7 +273,8 @@ class Worker(object):
             # random task ID so that the backend can differentiate
             # between different threads.
             current_task_id = ray.ObjectID(random_string())
-            if not self.multithreading_warned:
+            if (not self.multithreading_warned
+                    and not self.in_threaded_actor_task()):
                 logger.warning(
                     "Calling ray.get or ray.wait in a separate thread "
                     "may lead to deadlock if the main thread blocks on this "
@@ -261,13 +339,14 @@ class Worker(object):
         """
         self.mode = mode
 
-    def store_and_register(self, object_id, value, depth=100):
+    def store_and_register(self, object_id, value, depth=100, metadata=None):
         """Store an object and attempt to register its class if needed.
 
         Args:
             object_id: The ID of the object to store.
             value: The value to put in the object store.
             depth: The maximum number of classes to recursively register.
+            metadata: The plasma metadata to store with the object, or None.
 
         Raises:
             Exception: An exception is raised if the attempt to store the
@@ -284,12 +363,15 @@ class Worker(object):
                                 "type {}.".format(type(value)))
             counter += 1
             try:
-                self.plasma_client.put(
-                    value,
-                    object_id=pyarrow.plasma.ObjectID(object_id.id()),
-                    memcopy_threads=self.memcopy_threads,
-                    serialization_context=self.get_serialization_context(
-                        self.task_driver_id))
+                if metadata is None:
+                    self.plasma_client.put(
+                        value,
+                        object_id=pyarrow.plasma.ObjectID(object_id.id()),
+                        memcopy_threads=self.memcopy_threads,
+                        serialization_context=self.get_serialization_context(
+                            self.task_driver_id))
+                else:
+                    self._put_with_metadata(object_id, value, metadata)
                 break
             except pyarrow.SerializationCallbackError as e:
                 try:
@@ -327,7 +409,34 @@ class Worker(object):
                                                type(e.example_object)))
                         logger.warning(warning_message)
 
-    def put_object(self, object_id, value):
+    def _put_with_metadata(self, object_id, value, metadata):
+        """Serialize a value into the object store with plasma metadata.
+
+        This does what plasma_client.put does, which cannot set metadata.
+        """
+        serialized = pyarrow.serialize(
+            value, self.get_serialization_context(self.task_driver_id))
+        plasma_id = pyarrow.plasma.ObjectID(object_id.id())
+        buffer = self.plasma_client.create(plasma_id, serialized.total_bytes,
+                                           metadata)
+        stream = pyarrow.FixedSizeBufferWriter(buffer)
+        stream.set_memcopy_threads(self.memcopy_threads)
+        serialized.write_to(stream)
+        self.plasma_client.seal(plasma_id)
+
+    def contains_object(self, object_id):
+        """Check if an object is in the local object store.
+
+        Args:
+            object_id (object_id.ObjectID): The object ID to check.
+
+        Returns:
+            True if the object is in the local object store.
+        """
+        return self.plasma_client.contains(
+            pyarrow.plasma.ObjectID(object_id.id()))
+
+    def put_object(self, object_id, value, metadata=None):
         """Put value in the local object store with object id objectid.
 
         This assumes that the value for objectid has not yet been placed in the
@@ -337,6 +446,7 @@ class Worker(object):
             object_id (object_id.ObjectID): The object ID of the value to be
                 put.
             value: The value to put in the object store.
+            metadata: The plasma metadata to store with the object, or None.
 
         Raises:
             Exception: An exception is raised if the attempt to store the
@@ -354,7 +464,7 @@ class Worker(object):
 
         # Serialize and put the object in the object store.
         try:
-            self.store_and_register(object_id, value)
+            self.store_and_register(object_id, value, metadata=metadata)
         except pyarrow.PlasmaObjectExists:
             # The object already exists in the object store, so there is no
             # need to add it again. TODO(rkn): We need to compare the hashes
@@ -374,7 +484,7 @@ class Worker(object):
                                "so are are falling back to cloudpickle."
                                .format(type(value)))
             logger.warning(warning_message)
-            self.store_and_register(object_id, value)
+            self.store_and_register(object_id, value, metadata=metadata)
 
     def retrieve_and_deserialize(self, object_ids, timeout, error_timeout=10):
         start_time = time.time()
@@ -389,11 +499,25 @@ class Worker(object):
                 results = []
                 for i in range(0, len(object_ids),
                                ray._config.worker_get_request_size()):
-                    results += self.plasma_client.get(
-                        object_ids[i:(
-                            i + ray._config.worker_get_request_size())],
-                        timeout,
-                        self.get_serialization_context(self.task_driver_id))
+                    batch = object_ids[i:(
+                        i + ray._config.worker_get_request_size())]
+                    context = self.get_serialization_context(
+                        self.task_driver_id)
+                    if not self.object_cache.enabled:
+                        results += self.plasma_client.get(
+                            batch, timeout, context)
+                        continue
+                    # Deserialize the buffers here rather than in the plasma
+                    # client to know the size of each object.
+                    buffers = self.plasma_client.get_buffers(batch, timeout)
+                    for object_id, buf in zip(batch, buffers):
+                        if buf is None:
+                            results.append(plasma.ObjectNotAvailable)
+                            continue
+                        value = pyarrow.deserialize(buf, context)
+                        self.object_cache.put(object_id.binary(), value,
+                                              buf.size)
+                        results.append(value)
                 return results
             except pyarrow.lib.ArrowInvalid:
                 # TODO(ekl): the local scheduler could include relevant
@@ -407,11 +531,14 @@ class Worker(object):
             except pyarrow.DeserializationCallbackError:
                 # Wait a little bit for the import thread to import the class.
                 # If we currently have the worker lock, we need to release it
-                # so that the import thread can acquire it.
-                if self.mode == WORKER_MODE:
+                # so that the import thread can acquire it. The threads of a
+                # threaded actor do not hold it.
+                holds_lock = (self.mode == WORKER_MODE
+                              and not self.in_threaded_actor_task())
+                if holds_lock:
                     self.lock.release()
                 time.sleep(0.01)
-                if self.mode == WORKER_MODE:
+                if holds_lock:
                     self.lock.acquire()
 
                 if time.time() - start_time > error_timeout:
@@ -444,6 +571,37 @@ class Worker(object):
             if not isinstance(object_id, ray.ObjectID):
                 raise Exception("Attempting to call `get` on the value {}, "
                                 "which is not an ObjectID.".format(object_id))
+        # The objects may be results of batched actor method calls that were
+        # not submitted yet.
+        self.flush_actor_batches()
+        if not self.object_cache.enabled:
+            return self._get_objects_from_store(object_ids)
+
+        results = [
+            self.object_cache.get(object_id.id(), plasma.ObjectNotAvailable)
+            for object_id in object_ids
+        ]
+        missing_indices = [
+            i for i, value in enumerate(results)
+            if value is plasma.ObjectNotAvailable
+        ]
+        if len(missing_indices) > 0:
+            values = self._get_objects_from_store(
+                [object_ids[i] for i in missing_indices])
+            for i, value in zip(missing_indices, values):
+                results[i] = value
+        return results
+
+    def _get_objects_from_store(self, object_ids):
+        """Get the values in the object store associated with the IDs.
+
+        This fetches the objects to the local object store if needed and
+        blocks until all of them are available.
+
+        Args:
+            object_ids (List[object_id.ObjectID]): A list of the object IDs
+                whose values should be retrieved.
+        """
         # Do an initial fetch for remote objects. We divide the fetch into
         # smaller fetches so as to not block the manager for a prolonged period
         # of time in a single call.
@@ -567,76 +725,336 @@ class Worker(object):
             The return object IDs for this task.
         """
         with profiling.profile("submit_task", worker=self):
-            if actor_id is None:
-                assert actor_handle_id is None
-                actor_id = ray.ObjectID(NIL_ACTOR_ID)
-                actor_handle_id = ray.ObjectID(NIL_ACTOR_HANDLE_ID)
-            else:
-                assert actor_handle_id is not None
-
-            if actor_creation_id is None:
-                actor_creation_id = ray.ObjectID(NIL_ACTOR_ID)
-
-            if actor_creation_dummy_object_id is None:
-                actor_creation_dummy_object_id = (ray.ObjectID(NIL_ID))
-
-            # Put large or complex arguments that are passed by value in the
-            # object store first.
-            args_for_local_scheduler = []
-            for arg in args:
-                if isinstance(arg, ray.ObjectID):
-                    args_for_local_scheduler.append(arg)
-                elif ray.raylet.check_simple_value(arg):
-                    args_for_local_scheduler.append(arg)
-                else:
-                    args_for_local_scheduler.append(put(arg))
+            if resources is None:
+                raise ValueError("The resources dictionary is required.")
+            check_resources(resources)
+            self.flush_actor_batches()
+            task = self._create_task(
+                function_descriptor,
+                args,
+                actor_id=actor_id,
+                actor_handle_id=actor_handle_id,
+                actor_counter=actor_counter,
+                is_actor_checkpoint_method=is_actor_checkpoint_method,
+                actor_creation_id=actor_creation_id,
+                actor_creation_dummy_object_id=actor_creation_dummy_object_id,
+                max_actor_reconstructions=max_actor_reconstructions,
+                execution_dependencies=execution_dependencies,
+                new_actor_handles=new_actor_handles,
+                num_return_vals=num_return_vals,
+                resources=resources,
+                placement_resources=placement_resources,
+                driver_id=driver_id)
+            # Submit the task to local scheduler.
+            self.raylet_client.submit_task(task)
 
-            # By default, there are no execution dependencies.
-            if execution_dependencies is None:
-                execution_dependencies = []
+            return task.returns()
 
-            if new_actor_handles is None:
-                new_actor_handles = []
+    def submit_tasks(self,
+                     function_descriptor,
+                     args_list,
+                     num_return_vals=None,
+                     resources=None,
+                     driver_id=None):
+        """Submit many tasks of the same remote function at once.
 
-            if driver_id is None:
-                driver_id = self.task_driver_id
+        The tasks are sent to the local scheduler in a single message. An
+        argument value that is shared by several tasks and needs to be put in
+        the object store is only put once.
 
+        Args:
+            function_descriptor: The function descriptor to execute.
+            args_list: A list with the argument list of each task.
+            num_return_vals: The number of return values each task should
+                have.
+            resources: The resource requirements of each task.
+            driver_id: The ID of the relevant driver, see submit_task.
+
+        Returns:
+            A list with the return object IDs of each task.
+        """
+        with profiling.profile("submit_tasks", worker=self):
             if resources is None:
                 raise ValueError("The resources dictionary is required.")
-            for value in resources.values():
-                assert (isinstance(value, int) or isinstance(value, float))
-                if value < 0:
-                    raise ValueError(
-                        "Resource quantities must be nonnegative.")
-                if (value >= 1 and isinstance(value, float)
-                        and not value.is_integer()):
-                    raise ValueError(
-                        "Resource quantities must all be whole numbers.")
-
-            if placement_resources is None:
-                placement_resources = {}
+            check_resources(resources)
+            self.flush_actor_batches()
+            task_index = self._reserve_task_indices(len(args_list))
+            put_cache = {}
+            tasks = [
+                self._create_task(
+                    function_descriptor,
+                    args,
+                    num_return_vals=num_return_vals,
+                    resources=resources,
+                    driver_id=driver_id,
+                    task_index=task_index + i,
+                    put_cache=put_cache) for i, args in enumerate(args_list)
+            ]
+            if tasks:
+                self.raylet_client.submit_tasks(tasks)
+            return [task.returns() for task in tasks]
+
+    def _create_task(self,
+                     function_descriptor,
+                     args,
+                     actor_id=None,
+                     actor_handle_id=None,
+                     actor_counter=0,
+                     is_actor_checkpoint_method=False,
+                     actor_creation_id=None,
+                     actor_creation_dummy_object_id=None,
+                     max_actor_reconstructions=0,
+                     execution_dependencies=None,
+                     new_actor_handles=None,
+                     num_return_vals=None,
+                     resources=None,
+                     placement_resources=None,
+                     driver_id=None,
+                     task_index=None,
+                     put_cache=None,
+                     parent_task_id=None):
+        """Create a task to submit to the scheduler.
+
+        The arguments are the same as for submit_task, except for task_index,
+        put_cache and parent_task_id. task_index is the index of the task
+        among the tasks submitted by its parent task. If it is None, the next
+        index is reserved. parent_task_id is the ID of the parent task, which
+        defaults to the current task. put_cache is a dictionary that maps the
+        id() of argument values that were already put in the object store to
+        their object IDs. It is used to put values that are passed to several
+        tasks only once. The caller must keep the argument values alive while
+        the cache is in use.
 
-            with self.state_lock:
-                # Increment the worker's task index to track how many tasks
-                # have been submitted by the current task so far.
-                task_index = self.task_index
-                self.task_index += 1
-                # The parent task must be set for the submitted task.
-                if self.actor_id == NIL_ACTOR_ID:
-                    assert not self.current_task_id.is_nil()
-            # Submit the task to local scheduler.
-            function_descriptor_list = (
-                function_descriptor.get_function_descriptor_list())
-            task = ray.raylet.Task(
-                driver_id, function_descriptor_list, args_for_local_scheduler,
-                num_return_vals, self.current_task_id, task_index,
-                actor_creation_id, actor_creation_dummy_object_id,
-                max_actor_reconstructions, actor_id, actor_handle_id,
-                actor_counter, new_actor_handles, execution_dependencies,
-                resources, placement_resources)
-            self.raylet_client.submit_task(task)
+        Returns:
+            The task.
+        """
+        if actor_id is None:
+            assert actor_handle_id is None
+            actor_id = ray.ObjectID(NIL_ACTOR_ID)
+            actor_handle_id = ray.ObjectID(NIL_ACTOR_HANDLE_ID)
+        else:
+            assert actor_handle_id is not None
 
-            return task.returns()
+        if actor_creation_id is None:
+            actor_creation_id = ray.ObjectID(NIL_ACTOR_ID)
+
+        if actor_creation_dummy_object_id is None:
+            actor_creation_dummy_object_id = (ray.ObjectID(NIL_ID))
+
+        if driver_id is None:
+            driver_id = self.task_driver_id
+
+        # Put large or complex arguments that are passed by value in the
+        # object store first.
+        args_for_local_scheduler = []
+        for arg in args:
+            if isinstance(arg, ray.ObjectID):
+                args_for_local_scheduler.append(arg)
+            elif ray.raylet.check_simple_value(arg):
+                args_for_local_scheduler.append(arg)
+            else:
+                object_id = (None
+                             if put_cache is None else put_cache.get(id(arg)))
+                if object_id is None:
+                    object_id = self.auto_put_cache.put(
+                        arg,
+                        put,
+                        driver_id=driver_id,
+                        contains=self.contains_object)
+                    if put_cache is not None:
+                        put_cache[id(arg)] = object_id
+                args_for_local_scheduler.append(object_id)
+
+        # By default, there are no execution dependencies.
+        if execution_dependencies is None:
+            execution_dependencies = []
+
+        if new_actor_handles is None:
+            new_actor_handles = []
+
+        if placement_resources is None:
+            placement_resources = {}
+
+        if parent_task_id is None:
+            parent_task_id = self.current_task_id
+
+        if task_index is None:
+            task_index = self._reserve_task_indices(1)
+        function_descriptor_list = (
+            function_descriptor.get_function_descriptor_list())
+        return ray.raylet.Task(
+            driver_id, function_descriptor_list, args_for_local_scheduler,
+            num_return_vals, parent_task_id, task_index, actor_creation_id,
+            actor_creation_dummy_object_id, max_actor_reconstructions,
+            actor_id, actor_handle_id, actor_counter, new_actor_handles,
+            execution_dependencies, resources, placement_resources)
+
+    def _reserve_task_indices(self, num_tasks):
+        """Reserve the task indices of tasks submitted by the current task.
+
+        Args:
+            num_tasks: The number of task indices to reserve.
+
+        Returns:
+            The first of the reserved task indices.
+        """
+        with self.state_lock:
+            # Increment the worker's task index to track how many tasks
+            # have been submitted by the current task so far.
+            task_index = self.task_index
+            self.task_index += num_tasks
+            # The parent task must be set for the submitted task.
+            if self.actor_id == NIL_ACTOR_ID:
+                assert not self.current_task_id.is_nil()
+        return task_index
+
+    def _compute_return_ids(self, task_index, num_return_vals, driver_id):
+        """Compute the return object IDs of a task before it is created.
+
+        The ID of a task only depends on its driver, its parent task and its
+        task index, so the return IDs of a task whose index was reserved are
+        known before the task's arguments are.
+
+        Args:
+            task_index: The reserved task index of the task.
+            num_return_vals: The number of return IDs to compute.
+            driver_id: The ID of the driver of the task.
+
+        Returns:
+            The first num_return_vals return object IDs of the task.
+        """
+        nil_id = ray.ObjectID(NIL_ID)
+        task = ray.raylet.Task(driver_id, [], [], num_return_vals,
+                               self.current_task_id, task_index, nil_id,
+                               nil_id, 0, nil_id, nil_id, 0, [], [])
+        return task.returns()
+
+    def wait_for_objects(self, object_ids, num_returns, timeout_milliseconds,
+                         current_task_id):
+        """Wait until some of the given objects are available.
+
+        The threads of a threaded actor cannot wait through the local
+        scheduler, since the main thread holds the connection while it waits
+        for the next task. They ask the local scheduler to fetch or
+        reconstruct the objects and poll the local object store instead, with
+        an exponential backoff of up to 100 milliseconds between polls. For
+        them, an object is only available once it is in the local object
+        store.
+
+        Args:
+            object_ids: A list of unique object IDs.
+            num_returns: The number of objects to wait for.
+            timeout_milliseconds: The maximum time to wait.
+            current_task_id: The task ID to notify the backend with.
+
+        Returns:
+            A list of the object IDs that are available and a list of the
+                remaining object IDs.
+        """
+        if not self.in_threaded_actor_task():
+            return self.raylet_client.wait(object_ids, num_returns,
+                                           timeout_milliseconds, False,
+                                           current_task_id)
+
+        fetch_request_size = ray._config.worker_fetch_request_size()
+        for i in range(0, len(object_ids), fetch_request_size):
+            self.raylet_client.fetch_or_reconstruct(
+                object_ids[i:(i + fetch_request_size)], False, current_task_id)
+        plasma_ids = [
+            plasma.ObjectID(object_id.id()) for object_id in object_ids
+        ]
+        start_time = time.time()
+        poll_interval = 0.001
+        try:
+            while True:
+                is_ready = [
+                    self.plasma_client.contains(plasma_id)
+                    for plasma_id in plasma_ids
+                ]
+                remaining_time = (
+                    timeout_milliseconds / 1000 - (time.time() - start_time))
+                if sum(is_ready) >= num_returns or remaining_time <= 0:
+                    break
+                time.sleep(min(poll_interval, remaining_time))
+                poll_interval = min(2 * poll_interval, 0.1)
+        finally:
+            # The local scheduler no longer needs to make the objects
+            # available for this thread.
+            self.raylet_client.notify_unblocked(current_task_id)
+        ready_ids = []
+        remaining_ids = []
+        for object_id, ready in zip(object_ids, is_ready):
+            if ready and len(ready_ids) < num_returns:
+                ready_ids.append(object_id)
+            else:
+                remaining_ids.append(object_id)
+        return ready_ids, remaining_ids
+
+    def flush_actor_batches(self):
+        """Submit the calls of batched actor methods that were held back.
+
+        Calls of an actor method with a max_batch_size are held back by the
+        actor handle, so that consecutive calls are submitted as one task.
+        They must be submitted before any task that may depend on their
+        results, before the worker blocks on objects, and before the current
+        task finishes. Batches that are held back for longer than
+        ray_constants.ACTOR_BATCH_MAX_HOLD_MS are also submitted by a
+        background thread.
+        """
+        if not self.pending_actor_batches:
+            return
+        with self.actor_batches_condition:
+            while self.pending_actor_batches:
+                actor_handle = self.pending_actor_batches.pop()
+                actor_handle._ray_flush_batch()
+
+    def _schedule_actor_batch_flush(self):
+        """Make sure that a newly held back batch is submitted in time.
+
+        This must be called with self.actor_batches_condition held, after an
+        actor handle was added to self.pending_actor_batches.
+        """
+        if self.actor_batch_flusher is None:
+            self.actor_batch_flusher = threading.Thread(
+                target=self._actor_batch_flush_loop,
+                name="ray_actor_batch_flusher")
+            self.actor_batch_flusher.daemon = True
+            self.actor_batch_flusher.start()
+        self.actor_batches_condition.notify()
+
+    def _actor_batch_flush_loop(self):
+        """Submit the batches that were held back for too long.
+
+        A batch is otherwise only submitted when it is full or when the
+        worker flushes its batches, so without this the calls of a driver
+        that does not block on their results would never run. Each batch is
+        held back for at most ray_constants.ACTOR_BATCH_MAX_HOLD_MS.
+        """
+        with self.actor_batches_condition:
+            while True:
+                if not self.pending_actor_batches:
+                    self.actor_batches_condition.wait()
+                    continue
+                max_hold_time = ray_constants.ACTOR_BATCH_MAX_HOLD_MS / 1000
+                now = time.time()
+                deadline = max_hold_time + min(
+                    actor_handle._ray_pending_batch.start_time
+                    for actor_handle in self.pending_actor_batches)
+                if deadline > now:
+                    self.actor_batches_condition.wait(deadline - now)
+                    continue
+                for actor_handle in list(self.pending_actor_batches):
+                    batch = actor_handle._ray_pending_batch
+                    if batch.start_time + max_hold_time > now:
+                        continue
+                    try:
+                        actor_handle._ray_flush_batch()
+                    except Exception:
+                        # The handle drops the batch before submitting it,
+                        # so a failed batch is not retried.
+                        logger.exception("Failed to submit a batch of calls "
+                                         "of actor method {}.".format(
+                                             batch.method_name))
 
     def run_function_on_all_workers(self, function,
                                     run_on_other_drivers=False):
@@ -760,7 +1178,7 @@ class Worker(object):
 
             self.put_object(object_ids[i], outputs[i])
 
-    def _process_task(self, task, function_execution_info):
+    def _process_task(self, task, function_execution_info, idle_time=None):
         """Execute a task assigned to this worker.
 
         This method deserializes a task from the scheduler, and attempts to
@@ -769,6 +1187,13 @@ class Worker(object):
         objects are stored in the object store to represent the failed task
         (these will be retrieved by calls to get or by subsequent tasks that
         use the outputs of this task).
+
+        Args:
+            task: The task to execute.
+            function_execution_info: The FunctionExecutionInfo of the function
+                that the task executes.
+            idle_time: The number of seconds the worker was idle waiting for
+                this task, if known.
         """
         with self.state_lock:
             assert self.current_task_id.is_nil()
@@ -798,15 +1223,28 @@ class Worker(object):
             dummy_return_id = return_object_ids.pop()
         function_executor = function_execution_info.function
         function_name = function_execution_info.function_name
+        # The fully qualified function name that task latencies are recorded
+        # under.
+        latency_key = ".".join(name for name in [
+            function_descriptor.module_name, function_descriptor.class_name,
+            function_name
+        ] if name)
+        profiler = self.profiler
+        if idle_time is not None:
+            profiler.record_task_latency(latency_key, "idle", idle_time)
 
         # Get task arguments from the object store.
         try:
             if function_name != "__ray_terminate__":
                 self.reraise_actor_init_error()
             self.memory_monitor.raise_if_low_memory()
+            phase_start_time = time.time()
             with profiling.profile("task:deserialize_arguments", worker=self):
                 arguments = self._get_arguments_for_execution(
                     function_name, args)
+            phase_end_time = time.time()
+            profiler.record_task_latency(latency_key, "deserialize_arguments",
+                                         phase_end_time - phase_start_time)
         except RayTaskError as e:
             self._handle_process_task_failure(
                 function_descriptor, return_object_ids, e,
@@ -820,6 +1258,7 @@ class Worker(object):
 
         # Execute the task.
         try:
+            phase_start_time = phase_end_time
             with profiling.profile("task:execute", worker=self):
                 if (task.actor_id().is_nil()
                         and task.actor_creation_id().is_nil()):
@@ -831,6 +1270,9 @@ class Worker(object):
                         key = task.actor_creation_id().id()
                     outputs = function_executor(dummy_return_id,
                                                 self.actors[key], *arguments)
+            phase_end_time = time.time()
+            profiler.record_task_latency(latency_key, "execute",
+                                         phase_end_time - phase_start_time)
         except Exception as e:
             # Determine whether the exception occured during a task, not an
             # actor method.
@@ -843,6 +1285,7 @@ class Worker(object):
 
         # Store the outputs in the local object store.
         try:
+            phase_start_time = phase_end_time
             with profiling.profile("task:store_outputs", worker=self):
                 # If this is an actor task, then the last object ID returned by
                 # the task is a dummy output, not returned by the function
@@ -851,6 +1294,8 @@ class Worker(object):
                 if num_returns == 1:
                     outputs = (outputs, )
                 self._store_outputs_in_object_store(return_object_ids, outputs)
+            profiler.record_task_latency(latency_key, "store_outputs",
+                                         time.time() - phase_start_time)
         except Exception as e:
             self._handle_process_task_failure(
                 function_descriptor, return_object_ids, e,
@@ -881,11 +1326,13 @@ class Worker(object):
         if self.actor_id != NIL_ACTOR_ID and function_name == "__init__":
             self.mark_actor_init_failed(error)
 
-    def _wait_for_and_process_task(self, task):
+    def _wait_for_and_process_task(self, task, idle_time=None):
         """Wait for a task to be ready and process the task.
 
         Args:
             task: The task to execute.
+            idle_time: The number of seconds the worker was idle waiting for
+                this task, if known.
         """
         function_descriptor = FunctionDescriptor.from_bytes_list(
             task.function_descriptor_list())
@@ -902,6 +1349,10 @@ class Worker(object):
         execution_info = self.function_actor_manager.get_execution_info(
             driver_id, function_descriptor)
 
+        if not task.actor_id().is_nil() and self.actor_max_concurrency > 1:
+            self._submit_threaded_actor_task(task, execution_info, idle_time)
+            return
+
         # Execute the task.
         # TODO(rkn): Consider acquiring this lock with a timeout and pushing a
         # warning to the user if we are waiting too long to acquire the lock
@@ -929,7 +1380,8 @@ class Worker(object):
                 next_title = "ray_{}".format(actor.__class__.__name__)
             with profiling.profile("task", extra_data=extra_data, worker=self):
                 with _changeproctitle(title, next_title):
-                    self._process_task(task, execution_info)
+                    self._process_task(task, execution_info, idle_time)
+                    self.flush_actor_batches()
                 # Reset the state fields so the next task can run.
                 with self.state_lock:
                     if self.actor_id == NIL_ACTOR_ID:
@@ -949,6 +1401,93 @@ class Worker(object):
             self.raylet_client.disconnect()
             sys.exit(0)
 
+    def _submit_threaded_actor_task(self, task, execution_info, idle_time):
+        """Hand a method of a threaded actor to the actor's threads.
+
+        This returns as soon as a thread is free to execute the method, so
+        that the worker can get the next task from the local scheduler while
+        the method runs. The methods start in the order that they are
+        received, but may finish in any order, unless the actor orders the
+        methods of each handle. The local scheduler keeps the method assigned
+        to this worker until its thread reports that it is done.
+
+        Args:
+            task: The actor task to execute.
+            execution_info: The FunctionExecutionInfo of the method.
+            idle_time: The number of seconds the worker was idle waiting for
+                this task, if known.
+        """
+        if self.actor_task_queue is None:
+            self.actor_task_queue = queue.Queue()
+            self.actor_task_slots = threading.Semaphore(
+                self.actor_max_concurrency)
+            for i in range(self.actor_max_concurrency):
+                thread = threading.Thread(
+                    target=self._threaded_actor_loop,
+                    name="ray_actor_thread_{}".format(i))
+                thread.daemon = True
+                thread.start()
+        # Keep the task assigned in the local scheduler until the thread
+        # finishes it, even though this worker asks for its next task first.
+        self.raylet_client.notify_task_in_flight(task.task_id())
+        if self.actor_per_handle_ordering:
+            handle_id = task.actor_handle_id()
+            with self.actor_handle_queues_lock:
+                if handle_id in self.actor_handle_queues:
+                    # An earlier method from the same handle is still running,
+                    # so this one starts when that one finishes. It does not
+                    # take a slot until then, so that it cannot keep the
+                    # methods of other handles from running.
+                    self.actor_handle_queues[handle_id].append(
+                        (task, execution_info, idle_time))
+                    return
+                self.actor_handle_queues[handle_id] = collections.deque()
+        self.actor_task_slots.acquire()
+        self.actor_task_queue.put((task, execution_info, idle_time))
+
+    def _start_next_handle_task(self, handle_id):
+        """Start the next queued method from an actor handle, if any.
+
+        The next method takes over the slot of the method that just finished.
+
+        Args:
+            handle_id: The ID of the actor handle whose method just finished.
+
+        Returns:
+            True if a queued method took over the slot and false otherwise.
+        """
+        with self.actor_handle_queues_lock:
+            pending = self.actor_handle_queues[handle_id]
+            if pending:
+                self.actor_task_queue.put(pending.popleft())
+                return True
+            del self.actor_handle_queues[handle_id]
+            return False
+
+    def _threaded_actor_loop(self):
+        """Execute methods of a threaded actor on this thread."""
+        while True:
+            task, execution_info, idle_time = self.actor_task_queue.get()
+            self.thread_local.task_context = TaskContext()
+            extra_data = {
+                "name": execution_info.function_name,
+                "task_id": task.task_id().hex()
+            }
+            try:
+                with profiling.profile(
+                        "task", extra_data=extra_data, worker=self):
+                    self._process_task(task, execution_info, idle_time)
+                    self.flush_actor_batches()
+            except Exception:
+                logger.exception("Failed to execute actor task {}.".format(
+                    task.task_id().hex()))
+            finally:
+                del self.thread_local.task_context
+                self.raylet_client.notify_in_flight_task_done(task.task_id())
+                if not (self.actor_per_handle_ordering and
+                        self._start_next_handle_task(task.actor_handle_id())):
+                    self.actor_task_slots.release()
+
     def _get_next_task_from_local_scheduler(self):
         """Get the next task from the local scheduler.
 
@@ -973,8 +1512,10 @@ class Worker(object):
         signal.signal(signal.SIGTERM, exit)
 
         while True:
+            idle_start_time = time.time()
             task = self._get_next_task_from_local_scheduler()
-            self._wait_for_and_process_task(task)
+            self._wait_for_and_process_task(
+                task, idle_time=time.time() - idle_start_time)
 
 
 def get_gpu_ids():
@@ -1583,6 +2124,9 @@ def shutdown(worker=global_worker):
     need to redefine them. If they were defined in an imported module, then you
     will need to reload the module.
     """
+    if worker.connected:
+        # Submit the batched actor method calls that are still held back.
+        worker.flush_actor_batches()
     disconnect(worker)
     if hasattr(worker, "raylet_client"):
         del worker.raylet_client
@@ -1784,6 +2328,17 @@ def connect(ray_params,
 
     worker.profiler = profiling.Profiler(worker)
 
+    def serialize_argument(value):
+        context = worker.get_serialization_context(worker.task_driver_id)
+        return pyarrow.serialize(value, context).to_buffer()
+
+    worker.auto_put_cache = AutoPutCache(
+        mode=ray_constants.AUTO_PUT_CACHE_MODE,
+        capacity=ray_constants.AUTO_PUT_CACHE_SIZE,
+        serialize=serialize_argument)
+    worker.object_cache = ObjectCache(
+        capacity_bytes=ray_constants.OBJECT_CACHE_SIZE_BYTES)
+
     # Initialize some fields.
     if mode is WORKER_MODE:
         worker.worker_id = random_string()
@@ -2034,9 +2589,13 @@ def disconnect(worker=global_worker):
     # the remote functions will be exported. This is mostly relevant for the
     # tests.
     worker.connected = False
+    with worker.actor_batches_condition:
+        worker.pending_actor_batches.clear()
     worker.cached_functions_to_run = []
     worker.function_actor_manager.reset_cache()
     worker.serialization_context_map.clear()
+    # Cached values may reference buffers of the disconnected object store.
+    worker.object_cache.clear()
 
 
 @contextmanager
@@ -2239,11 +2798,106 @@ def get(object_ids, worker=global_worker):
             return value
 
 
-def put(value, worker=global_worker):
+def get_iter(object_ids, ordered=False, prefetch=100, worker=global_worker):
+    """Get a list of remote objects, yielding each value once it is available.
+
+    Unlike `ray.get`, which returns all values at once after all objects are
+    local, this generator yields values while the remaining objects are
+    still being computed or fetched. At most `prefetch` objects are fetched
+    ahead of the value that is being consumed, so the values that are held at
+    the same time are bounded regardless of the number of object IDs.
+
+    Examples:
+        >>> total = 0
+        >>> for value in ray.get_iter([f.remote(i) for i in range(100000)]):
+        ...     total += value
+
+    Args:
+        object_ids (List[ObjectID]): The object IDs of the objects to get.
+        ordered (bool): If true, values are yielded in the order of
+            object_ids. Otherwise, values are yielded as soon as they are
+            available, which keeps a slow object from delaying the others.
+        prefetch (int): The maximum number of objects that are fetched to
+            the local object store ahead of being yielded.
+
+    Yields:
+        The value of each object in object_ids.
+
+    Raises:
+        Exception: An exception is raised when the iterator reaches an object
+            whose task raised an exception.
+    """
+    global last_task_error_raise_time
+    if not isinstance(object_ids, list):
+        raise TypeError("get_iter() expected a list of ObjectID, got "
+                        "{}".format(type(object_ids)))
+    if prefetch < 1:
+        raise ValueError("The 'prefetch' argument must be positive. "
+                         "Received {}".format(prefetch))
+
+    worker.check_connected()
+    if worker.mode == LOCAL_MODE:
+        # In LOCAL_MODE, the object IDs are already the values.
+        for value in object_ids:
+            yield value
+        return
+    for object_id in object_ids:
+        if not isinstance(object_id, ray.ObjectID):
+            raise TypeError("get_iter() expected a list of ObjectID, got "
+                            "list containing {}".format(type(object_id)))
+
+    worker.flush_actor_batches()
+    pending_ids = collections.deque(object_ids)
+    # The object IDs that are being fetched, in their input order.
+    window = []
+    while len(pending_ids) > 0 or len(window) > 0:
+        new_ids = []
+        while len(pending_ids) > 0 and len(window) + len(new_ids) < prefetch:
+            new_ids.append(pending_ids.popleft())
+        window += new_ids
+        fetch_request_size = ray._config.worker_fetch_request_size()
+        for i in range(0, len(new_ids), fetch_request_size):
+            worker.raylet_client.fetch_or_reconstruct(
+                new_ids[i:(i + fetch_request_size)], True)
+
+        with profiling.profile("ray.get_iter", worker=worker):
+            if ordered:
+                ready_ids = window[:1]
+            else:
+                with worker.state_lock:
+                    current_task_id = worker.get_current_thread_task_id()
+                # Wait requires unique object IDs.
+                unique_window = list(collections.OrderedDict.fromkeys(window))
+                ready_ids, _ = worker.wait_for_objects(unique_window, 1, 10**9,
+                                                       current_task_id)
+            values = dict(zip(ready_ids, worker.get_object(ready_ids)))
+
+        # Yield the value once for each occurrence of a ready object ID.
+        remaining_window = []
+        for object_id in window:
+            if object_id not in values:
+                remaining_window.append(object_id)
+                continue
+            value = values[object_id]
+            if isinstance(value, RayTaskError):
+                last_task_error_raise_time = time.time()
+                raise value
+            yield value
+            if ordered:
+                remaining_window += window[1:]
+                break
+        window = remaining_window
+
+
+def put(value, compress=True, worker=global_worker):
     """Store an object in the object store.
 
     Args:
         value: The Python object to be stored.
+        compress: If False, the object manager never compresses the object
+            when it sends the object to other nodes, e.g., because the value
+            is already compressed. This only matters if the
+            object_manager_compression_min_bytes config is set.
 
     Returns:
         The object ID assigned to this value.
@@ -2255,7 +2909,9 @@ def put(value, worker=global_worker):
             return value
         object_id = worker.raylet_client.compute_put_id(
             worker.current_task_id, worker.put_index)
-        worker.put_object(object_id, value)
+        metadata = (None if compress else
+                    ray_constants.OBJECT_METADATA_NO_COMPRESSION)
+        worker.put_object(object_id, value, metadata=metadata)
         worker.put_index += 1
         return object_id
 
@@ -2342,15 +2998,16 @@ def wait(object_ids, num_returns=1, timeout=None, worker=global_worker):
             raise Exception("num_returns cannot be greater than the number "
                             "of objects provided to ray.wait.")
 
+        worker.flush_actor_batches()
+
         # Get the task ID, to notify the backend which task is blocked.
         with worker.state_lock:
             current_task_id = worker.get_current_thread_task_id()
 
         timeout = timeout if timeout is not None else 10**6
         timeout_milliseconds = int(timeout * 1000)
-        ready_ids, remaining_ids = worker.raylet_client.wait(
-            object_ids, num_returns, timeout_milliseconds, False,
-            current_task_id)
+        ready_ids, remaining_ids = worker.wait_for_objects(
+            object_ids, num_returns, timeout_milliseconds, current_task_id)
         return ready_ids, remaining_ids
 
 
@@ -2376,6 +3033,8 @@ def make_decorator(num_return_vals=None,
                    max_calls=None,
                    checkpoint_interval=None,
                    max_reconstructions=None,
+                   max_concurrency=None,
+                   per_handle_ordering=None,
                    worker=None):
     def decorator(function_or_class):
         if (inspect.isfunction(function_or_class)
@@ -2387,6 +3046,12 @@ def make_decorator(num_return_vals=None,
             if max_reconstructions is not None:
                 raise Exception("The keyword 'max_reconstructions' is not "
                                 "allowed for remote functions.")
+            if max_concurrency is not None:
+                raise Exception("The keyword 'max_concurrency' is not "
+                                "allowed for remote functions.")
+            if per_handle_ordering is not None:
+                raise Exception("The keyword 'per_handle_ordering' is not "
+                                "allowed for remote functions.")
 
             return ray.remote_function.RemoteFunction(
                 function_or_class, num_cpus, num_gpus, resources,
@@ -2416,7 +3081,8 @@ def make_decorator(num_return_vals=None,
 
             return worker.make_actor(function_or_class, cpus_to_use, num_gpus,
                                      resources, actor_method_cpus,
-                                     checkpoint_interval, max_reconstructions)
+                                     checkpoint_interval, max_reconstructions,
+                                     max_concurrency, per_handle_ordering)
 
         raise Exception("The @ray.remote decorator must be applied to "
                         "either a function or to a class.")
@@ -2463,6 +3129,18 @@ def remote(*args, **kwargs):
       unexpectedly. The minimum valid value is 0 (default), which indicates
       that the actor doesn't need to be reconstructed. And the maximum valid
       value is ray.ray_constants.INFINITE_RECONSTRUCTIONS.
+    * **max_concurrency**: Only for *actors*. This specifies the maximum
+      number of methods that the actor executes at once. If this is greater
+      than 1, the methods run on a pool of threads, so that e.g. an actor that
+      waits on I/O or calls ray.get can serve several callers at once. The
+      methods start in the order that they are submitted, but may finish in
+      any order, so the actor's state must be safe to access from several
+      threads. By default this is 1, and the methods run one at a time.
+    * **per_handle_ordering**: Only for *actors*. If this is True, the methods
+      that are submitted through the same actor handle run one at a time, in
+      the order that they are submitted, even if max_concurrency is greater
+      than 1. Methods from different handles still run concurrently. By
+      default this is False.
 
     This can be done as follows:
 
@@ -2488,15 +3166,17 @@ def remote(*args, **kwargs):
                     "with no arguments and no parentheses, for example "
                     "'@ray.remote', or it must be applied using some of "
                     "the arguments 'num_return_vals', 'num_cpus', 'num_gpus', "
-                    "'resources', 'max_calls', 'checkpoint_interval',"
-                    "or 'max_reconstructions', like "
+                    "'resources', 'max_calls', 'checkpoint_interval', "
+                    "'max_reconstructions', 'max_concurrency' or "
+                    "'per_handle_ordering', like "
                     "'@ray.remote(num_return_vals=2, "
                     "resources={\"CustomResource\": 1})'.")
     assert len(args) == 0 and len(kwargs) > 0, error_string
     for key in kwargs:
         assert key in [
             "num_return_vals", "num_cpus", "num_gpus", "resources",
-            "max_calls", "checkpoint_interval", "max_reconstructions"
+            "max_calls", "checkpoint_interval", "max_reconstructions",
+            "max_concurrency", "per_handle_ordering"
         ], error_string
 
     num_cpus = kwargs["num_cpus"] if "num_cpus" in kwargs else None
@@ -2515,6 +3195,8 @@ def remote(*args, **kwargs):
     max_calls = kwargs.get("max_calls")
     checkpoint_interval = kwargs.get("checkpoint_interval")
     max_reconstructions = kwargs.get("max_reconstructions")
+    max_concurrency = kwargs.get("max_concurrency")
+    per_handle_ordering = kwargs.get("per_handle_ordering")
 
     return make_decorator(
         num_return_vals=num_return_vals,
@@ -2524,4 +3206,6 @@ def remote(*args, **kwargs):
         max_calls=max_calls,
         checkpoint_interval=checkpoint_interval,
         max_reconstructions=max_reconstructions,
+        max_concurrency=max_concurrency,
+        per_handle_ordering=per_handle_ordering,
         worker=worker)
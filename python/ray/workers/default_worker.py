@@ -3,6 +3,7 @@ from __future__ import division
 from __future__ import print_function
 
 import argparse
+import importlib
 import logging
 import traceback
 
@@ -76,6 +77,15 @@ if __name__ == "__main__":
     # Override the temporary directory.
     tempfile_services.set_temp_root(args.temp_dir)
 
+    # Import the preloaded modules before connecting, so that the raylet only
+    # assigns tasks to this worker once the imports are done.
+    for module_name in ray_constants.WORKER_PRELOAD_MODULES:
+        try:
+            importlib.import_module(module_name)
+        except Exception:
+            logging.exception(
+                "Failed to preload module {}.".format(module_name))
+
     ray_params = RayParams(
         node_ip_address=args.node_ip_address,
         redis_address=args.redis_address,
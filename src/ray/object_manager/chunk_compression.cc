@@ -0,0 +1,132 @@
+#include "ray/object_manager/chunk_compression.h"
+
+#include <cstring>
+
+namespace ray {
+
+namespace {
+
+/// Runs of zeros that are shorter than this are kept in the literal bytes,
+/// since encoding them would barely save any space.
+constexpr uint64_t kMinZeroRun = 16;
+
+/// The number of bytes that are checked for zeros at once.
+constexpr uint64_t kWordSize = sizeof(uint64_t);
+
+static_assert(kMinZeroRun >= 2 * kWordSize - 1,
+              "Every run of zeros that is encoded must contain a whole word at "
+              "any word-sized stride.");
+
+bool IsZeroWord(const uint8_t *data) {
+  uint64_t word;
+  std::memcpy(&word, data, kWordSize);
+  return word == 0;
+}
+
+void AppendVarint(uint64_t value, std::vector<uint8_t> *output) {
+  while (value >= 0x80) {
+    output->push_back(static_cast<uint8_t>(value) | 0x80);
+    value >>= 7;
+  }
+  output->push_back(static_cast<uint8_t>(value));
+}
+
+bool ReadVarint(const uint8_t *input, uint64_t input_size, uint64_t *position,
+                uint64_t *value) {
+  *value = 0;
+  for (int shift = 0; shift < 64; shift += 7) {
+    if (*position >= input_size) {
+      return false;
+    }
+    uint8_t byte = input[(*position)++];
+    *value |= static_cast<uint64_t>(byte & 0x7f) << shift;
+    if ((byte & 0x80) == 0) {
+      return true;
+    }
+  }
+  return false;
+}
+
+void AppendRecord(const uint8_t *literal, uint64_t literal_size, uint64_t zero_size,
+                  std::vector<uint8_t> *output) {
+  AppendVarint(literal_size, output);
+  output->insert(output->end(), literal, literal + literal_size);
+  AppendVarint(zero_size, output);
+}
+
+}  // namespace
+
+bool IsCompressionAllowed(const std::string &metadata) {
+  return metadata != kNoCompressionMetadata;
+}
+
+bool CompressChunk(const uint8_t *data, uint64_t size, std::vector<uint8_t> *output) {
+  output->clear();
+  uint64_t literal_start = 0;
+  uint64_t position = 0;
+  // Only check every word-sized stride for zeros. Every run of zeros that is
+  // long enough to be encoded contains one of these words, so incompressible
+  // data is skipped quickly.
+  while (position + kWordSize <= size) {
+    if (!IsZeroWord(data + position)) {
+      position += kWordSize;
+      continue;
+    }
+    // Find the bounds of the run of zeros that contains this word.
+    uint64_t run_start = position;
+    while (run_start > literal_start && data[run_start - 1] == 0) {
+      --run_start;
+    }
+    uint64_t run_end = position + kWordSize;
+    while (run_end + kWordSize <= size && IsZeroWord(data + run_end)) {
+      run_end += kWordSize;
+    }
+    while (run_end < size && data[run_end] == 0) {
+      ++run_end;
+    }
+    if (run_end - run_start >= kMinZeroRun) {
+      AppendRecord(data + literal_start, run_start - literal_start, run_end - run_start,
+                   output);
+      literal_start = run_end;
+      if (output->size() >= size) {
+        return false;
+      }
+    }
+    position = run_end;
+  }
+  if (literal_start < size) {
+    AppendRecord(data + literal_start, size - literal_start, 0, output);
+  }
+  return output->size() < size;
+}
+
+ray::Status DecompressChunk(const uint8_t *input, uint64_t input_size, uint8_t *output,
+                            uint64_t output_size) {
+  uint64_t input_position = 0;
+  uint64_t output_position = 0;
+  while (input_position < input_size) {
+    uint64_t literal_size;
+    if (!ReadVarint(input, input_size, &input_position, &literal_size) ||
+        literal_size > input_size - input_position ||
+        literal_size > output_size - output_position) {
+      return ray::Status::IOError("Malformed compressed object chunk.");
+    }
+    std::memcpy(output + output_position, input + input_position, literal_size);
+    input_position += literal_size;
+    output_position += literal_size;
+
+    uint64_t zero_size;
+    if (!ReadVarint(input, input_size, &input_position, &zero_size) ||
+        zero_size > output_size - output_position) {
+      return ray::Status::IOError("Malformed compressed object chunk.");
+    }
+    std::memset(output + output_position, 0, zero_size);
+    output_position += zero_size;
+  }
+  if (output_position != output_size) {
+    return ray::Status::IOError("Compressed object chunk has the wrong size.");
+  }
+  return ray::Status::OK();
+}
+
+}  // namespace ray
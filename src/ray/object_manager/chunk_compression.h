@@ -0,0 +1,52 @@
+#ifndef RAY_OBJECT_MANAGER_CHUNK_COMPRESSION_H
+#define RAY_OBJECT_MANAGER_CHUNK_COMPRESSION_H
+
+#include <cstdint>
+#include <string>
+#include <vector>
+
+#include "ray/status.h"
+
+namespace ray {
+
+/// The plasma metadata of objects whose chunks are never compressed, e.g.,
+/// because their contents are already compressed. This must match
+/// OBJECT_METADATA_NO_COMPRESSION in python/ray/ray_constants.py.
+constexpr char kNoCompressionMetadata[] = "RAY_NO_COMPRESSION";
+
+/// Check whether an object's chunks may be compressed.
+///
+/// \param metadata The plasma metadata of the object.
+/// \return False if the object opted out of compression.
+bool IsCompressionAllowed(const std::string &metadata);
+
+/// Compress an object chunk for transfer.
+///
+/// The chunk is encoded as a sequence of records, each of which is a run of
+/// literal bytes followed by a run of zero bytes. The lengths are encoded as
+/// varints. Only runs of zeros are compressed, which makes the encoding cheap
+/// enough to run at network speed and effective for the sparse arrays and
+/// zero-padded buffers that make up many large objects.
+///
+/// \param data The chunk to compress.
+/// \param size The size of the chunk in bytes.
+/// \param output The compressed chunk. Its contents are undefined if the
+/// chunk was not compressed.
+/// \return Whether the chunk was compressed. This is false if the compressed
+/// chunk would not be smaller than the chunk itself.
+bool CompressChunk(const uint8_t *data, uint64_t size, std::vector<uint8_t> *output);
+
+/// Decompress an object chunk that was compressed by CompressChunk.
+///
+/// \param input The compressed chunk.
+/// \param input_size The size of the compressed chunk in bytes.
+/// \param output The buffer to write the decompressed chunk to.
+/// \param output_size The size of the decompressed chunk in bytes.
+/// \return Status IOError if the compressed chunk is malformed or does not
+/// decompress to exactly output_size bytes.
+ray::Status DecompressChunk(const uint8_t *input, uint64_t input_size, uint8_t *output,
+                            uint64_t output_size);
+
+}  // namespace ray
+
+#endif  // RAY_OBJECT_MANAGER_CHUNK_COMPRESSION_H
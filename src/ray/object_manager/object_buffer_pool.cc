@@ -76,6 +76,21 @@ void ObjectBufferPool::ReleaseGetChunk(const ObjectID &object_id, uint64_t chunk
   }
 }
 
+ray::Status ObjectBufferPool::GetMetadata(const ObjectID &object_id,
+                                          std::string *metadata) {
+  std::lock_guard<std::mutex> lock(pool_mutex_);
+  plasma::ObjectBuffer object_buffer;
+  plasma::ObjectID plasma_id = object_id.to_plasma_id();
+  ARROW_CHECK_OK(store_client_.Get(&plasma_id, 1, 0, &object_buffer));
+  if (object_buffer.data == nullptr) {
+    return ray::Status::IOError("Unable to obtain object metadata, object not local.");
+  }
+  metadata->assign(reinterpret_cast<const char *>(object_buffer.metadata->data()),
+                   object_buffer.metadata->size());
+  ARROW_CHECK_OK(store_client_.Release(plasma_id));
+  return ray::Status::OK();
+}
+
 void ObjectBufferPool::AbortGet(const ObjectID &object_id) {
   std::lock_guard<std::mutex> lock(pool_mutex_);
   ARROW_CHECK_OK(store_client_.Release(object_id.to_plasma_id()));
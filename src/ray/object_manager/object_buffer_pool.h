@@ -4,6 +4,7 @@
 #include <list>
 #include <memory>
 #include <mutex>
+#include <string>
 #include <vector>
 
 #include <boost/asio.hpp>
@@ -81,6 +82,13 @@ class ObjectBufferPool {
   /// \param chunk_index The index of the chunk.
   void ReleaseGetChunk(const ObjectID &object_id, uint64_t chunk_index);
 
+  /// Get the metadata of a local object.
+  ///
+  /// \param object_id The ObjectID.
+  /// \param metadata The metadata of the object.
+  /// \return Status IOError if the object is not local.
+  ray::Status GetMetadata(const ObjectID &object_id, std::string *metadata);
+
   /// Returns a chunk of an empty object at the given chunk_index. The object chunk
   /// serves as the buffer that is to be written to by a connection receiving an object
   /// from a remote node. Only one thread is permitted to create the object chunk at
@@ -1,5 +1,9 @@
 #include "ray/object_manager/object_directory.h"
 
+#include <algorithm>
+
+#include "ray/ray_config.h"
+
 namespace ray {
 
 ObjectDirectory::ObjectDirectory(boost::asio::io_service &io_service,
@@ -47,8 +51,59 @@ void UpdateObjectLocations(const std::vector<ObjectTableDataT> &location_history
   }
 }
 
+/// Get the size of an object from a suffix of the object table log.
+///
+/// \return The size of the object in bytes, or -1 if no addition entry in
+/// the suffix records it.
+int64_t ObjectSizeFromLocations(const std::vector<ObjectTableDataT> &location_history) {
+  int64_t object_size = -1;
+  for (const auto &object_table_data : location_history) {
+    if (!object_table_data.is_eviction) {
+      object_size = object_table_data.object_size;
+    }
+  }
+  return object_size;
+}
+
 }  // namespace
 
+void ObjectDirectory::CacheLocations(const ObjectID &object_id,
+                                     const std::unordered_set<ClientID> &client_ids,
+                                     int64_t object_size) {
+  auto it = location_cache_.find(object_id);
+  if (it == location_cache_.end()) {
+    it = location_cache_.emplace(object_id, CachedLocations{{}, 0}).first;
+    location_cache_order_.push_back(object_id);
+  }
+  it->second.locations = client_ids;
+  if (object_size >= 0) {
+    it->second.object_size = object_size;
+  }
+  int max_size = std::max(RayConfig::instance().object_location_cache_size(), 0);
+  while (location_cache_order_.size() > static_cast<size_t>(max_size)) {
+    location_cache_.erase(location_cache_order_.front());
+    location_cache_order_.pop_front();
+  }
+}
+
+bool ObjectDirectory::GetCachedLocations(const ObjectID &object_id,
+                                         std::unordered_set<ClientID> *client_ids,
+                                         int64_t *object_size) const {
+  auto it = location_cache_.find(object_id);
+  if (it == location_cache_.end()) {
+    return false;
+  }
+  client_ids->clear();
+  // Skip the clients that were removed since the locations were cached.
+  for (const auto &client_id : it->second.locations) {
+    if (!gcs_client_->client_table().IsRemoved(client_id)) {
+      client_ids->insert(client_id);
+    }
+  }
+  *object_size = it->second.object_size;
+  return true;
+}
+
 void ObjectDirectory::RegisterBackend() {
   auto object_notification_callback = [this](
       gcs::AsyncGcsClient *client, const ObjectID &object_id,
@@ -63,6 +118,8 @@ void ObjectDirectory::RegisterBackend() {
     UpdateObjectLocations(location_history, gcs_client_->client_table(),
                           &it->second.current_object_locations,
                           &it->second.has_been_created);
+    CacheLocations(object_id, it->second.current_object_locations,
+                   ObjectSizeFromLocations(location_history));
     // Copy the callbacks so that the callbacks can unsubscribe without interrupting
     // looping over the callbacks.
     auto callbacks = it->second.callbacks;
@@ -123,6 +180,7 @@ void ObjectDirectory::LookupRemoteConnectionInfo(
     if (client_data.is_insertion) {
       connection_info.ip = client_data.node_manager_address;
       connection_info.port = static_cast<uint16_t>(client_data.object_manager_port);
+      connection_info.accepts_compressed_objects = client_data.accepts_compressed_objects;
     }
   }
 }
@@ -219,6 +277,8 @@ ray::Status ObjectDirectory::LookupLocations(const ObjectID &object_id,
           bool has_been_created = false;
           UpdateObjectLocations(location_history, gcs_client_->client_table(),
                                 &client_ids, &has_been_created);
+          CacheLocations(object_id, client_ids,
+                         ObjectSizeFromLocations(location_history));
           // It is safe to call the callback directly since this is already running
           // in the GCS client's lookup callback stack.
           callback(object_id, client_ids, has_been_created);
@@ -244,6 +304,7 @@ std::string ObjectDirectory::DebugString() const {
   result << "ObjectDirectory:";
   result << "\n- num listeners: " << listeners_.size();
   result << "\n- num eviction entries: " << object_evictions_.size();
+  result << "\n- num cached object locations: " << location_cache_.size();
   return result.str();
 }
 
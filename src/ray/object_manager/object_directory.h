@@ -1,6 +1,7 @@
 #ifndef RAY_OBJECT_MANAGER_OBJECT_DIRECTORY_H
 #define RAY_OBJECT_MANAGER_OBJECT_DIRECTORY_H
 
+#include <deque>
 #include <memory>
 #include <mutex>
 #include <unordered_map>
@@ -25,6 +26,8 @@ struct RemoteConnectionInfo {
   ClientID client_id;
   std::string ip;
   uint16_t port;
+  /// Whether the remote object manager accepts compressed object chunks.
+  bool accepts_compressed_objects = false;
 };
 
 class ObjectDirectoryInterface {
@@ -60,6 +63,20 @@ class ObjectDirectoryInterface {
   virtual ray::Status LookupLocations(const ObjectID &object_id,
                                       const OnLocationsFound &callback) = 0;
 
+  /// Get the locations of an object that were last received from the GCS,
+  /// without contacting the GCS. Locations are only remembered for a bounded
+  /// number of recently looked up or subscribed objects, so they may be stale
+  /// or missing.
+  ///
+  /// \param object_id The object's ObjectID.
+  /// \param client_ids Set to the known locations of the object.
+  /// \param object_size Set to the size of the object in bytes, or 0 if it is
+  /// unknown.
+  /// \return Whether locations for the object were found.
+  virtual bool GetCachedLocations(const ObjectID &object_id,
+                                  std::unordered_set<ClientID> *client_ids,
+                                  int64_t *object_size) const = 0;
+
   /// Handle the removal of an object manager client. This updates the
   /// locations of all subscribed objects that have the removed client as a
   /// location, and fires the subscribed callbacks for those objects.
@@ -146,6 +163,10 @@ class ObjectDirectory : public ObjectDirectoryInterface {
   ray::Status LookupLocations(const ObjectID &object_id,
                               const OnLocationsFound &callback) override;
 
+  bool GetCachedLocations(const ObjectID &object_id,
+                          std::unordered_set<ClientID> *client_ids,
+                          int64_t *object_size) const override;
+
   void HandleClientRemoved(const ClientID &client_id) override;
 
   ray::Status SubscribeObjectLocations(const UniqueID &callback_id,
@@ -182,6 +203,25 @@ class ObjectDirectory : public ObjectDirectoryInterface {
     bool has_been_created;
   };
 
+  /// Locations of an object that were received from the GCS.
+  struct CachedLocations {
+    /// The set of known locations of the object.
+    std::unordered_set<ClientID> locations;
+    /// The size of the object in bytes, or 0 if it is unknown.
+    int64_t object_size;
+  };
+
+  /// Remember the locations of an object, evicting the oldest cached object
+  /// if the cache is full.
+  ///
+  /// \param object_id The object's ObjectID.
+  /// \param client_ids The current locations of the object.
+  /// \param object_size The size of the object in bytes, or -1 if it is not
+  /// known from this update.
+  void CacheLocations(const ObjectID &object_id,
+                      const std::unordered_set<ClientID> &client_ids,
+                      int64_t object_size);
+
   /// Reference to the event loop.
   boost::asio::io_service &io_service_;
   /// Reference to the gcs client.
@@ -191,6 +231,10 @@ class ObjectDirectory : public ObjectDirectoryInterface {
   /// Map from object ID to the number of times it's been evicted on this
   /// node before.
   std::unordered_map<ObjectID, int> object_evictions_;
+  /// The last known locations of recently seen objects.
+  std::unordered_map<ObjectID, CachedLocations> location_cache_;
+  /// The objects in location_cache_, in the order they were first cached.
+  std::deque<ObjectID> location_cache_order_;
 };
 
 }  // namespace ray
@@ -1,5 +1,6 @@
 #include "ray/object_manager/object_manager.h"
 #include "ray/common/common_protocol.h"
+#include "ray/object_manager/chunk_compression.h"
 #include "ray/util/util.h"
 
 namespace asio = boost::asio;
@@ -18,11 +19,21 @@ ObjectManager::ObjectManager(asio::io_service &main_service,
       send_work_(send_service_),
       receive_work_(receive_service_),
       connection_pool_(),
-      gen_(std::chrono::high_resolution_clock::now().time_since_epoch().count()) {
+      gen_(std::chrono::high_resolution_clock::now().time_since_epoch().count()),
+      unspilled_bytes_(0) {
   RAY_CHECK(config_.max_sends > 0);
   RAY_CHECK(config_.max_receives > 0);
   client_id_ = object_directory_->GetLocalClientID();
   main_service_ = &main_service;
+  if (RayConfig::instance().object_spilling_threshold_percent() > 0 &&
+      !config_.spill_directory.empty()) {
+    // Several raylets may share the same temporary directory.
+    spiller_.reset(new ObjectSpiller(
+        main_service, config_.store_socket_name,
+        config_.spill_directory + "/" + client_id_.hex(),
+        RayConfig::instance().object_spilling_max_bytes(),
+        [this](const ObjectID &object_id) { HandleSpilledObjectDeleted(object_id); }));
+  }
   store_notification_.SubscribeObjAdded(
       [this](const object_manager::protocol::ObjectInfoT &object_info) {
         HandleObjectAdded(object_info);
@@ -65,9 +76,22 @@ void ObjectManager::HandleObjectAdded(
   // Notify the object directory that the object has been added to this node.
   ObjectID object_id = ObjectID::from_binary(object_info.object_id);
   RAY_CHECK(local_objects_.count(object_id) == 0);
-  local_objects_[object_id].object_info = object_info;
-  ray::Status status =
-      object_directory_->ReportObjectAdded(object_id, client_id_, object_info);
+  auto &local_object = local_objects_[object_id];
+  local_object.object_info = object_info;
+  if (spiller_ != nullptr &&
+      (spiller_->IsSpilled(object_id) || spiller_->IsSpilling(object_id))) {
+    // The object was restored from disk, or recreated while it was being
+    // spilled. This node was never removed from the object's locations.
+  } else {
+    ray::Status status =
+        object_directory_->ReportObjectAdded(object_id, client_id_, object_info);
+    if (spiller_ != nullptr) {
+      local_object.awaiting_spill = true;
+      unspilled_bytes_ += object_info.data_size + object_info.metadata_size;
+      spill_candidates_.push_back(object_id);
+      SpillObjectsIfNeeded();
+    }
+  }
 
   // Handle the unfulfilled_push_requests_ which contains the push request that is not
   // completed due to unsatisfied local objects.
@@ -84,6 +108,16 @@ void ObjectManager::HandleObjectAdded(
     unfulfilled_push_requests_.erase(iter);
   }
 
+  // Forward the object to the broadcasts that waited for it.
+  auto broadcast_it = pending_broadcasts_.find(object_id);
+  if (broadcast_it != pending_broadcasts_.end()) {
+    auto broadcasts = std::move(broadcast_it->second);
+    pending_broadcasts_.erase(broadcast_it);
+    for (const auto &broadcast : broadcasts) {
+      ForwardBroadcast(object_id, broadcast.first, broadcast.second);
+    }
+  }
+
   // The object is local, so we no longer need to Pull it from a remote
   // manager. Cancel any outstanding Pull requests for this object.
   CancelPull(object_id);
@@ -92,10 +126,117 @@ void ObjectManager::HandleObjectAdded(
 void ObjectManager::NotifyDirectoryObjectDeleted(const ObjectID &object_id) {
   auto it = local_objects_.find(object_id);
   RAY_CHECK(it != local_objects_.end());
+  if (it->second.awaiting_spill) {
+    const auto &object_info = it->second.object_info;
+    unspilled_bytes_ -= object_info.data_size + object_info.metadata_size;
+  }
   local_objects_.erase(it);
+  if (spiller_ != nullptr &&
+      (spiller_->IsSpilled(object_id) || spiller_->IsSpilling(object_id))) {
+    // The object can still be served from disk, so this node remains one of
+    // its locations.
+    return;
+  }
   ray::Status status = object_directory_->ReportObjectRemoved(object_id, client_id_);
 }
 
+void ObjectManager::SpillObjectsIfNeeded() {
+  int64_t threshold = spiller_->StoreCapacity() *
+                      RayConfig::instance().object_spilling_threshold_percent() / 100;
+  while (unspilled_bytes_ > threshold && !spill_candidates_.empty()) {
+    ObjectID object_id = spill_candidates_.front();
+    spill_candidates_.pop_front();
+    auto it = local_objects_.find(object_id);
+    if (it == local_objects_.end() || !it->second.awaiting_spill) {
+      // The object was evicted or already spilled.
+      continue;
+    }
+    const auto object_info = it->second.object_info;
+    it->second.awaiting_spill = false;
+    unspilled_bytes_ -= object_info.data_size + object_info.metadata_size;
+    spiller_->Spill(object_id, [this, object_info](const ray::Status &status) {
+      HandleObjectSpilled(object_info, status);
+    });
+  }
+  // Drop the candidates that are no longer local or were already spilled, so
+  // that the queue does not grow with objects that were evicted.
+  if (spill_candidates_.size() > 2 * local_objects_.size()) {
+    std::deque<ObjectID> candidates;
+    for (const auto &object_id : spill_candidates_) {
+      auto it = local_objects_.find(object_id);
+      if (it != local_objects_.end() && it->second.awaiting_spill) {
+        candidates.push_back(object_id);
+      }
+    }
+    spill_candidates_.swap(candidates);
+  }
+}
+
+void ObjectManager::HandleObjectSpilled(
+    const object_manager::protocol::ObjectInfoT &object_info, const ray::Status &status) {
+  if (status.ok() || status.IsInvalid()) {
+    // The object was spilled, or it was freed while it was being spilled.
+    return;
+  }
+  ObjectID object_id = ObjectID::from_binary(object_info.object_id);
+  RAY_LOG(WARNING) << "Failed to spill object " << object_id << ": "
+                   << status.ToString();
+  if (local_objects_.count(object_id) == 0) {
+    // The object was evicted while it was being spilled, so this node no
+    // longer has a copy of it.
+    RAY_CHECK_OK(object_directory_->ReportObjectRemoved(object_id, client_id_));
+  }
+}
+
+bool ObjectManager::RestoreSpilledObject(const ObjectID &object_id) {
+  if (spiller_ == nullptr || local_objects_.count(object_id) != 0 ||
+      !spiller_->IsSpilled(object_id)) {
+    return false;
+  }
+  spiller_->Restore(object_id, [this, object_id](const ray::Status &status) {
+    // Once the object is sealed, HandleObjectAdded completes the pending
+    // pulls and pushes of the object.
+    if (!status.ok()) {
+      HandleRestoreFailed(object_id, status);
+    }
+  });
+  return true;
+}
+
+void ObjectManager::HandleRestoreFailed(const ObjectID &object_id,
+                                        const ray::Status &status) {
+  // Concurrent restores of the object fail together, so this may be called
+  // several times.
+  if (spiller_->IsSpilled(object_id)) {
+    RAY_LOG(WARNING) << "Failed to restore object " << object_id
+                     << " from disk: " << status.ToString();
+    spiller_->Delete(object_id);
+    HandleSpilledObjectDeleted(object_id);
+  }
+  if (pulls_awaiting_restore_.erase(object_id) > 0 &&
+      local_objects_.count(object_id) == 0) {
+    // Pull the object from another node instead. If there is none, the object
+    // is reconstructed once this node's removal reaches the object table.
+    RAY_CHECK_OK(Pull(object_id));
+  }
+}
+
+void ObjectManager::HandleSpilledObjectDeleted(const ObjectID &object_id) {
+  if (local_objects_.count(object_id) == 0) {
+    // This node remained a location of the object after it was evicted,
+    // because of its copy on disk.
+    RAY_CHECK_OK(object_directory_->ReportObjectRemoved(object_id, client_id_));
+  }
+}
+
+int64_t ObjectManager::SpilledBytesTotal() const {
+  return spiller_ == nullptr ? 0 : spiller_->SpilledBytesTotal();
+}
+
+int64_t ObjectManager::RestoredBytesTotal() const {
+  return spiller_ == nullptr ? 0 : spiller_->RestoredBytesTotal();
+}
+
 ray::Status ObjectManager::SubscribeObjAdded(
     std::function<void(const object_manager::protocol::ObjectInfoT &)> callback) {
   store_notification_.SubscribeObjAdded(callback);
@@ -114,7 +255,13 @@ ray::Status ObjectManager::Pull(const ObjectID &object_id) {
     RAY_LOG(ERROR) << object_id << " attempted to pull an object that's already local.";
     return ray::Status::OK();
   }
-  if (pull_requests_.find(object_id) != pull_requests_.end()) {
+  if (pull_requests_.find(object_id) != pull_requests_.end() ||
+      pulls_awaiting_restore_.count(object_id) != 0) {
+    return ray::Status::OK();
+  }
+  if (RestoreSpilledObject(object_id)) {
+    // The object is read back from local disk instead of being pulled.
+    pulls_awaiting_restore_.insert(object_id);
     return ray::Status::OK();
   }
 
@@ -136,8 +283,14 @@ ray::Status ObjectManager::Pull(const ObjectID &object_id) {
         // NOTE(swang): Since we are overwriting the previous list of clients,
         // we may end up sending a duplicate request to the same client as
         // before.
-        it->second.client_locations =
-            std::vector<ClientID>(client_ids.begin(), client_ids.end());
+        it->second.client_locations.clear();
+        for (const auto &client_id : client_ids) {
+          // This node may still be listed after it lost its spilled copy of the
+          // object, until its removal reaches the object table.
+          if (client_id != client_id_) {
+            it->second.client_locations.push_back(client_id);
+          }
+        }
         if (it->second.client_locations.empty()) {
           // The object locations are now empty, so we should wait for the next
           // notification about a new object location.  Cancel the timer until
@@ -170,26 +323,32 @@ void ObjectManager::TryPull(const ObjectID &object_id) {
   // TODO(rkn): It may actually be possible for this check to fail.
   RAY_CHECK(client_vector.size() != 1 || client_vector[0] != client_id_);
 
-  // Choose a random client to pull the object from.
-  // Generate a random index.
-  std::uniform_int_distribution<int> distribution(0, client_vector.size() - 1);
-  int client_index = distribution(gen_);
-  ClientID client_id = client_vector[client_index];
-  // If the object manager somehow ended up choosing itself, choose a different
-  // object manager.
-  if (client_id == client_id_) {
-    std::swap(client_vector[client_index], client_vector[client_vector.size() - 1]);
+  // If the object manager somehow ended up in the list of clients, remove it
+  // so that it does not choose itself.
+  auto self_it = std::find(client_vector.begin(), client_vector.end(), client_id_);
+  if (self_it != client_vector.end()) {
+    std::swap(*self_it, client_vector.back());
     client_vector.pop_back();
     RAY_LOG(ERROR) << "The object manager with client ID " << client_id_
                    << " is trying to pull object " << object_id
                    << " but the object table suggests that this object manager "
                    << "already has the object.";
-    client_id = client_vector[client_index % client_vector.size()];
-    RAY_CHECK(client_id != client_id_);
   }
 
-  // Try pulling from the client.
-  PullEstablishConnection(object_id, client_id);
+  // Choose random clients to pull the object from by moving them to the front
+  // of the list. If there are several, each of them sends a different stripe
+  // of the object's chunks, so that the transfer is spread over their links.
+  uint64_t num_sources = std::min<uint64_t>(
+      client_vector.size(), static_cast<uint64_t>(std::max(1, config_.max_pull_sources)));
+  for (uint64_t i = 0; i < num_sources; ++i) {
+    std::uniform_int_distribution<uint64_t> distribution(i, client_vector.size() - 1);
+    std::swap(client_vector[i], client_vector[distribution(gen_)]);
+  }
+
+  // Try pulling from the clients.
+  for (uint64_t i = 0; i < num_sources; ++i) {
+    PullEstablishConnection(object_id, client_vector[i], ChunkStripe(i, num_sources));
+  }
 
   // If there are more clients to try, try them in succession, with a timeout
   // in between each try.
@@ -226,7 +385,8 @@ void ObjectManager::TryPull(const ObjectID &object_id) {
 };
 
 void ObjectManager::PullEstablishConnection(const ObjectID &object_id,
-                                            const ClientID &client_id) {
+                                            const ClientID &client_id,
+                                            const ChunkStripe &stripe) {
   // Acquire a message connection and send pull request.
   ray::Status status;
   std::shared_ptr<SenderConnection> conn;
@@ -247,19 +407,21 @@ void ObjectManager::PullEstablishConnection(const ObjectID &object_id,
   }
 
   if (conn != nullptr) {
-    PullSendRequest(object_id, conn);
+    PullSendRequest(object_id, stripe, conn);
     connection_pool_.ReleaseSender(ConnectionPool::ConnectionType::MESSAGE, conn);
   }
 }
 
 void ObjectManager::PullSendRequest(const ObjectID &object_id,
+                                    const ChunkStripe &stripe,
                                     std::shared_ptr<SenderConnection> &conn) {
   // TODO(rkn): This would be a natural place to record a profile event
   // indicating that a pull request was sent.
 
   flatbuffers::FlatBufferBuilder fbb;
   auto message = object_manager_protocol::CreatePullRequestMessage(
-      fbb, fbb.CreateString(client_id_.binary()), fbb.CreateString(object_id.binary()));
+      fbb, fbb.CreateString(client_id_.binary()), fbb.CreateString(object_id.binary()),
+      stripe.stripe_index, stripe.num_stripes);
   fbb.Finish(message);
   conn->WriteMessageAsync(
       static_cast<int64_t>(object_manager_protocol::MessageType::PullRequest),
@@ -325,8 +487,11 @@ void ObjectManager::HandleReceiveFinished(const ObjectID &object_id,
   profile_events_.push_back(profile_event);
 }
 
-void ObjectManager::Push(const ObjectID &object_id, const ClientID &client_id) {
+void ObjectManager::Push(const ObjectID &object_id, const ClientID &client_id,
+                         const ChunkStripe &stripe) {
   if (local_objects_.count(object_id) == 0) {
+    // If the object was spilled, the push completes once it is restored.
+    RestoreSpilledObject(object_id);
     // Avoid setting duplicated timer for the same object and client pair.
     auto &clients = unfulfilled_push_requests_[object_id];
     if (clients.count(client_id) == 0) {
@@ -358,25 +523,26 @@ void ObjectManager::Push(const ObjectID &object_id, const ClientID &client_id) {
     return;
   }
 
-  // If we haven't pushed this object to this same object manager yet, then push
-  // it. If we have, but it was a long time ago, then push it. If we have and it
-  // was recent, then don't do it again.
+  // If we haven't pushed these chunks of this object to this same object
+  // manager yet, then push them. If we have, but it was a long time ago, then
+  // push them. If we have and it was recent, then don't do it again.
   auto &recent_pushes = local_objects_[object_id].recent_pushes;
   auto it = recent_pushes.find(client_id);
   if (it == recent_pushes.end()) {
     // We haven't pushed this specific object to this specific object manager
     // yet (or if we have then the object must have been evicted and recreated
     // locally).
-    recent_pushes[client_id] = current_sys_time_ms();
+    recent_pushes[client_id] = std::make_pair(current_sys_time_ms(), stripe);
   } else {
     int64_t current_time = current_sys_time_ms();
-    if (current_time - it->second <=
-        RayConfig::instance().object_manager_repeated_push_delay_ms()) {
-      // We pushed this object to the object manager recently, so don't do it
+    if (current_time - it->second.first <=
+            RayConfig::instance().object_manager_repeated_push_delay_ms() &&
+        it->second.second.Covers(stripe)) {
+      // We pushed these chunks to the object manager recently, so don't do it
       // again.
       return;
     } else {
-      it->second = current_time;
+      it->second = std::make_pair(current_time, stripe);
     }
   }
 
@@ -389,16 +555,31 @@ void ObjectManager::Push(const ObjectID &object_id, const ClientID &client_id) {
         static_cast<uint64_t>(object_info.data_size + object_info.metadata_size);
     uint64_t metadata_size = static_cast<uint64_t>(object_info.metadata_size);
     uint64_t num_chunks = buffer_pool_.GetNumChunks(data_size);
+    // Compress the chunks of large objects if the receiver accepts it.
+    bool compress = config_.compression_min_bytes >= 0 &&
+                    connection_info.accepts_compressed_objects &&
+                    data_size >= static_cast<uint64_t>(config_.compression_min_bytes);
+    // Objects can opt out of compression through their metadata, e.g., if
+    // their contents are already compressed.
+    if (compress && metadata_size > 0) {
+      std::string metadata;
+      compress = buffer_pool_.GetMetadata(object_id, &metadata).ok() &&
+                 IsCompressionAllowed(metadata);
+    }
     for (uint64_t chunk_index = 0; chunk_index < num_chunks; ++chunk_index) {
+      if (!stripe.Contains(chunk_index)) {
+        continue;
+      }
       send_service_.post([this, client_id, object_id, data_size, metadata_size,
-                          chunk_index, connection_info]() {
+                          chunk_index, compress, connection_info]() {
         double start_time = current_sys_time_seconds();
         // NOTE: When this callback executes, it's possible that the object
         // will have already been evicted. It's also possible that the
         // object could be in the process of being transferred to this
         // object manager from another object manager.
-        ray::Status status = ExecuteSendObject(
-            client_id, object_id, data_size, metadata_size, chunk_index, connection_info);
+        ray::Status status =
+            ExecuteSendObject(client_id, object_id, data_size, metadata_size,
+                              chunk_index, compress, connection_info);
         double end_time = current_sys_time_seconds();
 
         // Notify the main thread that we have finished sending the chunk.
@@ -418,7 +599,7 @@ void ObjectManager::Push(const ObjectID &object_id, const ClientID &client_id) {
 
 ray::Status ObjectManager::ExecuteSendObject(
     const ClientID &client_id, const ObjectID &object_id, uint64_t data_size,
-    uint64_t metadata_size, uint64_t chunk_index,
+    uint64_t metadata_size, uint64_t chunk_index, bool compress,
     const RemoteConnectionInfo &connection_info) {
   RAY_LOG(DEBUG) << "ExecuteSendObject " << client_id << " " << object_id << " "
                  << chunk_index;
@@ -431,7 +612,8 @@ ray::Status ObjectManager::ExecuteSendObject(
   }
 
   if (conn != nullptr) {
-    status = SendObjectHeaders(object_id, data_size, metadata_size, chunk_index, conn);
+    status = SendObjectHeaders(object_id, data_size, metadata_size, chunk_index,
+                               compress, conn);
     if (!status.ok()) {
       RAY_CHECK(status.IsIOError())
           << "Failed to contact remote object manager during Push";
@@ -443,7 +625,7 @@ ray::Status ObjectManager::ExecuteSendObject(
 
 ray::Status ObjectManager::SendObjectHeaders(const ObjectID &object_id,
                                              uint64_t data_size, uint64_t metadata_size,
-                                             uint64_t chunk_index,
+                                             uint64_t chunk_index, bool compress,
                                              std::shared_ptr<SenderConnection> &conn) {
   std::pair<const ObjectBufferPool::ChunkInfo &, ray::Status> chunk_status =
       buffer_pool_.GetChunk(object_id, data_size, metadata_size, chunk_index);
@@ -458,10 +640,21 @@ ray::Status ObjectManager::SendObjectHeaders(const ObjectID &object_id,
     RAY_RETURN_NOT_OK(status);
   }
 
+  // Chunks that do not get smaller are sent uncompressed.
+  std::vector<uint8_t> compressed_data;
+  bool compressed = compress && CompressChunk(chunk_info.data, chunk_info.buffer_length,
+                                              &compressed_data);
+  if (compressed) {
+    num_compressed_chunks_sent_++;
+  }
+
   // Create buffer.
   flatbuffers::FlatBufferBuilder fbb;
   auto message = object_manager_protocol::CreatePushRequestMessage(
-      fbb, to_flatbuf(fbb, object_id), chunk_index, data_size, metadata_size);
+      fbb, to_flatbuf(fbb, object_id), chunk_index, data_size, metadata_size,
+      compressed ? object_manager_protocol::CompressionType::ZeroRunLength
+                 : object_manager_protocol::CompressionType::Uncompressed,
+      compressed ? compressed_data.size() : 0);
   fbb.Finish(message);
   status = conn->WriteMessage(
       static_cast<int64_t>(object_manager_protocol::MessageType::PushRequest),
@@ -469,15 +662,21 @@ ray::Status ObjectManager::SendObjectHeaders(const ObjectID &object_id,
   if (!status.ok()) {
     return status;
   }
-  return SendObjectData(object_id, chunk_info, conn);
+  return SendObjectData(object_id, chunk_info, compressed ? &compressed_data : nullptr,
+                        conn);
 }
 
 ray::Status ObjectManager::SendObjectData(const ObjectID &object_id,
                                           const ObjectBufferPool::ChunkInfo &chunk_info,
+                                          const std::vector<uint8_t> *compressed_data,
                                           std::shared_ptr<SenderConnection> &conn) {
   boost::system::error_code error;
   std::vector<asio::const_buffer> buffer;
-  buffer.push_back(asio::buffer(chunk_info.data, chunk_info.buffer_length));
+  if (compressed_data != nullptr) {
+    buffer.push_back(asio::buffer(*compressed_data));
+  } else {
+    buffer.push_back(asio::buffer(chunk_info.data, chunk_info.buffer_length));
+  }
   Status status = conn->WriteBuffer(buffer);
 
   // Do this regardless of whether it failed or succeeded.
@@ -492,6 +691,7 @@ ray::Status ObjectManager::SendObjectData(const ObjectID &object_id,
 }
 
 void ObjectManager::CancelPull(const ObjectID &object_id) {
+  pulls_awaiting_restore_.erase(object_id);
   auto it = pull_requests_.find(object_id);
   if (it == pull_requests_.end()) {
     return;
@@ -726,6 +926,10 @@ void ObjectManager::ProcessClientMessage(std::shared_ptr<TcpClientConnection> &c
     ReceiveFreeRequest(conn, message);
     break;
   }
+  case object_manager_protocol::MessageType::BroadcastRequest: {
+    ReceiveBroadcastRequest(conn, message);
+    break;
+  }
   case object_manager_protocol::MessageType::DisconnectClient: {
     DisconnectClient(conn, message);
     break;
@@ -766,6 +970,10 @@ void ObjectManager::ReceivePullRequest(std::shared_ptr<TcpClientConnection> &con
   auto pr = flatbuffers::GetRoot<object_manager_protocol::PullRequestMessage>(message);
   ObjectID object_id = ObjectID::from_binary(pr->object_id()->str());
   ClientID client_id = ClientID::from_binary(pr->client_id()->str());
+  ChunkStripe stripe;
+  if (pr->num_stripes() > 1 && pr->stripe_index() < pr->num_stripes()) {
+    stripe = ChunkStripe(pr->stripe_index(), pr->num_stripes());
+  }
 
   ProfileEventT profile_event;
   profile_event.event_type = "receive_pull_request";
@@ -774,7 +982,7 @@ void ObjectManager::ReceivePullRequest(std::shared_ptr<TcpClientConnection> &con
   profile_event.extra_data = "[\"" + object_id.hex() + "\",\"" + client_id.hex() + "\"]";
   profile_events_.push_back(profile_event);
 
-  Push(object_id, client_id);
+  Push(object_id, client_id, stripe);
   conn->ProcessMessages();
 }
 
@@ -787,11 +995,17 @@ void ObjectManager::ReceivePushRequest(std::shared_ptr<TcpClientConnection> &con
   uint64_t chunk_index = object_header->chunk_index();
   uint64_t data_size = object_header->data_size();
   uint64_t metadata_size = object_header->metadata_size();
-  receive_service_.post([this, object_id, data_size, metadata_size, chunk_index, conn]() {
+  uint64_t compressed_size = 0;
+  if (object_header->compression() ==
+      object_manager_protocol::CompressionType::ZeroRunLength) {
+    compressed_size = object_header->compressed_size();
+  }
+  receive_service_.post([this, object_id, data_size, metadata_size, chunk_index,
+                         compressed_size, conn]() {
     double start_time = current_sys_time_seconds();
     const ClientID client_id = conn->GetClientId();
     auto status = ExecuteReceiveObject(client_id, object_id, data_size, metadata_size,
-                                       chunk_index, *conn);
+                                       chunk_index, compressed_size, *conn);
     double end_time = current_sys_time_seconds();
     // Notify the main thread that we have finished receiving the object.
     main_service_->post(
@@ -805,7 +1019,8 @@ void ObjectManager::ReceivePushRequest(std::shared_ptr<TcpClientConnection> &con
 
 ray::Status ObjectManager::ExecuteReceiveObject(
     const ClientID &client_id, const ObjectID &object_id, uint64_t data_size,
-    uint64_t metadata_size, uint64_t chunk_index, TcpClientConnection &conn) {
+    uint64_t metadata_size, uint64_t chunk_index, uint64_t compressed_size,
+    TcpClientConnection &conn) {
   RAY_LOG(DEBUG) << "ExecuteReceiveObject " << client_id << " " << object_id << " "
                  << chunk_index;
 
@@ -814,11 +1029,25 @@ ray::Status ObjectManager::ExecuteReceiveObject(
   ObjectBufferPool::ChunkInfo chunk_info = chunk_status.first;
   if (chunk_status.second.ok()) {
     // Avoid handling this chunk if it's already being handled by another process.
+    std::vector<uint8_t> compressed_data(compressed_size);
     std::vector<boost::asio::mutable_buffer> buffer;
-    buffer.push_back(asio::buffer(chunk_info.data, chunk_info.buffer_length));
+    if (compressed_size > 0) {
+      buffer.push_back(asio::buffer(compressed_data));
+    } else {
+      buffer.push_back(asio::buffer(chunk_info.data, chunk_info.buffer_length));
+    }
     boost::system::error_code ec;
     conn.ReadBuffer(buffer, ec);
-    if (ec.value() == boost::system::errc::success) {
+    ray::Status decompress_status = ray::Status::OK();
+    if (ec.value() == boost::system::errc::success && compressed_size > 0) {
+      decompress_status = DecompressChunk(compressed_data.data(), compressed_size,
+                                          chunk_info.data, chunk_info.buffer_length);
+      if (!decompress_status.ok()) {
+        RAY_LOG(ERROR) << "Failed to decompress chunk " << chunk_index << " of object "
+                       << object_id << ": " << decompress_status.ToString();
+      }
+    }
+    if (ec.value() == boost::system::errc::success && decompress_status.ok()) {
       buffer_pool_.SealChunk(object_id, chunk_index);
     } else {
       buffer_pool_.AbortCreateChunk(object_id, chunk_index);
@@ -828,7 +1057,9 @@ ray::Status ObjectManager::ExecuteReceiveObject(
     RAY_LOG(DEBUG) << "Create Chunk Failed index = " << chunk_index << ": "
                    << chunk_status.second.message();
     // Read object into empty buffer.
-    uint64_t buffer_length = buffer_pool_.GetBufferLength(chunk_index, data_size);
+    uint64_t buffer_length = compressed_size > 0
+                                 ? compressed_size
+                                 : buffer_pool_.GetBufferLength(chunk_index, data_size);
     std::vector<uint8_t> mutable_vec;
     mutable_vec.resize(buffer_length);
     std::vector<boost::asio::mutable_buffer> buffer;
@@ -859,9 +1090,32 @@ void ObjectManager::ReceiveFreeRequest(std::shared_ptr<TcpClientConnection> &con
   conn->ProcessMessages();
 }
 
+void ObjectManager::ReceiveBroadcastRequest(std::shared_ptr<TcpClientConnection> &conn,
+                                            const uint8_t *message) {
+  auto broadcast_request =
+      flatbuffers::GetRoot<object_manager_protocol::BroadcastRequestMessage>(message);
+  ObjectID object_id = ObjectID::from_binary(broadcast_request->object_id()->str());
+  std::vector<ClientID> client_ids = from_flatbuf(*broadcast_request->client_ids());
+  HandleBroadcast(object_id, client_ids, broadcast_request->fanout());
+  conn->ProcessMessages();
+}
+
 void ObjectManager::FreeObjects(const std::vector<ObjectID> &object_ids,
                                 bool local_only) {
   buffer_pool_.FreeObjects(object_ids);
+  for (const auto &object_id : object_ids) {
+    pending_broadcasts_.erase(object_id);
+  }
+  if (spiller_ != nullptr) {
+    for (const auto &object_id : object_ids) {
+      bool spilled = spiller_->IsSpilled(object_id) || spiller_->IsSpilling(object_id);
+      spiller_->Delete(object_id);
+      pulls_awaiting_restore_.erase(object_id);
+      if (spilled) {
+        HandleSpilledObjectDeleted(object_id);
+      }
+    }
+  }
   if (!local_only) {
     SpreadFreeObjectRequest(object_ids);
   }
@@ -899,6 +1153,151 @@ void ObjectManager::SpreadFreeObjectRequest(const std::vector<ObjectID> &object_
   }
 }
 
+void ObjectManager::Broadcast(const ObjectID &object_id,
+                              const std::vector<ClientID> &client_ids, uint64_t fanout) {
+  if (local_objects_.count(object_id) != 0) {
+    HandleBroadcast(object_id, client_ids, fanout);
+    return;
+  }
+  // Start the broadcast at an object manager that has the object.
+  RAY_CHECK_OK(object_directory_->LookupLocations(
+      object_id, [this, client_ids, fanout](const ObjectID &object_id,
+                                            const std::unordered_set<ClientID> &locations,
+                                            bool has_been_created) {
+        if (local_objects_.count(object_id) == 0) {
+          std::vector<ClientID> sources;
+          for (const auto &location : locations) {
+            if (location != client_id_) {
+              sources.push_back(location);
+            }
+          }
+          if (!sources.empty()) {
+            std::uniform_int_distribution<size_t> distribution(0, sources.size() - 1);
+            if (SendBroadcastRequest(sources[distribution(gen_)], object_id, client_ids,
+                                     fanout)) {
+              return;
+            }
+          }
+          // Otherwise, this object manager becomes the root of the broadcast
+          // and fetches the object itself.
+          RAY_CHECK_OK(Pull(object_id));
+        }
+        HandleBroadcast(object_id, client_ids, fanout);
+      }));
+}
+
+void ObjectManager::HandleBroadcast(const ObjectID &object_id,
+                                    const std::vector<ClientID> &client_ids,
+                                    uint64_t fanout) {
+  std::vector<ClientID> subtree;
+  for (const auto &client_id : client_ids) {
+    if (client_id != client_id_) {
+      subtree.push_back(client_id);
+    }
+  }
+  if (subtree.empty()) {
+    return;
+  }
+  if (local_objects_.count(object_id) != 0) {
+    ForwardBroadcast(object_id, subtree, fanout);
+  } else {
+    // The object is forwarded once it is received or restored from disk.
+    bool waiting = pending_broadcasts_.count(object_id) != 0;
+    pending_broadcasts_[object_id].emplace_back(subtree, fanout);
+    RestoreSpilledObject(object_id);
+    if (!waiting) {
+      // If the object does not arrive in time, e.g. because the parent in the
+      // tree failed, pull it from any node that has it instead.
+      auto timer = std::make_shared<boost::asio::deadline_timer>(
+          *main_service_, boost::posix_time::milliseconds(config_.pull_timeout_ms));
+      timer->async_wait([this, object_id, timer](const boost::system::error_code &error) {
+        if (!error && pending_broadcasts_.count(object_id) != 0 &&
+            local_objects_.count(object_id) == 0) {
+          RAY_CHECK_OK(Pull(object_id));
+        }
+      });
+    }
+  }
+}
+
+void ObjectManager::ForwardBroadcast(const ObjectID &object_id,
+                                     const std::vector<ClientID> &client_ids,
+                                     uint64_t fanout) {
+  // Skip object managers that are not connected, so that they are not chosen
+  // as the root of a subtree.
+  std::vector<ClientID> reachable;
+  for (const auto &client_id : client_ids) {
+    RemoteConnectionInfo connection_info(client_id);
+    object_directory_->LookupRemoteConnectionInfo(connection_info);
+    if (connection_info.Connected()) {
+      reachable.push_back(client_id);
+    }
+  }
+  uint64_t num_children =
+      std::min<uint64_t>(reachable.size(), std::max<uint64_t>(fanout, 1));
+  size_t begin = 0;
+  for (uint64_t i = 0; i < num_children; ++i) {
+    // Split the object managers into subtrees of nearly equal size.
+    size_t end = begin + (reachable.size() - begin) / (num_children - i);
+    const ClientID &child = reachable[begin];
+    std::vector<ClientID> subtree(reachable.begin() + begin + 1, reachable.begin() + end);
+    if (SendBroadcastRequest(child, object_id, subtree, fanout)) {
+      Push(object_id, child);
+    } else {
+      // Forward the object to the rest of the subtree directly.
+      ForwardBroadcast(object_id, subtree, fanout);
+    }
+    begin = end;
+  }
+}
+
+bool ObjectManager::SendBroadcastRequest(const ClientID &client_id,
+                                         const ObjectID &object_id,
+                                         const std::vector<ClientID> &client_ids,
+                                         uint64_t fanout) {
+  std::shared_ptr<SenderConnection> conn;
+  connection_pool_.GetSender(ConnectionPool::ConnectionType::MESSAGE, client_id, &conn);
+  if (conn == nullptr) {
+    RemoteConnectionInfo connection_info(client_id);
+    object_directory_->LookupRemoteConnectionInfo(connection_info);
+    if (!connection_info.Connected()) {
+      return false;
+    }
+    conn = CreateSenderConnection(ConnectionPool::ConnectionType::MESSAGE,
+                                  connection_info);
+    if (conn == nullptr) {
+      return false;
+    }
+  }
+
+  flatbuffers::FlatBufferBuilder fbb;
+  auto message = object_manager_protocol::CreateBroadcastRequestMessage(
+      fbb, fbb.CreateString(object_id.binary()), to_flatbuf(fbb, client_ids), fanout);
+  fbb.Finish(message);
+  conn->WriteMessageAsync(
+      static_cast<int64_t>(object_manager_protocol::MessageType::BroadcastRequest),
+      fbb.GetSize(), fbb.GetBufferPointer(), [this, conn](ray::Status status) {
+        if (!status.ok()) {
+          RAY_CHECK(status.IsIOError())
+              << "Failed to contact remote object manager during Broadcast";
+          connection_pool_.RemoveSender(conn);
+        }
+      });
+  connection_pool_.ReleaseSender(ConnectionPool::ConnectionType::MESSAGE, conn);
+  return true;
+}
+
+bool ObjectManager::GetLocalObjectSize(const ObjectID &object_id,
+                                       int64_t *object_size) const {
+  auto it = local_objects_.find(object_id);
+  if (it == local_objects_.end()) {
+    return false;
+  }
+  const auto &object_info = it->second.object_info;
+  *object_size = object_info.data_size + object_info.metadata_size;
+  return true;
+}
+
 ProfileTableDataT ObjectManager::GetAndResetProfilingInfo() {
   ProfileTableDataT profile_info;
   profile_info.component_type = "object_manager";
@@ -920,11 +1319,16 @@ std::string ObjectManager::DebugString() const {
   result << "\n- num active wait requests: " << active_wait_requests_.size();
   result << "\n- num unfulfilled push requests: " << unfulfilled_push_requests_.size();
   result << "\n- num pull requests: " << pull_requests_.size();
+  result << "\n- num pending broadcasts: " << pending_broadcasts_.size();
   result << "\n- num buffered profile events: " << profile_events_.size();
+  result << "\n- num compressed chunks sent: " << num_compressed_chunks_sent_;
   result << "\n" << object_directory_->DebugString();
   result << "\n" << store_notification_.DebugString();
   result << "\n" << buffer_pool_.DebugString();
   result << "\n" << connection_pool_.DebugString();
+  if (spiller_ != nullptr) {
+    result << "\n" << spiller_->DebugString();
+  }
   return result.str();
 }
 
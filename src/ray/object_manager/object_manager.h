@@ -2,6 +2,7 @@
 #define RAY_OBJECT_MANAGER_OBJECT_MANAGER_H
 
 #include <algorithm>
+#include <atomic>
 #include <cstdint>
 #include <deque>
 #include <map>
@@ -25,6 +26,7 @@
 #include "ray/object_manager/object_buffer_pool.h"
 #include "ray/object_manager/object_directory.h"
 #include "ray/object_manager/object_manager_client_connection.h"
+#include "ray/object_manager/object_spiller.h"
 #include "ray/object_manager/object_store_notification_manager.h"
 
 namespace ray {
@@ -50,14 +52,51 @@ struct ObjectManagerConfig {
   /// Negative: waiting infinitely.
   /// 0: giving up retrying immediately.
   int push_timeout_ms;
+  /// The directory that objects are spilled to when the object store fills
+  /// up. If this is empty, objects are never spilled.
+  std::string spill_directory;
+  /// The minimum size in bytes of an object for its chunks to be compressed
+  /// when it is sent to an object manager that accepts compressed chunks. If
+  /// this is negative, chunks are never compressed, and this object manager
+  /// does not accept compressed chunks.
+  int64_t compression_min_bytes = -1;
+  /// The maximum number of object managers that an object is pulled from at
+  /// once. Each of them is asked for a different stripe of the object's chunks.
+  int max_pull_sources = 1;
+};
+
+/// A subset of the chunks of an object, namely the chunks whose index modulo
+/// num_stripes is stripe_index.
+struct ChunkStripe {
+  ChunkStripe() : stripe_index(0), num_stripes(1) {}
+  ChunkStripe(uint64_t stripe_index, uint64_t num_stripes)
+      : stripe_index(stripe_index), num_stripes(num_stripes) {}
+
+  /// Whether the chunk at chunk_index is in this stripe.
+  bool Contains(uint64_t chunk_index) const {
+    return chunk_index % num_stripes == stripe_index;
+  }
+
+  /// Whether every chunk in the other stripe is also in this stripe.
+  bool Covers(const ChunkStripe &other) const {
+    return num_stripes == 1 ||
+           (num_stripes == other.num_stripes && stripe_index == other.stripe_index);
+  }
+
+  uint64_t stripe_index;
+  uint64_t num_stripes;
 };
 
 struct LocalObjectInfo {
   /// Information from the object store about the object.
   object_manager::protocol::ObjectInfoT object_info;
   /// A map from the ID of a remote object manager to the timestamp of when
-  /// the object was last pushed to that object manager (if a push took place).
-  std::unordered_map<ClientID, int64_t> recent_pushes;
+  /// the object was last pushed to that object manager (if a push took place)
+  /// and the chunks that were pushed.
+  std::unordered_map<ClientID, std::pair<int64_t, ChunkStripe>> recent_pushes;
+  /// Whether the object is neither spilled nor being spilled to disk. The
+  /// sizes of such objects count towards the spilling threshold.
+  bool awaiting_spill = false;
 };
 
 class ObjectManagerInterface {
@@ -108,8 +147,11 @@ class ObjectManager : public ObjectManagerInterface {
   ///
   /// \param object_id The object's object id.
   /// \param client_id The remote node's client id.
+  /// \param stripe The chunks of the object to push. If the object is not local
+  /// yet, all of its chunks are pushed once it becomes local.
   /// \return Void.
-  void Push(const ObjectID &object_id, const ClientID &client_id);
+  void Push(const ObjectID &object_id, const ClientID &client_id,
+            const ChunkStripe &stripe = ChunkStripe());
 
   /// Pull an object from ClientID.
   ///
@@ -117,12 +159,14 @@ class ObjectManager : public ObjectManagerInterface {
   /// \return Status of whether the pull request successfully initiated.
   ray::Status Pull(const ObjectID &object_id);
 
-  /// Try to Pull an object from one of its expected client locations. If there
-  /// are more client locations to try after this attempt, then this method
-  /// will try each of the other clients in succession, with a timeout between
-  /// each attempt. If the object is received or if the Pull is Canceled before
-  /// the timeout, then no more Pull requests for this object will be sent
-  /// to other node managers until TryPull is called again.
+  /// Try to Pull an object from some of its expected client locations. If the
+  /// object is pulled from several clients at once, each of them is asked for
+  /// a different stripe of the object's chunks. If there are more client
+  /// locations to try after this attempt, then this method will try the
+  /// clients again in a random order, with a timeout between each attempt. If
+  /// the object is received or if the Pull is Canceled before the timeout,
+  /// then no more Pull requests for this object will be sent to other node
+  /// managers until TryPull is called again.
   ///
   /// \param object_id The object's object id.
   /// \return Void.
@@ -177,6 +221,34 @@ class ObjectManager : public ObjectManagerInterface {
   ///                   or send it to all the object stores.
   void FreeObjects(const std::vector<ObjectID> &object_ids, bool local_only);
 
+  /// Replicate an object to a set of object managers along a tree. The object
+  /// manager at the root of the tree pushes the object to fanout children, and
+  /// each of them forwards it to the object managers in its subtree once it
+  /// has the whole object, so the object reaches n object managers in about
+  /// log(n) / log(fanout + 1) rounds of transfers. If fanout is 1, the object
+  /// is passed along a chain.
+  ///
+  /// \param object_id The object to broadcast.
+  /// \param client_ids The object managers to replicate the object to.
+  /// \param fanout The number of object managers that each object manager
+  /// forwards the object to directly.
+  void Broadcast(const ObjectID &object_id, const std::vector<ClientID> &client_ids,
+                 uint64_t fanout);
+
+  /// Get the size of an object in this node's object store.
+  ///
+  /// \param object_id The object's ObjectID.
+  /// \param object_size Set to the size of the object's data and metadata in
+  /// bytes.
+  /// \return Whether the object is in this node's object store.
+  bool GetLocalObjectSize(const ObjectID &object_id, int64_t *object_size) const;
+
+  /// The total number of bytes that were spilled to disk so far.
+  int64_t SpilledBytesTotal() const;
+
+  /// The total number of bytes that were restored from disk so far.
+  int64_t RestoredBytesTotal() const;
+
   /// Return profiling information and reset the profiling information.
   ///
   /// \return All profiling information that has accumulated since the last call
@@ -188,6 +260,11 @@ class ObjectManager : public ObjectManagerInterface {
   /// \return string.
   std::string DebugString() const;
 
+  /// Return the number of object chunks that were sent compressed.
+  ///
+  /// \return The number of compressed chunks sent.
+  uint64_t NumCompressedChunksSent() const { return num_compressed_chunks_sent_; }
+
  private:
   friend class TestObjectManager;
 
@@ -239,6 +316,37 @@ class ObjectManager : public ObjectManagerInterface {
   /// Completion handler for Wait.
   void WaitComplete(const UniqueID &wait_id);
 
+  /// Add this object manager to a broadcast tree. Once the object is local,
+  /// it is forwarded to the given object managers. If the object is not
+  /// received within the pull timeout, it is pulled from any node that has it.
+  ///
+  /// \param object_id The object to broadcast.
+  /// \param client_ids The object managers in the subtree of this object
+  /// manager.
+  /// \param fanout The number of object managers to forward the object to
+  /// directly.
+  void HandleBroadcast(const ObjectID &object_id, const std::vector<ClientID> &client_ids,
+                       uint64_t fanout);
+
+  /// Forward a local object to the children of this object manager in a
+  /// broadcast tree. The object managers are split into fanout subtrees, and
+  /// the first object manager of each subtree is sent the object and asked to
+  /// forward it to the rest of its subtree.
+  void ForwardBroadcast(const ObjectID &object_id,
+                        const std::vector<ClientID> &client_ids, uint64_t fanout);
+
+  /// Ask a remote object manager to join a broadcast tree.
+  ///
+  /// \param client_id The remote object manager.
+  /// \param object_id The object to broadcast.
+  /// \param client_ids The object managers in the subtree of the remote object
+  /// manager.
+  /// \param fanout The number of object managers that each object manager
+  /// forwards the object to directly.
+  /// \return Whether the request was sent.
+  bool SendBroadcastRequest(const ClientID &client_id, const ObjectID &object_id,
+                            const std::vector<ClientID> &client_ids, uint64_t fanout);
+
   /// Spread the Free request to all objects managers.
   ///
   /// \param object_ids the The list of ObjectIDs to be deleted.
@@ -261,15 +369,17 @@ class ObjectManager : public ObjectManagerInterface {
   /// Part of an asynchronous sequence of Pull methods.
   /// Uses an existing connection or creates a connection to ClientID.
   /// Executes on main_service_ thread.
-  void PullEstablishConnection(const ObjectID &object_id, const ClientID &client_id);
+  void PullEstablishConnection(const ObjectID &object_id, const ClientID &client_id,
+                               const ChunkStripe &stripe);
 
   /// Asynchronously send a pull request via remote object manager connection.
   /// Executes on main_service_ thread.
   ///
   /// \param object_id The ID of the object request.
+  /// \param stripe The chunks of the object to request.
   /// \param conn The connection to the remote object manager.
   /// \return Void.
-  void PullSendRequest(const ObjectID &object_id,
+  void PullSendRequest(const ObjectID &object_id, const ChunkStripe &stripe,
                        std::shared_ptr<SenderConnection> &conn);
 
   std::shared_ptr<SenderConnection> CreateSenderConnection(
@@ -311,20 +421,28 @@ class ObjectManager : public ObjectManagerInterface {
   /// Executes on send_service_ thread pool.
   ray::Status ExecuteSendObject(const ClientID &client_id, const ObjectID &object_id,
                                 uint64_t data_size, uint64_t metadata_size,
-                                uint64_t chunk_index,
+                                uint64_t chunk_index, bool compress,
                                 const RemoteConnectionInfo &connection_info);
 
   /// This method synchronously sends the object id and object size
-  /// to the remote object manager.
+  /// to the remote object manager. If compress is true, the chunk is sent
+  /// compressed unless compression does not make it smaller.
   /// Executes on send_service_ thread pool.
   ray::Status SendObjectHeaders(const ObjectID &object_id, uint64_t data_size,
                                 uint64_t metadata_size, uint64_t chunk_index,
-                                std::shared_ptr<SenderConnection> &conn);
+                                bool compress, std::shared_ptr<SenderConnection> &conn);
 
   /// This method initiates the actual object transfer.
   /// Executes on send_service_ thread pool.
+  ///
+  /// \param object_id The ID of the object.
+  /// \param chunk_info The chunk that is sent.
+  /// \param compressed_data The compressed chunk data, or nullptr if the chunk
+  /// is sent uncompressed.
+  /// \param conn The connection to send the chunk on.
   ray::Status SendObjectData(const ObjectID &object_id,
                              const ObjectBufferPool::ChunkInfo &chunk_info,
+                             const std::vector<uint8_t> *compressed_data,
                              std::shared_ptr<SenderConnection> &conn);
 
   /// Invoked when a remote object manager pushes an object to this object manager.
@@ -333,9 +451,12 @@ class ObjectManager : public ObjectManagerInterface {
                           const uint8_t *message);
 
   /// Execute a receive on the receive_service_ thread pool.
+  /// If compressed_size is not zero, the chunk data is compressed and has
+  /// that size.
   ray::Status ExecuteReceiveObject(const ClientID &client_id, const ObjectID &object_id,
                                    uint64_t data_size, uint64_t metadata_size,
-                                   uint64_t chunk_index, TcpClientConnection &conn);
+                                   uint64_t chunk_index, uint64_t compressed_size,
+                                   TcpClientConnection &conn);
 
   /// Handles receiving a pull request message.
   void ReceivePullRequest(std::shared_ptr<TcpClientConnection> &conn,
@@ -343,6 +464,9 @@ class ObjectManager : public ObjectManagerInterface {
   /// Handles freeing objects request.
   void ReceiveFreeRequest(std::shared_ptr<TcpClientConnection> &conn,
                           const uint8_t *message);
+  /// Handles a request to join a broadcast tree.
+  void ReceiveBroadcastRequest(std::shared_ptr<TcpClientConnection> &conn,
+                               const uint8_t *message);
 
   /// Handles connect message of a new client connection.
   void ConnectClient(std::shared_ptr<TcpClientConnection> &conn, const uint8_t *message);
@@ -352,6 +476,39 @@ class ObjectManager : public ObjectManagerInterface {
   /// Handle Push task timeout.
   void HandlePushTaskTimeout(const ObjectID &object_id, const ClientID &client_id);
 
+  /// Spill the oldest local objects that have not been spilled yet, until the
+  /// bytes of such objects are below the spilling threshold. Spilled objects
+  /// can be evicted by the object store without being lost.
+  void SpillObjectsIfNeeded();
+
+  /// Handle the completion of spilling an object.
+  ///
+  /// \param object_info Information about the spilled object.
+  /// \param status Whether the object was written to disk.
+  void HandleObjectSpilled(const object_manager::protocol::ObjectInfoT &object_info,
+                           const ray::Status &status);
+
+  /// Restore an object from disk if it was spilled and is not local.
+  ///
+  /// \param object_id The object to restore.
+  /// \return Whether the object is being restored.
+  bool RestoreSpilledObject(const ObjectID &object_id);
+
+  /// Handle the failure to restore a spilled object. The spilled copy is
+  /// deleted, and a pull that was waiting for the restore is retried from the
+  /// other nodes, or waits for the object to be reconstructed.
+  ///
+  /// \param object_id The object that could not be restored.
+  /// \param status The reason of the failure.
+  void HandleRestoreFailed(const ObjectID &object_id, const ray::Status &status);
+
+  /// Handle the deletion of the spilled copy of an object, e.g. to stay within
+  /// the disk budget. If the object is not local, this node is no longer one
+  /// of its locations.
+  ///
+  /// \param object_id The object whose spilled copy was deleted.
+  void HandleSpilledObjectDeleted(const ObjectID &object_id);
+
   ClientID client_id_;
   const ObjectManagerConfig config_;
   std::shared_ptr<ObjectDirectoryInterface> object_directory_;
@@ -407,12 +564,37 @@ class ObjectManager : public ObjectManagerInterface {
   /// remote object managers.
   std::unordered_map<ObjectID, PullRequest> pull_requests_;
 
+  /// The broadcasts that wait for an object to become local before it is
+  /// forwarded. Each entry holds the object managers to forward the object to
+  /// and the fanout of the broadcast.
+  std::unordered_map<ObjectID, std::vector<std::pair<std::vector<ClientID>, uint64_t>>>
+      pending_broadcasts_;
+
   /// Profiling events that are to be batched together and added to the profile
   /// table in the GCS.
   std::vector<ProfileEventT> profile_events_;
 
   /// Internally maintained random number generator.
   std::mt19937_64 gen_;
+
+  /// Spills objects to disk and restores them. This is null if spilling is
+  /// disabled.
+  std::unique_ptr<ObjectSpiller> spiller_;
+
+  /// The local objects that may be spilled, from the oldest to the newest.
+  /// This may contain objects that are no longer local or already spilled.
+  std::deque<ObjectID> spill_candidates_;
+
+  /// The total size of the local objects that are neither spilled nor being
+  /// spilled.
+  int64_t unspilled_bytes_;
+
+  /// The objects that were pulled and are being restored from disk instead.
+  std::unordered_set<ObjectID> pulls_awaiting_restore_;
+
+  /// The number of object chunks that were sent compressed. This is updated
+  /// by the send threads.
+  std::atomic<uint64_t> num_compressed_chunks_sent_{0};
 };
 
 }  // namespace ray
@@ -0,0 +1,260 @@
+#include "ray/object_manager/object_spiller.h"
+
+#include <fcntl.h>
+#include <sys/mman.h>
+#include <sys/stat.h>
+#include <unistd.h>
+
+#include <cerrno>
+#include <cstring>
+#include <sstream>
+
+#include "ray/util/logging.h"
+
+namespace ray {
+
+ObjectSpiller::ObjectSpiller(boost::asio::io_service &main_service,
+                             const std::string &store_socket_name,
+                             const std::string &spill_directory,
+                             int64_t max_spilled_bytes,
+                             const DeleteCallback &delete_callback)
+    : main_service_(main_service),
+      io_work_(io_service_),
+      spill_directory_(spill_directory),
+      max_spilled_bytes_(max_spilled_bytes),
+      delete_callback_(delete_callback),
+      spilled_bytes_current_(0),
+      spilled_bytes_total_(0),
+      restored_bytes_total_(0) {
+  // Create the spill directory and its parents if they do not exist yet.
+  for (size_t pos = spill_directory_.find('/', 1); pos != std::string::npos;
+       pos = spill_directory_.find('/', pos + 1)) {
+    mkdir(spill_directory_.substr(0, pos).c_str(), 0700);
+  }
+  if (mkdir(spill_directory_.c_str(), 0700) != 0 && errno != EEXIST) {
+    RAY_LOG(FATAL) << "Failed to create the object spill directory " << spill_directory_
+                   << ": " << std::strerror(errno);
+  }
+  ARROW_CHECK_OK(store_client_.Connect(store_socket_name.c_str()));
+  store_capacity_ = store_client_.store_capacity();
+  io_thread_ = std::thread([this]() { io_service_.run(); });
+}
+
+ObjectSpiller::~ObjectSpiller() {
+  io_service_.stop();
+  io_thread_.join();
+  ARROW_CHECK_OK(store_client_.Disconnect());
+  // Spilled objects do not outlive the node, so remove their files.
+  for (const auto &spilled_object : spilled_objects_) {
+    unlink(spilled_object.second.path.c_str());
+  }
+  rmdir(spill_directory_.c_str());
+}
+
+void ObjectSpiller::Spill(const ObjectID &object_id, const Callback &callback) {
+  if (spilled_objects_.count(object_id) > 0) {
+    callback(ray::Status::OK());
+    return;
+  }
+  if (!spilling_objects_.insert(object_id).second) {
+    callback(ray::Status::Invalid("The object is already being spilled."));
+    return;
+  }
+  io_service_.post([this, object_id, callback]() {
+    SpilledObject spilled_object;
+    ray::Status status = WriteObject(object_id, &spilled_object);
+    main_service_.post([this, object_id, callback, spilled_object, status]() {
+      if (spilling_objects_.erase(object_id) == 0) {
+        // The object was deleted while it was being written.
+        if (status.ok()) {
+          unlink(spilled_object.path.c_str());
+        }
+        callback(ray::Status::Invalid("The object was deleted while spilling."));
+        return;
+      }
+      if (status.ok()) {
+        int64_t size = spilled_object.data_size + spilled_object.metadata_size;
+        spilled_bytes_current_ += size;
+        spilled_bytes_total_ += size;
+        auto it = spilled_objects_.emplace(object_id, spilled_object).first;
+        it->second.lru_it = lru_objects_.insert(lru_objects_.end(), object_id);
+      }
+      callback(status);
+      if (status.ok()) {
+        DeleteObjectsIfNeeded();
+      }
+    });
+  });
+}
+
+void ObjectSpiller::Restore(const ObjectID &object_id, const Callback &callback) {
+  auto it = spilled_objects_.find(object_id);
+  if (it == spilled_objects_.end()) {
+    callback(ray::Status::Invalid("The object is not spilled."));
+    return;
+  }
+  // The object is used again, so its file is deleted last.
+  lru_objects_.splice(lru_objects_.end(), lru_objects_, it->second.lru_it);
+  auto &callbacks = restoring_objects_[object_id];
+  callbacks.push_back(callback);
+  if (callbacks.size() > 1) {
+    // A restore of this object is already in progress.
+    return;
+  }
+  const SpilledObject spilled_object = it->second;
+  io_service_.post([this, object_id, spilled_object]() {
+    ray::Status status = ReadObject(object_id, spilled_object);
+    main_service_.post([this, object_id, spilled_object, status]() {
+      if (status.ok()) {
+        restored_bytes_total_ += spilled_object.data_size + spilled_object.metadata_size;
+      }
+      auto callbacks = std::move(restoring_objects_[object_id]);
+      restoring_objects_.erase(object_id);
+      for (const auto &callback : callbacks) {
+        callback(status);
+      }
+    });
+  });
+}
+
+void ObjectSpiller::Delete(const ObjectID &object_id) {
+  spilling_objects_.erase(object_id);
+  auto it = spilled_objects_.find(object_id);
+  if (it == spilled_objects_.end()) {
+    return;
+  }
+  // A restore that is in progress either already mapped the file or fails to
+  // open it, so unlinking it is safe.
+  unlink(it->second.path.c_str());
+  spilled_bytes_current_ -= it->second.data_size + it->second.metadata_size;
+  lru_objects_.erase(it->second.lru_it);
+  spilled_objects_.erase(it);
+}
+
+void ObjectSpiller::DeleteObjectsIfNeeded() {
+  if (max_spilled_bytes_ < 0) {
+    return;
+  }
+  auto it = lru_objects_.begin();
+  while (spilled_bytes_current_ > max_spilled_bytes_ && it != lru_objects_.end()) {
+    ObjectID object_id = *it;
+    // Advance first, since deleting the object erases its position.
+    ++it;
+    if (restoring_objects_.count(object_id) > 0) {
+      continue;
+    }
+    Delete(object_id);
+    delete_callback_(object_id);
+  }
+}
+
+bool ObjectSpiller::IsSpilled(const ObjectID &object_id) const {
+  return spilled_objects_.count(object_id) > 0;
+}
+
+bool ObjectSpiller::IsSpilling(const ObjectID &object_id) const {
+  return spilling_objects_.count(object_id) > 0;
+}
+
+ray::Status ObjectSpiller::WriteObject(const ObjectID &object_id,
+                                       SpilledObject *spilled_object) {
+  plasma::ObjectID plasma_id = object_id.to_plasma_id();
+  plasma::ObjectBuffer object_buffer;
+  arrow::Status plasma_status = store_client_.Get(&plasma_id, 1, 0, &object_buffer);
+  if (!plasma_status.ok()) {
+    return ray::Status::IOError(plasma_status.message());
+  }
+  if (object_buffer.data == nullptr) {
+    return ray::Status::IOError("The object is not in the local object store.");
+  }
+  // The metadata is stored right after the data, so both can be written at once.
+  RAY_CHECK(object_buffer.metadata->data() ==
+            object_buffer.data->data() + object_buffer.data->size());
+  spilled_object->path = spill_directory_ + "/" + object_id.hex();
+  spilled_object->data_size = object_buffer.data->size();
+  spilled_object->metadata_size = object_buffer.metadata->size();
+
+  ray::Status status = ray::Status::OK();
+  int fd = open(spilled_object->path.c_str(), O_CREAT | O_WRONLY | O_TRUNC, 0600);
+  if (fd < 0) {
+    status = ray::Status::IOError(std::strerror(errno));
+  } else {
+    const uint8_t *data = object_buffer.data->data();
+    int64_t remaining = spilled_object->data_size + spilled_object->metadata_size;
+    while (remaining > 0) {
+      ssize_t written = write(fd, data, remaining);
+      if (written < 0) {
+        if (errno == EINTR) {
+          continue;
+        }
+        status = ray::Status::IOError(std::strerror(errno));
+        break;
+      }
+      data += written;
+      remaining -= written;
+    }
+    close(fd);
+    if (!status.ok()) {
+      unlink(spilled_object->path.c_str());
+    }
+  }
+  ARROW_CHECK_OK(store_client_.Release(plasma_id));
+  return status;
+}
+
+ray::Status ObjectSpiller::ReadObject(const ObjectID &object_id,
+                                      const SpilledObject &spilled_object) {
+  int fd = open(spilled_object.path.c_str(), O_RDONLY);
+  if (fd < 0) {
+    return ray::Status::IOError(std::strerror(errno));
+  }
+  int64_t size = spilled_object.data_size + spilled_object.metadata_size;
+  // Map the file rather than reading it, so that its pages are copied straight
+  // from the page cache into the store.
+  void *file_data = nullptr;
+  if (size > 0) {
+    file_data = mmap(nullptr, size, PROT_READ, MAP_PRIVATE, fd, 0);
+  }
+  close(fd);
+  if (file_data == MAP_FAILED) {
+    return ray::Status::IOError(std::strerror(errno));
+  }
+  const uint8_t *data = static_cast<const uint8_t *>(file_data);
+
+  ray::Status status = ray::Status::OK();
+  plasma::ObjectID plasma_id = object_id.to_plasma_id();
+  std::shared_ptr<Buffer> buffer;
+  arrow::Status plasma_status =
+      store_client_.Create(plasma_id, spilled_object.data_size,
+                           data + spilled_object.data_size,
+                           spilled_object.metadata_size, &buffer);
+  if (plasma_status.ok()) {
+    if (spilled_object.data_size > 0) {
+      std::memcpy(buffer->mutable_data(), data, spilled_object.data_size);
+    }
+    ARROW_CHECK_OK(store_client_.Seal(plasma_id));
+    ARROW_CHECK_OK(store_client_.Release(plasma_id));
+  } else if (!plasma_status.IsPlasmaObjectExists()) {
+    // The object may have been recreated in the meantime, which is fine.
+    // Otherwise, e.g. if the store is full, the restore fails.
+    status = ray::Status::IOError(plasma_status.message());
+  }
+  if (file_data != nullptr) {
+    munmap(file_data, size);
+  }
+  return status;
+}
+
+std::string ObjectSpiller::DebugString() const {
+  std::stringstream result;
+  result << "ObjectSpiller:";
+  result << "\n- num spilled objects: " << spilled_objects_.size();
+  result << "\n- num objects being spilled: " << spilling_objects_.size();
+  result << "\n- num objects being restored: " << restoring_objects_.size();
+  result << "\n- spilled bytes on disk: " << spilled_bytes_current_;
+  result << "\n- total spilled bytes: " << spilled_bytes_total_;
+  result << "\n- total restored bytes: " << restored_bytes_total_;
+  return result.str();
+}
+
+}  // namespace ray
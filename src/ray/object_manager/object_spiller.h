@@ -0,0 +1,159 @@
+#ifndef RAY_OBJECT_MANAGER_OBJECT_SPILLER_H
+#define RAY_OBJECT_MANAGER_OBJECT_SPILLER_H
+
+#include <functional>
+#include <list>
+#include <thread>
+#include <unordered_map>
+#include <unordered_set>
+#include <vector>
+
+#include <boost/asio.hpp>
+
+#include "plasma/client.h"
+
+#include "ray/id.h"
+#include "ray/status.h"
+#include "ray/util/macros.h"
+
+namespace ray {
+
+/// \class ObjectSpiller
+///
+/// Copies objects from the local object store to files on local disk, so that
+/// they are not lost when the store evicts them, and copies them back into the
+/// store when they are needed again. If the spilled objects take up more than
+/// a disk budget, the files of the least recently spilled or restored objects
+/// are deleted. File I/O runs on a dedicated thread, and all callbacks are
+/// posted to the main event loop. All public methods must be called from the
+/// main event loop.
+class ObjectSpiller {
+ public:
+  /// Callback for a spill or restore operation.
+  using Callback = std::function<void(const ray::Status &status)>;
+
+  /// Callback for a spilled copy that was deleted to stay within the disk budget.
+  using DeleteCallback = std::function<void(const ObjectID &object_id)>;
+
+  /// Create an object spiller.
+  ///
+  /// \param main_service The event loop that callbacks are posted to.
+  /// \param store_socket_name The socket name of the local object store.
+  /// \param spill_directory The directory to write spilled objects to. It is
+  /// created if it does not exist.
+  /// \param max_spilled_bytes The maximum number of bytes of spilled objects to
+  /// keep on disk. A negative value means no limit.
+  /// \param delete_callback Invoked for each spilled copy that is deleted to
+  /// stay within max_spilled_bytes.
+  ObjectSpiller(boost::asio::io_service &main_service,
+                const std::string &store_socket_name,
+                const std::string &spill_directory, int64_t max_spilled_bytes,
+                const DeleteCallback &delete_callback);
+
+  ~ObjectSpiller();
+
+  /// Copy an object from the local object store to disk.
+  ///
+  /// \param object_id The ID of the object to spill.
+  /// \param callback Invoked once the object is written, or if it could not be
+  /// spilled, e.g. because it is no longer in the store.
+  void Spill(const ObjectID &object_id, const Callback &callback);
+
+  /// Copy a spilled object back into the local object store. Concurrent
+  /// restores of the same object are merged.
+  ///
+  /// \param object_id The ID of the object to restore. It must be spilled.
+  /// \param callback Invoked once the object is sealed in the store, or if it
+  /// could not be restored, e.g. because the store is full.
+  void Restore(const ObjectID &object_id, const Callback &callback);
+
+  /// Delete the spilled copy of an object, if there is one.
+  ///
+  /// \param object_id The ID of the object to delete.
+  void Delete(const ObjectID &object_id);
+
+  /// Whether an object has a spilled copy on disk.
+  bool IsSpilled(const ObjectID &object_id) const;
+
+  /// Whether an object is currently being written to disk.
+  bool IsSpilling(const ObjectID &object_id) const;
+
+  /// The capacity of the local object store in bytes.
+  int64_t StoreCapacity() const { return store_capacity_; }
+
+  /// The total number of bytes written to disk so far.
+  int64_t SpilledBytesTotal() const { return spilled_bytes_total_; }
+
+  /// The total number of bytes restored from disk so far.
+  int64_t RestoredBytesTotal() const { return restored_bytes_total_; }
+
+  /// Returns debug string for class.
+  ///
+  /// \return string.
+  std::string DebugString() const;
+
+  /// ObjectSpiller should not be copied.
+  RAY_DISALLOW_COPY_AND_ASSIGN(ObjectSpiller);
+
+ private:
+  /// Information about a spilled object.
+  struct SpilledObject {
+    /// The path of the file that holds the object's data followed by its
+    /// metadata.
+    std::string path;
+    /// The size of the object's data in bytes.
+    int64_t data_size;
+    /// The size of the object's metadata in bytes.
+    int64_t metadata_size;
+    /// The position of the object in lru_objects_.
+    std::list<ObjectID>::iterator lru_it;
+  };
+
+  /// Write an object to a file. Runs on the I/O thread.
+  ray::Status WriteObject(const ObjectID &object_id, SpilledObject *spilled_object);
+
+  /// Read an object from a file into the store. Runs on the I/O thread.
+  ray::Status ReadObject(const ObjectID &object_id, const SpilledObject &spilled_object);
+
+  /// Delete the least recently used spilled copies that are not being
+  /// restored, until the spilled objects fit in the disk budget.
+  void DeleteObjectsIfNeeded();
+
+  /// Reference to the main event loop.
+  boost::asio::io_service &main_service_;
+  /// The event loop of the I/O thread.
+  boost::asio::io_service io_service_;
+  /// Keeps io_service_ running when it has no work.
+  boost::asio::io_service::work io_work_;
+  /// The thread that reads and writes spilled objects.
+  std::thread io_thread_;
+  /// A client of the local object store. It is only used on the I/O thread.
+  plasma::PlasmaClient store_client_;
+  /// The directory that spilled objects are written to.
+  std::string spill_directory_;
+  /// The capacity of the local object store in bytes.
+  int64_t store_capacity_;
+  /// The maximum number of bytes of spilled objects to keep on disk.
+  int64_t max_spilled_bytes_;
+  /// Invoked for each spilled copy that is deleted to stay within the budget.
+  DeleteCallback delete_callback_;
+  /// The objects that have a spilled copy on disk.
+  std::unordered_map<ObjectID, SpilledObject> spilled_objects_;
+  /// The spilled objects, from the least to the most recently spilled or
+  /// restored.
+  std::list<ObjectID> lru_objects_;
+  /// The objects that are being written to disk.
+  std::unordered_set<ObjectID> spilling_objects_;
+  /// The callbacks of the objects that are being restored.
+  std::unordered_map<ObjectID, std::vector<Callback>> restoring_objects_;
+  /// The number of bytes currently on disk.
+  int64_t spilled_bytes_current_;
+  /// The total number of bytes written to disk so far.
+  int64_t spilled_bytes_total_;
+  /// The total number of bytes restored from disk so far.
+  int64_t restored_bytes_total_;
+};
+
+}  // namespace ray
+
+#endif  // RAY_OBJECT_MANAGER_OBJECT_SPILLER_H
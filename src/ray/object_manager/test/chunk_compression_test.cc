@@ -0,0 +1,93 @@
+#include <algorithm>
+#include <random>
+#include <vector>
+
+#include "gtest/gtest.h"
+
+#include "ray/object_manager/chunk_compression.h"
+
+namespace ray {
+
+// Compress and decompress a chunk, and check that the round trip preserves it.
+// Returns whether the chunk was compressed.
+bool TestRoundTrip(const std::vector<uint8_t> &chunk) {
+  std::vector<uint8_t> compressed;
+  if (!CompressChunk(chunk.data(), chunk.size(), &compressed)) {
+    return false;
+  }
+  EXPECT_LT(compressed.size(), chunk.size());
+  std::vector<uint8_t> decompressed(chunk.size(), 1);
+  EXPECT_TRUE(DecompressChunk(compressed.data(), compressed.size(), decompressed.data(),
+                              decompressed.size())
+                  .ok());
+  EXPECT_EQ(decompressed, chunk);
+  return true;
+}
+
+TEST(ChunkCompressionTest, TestZeros) {
+  std::vector<uint8_t> chunk(1 << 20, 0);
+  std::vector<uint8_t> compressed;
+  ASSERT_TRUE(CompressChunk(chunk.data(), chunk.size(), &compressed));
+  // A chunk of zeros is encoded as a single record.
+  ASSERT_LT(compressed.size(), 8);
+  ASSERT_TRUE(TestRoundTrip(chunk));
+}
+
+TEST(ChunkCompressionTest, TestIncompressible) {
+  std::mt19937 gen(0);
+  std::vector<uint8_t> chunk(1 << 20);
+  for (auto &byte : chunk) {
+    byte = static_cast<uint8_t>(gen() | 1);
+  }
+  ASSERT_FALSE(TestRoundTrip(chunk));
+  ASSERT_FALSE(TestRoundTrip({}));
+}
+
+TEST(ChunkCompressionTest, TestSparse) {
+  // Chunks with random runs of zeros of all lengths, at all offsets.
+  std::mt19937 gen(0);
+  for (int i = 0; i < 10000; i++) {
+    std::vector<uint8_t> chunk(gen() % 300);
+    for (auto &byte : chunk) {
+      byte = (gen() % 3 == 0) ? static_cast<uint8_t>(gen()) : 0;
+    }
+    for (int j = 0; j < 3 && !chunk.empty(); j++) {
+      size_t start = gen() % chunk.size();
+      size_t end = std::min(chunk.size(), start + gen() % 50);
+      std::fill(chunk.begin() + start, chunk.begin() + end, 0);
+    }
+    TestRoundTrip(chunk);
+  }
+}
+
+TEST(ChunkCompressionTest, TestOptOut) {
+  ASSERT_TRUE(IsCompressionAllowed(""));
+  ASSERT_TRUE(IsCompressionAllowed("other"));
+  ASSERT_FALSE(IsCompressionAllowed(kNoCompressionMetadata));
+}
+
+TEST(ChunkCompressionTest, TestMalformed) {
+  std::vector<uint8_t> chunk(1000, 0);
+  chunk[500] = 1;
+  std::vector<uint8_t> compressed;
+  ASSERT_TRUE(CompressChunk(chunk.data(), chunk.size(), &compressed));
+  std::vector<uint8_t> decompressed(chunk.size());
+  // Truncated input.
+  ASSERT_FALSE(DecompressChunk(compressed.data(), compressed.size() - 1,
+                               decompressed.data(), decompressed.size())
+                   .ok());
+  // The wrong decompressed size.
+  ASSERT_FALSE(DecompressChunk(compressed.data(), compressed.size(), decompressed.data(),
+                               decompressed.size() - 1)
+                   .ok());
+  ASSERT_FALSE(DecompressChunk(compressed.data(), compressed.size(), decompressed.data(),
+                               decompressed.size() + 1)
+                   .ok());
+}
+
+}  // namespace ray
+
+int main(int argc, char **argv) {
+  ::testing::InitGoogleTest(&argc, argv);
+  return RUN_ALL_TESTS();
+}
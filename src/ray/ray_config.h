@@ -107,6 +107,28 @@ class RayConfig {
 
   int num_workers_per_process() const { return num_workers_per_process_; }
 
+  int min_idle_workers() const { return min_idle_workers_; }
+
+  int64_t scheduler_locality_min_bytes() const { return scheduler_locality_min_bytes_; }
+
+  int object_location_cache_size() const { return object_location_cache_size_; }
+
+  int object_spilling_threshold_percent() const {
+    return object_spilling_threshold_percent_;
+  }
+
+  int64_t object_spilling_max_bytes() const { return object_spilling_max_bytes_; }
+
+  bool push_arguments_to_consumers() const { return push_arguments_to_consumers_; }
+
+  int64_t object_manager_compression_min_bytes() const {
+    return object_manager_compression_min_bytes_;
+  }
+
+  int object_manager_max_pull_sources() const {
+    return object_manager_max_pull_sources_;
+  }
+
   int64_t max_task_lease_timeout_ms() const { return max_task_lease_timeout_ms_; }
 
   void initialize(const std::unordered_map<std::string, int> &config_map) {
@@ -184,6 +206,22 @@ class RayConfig {
         object_manager_repeated_push_delay_ms_ = pair.second;
       } else if (pair.first == "max_task_lease_timeout_ms") {
         max_task_lease_timeout_ms_ = pair.second;
+      } else if (pair.first == "min_idle_workers") {
+        min_idle_workers_ = pair.second;
+      } else if (pair.first == "scheduler_locality_min_bytes") {
+        scheduler_locality_min_bytes_ = pair.second;
+      } else if (pair.first == "object_location_cache_size") {
+        object_location_cache_size_ = pair.second;
+      } else if (pair.first == "object_spilling_threshold_percent") {
+        object_spilling_threshold_percent_ = pair.second;
+      } else if (pair.first == "object_spilling_max_bytes") {
+        object_spilling_max_bytes_ = pair.second;
+      } else if (pair.first == "push_arguments_to_consumers") {
+        push_arguments_to_consumers_ = pair.second;
+      } else if (pair.first == "object_manager_compression_min_bytes") {
+        object_manager_compression_min_bytes_ = pair.second;
+      } else if (pair.first == "object_manager_max_pull_sources") {
+        object_manager_max_pull_sources_ = pair.second;
       } else {
         RAY_LOG(FATAL) << "Received unexpected config parameter " << pair.first;
       }
@@ -229,6 +267,14 @@ class RayConfig {
         object_manager_default_chunk_size_(1000000),
         num_workers_per_process_(1),
         max_task_lease_timeout_ms_(60 * 1000),
+        min_idle_workers_(0),
+        scheduler_locality_min_bytes_(100 * 1024),
+        object_location_cache_size_(10000),
+        object_spilling_threshold_percent_(0),
+        object_spilling_max_bytes_(-1),
+        push_arguments_to_consumers_(false),
+        object_manager_compression_min_bytes_(-1),
+        object_manager_max_pull_sources_(1),
         initialized_(false) {}
 
   ~RayConfig() {}
@@ -360,6 +406,55 @@ class RayConfig {
   // Maximum timeout in milliseconds within which a task lease must be renewed.
   int64_t max_task_lease_timeout_ms_;
 
+  /// The number of idle workers that the raylet keeps started, so that new
+  /// tasks do not wait for a worker process to start. Workers that exit, e.g.,
+  /// because a function reached its max_calls, are replaced in the background.
+  int min_idle_workers_;
+
+  /// The minimum number of bytes of a task's object arguments that must be
+  /// resident on a node for the scheduling policy to place the task there
+  /// because of locality. Tasks with fewer resident argument bytes on every
+  /// node are placed by load. A negative value disables locality-aware
+  /// placement.
+  int64_t scheduler_locality_min_bytes_;
+
+  /// The maximum number of objects whose locations the object directory
+  /// remembers after they were received from the GCS. The scheduling policy
+  /// uses these locations to place tasks near their arguments.
+  int object_location_cache_size_;
+
+  /// The percentage of the object store capacity that local objects which
+  /// were not spilled to disk may occupy. Above this, the oldest local objects
+  /// are spilled to disk, so that the object store can evict them without
+  /// losing them. A value of 0 disables spilling.
+  int object_spilling_threshold_percent_;
+
+  /// The maximum number of bytes of spilled objects that a node keeps on disk.
+  /// When a spill goes over this, the files of the least recently spilled or
+  /// restored objects are deleted. A negative value means no limit.
+  int64_t object_spilling_max_bytes_;
+
+  /// Whether a raylet that forwards a task to another node pushes the task's
+  /// arguments to that node, including the arguments that are still being
+  /// created by tasks on the forwarding node. These are pushed as soon as
+  /// they are created, unless this takes longer than the object manager's
+  /// push timeout. If this is false, only the local arguments of actor tasks
+  /// are pushed, and other arguments are pulled by the receiving node.
+  bool push_arguments_to_consumers_;
+
+  /// The minimum size in bytes of an object for the object manager to
+  /// compress its chunks when it sends the object to another node. Chunks are
+  /// only compressed if both nodes enable compression, and chunks that do not
+  /// get smaller are sent as is. A negative value disables compression.
+  /// Individual objects can opt out, see ray.put.
+  int64_t object_manager_compression_min_bytes_;
+
+  /// The maximum number of nodes that an object is pulled from at once. If an
+  /// object has copies on several nodes, each of them sends a different subset
+  /// of the object's chunks, which spreads the transfer of an object that many
+  /// nodes need over the nodes that already have it.
+  int object_manager_max_pull_sources_;
+
   /// Whether the initialization of the instance has been called before.
   /// The RayConfig instance can only (and must) be initialized once.
   bool initialized_;
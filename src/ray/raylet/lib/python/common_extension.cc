@@ -534,6 +534,11 @@ static PyObject *PyTask_actor_id(PyTask *self) {
   return PyObjectID_make(actor_id);
 }
 
+static PyObject *PyTask_actor_handle_id(PyTask *self) {
+  ActorHandleID actor_handle_id = self->task_spec->ActorHandleId();
+  return PyObjectID_make(actor_handle_id);
+}
+
 static PyObject *PyTask_actor_counter(PyTask *self) {
   int64_t actor_counter = self->task_spec->ActorCounter();
   return PyLong_FromLongLong(actor_counter);
@@ -659,6 +664,8 @@ static PyMethodDef PyTask_methods[] = {
      "Return the parent counter of this task."},
     {"actor_id", (PyCFunction)PyTask_actor_id, METH_NOARGS,
      "Return the actor ID for this task."},
+    {"actor_handle_id", (PyCFunction)PyTask_actor_handle_id, METH_NOARGS,
+     "Return the ID of the actor handle that submitted this task."},
     {"actor_counter", (PyCFunction)PyTask_actor_counter, METH_NOARGS,
      "Return the actor counter for this task."},
     {"driver_id", (PyCFunction)PyTask_driver_id, METH_NOARGS,
@@ -56,6 +56,35 @@ static PyObject *PyRayletClient_SubmitTask(PyRayletClient *self, PyObject *args)
   Py_RETURN_NONE;
 }
 
+static PyObject *PyRayletClient_SubmitTasks(PyRayletClient *self, PyObject *args) {
+  PyObject *py_tasks;
+  if (!PyArg_ParseTuple(args, "O", &py_tasks)) {
+    return NULL;
+  }
+  if (!PyList_Check(py_tasks)) {
+    PyErr_SetString(PyExc_TypeError, "submit_tasks expects a list of tasks");
+    return NULL;
+  }
+  Py_ssize_t n = PyList_Size(py_tasks);
+  std::vector<std::vector<ObjectID>> execution_dependencies;
+  std::vector<const ray::raylet::TaskSpecification *> task_specs;
+  execution_dependencies.reserve(n);
+  task_specs.reserve(n);
+  for (Py_ssize_t i = 0; i < n; ++i) {
+    PyObject *py_task = PyList_GetItem(py_tasks, i);
+    if (!PyObject_TypeCheck(py_task, &PyTaskType)) {
+      PyErr_SetString(PyExc_TypeError, "submit_tasks expects a list of tasks");
+      return NULL;
+    }
+    PyTask *task = reinterpret_cast<PyTask *>(py_task);
+    execution_dependencies.push_back(*task->execution_dependencies);
+    task_specs.push_back(task->task_spec);
+  }
+  auto status = self->raylet_client->SubmitTasks(execution_dependencies, task_specs);
+  RAY_CHECK_OK_PREPEND(status, "[RayletClient] Failed to submit tasks to raylet.");
+  Py_RETURN_NONE;
+}
+
 // clang-format off
 static PyObject *PyRayletClient_GetTask(PyRayletClient *self) {
   std::unique_ptr<ray::raylet::TaskSpecification> task_spec;
@@ -338,11 +367,55 @@ static PyObject *PyRayletClient_FreeObjects(PyRayletClient *self, PyObject *args
   Py_RETURN_NONE;
 }
 
+static PyObject *PyRayletClient_BroadcastObject(PyRayletClient *self, PyObject *args) {
+  ObjectID object_id;
+  PyObject *py_client_ids;
+  unsigned long long fanout;
+  if (!PyArg_ParseTuple(args, "O&OK", &PyObjectToUniqueID, &object_id, &py_client_ids,
+                        &fanout)) {
+    return NULL;
+  }
+
+  // Convert client ids.
+  std::vector<ray::ClientID> client_ids;
+  if (py_object_id_list_to_vector(py_client_ids, client_ids)) {
+    return NULL;
+  }
+
+  auto status = self->raylet_client->BroadcastObject(object_id, client_ids, fanout);
+  RAY_CHECK_OK_PREPEND(status, "[RayletClient] Failed to broadcast object.");
+  Py_RETURN_NONE;
+}
+
+static PyObject *PyRayletClient_NotifyTaskInFlight(PyRayletClient *self,
+                                                   PyObject *args) {
+  TaskID task_id;
+  if (!PyArg_ParseTuple(args, "O&", &PyObjectToUniqueID, &task_id)) {
+    return NULL;
+  }
+  auto status = self->raylet_client->NotifyTaskInFlight(task_id);
+  RAY_CHECK_OK_PREPEND(status, "[RayletClient] Failed to notify task in flight.");
+  Py_RETURN_NONE;
+}
+
+static PyObject *PyRayletClient_NotifyInFlightTaskDone(PyRayletClient *self,
+                                                       PyObject *args) {
+  TaskID task_id;
+  if (!PyArg_ParseTuple(args, "O&", &PyObjectToUniqueID, &task_id)) {
+    return NULL;
+  }
+  auto status = self->raylet_client->NotifyInFlightTaskDone(task_id);
+  RAY_CHECK_OK_PREPEND(status, "[RayletClient] Failed to notify in-flight task done.");
+  Py_RETURN_NONE;
+}
+
 static PyMethodDef PyRayletClient_methods[] = {
     {"disconnect", (PyCFunction)PyRayletClient_Disconnect, METH_NOARGS,
      "Notify the local scheduler that this client is exiting gracefully."},
     {"submit_task", (PyCFunction)PyRayletClient_SubmitTask, METH_VARARGS,
      "Submit a task to the local scheduler."},
+    {"submit_tasks", (PyCFunction)PyRayletClient_SubmitTasks, METH_VARARGS,
+     "Submit a list of tasks to the local scheduler in one message."},
     {"get_task", (PyCFunction)PyRayletClient_GetTask, METH_NOARGS,
      "Get a task from the local scheduler."},
     {"fetch_or_reconstruct", (PyCFunction)PyRayletClient_FetchOrReconstruct, METH_VARARGS,
@@ -361,6 +434,14 @@ static PyMethodDef PyRayletClient_methods[] = {
      "Store some profiling events in the GCS."},
     {"free_objects", (PyCFunction)PyRayletClient_FreeObjects, METH_VARARGS,
      "Free a list of objects from object stores."},
+    {"broadcast_object", (PyCFunction)PyRayletClient_BroadcastObject, METH_VARARGS,
+     "Replicate an object to a list of nodes along a tree."},
+    {"notify_task_in_flight", (PyCFunction)PyRayletClient_NotifyTaskInFlight,
+     METH_VARARGS,
+     "Notify the local scheduler that a task keeps running on a background thread."},
+    {"notify_in_flight_task_done", (PyCFunction)PyRayletClient_NotifyInFlightTaskDone,
+     METH_VARARGS,
+     "Notify the local scheduler that an in-flight task finished executing."},
     {NULL} /* Sentinel */
 };
 
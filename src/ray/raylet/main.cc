@@ -102,6 +102,11 @@ int main(int argc, char *argv[]) {
   ray::ObjectManagerConfig object_manager_config;
   object_manager_config.object_manager_port = object_manager_port;
   object_manager_config.store_socket_name = store_socket_name;
+  object_manager_config.spill_directory = temp_dir + "/spilled_objects";
+  object_manager_config.compression_min_bytes =
+      RayConfig::instance().object_manager_compression_min_bytes();
+  object_manager_config.max_pull_sources =
+      RayConfig::instance().object_manager_max_pull_sources();
   object_manager_config.pull_timeout_ms =
       RayConfig::instance().object_manager_pull_timeout_ms();
   object_manager_config.push_timeout_ms =
@@ -270,6 +270,17 @@ void NodeManager::Heartbeat() {
     heartbeat_data->resource_load_capacity.push_back(resource_pair.second);
   }
 
+  // Report the queued resource demand so that the autoscaler can scale up to
+  // satisfy it directly.
+  const ResourceSet resource_demand = local_queues_.GetResourceDemand();
+  for (const auto &resource_pair : resource_demand.GetResourceMap()) {
+    heartbeat_data->resource_demand_label.push_back(resource_pair.first);
+    heartbeat_data->resource_demand_capacity.push_back(resource_pair.second);
+  }
+
+  heartbeat_data->spilled_bytes = object_manager_.SpilledBytesTotal();
+  heartbeat_data->restored_bytes = object_manager_.RestoredBytesTotal();
+
   ray::Status status = heartbeat_table.Add(
       UniqueID::nil(), gcs_client_->client_table().GetLocalClientId(), heartbeat_data,
       [](ray::gcs::AsyncGcsClient *client, const ClientID &id,
@@ -283,6 +294,10 @@ void NodeManager::Heartbeat() {
   }
   RAY_CHECK_OK(status);
 
+  // Replace idle workers that were assigned tasks or that exited, so that a
+  // pool of warm workers is ready for new tasks.
+  worker_pool_.PrestartWorkers(RayConfig::instance().min_idle_workers());
+
   if (debug_dump_period_ > 0 &&
       static_cast<int64_t>(now_ms - last_debug_dump_at_ms_) > debug_dump_period_) {
     DumpDebugState();
@@ -669,6 +684,9 @@ void NodeManager::ProcessClientMessage(
   case protocol::MessageType::SubmitTask: {
     ProcessSubmitTaskMessage(message_data);
   } break;
+  case protocol::MessageType::SubmitTasks: {
+    ProcessSubmitTasksMessage(message_data);
+  } break;
   case protocol::MessageType::FetchOrReconstruct: {
     ProcessFetchOrReconstructMessage(client, message_data);
   } break;
@@ -676,6 +694,16 @@ void NodeManager::ProcessClientMessage(
     auto message = flatbuffers::GetRoot<protocol::NotifyUnblocked>(message_data);
     HandleTaskUnblocked(client, from_flatbuf(*message->task_id()));
   } break;
+  case protocol::MessageType::NotifyTaskInFlight: {
+    auto message = flatbuffers::GetRoot<protocol::NotifyTaskInFlight>(message_data);
+    std::shared_ptr<Worker> worker = worker_pool_.GetRegisteredWorker(client);
+    RAY_CHECK(worker);
+    worker->AddInFlightTaskId(from_flatbuf(*message->task_id()));
+  } break;
+  case protocol::MessageType::NotifyInFlightTaskDone: {
+    auto message = flatbuffers::GetRoot<protocol::NotifyInFlightTaskDone>(message_data);
+    HandleInFlightTaskDone(client, from_flatbuf(*message->task_id()));
+  } break;
   case protocol::MessageType::WaitRequest: {
     ProcessWaitRequestMessage(client, message_data);
   } break;
@@ -691,6 +719,12 @@ void NodeManager::ProcessClientMessage(
     std::vector<ObjectID> object_ids = from_flatbuf(*message->object_ids());
     object_manager_.FreeObjects(object_ids, message->local_only());
   } break;
+  case protocol::MessageType::BroadcastObjectRequest: {
+    auto message = flatbuffers::GetRoot<protocol::BroadcastObjectRequest>(message_data);
+    ObjectID object_id = from_flatbuf(*message->object_id());
+    std::vector<ClientID> client_ids = from_flatbuf(*message->client_ids());
+    object_manager_.Broadcast(object_id, client_ids, message->fanout());
+  } break;
 
   default:
     RAY_LOG(FATAL) << "Received unexpected message type " << message_type;
@@ -843,8 +877,22 @@ void NodeManager::ProcessDisconnectClientMessage(
             job_id, type, error_message.str(), current_time_ms()));
       }
     }
+    // Fail the tasks that were still executing on background threads of the
+    // worker. The assigned task, if any, was handled above.
+    if (!worker->IsDead()) {
+      for (const auto &in_flight_task_id : worker->GetInFlightTaskIds()) {
+        if (in_flight_task_id == task_id || !local_queues_.HasTask(in_flight_task_id)) {
+          continue;
+        }
+        const Task &in_flight_task = local_queues_.RemoveTask(in_flight_task_id);
+        TreatTaskAsFailed(in_flight_task);
+      }
+    }
 
     worker_pool_.DisconnectWorker(worker);
+    // Start a replacement right away if the worker was part of the pool of
+    // warm workers, e.g., because it exited after reaching max_calls.
+    worker_pool_.PrestartWorkers(RayConfig::instance().min_idle_workers());
 
     // If the worker was an actor, add it to the list of dead actors.
     const ActorID &actor_id = worker->GetActorId();
@@ -902,6 +950,22 @@ void NodeManager::ProcessSubmitTaskMessage(const uint8_t *message_data) {
   SubmitTask(task, Lineage());
 }
 
+void NodeManager::ProcessSubmitTasksMessage(const uint8_t *message_data) {
+  // Read the batch of tasks submitted by the client.
+  auto message = flatbuffers::GetRoot<protocol::SubmitTasksRequest>(message_data);
+  auto tasks = message->tasks();
+  // Submit the tasks in order, so that consecutive tasks for the same actor handle
+  // keep their order.
+  for (size_t i = 0; i < tasks->size(); i++) {
+    auto request = tasks->Get(i);
+    TaskExecutionSpecification task_execution_spec(
+        from_flatbuf(*request->execution_dependencies()));
+    TaskSpecification task_spec(*request->task_spec());
+    Task task(task_execution_spec, task_spec);
+    SubmitTask(task, Lineage());
+  }
+}
+
 void NodeManager::ProcessFetchOrReconstructMessage(
     const std::shared_ptr<LocalClientConnection> &client, const uint8_t *message_data) {
   auto message = flatbuffers::GetRoot<protocol::FetchOrReconstruct>(message_data);
@@ -1027,6 +1091,31 @@ void NodeManager::ProcessNodeManagerMessage(TcpClientConnection &node_manager_cl
   node_manager_client.ProcessMessages();
 }
 
+std::unordered_map<ClientID, int64_t> NodeManager::GetArgumentBytesByNode(
+    const Task &task) const {
+  const ClientID &local_client_id = gcs_client_->client_table().GetLocalClientId();
+  std::unordered_map<ClientID, int64_t> argument_bytes;
+  for (const auto &object_id : task.GetDependencies()) {
+    // Objects in the local store are counted exactly. For other objects, use
+    // the locations that the object directory last received, if any.
+    int64_t object_size = 0;
+    if (object_manager_.GetLocalObjectSize(object_id, &object_size)) {
+      argument_bytes[local_client_id] += object_size;
+    }
+    std::unordered_set<ClientID> client_ids;
+    int64_t cached_object_size = 0;
+    if (object_directory_->GetCachedLocations(object_id, &client_ids,
+                                              &cached_object_size)) {
+      for (const auto &client_id : client_ids) {
+        if (client_id != local_client_id) {
+          argument_bytes[client_id] += cached_object_size;
+        }
+      }
+    }
+  }
+  return argument_bytes;
+}
+
 void NodeManager::ScheduleTasks(
     std::unordered_map<ClientID, SchedulingResources> &resource_map) {
   const ClientID &local_client_id = gcs_client_->client_table().GetLocalClientId();
@@ -1036,7 +1125,9 @@ void NodeManager::ScheduleTasks(
     resource_map[local_client_id].SetLoadResources(local_queues_.GetResourceLoad());
   }
   // Invoke the scheduling policy.
-  auto policy_decision = scheduling_policy_.Schedule(resource_map, local_client_id);
+  auto policy_decision = scheduling_policy_.Schedule(
+      resource_map, local_client_id,
+      [this](const Task &task) { return GetArgumentBytesByNode(task); });
 
 #ifndef NDEBUG
   RAY_LOG(DEBUG) << "[NM ScheduleTasks] policy decision:";
@@ -1610,6 +1701,12 @@ void NodeManager::FinishAssignedTask(Worker &worker) {
 
   // (See design_docs/task_states.rst for the state transition diagram.)
   const auto task = local_queues_.RemoveTask(task_id);
+  // If the worker is still executing the task on a background thread, keep
+  // the task in the running queue until the worker reports that it is done.
+  const bool in_flight = worker.GetInFlightTaskIds().count(task_id) > 0;
+  if (in_flight) {
+    local_queues_.QueueRunningTasks(std::vector<Task>({task}));
+  }
 
   // Release task's resources. The worker's lifetime resources are still held.
   auto const &task_resources = worker.GetTaskResourceIds();
@@ -1625,7 +1722,11 @@ void NodeManager::FinishAssignedTask(Worker &worker) {
   }
 
   // Notify the task dependency manager that this task has finished execution.
-  task_dependency_manager_.TaskCanceled(task_id);
+  // An in-flight task keeps its lease, so that its return values are not
+  // reconstructed while it is still running.
+  if (!in_flight) {
+    task_dependency_manager_.TaskCanceled(task_id);
+  }
 
   // Unset the worker's assigned task.
   worker.AssignTaskId(TaskID::nil());
@@ -1636,6 +1737,27 @@ void NodeManager::FinishAssignedTask(Worker &worker) {
   }
 }
 
+void NodeManager::HandleInFlightTaskDone(
+    const std::shared_ptr<LocalClientConnection> &client, const TaskID &task_id) {
+  std::shared_ptr<Worker> worker = worker_pool_.GetRegisteredWorker(client);
+  RAY_CHECK(worker);
+  if (!worker->RemoveInFlightTaskId(task_id)) {
+    return;
+  }
+  // If the worker has not asked for another task yet, the task is still
+  // assigned and will be finished by the next GetTask message.
+  if (task_id == worker->GetAssignedTaskId()) {
+    return;
+  }
+  RAY_LOG(DEBUG) << "Finished in-flight task " << task_id;
+  // The task may already have been removed, e.g., if its driver died.
+  if (local_queues_.HasTask(task_id)) {
+    local_queues_.RemoveTask(task_id);
+  }
+  // Notify the task dependency manager that this task has finished execution.
+  task_dependency_manager_.TaskCanceled(task_id);
+}
+
 void NodeManager::FinishAssignedActorTask(Worker &worker, const Task &task) {
   // If this was an actor creation task, then convert the worker to an actor
   // and notify the other node managers.
@@ -1935,10 +2057,13 @@ void NodeManager::ForwardTask(const Task &task, const ClientID &node_id,
           // Notify the task dependency manager that we are no longer responsible
           // for executing this task.
           task_dependency_manager_.TaskCanceled(task_id);
-          // Preemptively push any local arguments to the receiving node. For now, we
-          // only do this with actor tasks, since actor tasks must be executed by a
+          // Preemptively push any local arguments to the receiving node. By default,
+          // we only do this with actor tasks, since actor tasks must be executed by a
           // specific process and therefore have affinity to the receiving node.
-          if (spec.IsActorTask()) {
+          // Other tasks may still be spilled back from the receiving node.
+          const bool push_to_consumer =
+              RayConfig::instance().push_arguments_to_consumers();
+          if (spec.IsActorTask() || push_to_consumer) {
             // Iterate through the object's arguments. NOTE(swang): We do not include
             // the execution dependencies here since those cannot be transferred
             // between nodes.
@@ -1946,8 +2071,13 @@ void NodeManager::ForwardTask(const Task &task, const ClientID &node_id,
               int count = spec.ArgIdCount(i);
               for (int j = 0; j < count; j++) {
                 ObjectID argument_id = spec.ArgId(i, j);
-                // If the argument is local, then push it to the receiving node.
-                if (task_dependency_manager_.CheckObjectLocal(argument_id)) {
+                // If the argument is local, then push it to the receiving node. If
+                // it is still being created here, the object manager pushes it once
+                // it is created, which overlaps the transfer with the remaining
+                // execution of the task that creates it.
+                if (task_dependency_manager_.CheckObjectLocal(argument_id) ||
+                    (push_to_consumer &&
+                     task_dependency_manager_.CheckObjectPending(argument_id))) {
                   object_manager_.Push(argument_id, node_id);
                 }
               }
@@ -189,6 +189,12 @@ class NodeManager {
   /// \param task The actor task or actor creationt ask.
   /// \return Void.
   void FinishAssignedActorTask(Worker &worker, const Task &task);
+  /// Get the number of bytes of a task's object arguments that are resident on
+  /// each node, as far as this node manager knows without contacting the GCS.
+  ///
+  /// \param task The task to get the argument locations of.
+  /// \return A mapping from node manager ID to the number of bytes.
+  std::unordered_map<ClientID, int64_t> GetArgumentBytesByNode(const Task &task) const;
   /// Make a placement decision for placeable tasks given the resource_map
   /// provided. This will perform task state transitions and task forwarding.
   ///
@@ -268,6 +274,16 @@ class NodeManager {
   void HandleTaskUnblocked(const std::shared_ptr<LocalClientConnection> &client,
                            const TaskID &current_task_id);
 
+  /// Handle a task that finished executing on a background thread of a
+  /// worker, after the worker had already asked for its next task. This
+  /// removes the task from the running queue and releases its lease.
+  ///
+  /// \param client The client that executed the task.
+  /// \param task_id The task that finished.
+  /// \return Void.
+  void HandleInFlightTaskDone(const std::shared_ptr<LocalClientConnection> &client,
+                              const TaskID &task_id);
+
   /// Kill a worker.
   ///
   /// \param worker The worker to kill.
@@ -361,6 +377,12 @@ class NodeManager {
   /// \return Void.
   void ProcessSubmitTaskMessage(const uint8_t *message_data);
 
+  /// Process client message of SubmitTasks
+  ///
+  /// \param message_data A pointer to the message data.
+  /// \return Void.
+  void ProcessSubmitTasksMessage(const uint8_t *message_data);
+
   /// Process client message of FetchOrReconstruct
   ///
   /// \param client The client that sent the message.
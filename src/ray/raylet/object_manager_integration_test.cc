@@ -1,9 +1,13 @@
+#include <cstring>
 #include <iostream>
+#include <string>
 #include <thread>
 
 #include "gtest/gtest.h"
 
+#include "ray/object_manager/chunk_compression.h"
 #include "ray/raylet/raylet.h"
+#include "ray/util/util.h"
 
 namespace ray {
 
@@ -59,6 +63,7 @@ class TestObjectManagerBase : public ::testing::Test {
     ObjectManagerConfig om_config_1;
     om_config_1.store_socket_name = store_sock_1;
     om_config_1.push_timeout_ms = 10000;
+    om_config_1.compression_min_bytes = compression_min_bytes_;
     server1.reset(new ray::raylet::Raylet(
         main_service, "raylet_1", "0.0.0.0", "127.0.0.1", 6379, "",
         GetNodeManagerConfig("raylet_1", store_sock_1), om_config_1, gcs_client_1));
@@ -69,6 +74,7 @@ class TestObjectManagerBase : public ::testing::Test {
     ObjectManagerConfig om_config_2;
     om_config_2.store_socket_name = store_sock_2;
     om_config_2.push_timeout_ms = 10000;
+    om_config_2.compression_min_bytes = compression_min_bytes_;
     server2.reset(new ray::raylet::Raylet(
         main_service, "raylet_2", "0.0.0.0", "127.0.0.1", 6379, "",
         GetNodeManagerConfig("raylet_2", store_sock_2), om_config_2, gcs_client_2));
@@ -99,16 +105,26 @@ class TestObjectManagerBase : public ::testing::Test {
   ObjectID WriteDataToClient(plasma::PlasmaClient &client, int64_t data_size) {
     ObjectID object_id = ObjectID::from_random();
     RAY_LOG(DEBUG) << "ObjectID Created: " << object_id;
-    uint8_t metadata[] = {5};
-    int64_t metadata_size = sizeof(metadata);
     std::shared_ptr<Buffer> data;
-    ARROW_CHECK_OK(client.Create(object_id.to_plasma_id(), data_size, metadata,
-                                 metadata_size, &data));
+    ARROW_CHECK_OK(client.Create(
+        object_id.to_plasma_id(), data_size,
+        reinterpret_cast<const uint8_t *>(object_metadata_.data()),
+        object_metadata_.size(), &data));
+    // Write sparse data, so that compressed transfers send less data.
+    std::memset(data->mutable_data(), 0, data_size);
+    for (int64_t i = 0; i < data_size; i += 4096) {
+      data->mutable_data()[i] = 1;
+    }
     ARROW_CHECK_OK(client.Seal(object_id.to_plasma_id()));
     return object_id;
   }
 
  protected:
+  /// The object managers' minimum size of objects to compress. A negative
+  /// value disables compression.
+  int64_t compression_min_bytes_ = -1;
+  /// The metadata of the objects that are written to the object stores.
+  std::string object_metadata_ = std::string(1, 5);
   std::thread p;
   boost::asio::io_service main_service;
   std::shared_ptr<gcs::AsyncGcsClient> gcs_client_1;
@@ -126,6 +142,13 @@ class TestObjectManagerIntegration : public TestObjectManagerBase {
  public:
   uint num_expected_objects;
 
+  /// The size of the object to push.
+  int64_t push_size_ = 100;
+  /// When the push started, in seconds.
+  double push_start_time_;
+  /// Whether the pushed object's chunks are expected to be compressed.
+  bool expect_compressed_ = false;
+
   int num_connected_clients = 0;
 
   ClientID client_id_1;
@@ -149,7 +172,7 @@ class TestObjectManagerIntegration : public TestObjectManagerBase {
   void StartTests() {
     TestConnections();
     AddTransferTestHandlers();
-    TestPush(100);
+    TestPush(push_size_);
   }
 
   void AddTransferTestHandlers() {
@@ -177,13 +200,20 @@ class TestObjectManagerIntegration : public TestObjectManagerBase {
 
     num_expected_objects = (uint)1;
     ObjectID oid1 = WriteDataToClient(client1, data_size);
+    push_start_time_ = current_sys_time_seconds();
     server1->object_manager_.Push(oid1, client_id_2);
   }
 
   void TestPushComplete() {
     RAY_LOG(INFO) << "TestPushComplete: "
                   << " " << v1.size() << " " << v2.size();
+    double duration = current_sys_time_seconds() - push_start_time_;
+    RAY_LOG(INFO) << "Pushed " << push_size_ << " bytes in " << duration
+                  << " s (compression_min_bytes=" << compression_min_bytes_ << "): "
+                  << push_size_ / duration / 1e6 << " MB/s";
     ASSERT_TRUE(v1.size() == v2.size());
+    ASSERT_EQ(server1->object_manager_.NumCompressedChunksSent() > 0,
+              expect_compressed_);
     for (int i = -1; ++i < (int)v1.size();) {
       ASSERT_TRUE(std::find(v1.begin(), v1.end(), v2[i]) != v1.end());
     }
@@ -224,6 +254,51 @@ TEST_F(TestObjectManagerIntegration, StartTestObjectManagerPush) {
   main_service.run();
 }
 
+class TestObjectManagerCompression : public TestObjectManagerIntegration {
+ public:
+  TestObjectManagerCompression() {
+    compression_min_bytes_ = 0;
+    push_size_ = 100 * 1000 * 1000;
+    expect_compressed_ = true;
+  }
+};
+
+class TestObjectManagerCompressionOptOut : public TestObjectManagerIntegration {
+ public:
+  TestObjectManagerCompressionOptOut() {
+    compression_min_bytes_ = 0;
+    push_size_ = 10 * 1000 * 1000;
+    object_metadata_ = kNoCompressionMetadata;
+  }
+};
+
+class TestObjectManagerNoCompression : public TestObjectManagerIntegration {
+ public:
+  TestObjectManagerNoCompression() { push_size_ = 100 * 1000 * 1000; }
+};
+
+// Compare the logged throughput of these tests to measure the effect of
+// compression on the transfer of a large sparse object.
+TEST_F(TestObjectManagerCompression, StartTestObjectManagerCompressedPush) {
+  auto AsyncStartTests = main_service.wrap([this]() { WaitConnections(); });
+  AsyncStartTests();
+  main_service.run();
+}
+
+TEST_F(TestObjectManagerNoCompression, StartTestObjectManagerUncompressedPush) {
+  auto AsyncStartTests = main_service.wrap([this]() { WaitConnections(); });
+  AsyncStartTests();
+  main_service.run();
+}
+
+// Objects whose metadata opts out of compression are sent as is, even though
+// compression is enabled and the object is compressible.
+TEST_F(TestObjectManagerCompressionOptOut, StartTestObjectManagerOptOutPush) {
+  auto AsyncStartTests = main_service.wrap([this]() { WaitConnections(); });
+  AsyncStartTests();
+  main_service.run();
+}
+
 }  // namespace raylet
 
 }  // namespace ray
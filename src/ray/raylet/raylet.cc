@@ -41,7 +41,8 @@ Raylet::Raylet(boost::asio::io_service &main_service, const std::string &socket_
 
   RAY_CHECK_OK(RegisterGcs(
       node_ip_address, socket_name_, object_manager_config.store_socket_name,
-      redis_address, redis_port, redis_password, main_service, node_manager_config));
+      redis_address, redis_port, redis_password, main_service, node_manager_config,
+      object_manager_config));
 
   RAY_CHECK_OK(RegisterPeriodicTimer(main_service));
 }
@@ -60,7 +61,8 @@ ray::Status Raylet::RegisterGcs(const std::string &node_ip_address,
                                 const std::string &redis_address, int redis_port,
                                 const std::string &redis_password,
                                 boost::asio::io_service &io_service,
-                                const NodeManagerConfig &node_manager_config) {
+                                const NodeManagerConfig &node_manager_config,
+                                const ObjectManagerConfig &object_manager_config) {
   RAY_RETURN_NOT_OK(gcs_client_->Attach(io_service));
 
   ClientTableDataT client_info = gcs_client_->client_table().GetLocalClient();
@@ -69,6 +71,8 @@ ray::Status Raylet::RegisterGcs(const std::string &node_ip_address,
   client_info.object_store_socket_name = object_store_socket_name;
   client_info.object_manager_port = object_manager_acceptor_.local_endpoint().port();
   client_info.node_manager_port = node_manager_acceptor_.local_endpoint().port();
+  client_info.accepts_compressed_objects =
+      object_manager_config.compression_min_bytes >= 0;
   // Add resource information.
   for (const auto &resource_pair : node_manager_config.resource_config.GetResourceMap()) {
     client_info.resources_total_label.push_back(resource_pair.first);
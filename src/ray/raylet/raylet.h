@@ -52,7 +52,8 @@ class Raylet {
                           const std::string &object_store_socket_name,
                           const std::string &redis_address, int redis_port,
                           const std::string &redis_password,
-                          boost::asio::io_service &io_service, const NodeManagerConfig &);
+                          boost::asio::io_service &io_service, const NodeManagerConfig &,
+                          const ObjectManagerConfig &);
 
   ray::Status RegisterPeriodicTimer(boost::asio::io_service &io_service);
   /// Accept a client connection.
@@ -232,6 +232,23 @@ ray::Status RayletClient::SubmitTask(const std::vector<ObjectID> &execution_depe
   return conn_->WriteMessage(MessageType::SubmitTask, &fbb);
 }
 
+ray::Status RayletClient::SubmitTasks(
+    const std::vector<std::vector<ObjectID>> &execution_dependencies,
+    const std::vector<const ray::raylet::TaskSpecification *> &task_specs) {
+  RAY_CHECK(execution_dependencies.size() == task_specs.size());
+  flatbuffers::FlatBufferBuilder fbb;
+  std::vector<flatbuffers::Offset<ray::protocol::SubmitTaskRequest>> requests;
+  for (size_t i = 0; i < task_specs.size(); i++) {
+    auto execution_dependencies_message = to_flatbuf(fbb, execution_dependencies[i]);
+    auto task_spec_message = task_specs[i]->ToFlatbuffer(fbb);
+    requests.push_back(ray::protocol::CreateSubmitTaskRequest(
+        fbb, execution_dependencies_message, task_spec_message));
+  }
+  auto message = ray::protocol::CreateSubmitTasksRequest(fbb, fbb.CreateVector(requests));
+  fbb.Finish(message);
+  return conn_->WriteMessage(MessageType::SubmitTasks, &fbb);
+}
+
 ray::Status RayletClient::GetTask(
     std::unique_ptr<ray::raylet::TaskSpecification> *task_spec) {
   std::unique_ptr<uint8_t[]> reply;
@@ -358,3 +375,29 @@ ray::Status RayletClient::FreeObjects(const std::vector<ray::ObjectID> &object_i
   auto status = conn_->WriteMessage(MessageType::FreeObjectsInObjectStoreRequest, &fbb);
   return status;
 }
+
+ray::Status RayletClient::BroadcastObject(const ray::ObjectID &object_id,
+                                          const std::vector<ray::ClientID> &client_ids,
+                                          uint64_t fanout) {
+  flatbuffers::FlatBufferBuilder fbb;
+  auto message = ray::protocol::CreateBroadcastObjectRequest(
+      fbb, to_flatbuf(fbb, object_id), to_flatbuf(fbb, client_ids), fanout);
+  fbb.Finish(message);
+
+  return conn_->WriteMessage(MessageType::BroadcastObjectRequest, &fbb);
+}
+
+ray::Status RayletClient::NotifyTaskInFlight(const TaskID &task_id) {
+  flatbuffers::FlatBufferBuilder fbb;
+  auto message = ray::protocol::CreateNotifyTaskInFlight(fbb, to_flatbuf(fbb, task_id));
+  fbb.Finish(message);
+  return conn_->WriteMessage(MessageType::NotifyTaskInFlight, &fbb);
+}
+
+ray::Status RayletClient::NotifyInFlightTaskDone(const TaskID &task_id) {
+  flatbuffers::FlatBufferBuilder fbb;
+  auto message =
+      ray::protocol::CreateNotifyInFlightTaskDone(fbb, to_flatbuf(fbb, task_id));
+  fbb.Finish(message);
+  return conn_->WriteMessage(MessageType::NotifyInFlightTaskDone, &fbb);
+}
@@ -79,6 +79,16 @@ class RayletClient {
   ray::Status SubmitTask(const std::vector<ObjectID> &execution_dependencies,
                          const ray::raylet::TaskSpecification &task_spec);
 
+  /// Submit a batch of tasks in a single message using the raylet code path.
+  /// The tasks are submitted in the given order.
+  ///
+  /// \param execution_dependencies The execution dependencies of each task.
+  /// \param task_specs The task specifications.
+  /// \return ray::Status.
+  ray::Status SubmitTasks(
+      const std::vector<std::vector<ObjectID>> &execution_dependencies,
+      const std::vector<const ray::raylet::TaskSpecification *> &task_specs);
+
   /// Get next task for this client. This will block until the scheduler assigns
   /// a task to this worker. The caller takes ownership of the returned task
   /// specification and must free it.
@@ -145,6 +155,31 @@ class RayletClient {
   /// \return ray::Status.
   ray::Status FreeObjects(const std::vector<ray::ObjectID> &object_ids, bool local_only);
 
+  /// Replicate an object to a set of nodes along a tree.
+  ///
+  /// \param object_id The object to broadcast.
+  /// \param client_ids The client IDs of the nodes to replicate the object to.
+  /// \param fanout The number of nodes that each node forwards the object to
+  /// directly.
+  /// \return ray::Status.
+  ray::Status BroadcastObject(const ray::ObjectID &object_id,
+                              const std::vector<ray::ClientID> &client_ids,
+                              uint64_t fanout);
+
+  /// Notify the raylet that a task will keep executing on a background thread
+  /// after this worker asks for its next task.
+  ///
+  /// \param task_id The task that is still executing.
+  /// \return ray::Status.
+  ray::Status NotifyTaskInFlight(const TaskID &task_id);
+
+  /// Notify the raylet that a task announced with NotifyTaskInFlight has
+  /// finished executing.
+  ///
+  /// \param task_id The task that finished executing.
+  /// \return ray::Status.
+  ray::Status NotifyInFlightTaskDone(const TaskID &task_id);
+
   Language GetLanguage() const { return language_; }
 
   JobID GetClientID() const { return client_id_; }
@@ -55,6 +55,8 @@ class MockObjectDirectory : public ObjectDirectoryInterface {
   MOCK_METHOD0(GetLocalClientID, ray::ClientID());
   MOCK_CONST_METHOD1(LookupRemoteConnectionInfo, void(RemoteConnectionInfo &));
   MOCK_CONST_METHOD0(LookupAllRemoteConnections, std::vector<RemoteConnectionInfo>());
+  MOCK_CONST_METHOD3(GetCachedLocations,
+                     bool(const ObjectID &, std::unordered_set<ClientID> *, int64_t *));
   MOCK_METHOD3(SubscribeObjectLocations,
                ray::Status(const ray::UniqueID &, const ObjectID &,
                            const OnLocationsFound &));
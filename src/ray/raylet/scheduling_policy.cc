@@ -4,6 +4,7 @@
 
 #include "scheduling_policy.h"
 
+#include "ray/ray_config.h"
 #include "ray/util/logging.h"
 
 namespace ray {
@@ -14,9 +15,33 @@ SchedulingPolicy::SchedulingPolicy(const SchedulingQueue &scheduling_queue)
     : scheduling_queue_(scheduling_queue),
       gen_(std::chrono::high_resolution_clock::now().time_since_epoch().count()) {}
 
+namespace {
+
+/// Compute the weight of a node for load-weighted placement, which is the number of
+/// tasks with the given demand that fit in the node's remaining resources.
+double LoadWeight(const ResourceSet &resource_demand,
+                  const ResourceSet &remaining_resources) {
+  double weight = -1;
+  for (const auto &resource_pair : resource_demand.GetResourceMap()) {
+    if (resource_pair.second <= 0) {
+      continue;
+    }
+    double remaining = 0;
+    remaining_resources.GetResource(resource_pair.first, &remaining);
+    double num_fit = remaining / resource_pair.second;
+    if (weight < 0 || num_fit < weight) {
+      weight = num_fit;
+    }
+  }
+  // Tasks without a resource demand fit anywhere, so weight the nodes equally.
+  return weight < 0 ? 1 : std::max(weight, 0.0);
+}
+
+}  // namespace
+
 std::unordered_map<TaskID, ClientID> SchedulingPolicy::Schedule(
     std::unordered_map<ClientID, SchedulingResources> &cluster_resources,
-    const ClientID &local_client_id) {
+    const ClientID &local_client_id, const ArgumentBytesFunction &get_argument_bytes) {
   // The policy decision to be returned.
   std::unordered_map<TaskID, ClientID> decision;
   // TODO(atumanov): protect DEBUG code blocks with ifdef DEBUG
@@ -41,10 +66,9 @@ std::unordered_map<TaskID, ClientID> SchedulingPolicy::Schedule(
     const auto &resource_demand = spec.GetRequiredPlacementResources();
     const TaskID &task_id = spec.TaskId();
 
-    // TODO(atumanov): try to place tasks locally first.
-    // Construct a set of viable node candidates and randomly pick between them.
-    // Get all the client id keys and randomly pick.
-    std::vector<ClientID> client_keys;
+    // Construct a set of viable node candidates, together with the resources
+    // that each of them has left after its current load.
+    std::vector<std::pair<ClientID, ResourceSet>> candidates;
     for (const auto &client_resource_pair : cluster_resources) {
       // pair = ClientID, SchedulingResources
       ClientID node_client_id = client_resource_pair.first;
@@ -59,65 +83,100 @@ std::unordered_map<TaskID, ClientID> SchedulingPolicy::Schedule(
 
       if (resource_demand.IsSubset(available_node_resources)) {
         // This node is a feasible candidate.
-        client_keys.push_back(node_client_id);
+        candidates.emplace_back(node_client_id, std::move(available_node_resources));
       }
     }
 
-    if (!client_keys.empty()) {
-      // Choose index at random.
-      // Initialize a uniform integer distribution over the key space.
-      // TODO(atumanov): change uniform random to discrete, weighted by resource capacity.
-      std::uniform_int_distribution<int> distribution(0, client_keys.size() - 1);
-      int client_key_index = distribution(gen_);
-      const ClientID &dst_client_id = client_keys[client_key_index];
-      decision[task_id] = dst_client_id;
-      // Update dst_client_id's load to keep track of remote task load until
-      // the next heartbeat.
-      ResourceSet new_load(cluster_resources[dst_client_id].GetLoadResources());
-      new_load.AddResources(resource_demand);
-      cluster_resources[dst_client_id].SetLoadResources(std::move(new_load));
+    // The number of bytes of the task's arguments resident on each node. This is
+    // only used if some nodes have enough resources available for the task, so
+    // that tasks that must queue are still spread across the cluster by load.
+    std::unordered_map<ClientID, int64_t> argument_bytes;
+    if (!candidates.empty()) {
+      argument_bytes = get_argument_bytes(t);
     } else {
-      // If the task doesn't fit, place randomly subject to hard constraints.
+      // If the task doesn't fit, place it subject to hard constraints, weighting
+      // the nodes by their total capacity.
       for (const auto &client_resource_pair2 : cluster_resources) {
         // pair = ClientID, SchedulingResources
         ClientID node_client_id = client_resource_pair2.first;
         const auto &node_resources = client_resource_pair2.second;
         if (resource_demand.IsSubset(node_resources.GetTotalResources())) {
           // This node is a feasible candidate.
-          client_keys.push_back(node_client_id);
+          candidates.emplace_back(node_client_id, node_resources.GetTotalResources());
         }
       }
-      // client candidate list constructed, pick randomly.
-      if (!client_keys.empty()) {
-        // Choose index at random.
-        // Initialize a uniform integer distribution over the key space.
-        // TODO(atumanov): change uniform random to discrete, weighted by resource
-        // capacity.
-        std::uniform_int_distribution<int> distribution(0, client_keys.size() - 1);
-        int client_key_index = distribution(gen_);
-        const ClientID &dst_client_id = client_keys[client_key_index];
-        decision[task_id] = dst_client_id;
-        // Update dst_client_id's load to keep track of remote task load until
-        // the next heartbeat.
-        ResourceSet new_load(cluster_resources[dst_client_id].GetLoadResources());
-        new_load.AddResources(resource_demand);
-        cluster_resources[dst_client_id].SetLoadResources(std::move(new_load));
-      } else {
-        // There are no nodes that can feasibly execute this task. The task remains
-        // placeable until cluster capacity becomes available.
-        // TODO(rkn): Propagate a warning to the user.
-        RAY_LOG(INFO) << "The task with ID " << task_id << " requires "
-                      << spec.GetRequiredResources().ToString() << " for execution and "
-                      << spec.GetRequiredPlacementResources().ToString()
-                      << " for placement, but no nodes have the necessary resources. "
-                      << "Check the client table to view node resources.";
-      }
+    }
+
+    if (!candidates.empty()) {
+      const ClientID dst_client_id =
+          ChooseNode(candidates, resource_demand, argument_bytes, local_client_id);
+      decision[task_id] = dst_client_id;
+      // Update dst_client_id's load to keep track of remote task load until
+      // the next heartbeat.
+      ResourceSet new_load(cluster_resources[dst_client_id].GetLoadResources());
+      new_load.AddResources(resource_demand);
+      cluster_resources[dst_client_id].SetLoadResources(std::move(new_load));
+    } else {
+      // There are no nodes that can feasibly execute this task. The task remains
+      // placeable until cluster capacity becomes available.
+      // TODO(rkn): Propagate a warning to the user.
+      RAY_LOG(INFO) << "The task with ID " << task_id << " requires "
+                    << spec.GetRequiredResources().ToString() << " for execution and "
+                    << spec.GetRequiredPlacementResources().ToString()
+                    << " for placement, but no nodes have the necessary resources. "
+                    << "Check the client table to view node resources.";
     }
   }
 
   return decision;
 }
 
+ClientID SchedulingPolicy::ChooseNode(
+    const std::vector<std::pair<ClientID, ResourceSet>> &candidates,
+    const ResourceSet &resource_demand,
+    const std::unordered_map<ClientID, int64_t> &argument_bytes,
+    const ClientID &local_client_id) {
+  // Prefer the candidate that already holds the most bytes of the task's
+  // arguments, breaking ties in favor of the local node.
+  const int64_t min_bytes = RayConfig::instance().scheduler_locality_min_bytes();
+  if (min_bytes >= 0 && !argument_bytes.empty()) {
+    const ClientID *best_client_id = nullptr;
+    int64_t best_bytes = 0;
+    for (const auto &candidate : candidates) {
+      auto it = argument_bytes.find(candidate.first);
+      if (it == argument_bytes.end()) {
+        continue;
+      }
+      if (it->second > best_bytes ||
+          (it->second == best_bytes && candidate.first == local_client_id)) {
+        best_client_id = &candidate.first;
+        best_bytes = it->second;
+      }
+    }
+    if (best_client_id != nullptr && best_bytes > 0 && best_bytes >= min_bytes) {
+      RAY_LOG(DEBUG) << "Placing task near " << best_bytes
+                     << " bytes of its arguments on " << *best_client_id;
+      return *best_client_id;
+    }
+  }
+
+  // Otherwise, pick a candidate at random, weighted by the number of tasks with
+  // the same demand that it can still fit.
+  std::vector<double> weights;
+  weights.reserve(candidates.size());
+  double total_weight = 0;
+  for (const auto &candidate : candidates) {
+    weights.push_back(LoadWeight(resource_demand, candidate.second));
+    total_weight += weights.back();
+  }
+  if (total_weight <= 0) {
+    std::uniform_int_distribution<int> distribution(0, candidates.size() - 1);
+    return candidates[distribution(gen_)].first;
+  }
+  std::discrete_distribution<int> distribution(weights.begin(), weights.end());
+  return candidates[distribution(gen_)].first;
+}
+
 std::vector<TaskID> SchedulingPolicy::SpillOver(
     SchedulingResources &remote_scheduling_resources) const {
   // The policy decision to be returned.
@@ -1,6 +1,7 @@
 #ifndef RAY_RAYLET_SCHEDULING_POLICY_H
 #define RAY_RAYLET_SCHEDULING_POLICY_H
 
+#include <functional>
 #include <random>
 #include <unordered_map>
 
@@ -11,6 +12,11 @@ namespace ray {
 
 namespace raylet {
 
+/// A function that returns the number of bytes of a task's object arguments
+/// that are known to be resident on each node.
+using ArgumentBytesFunction =
+    std::function<std::unordered_map<ClientID, int64_t>(const Task &task)>;
+
 /// \class SchedulingPolicy
 /// \brief Implements a scheduling policy for the node manager.
 class SchedulingPolicy {
@@ -25,16 +31,25 @@ class SchedulingPolicy {
   /// \brief Perform a scheduling operation, given a set of cluster resources and
   /// producing a mapping of tasks to raylets.
   ///
+  /// Among the nodes that have enough available resources for a task, the task
+  /// is placed on the node where the most bytes of its object arguments are
+  /// resident, if that is at least the configured
+  /// scheduler_locality_min_bytes. Otherwise, or if no node has enough available
+  /// resources, a node is chosen at random, weighted by how many more tasks
+  /// with the same demand it can fit.
+  ///
   /// \param cluster_resources: a set of cluster resources containing resource and load
   /// information for some subset of the cluster. For all client IDs in the returned
   /// placement map, the corresponding SchedulingResources::resources_load_ is
   /// incremented by the aggregate resource demand of the tasks assigned to it.
   /// \param local_client_id The ID of the node manager that owns this
   /// SchedulingPolicy object.
+  /// \param get_argument_bytes A function that returns the number of bytes of a
+  /// task's object arguments that are resident on each node.
   /// \return Scheduling decision, mapping tasks to raylets for placement.
   std::unordered_map<TaskID, ClientID> Schedule(
       std::unordered_map<ClientID, SchedulingResources> &cluster_resources,
-      const ClientID &local_client_id);
+      const ClientID &local_client_id, const ArgumentBytesFunction &get_argument_bytes);
 
   /// \brief Given a set of cluster resources perform a spill-over scheduling operation.
   ///
@@ -49,6 +64,21 @@ class SchedulingPolicy {
   virtual ~SchedulingPolicy();
 
  private:
+  /// \brief Choose a node for a task by data locality, falling back to a
+  /// random choice weighted by load.
+  ///
+  /// \param candidates The nodes that can run the task, each with the
+  /// resources it has left after its current load.
+  /// \param resource_demand The resources that the task requires for placement.
+  /// \param argument_bytes The number of bytes of the task's object arguments
+  /// that are resident on each node.
+  /// \param local_client_id The ID of the local node manager.
+  /// \return The ID of the chosen node.
+  ClientID ChooseNode(const std::vector<std::pair<ClientID, ResourceSet>> &candidates,
+                      const ResourceSet &resource_demand,
+                      const std::unordered_map<ClientID, int64_t> &argument_bytes,
+                      const ClientID &local_client_id);
+
   /// An immutable reference to the scheduling task queues.
   const SchedulingQueue &scheduling_queue_;
   /// Internally maintained random number generator.
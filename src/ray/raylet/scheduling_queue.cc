@@ -160,6 +160,13 @@ ResourceSet SchedulingQueue::GetResourceLoad() const {
   return ready_tasks_.GetCurrentResourceLoad();
 }
 
+ResourceSet SchedulingQueue::GetResourceDemand() const {
+  ResourceSet demand = ready_tasks_.GetCurrentResourceLoad();
+  demand.AddResources(placeable_tasks_.GetCurrentResourceLoad());
+  demand.AddResources(infeasible_tasks_.GetCurrentResourceLoad());
+  return demand;
+}
+
 const std::list<Task> &SchedulingQueue::GetRunningTasks() const {
   return running_tasks_.GetTasks();
 }
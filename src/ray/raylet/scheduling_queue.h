@@ -176,6 +176,14 @@ class SchedulingQueue {
   /// this raylet.
   ResourceSet GetResourceLoad() const;
 
+  /// \brief Return an aggregate resource set for all tasks that are queued on
+  /// this raylet waiting for resources, including tasks that are currently
+  /// infeasible. This is reported to the autoscaler.
+  ///
+  /// \return A resource set with the aggregate resource demand of the
+  /// placeable, ready and infeasible tasks on this raylet.
+  ResourceSet GetResourceDemand() const;
+
   /// Get the queue of tasks in the ready state.
   ///
   /// \return A const reference to the queue of tasks ready
@@ -21,6 +21,11 @@ bool TaskDependencyManager::CheckObjectLocal(const ObjectID &object_id) const {
   return local_objects_.count(object_id) == 1;
 }
 
+bool TaskDependencyManager::CheckObjectPending(const ObjectID &object_id) const {
+  return local_objects_.count(object_id) == 0 &&
+         pending_tasks_.count(ComputeTaskId(object_id)) == 1;
+}
+
 bool TaskDependencyManager::CheckObjectRequired(const ObjectID &object_id) const {
   const TaskID task_id = ComputeTaskId(object_id);
   auto task_entry = required_tasks_.find(task_id);
@@ -40,6 +40,13 @@ class TaskDependencyManager {
   /// \return Whether the object is local.
   bool CheckObjectLocal(const ObjectID &object_id) const;
 
+  /// Check whether an object is not local yet, but will be created locally by
+  /// a task that is pending execution on this node.
+  ///
+  /// \param object_id The object to check for.
+  /// \return Whether the object is pending creation on this node.
+  bool CheckObjectPending(const ObjectID &object_id) const;
+
   /// Subscribe to object depedencies required by the task and check whether
   /// all dependencies are fulfilled. This will track this task's dependencies
   /// until UnsubscribeDependencies is called on the same task ID. If any
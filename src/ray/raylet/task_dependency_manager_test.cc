@@ -321,6 +321,29 @@ TEST_F(TaskDependencyManagerTest, TestTaskForwarding) {
   ASSERT_EQ(ready_tasks.front(), tasks.back().GetTaskSpecification().TaskId());
 }
 
+TEST_F(TaskDependencyManagerTest, TestObjectPending) {
+  auto task = ExampleTask({}, 1);
+  TaskID task_id = task.GetTaskSpecification().TaskId();
+  ObjectID return_id = task.GetTaskSpecification().ReturnId(0);
+  ObjectID put_id = ComputePutId(task_id, 1);
+  ASSERT_FALSE(task_dependency_manager_.CheckObjectPending(return_id));
+
+  // The objects that a task creates are pending while the task is pending.
+  EXPECT_CALL(gcs_mock_, Add(_, task_id, _, _));
+  task_dependency_manager_.TaskPending(task);
+  ASSERT_TRUE(task_dependency_manager_.CheckObjectPending(return_id));
+  ASSERT_TRUE(task_dependency_manager_.CheckObjectPending(put_id));
+
+  // Objects that were already created are local, not pending.
+  task_dependency_manager_.HandleObjectLocal(put_id);
+  ASSERT_FALSE(task_dependency_manager_.CheckObjectPending(put_id));
+  ASSERT_TRUE(task_dependency_manager_.CheckObjectPending(return_id));
+
+  // The objects are no longer pending once the task is forwarded.
+  task_dependency_manager_.TaskCanceled(task_id);
+  ASSERT_FALSE(task_dependency_manager_.CheckObjectPending(return_id));
+}
+
 TEST_F(TaskDependencyManagerTest, TestEviction) {
   // Create a task with 3 arguments.
   int num_arguments = 3;
@@ -50,6 +50,20 @@ const std::unordered_set<TaskID> &Worker::GetBlockedTaskIds() const {
   return blocked_task_ids_;
 }
 
+bool Worker::AddInFlightTaskId(const TaskID &task_id) {
+  auto inserted = in_flight_task_ids_.insert(task_id);
+  return inserted.second;
+}
+
+bool Worker::RemoveInFlightTaskId(const TaskID &task_id) {
+  auto erased = in_flight_task_ids_.erase(task_id);
+  return erased == 1;
+}
+
+const std::unordered_set<TaskID> &Worker::GetInFlightTaskIds() const {
+  return in_flight_task_ids_;
+}
+
 void Worker::AssignDriverId(const DriverID &driver_id) {
   assigned_driver_id_ = driver_id;
 }
@@ -34,6 +34,9 @@ class Worker {
   bool AddBlockedTaskId(const TaskID &task_id);
   bool RemoveBlockedTaskId(const TaskID &task_id);
   const std::unordered_set<TaskID> &GetBlockedTaskIds() const;
+  bool AddInFlightTaskId(const TaskID &task_id);
+  bool RemoveInFlightTaskId(const TaskID &task_id);
+  const std::unordered_set<TaskID> &GetInFlightTaskIds() const;
   void AssignDriverId(const DriverID &driver_id);
   const DriverID &GetAssignedDriverId() const;
   void AssignActorId(const ActorID &actor_id);
@@ -76,6 +79,9 @@ class Worker {
   // of a task.
   ResourceIdSet task_resource_ids_;
   std::unordered_set<TaskID> blocked_task_ids_;
+  /// The tasks that are still executing on a background thread of this
+  /// worker, even though the worker may already have asked for another task.
+  std::unordered_set<TaskID> in_flight_task_ids_;
 };
 
 }  // namespace raylet
@@ -144,6 +144,26 @@ void WorkerPool::StartWorkerProcess(const Language &language) {
                  << strerror(errno);
 }
 
+void WorkerPool::PrestartWorkers(int num_idle_workers) {
+  int num_starting_workers = 0;
+  for (const auto &entry : starting_worker_processes_) {
+    num_starting_workers += entry.second;
+  }
+  for (const auto &entry : states_by_lang_) {
+    int num_idle = static_cast<int>(entry.second.idle.size());
+    int num_missing_workers = num_idle_workers - num_idle - num_starting_workers;
+    for (int i = 0; i < num_missing_workers; i += num_workers_per_process_) {
+      if (static_cast<int>(starting_worker_processes_.size()) >=
+          maximum_startup_concurrency_) {
+        return;
+      }
+      RAY_LOG(DEBUG) << "Prestarting a worker process, " << num_missing_workers - i
+                     << " idle workers are missing";
+      StartWorkerProcess(entry.first);
+    }
+  }
+}
+
 void WorkerPool::RegisterWorker(std::shared_ptr<Worker> worker) {
   auto pid = worker->Pid();
   RAY_LOG(DEBUG) << "Registering worker with pid " << pid;
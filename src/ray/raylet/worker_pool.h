@@ -53,6 +53,15 @@ class WorkerPool {
   /// \param language Which language this worker process should be.
   void StartWorkerProcess(const Language &language);
 
+  /// Start worker processes until the number of idle and starting non-actor
+  /// workers of each language reaches the given number. This keeps a pool of
+  /// warm workers, so that tasks do not wait for worker processes to start.
+  /// Starting workers are counted across all languages, and no more than
+  /// maximum_startup_concurrency worker processes are started at once.
+  ///
+  /// \param num_idle_workers The number of idle workers to keep per language.
+  void PrestartWorkers(int num_idle_workers);
+
   /// Register a new worker. The Worker should be added by the caller to the
   /// pool after it becomes idle (e.g., requests a work assignment).
   ///
@@ -43,6 +43,7 @@ sleep 1s
 ${REDIS_SERVER} --loglevel warning ${LOAD_MODULE_ARGS} --port 6379 &
 sleep 1s
 # Run tests.
+$CORE_DIR/src/ray/object_manager/chunk_compression_test
 $CORE_DIR/src/ray/object_manager/object_manager_stress_test $STORE_EXEC
 sleep 1s
 $CORE_DIR/src/ray/object_manager/object_manager_test $STORE_EXEC
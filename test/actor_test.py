@@ -10,6 +10,7 @@ import os
 import pytest
 import signal
 import sys
+import threading
 import time
 
 import ray
@@ -373,6 +374,241 @@ def test_multiple_return_values(ray_start_regular):
     assert ray.get([id3a, id3b, id3c]) == [1, 2, 3]
 
 
+def test_batched_actor_method(ray_start_regular):
+    @ray.remote
+    class Counter(object):
+        def __init__(self):
+            self.value = 0
+            self.batch_sizes = []
+
+        @ray.method(max_batch_size=10)
+        def increment(self, calls):
+            self.batch_sizes.append(len(calls))
+            results = []
+            for (amount, ) in calls:
+                self.value += amount
+                results.append(self.value)
+            return results
+
+        def reset(self):
+            self.value = 0
+
+        def get_batch_sizes(self):
+            return self.batch_sizes
+
+    c = Counter.remote()
+
+    # Each call returns its own object ID.
+    ids = [c.increment.remote(1) for _ in range(25)]
+    assert ray.get(ids) == list(range(1, 26))
+    assert ray.get(c.get_batch_sizes.remote()) == [10, 10, 5]
+
+    # A call of another method submits the pending calls first.
+    id1 = c.increment.remote(1)
+    c.reset.remote()
+    id2 = c.increment.remote(2)
+    assert ray.get([id1, id2]) == [26, 2]
+
+    # The results of pending calls can be passed to tasks.
+    @ray.remote
+    def f(x):
+        return x
+
+    assert ray.get(f.remote(c.increment.remote(3))) == 5
+    assert ray.get(c.increment.map([(1, ), (2, )])) == [6, 8]
+
+    with pytest.raises(TypeError):
+        c.increment.remote(amount=1)
+
+
+def test_batched_actor_method_completion_set(ray_start_regular, monkeypatch):
+    # Only explicit flushes submit the held back calls.
+    monkeypatch.setattr(ray_constants, "ACTOR_BATCH_MAX_HOLD_MS", 10**6)
+
+    @ray.remote
+    class Counter(object):
+        def __init__(self):
+            self.value = 0
+
+        @ray.method(max_batch_size=10)
+        def increment(self, calls):
+            results = []
+            for (amount, ) in calls:
+                self.value += amount
+                results.append(self.value)
+            return results
+
+    c = Counter.remote()
+    completion_set = ray.experimental.CompletionSet()
+    object_id = c.increment.remote(1)
+    completion_set.add(object_id)
+    assert completion_set.poll(timeout=None) == [object_id]
+    assert ray.get(object_id) == 1
+
+
+def test_batched_actor_method_max_hold_time(ray_start_regular):
+    @ray.remote
+    class Counter(object):
+        def __init__(self):
+            self.value = 0
+
+        @ray.method(max_batch_size=10)
+        def increment(self, calls):
+            results = []
+            for (amount, ) in calls:
+                self.value += amount
+                results.append(self.value)
+            return results
+
+    c = Counter.remote()
+    object_id = c.increment.remote(1)
+    # The call is submitted after the max hold time, even though the driver
+    # does not flush its batches.
+    worker = ray.worker.global_worker
+    start_time = time.time()
+    while worker.pending_actor_batches:
+        assert time.time() - start_time < 10
+        time.sleep(0.01)
+    assert ray.get(object_id) == 1
+
+
+def test_threaded_actor(ray_start_regular):
+    @ray.remote(max_concurrency=2)
+    class Signal(object):
+        def __init__(self):
+            self.event = threading.Event()
+
+        def wait(self):
+            # This only returns if send runs while this method is running.
+            self.event.wait(60)
+            return self.event.is_set()
+
+        def send(self):
+            self.event.set()
+
+        def echo(self, x):
+            object_id = ray.put(x)
+            ready_ids, _ = ray.wait([object_id])
+            return ray.get(ready_ids[0])
+
+    s = Signal.remote()
+    wait_id = s.wait.remote()
+    s.send.remote()
+    assert ray.get(wait_id)
+    assert ray.get([s.echo.remote(i) for i in range(10)]) == list(range(10))
+
+    with pytest.raises(Exception):
+
+        @ray.remote(max_concurrency=2, checkpoint_interval=1)
+        class Foo(object):
+            pass
+
+    with pytest.raises(Exception):
+
+        @ray.remote(max_concurrency=2)
+        def f():
+            pass
+
+
+def test_threaded_actor_long_method(ray_start_regular):
+    # The method runs much longer than the reconstruction timeout. Its return
+    # value must not be reconstructed or marked as lost while it is running
+    # on a background thread of the actor.
+    @ray.remote(max_concurrency=2)
+    class Actor(object):
+        def slow(self, x):
+            time.sleep(2)
+            return x
+
+        def fast(self, x):
+            return x
+
+    @ray.remote
+    def consume(object_ids):
+        return ray.get(object_ids[0])
+
+    a = Actor.remote()
+    slow_id = a.slow.remote(1)
+    assert ray.get(a.fast.remote(2)) == 2
+    assert ray.get(consume.remote([slow_id])) == 1
+    assert ray.get(slow_id) == 1
+
+
+def test_threaded_actor_per_handle_ordering(ray_start_regular):
+    @ray.remote(max_concurrency=2, per_handle_ordering=True)
+    class Actor(object):
+        def __init__(self):
+            self.event = threading.Event()
+            self.calls = []
+
+        def record(self, i, delay):
+            time.sleep(delay)
+            self.calls.append(i)
+
+        def get_calls(self):
+            return self.calls
+
+        def wait(self):
+            self.event.wait(60)
+            return self.event.is_set()
+
+        def send(self):
+            self.event.set()
+
+    @ray.remote
+    def send(actor):
+        ray.get(actor.send.remote())
+
+    a = Actor.remote()
+    # Methods from the same handle run in submission order.
+    a.record.remote(0, 0.5)
+    a.record.remote(1, 0)
+    assert ray.get(a.get_calls.remote()) == [0, 1]
+
+    # Methods from different handles still run concurrently.
+    wait_id = a.wait.remote()
+    ray.get(send.remote(a))
+    assert ray.get(wait_id)
+
+    with pytest.raises(Exception):
+
+        @ray.remote(per_handle_ordering=True)
+        def f():
+            pass
+
+
+def test_threaded_actor_per_handle_ordering_slots(ray_start_regular):
+    # Methods that wait behind an earlier method from the same handle must
+    # not take the slots that the methods of other handles need.
+    @ray.remote(max_concurrency=2, per_handle_ordering=True)
+    class Actor(object):
+        def __init__(self):
+            self.event = threading.Event()
+
+        def wait(self):
+            self.event.wait(30)
+            return self.event.is_set()
+
+        def noop(self):
+            return 1
+
+        def send(self):
+            self.event.set()
+
+    @ray.remote
+    def send(actor):
+        ray.get(actor.send.remote())
+
+    a = Actor.remote()
+    # The first method blocks on a method from a second handle, while the
+    # second method waits behind it.
+    wait_id = a.wait.remote()
+    noop_id = a.noop.remote()
+    ray.get(send.remote(a))
+    assert ray.get(wait_id)
+    assert ray.get(noop_id) == 1
+
+
 def test_define_actor(ray_start_regular):
     @ray.remote
     class Test(object):
@@ -169,6 +169,19 @@ class LoadMetricsTest(unittest.TestCase):
         assert "NumNodesConnected: 2" in debug
         assert "NumNodesUsed: 1.88" in debug
 
+    def testResourceDemand(self):
+        lm = LoadMetrics()
+        lm.update(lm.local_ip, {"CPU": 2}, {"CPU": 0}, {"CPU": 3})
+        lm.update("2.2.2.2", {"CPU": 4}, {"CPU": 1}, {"CPU": 6, "GPU": 1})
+        assert lm.get_resource_demand() == {"CPU": 9, "GPU": 1}
+        assert lm.worker_node_resources() == {"CPU": 4}
+        # 9 CPUs are queued and 1 is available. The GPU demand cannot be
+        # satisfied by adding workers.
+        assert lm.approx_workers_needed_for_demand() == 2
+        assert "ResourceDemand: 9.0 CPU, 1.0 GPU" in lm.info_string()
+        lm.prune_active_ips({"1.1.1.1"})
+        assert lm.get_resource_demand() == {"CPU": 3}
+
 
 class AutoscalingTest(unittest.TestCase):
     def setUp(self):
@@ -640,6 +653,37 @@ class AutoscalingTest(unittest.TestCase):
         assert autoscaler.num_launches_pending.value == 0
         assert len(self.provider.nodes({})) == 1
 
+    def testScaleUpBasedOnDemand(self):
+        config = SMALL_CLUSTER.copy()
+        config["min_workers"] = 0
+        config["max_workers"] = 10
+        config["initial_workers"] = 0
+        config["target_utilization_fraction"] = 1.0
+        config_path = self.write_config(config)
+        self.provider = MockProvider()
+        lm = LoadMetrics()
+        autoscaler = StandardAutoscaler(
+            config_path, lm, max_failures=0, update_interval_s=0)
+        autoscaler.update()
+        autoscaler.update()
+        self.waitForNodes(0)
+
+        # Scales up in one step to satisfy the queued demand
+        local_ip = services.get_node_ip_address()
+        lm.update(local_ip, {"CPU": 2}, {"CPU": 0}, {"CPU": 8})  # head
+        autoscaler.update()
+        self.waitForNodes(4)
+        autoscaler.update()
+        self.waitForNodes(4)
+
+        # Holds steady once the demand is met
+        lm.update(local_ip, {"CPU": 2}, {"CPU": 0}, {})
+        for i in range(4):
+            lm.update("172.0.0.{}".format(i), {"CPU": 2}, {"CPU": 0}, {})
+        autoscaler.update()
+        assert autoscaler.num_launches_pending.value == 0
+        assert len(self.provider.nodes({})) == 4
+
     def testDontScaleBelowTarget(self):
         config = SMALL_CLUSTER.copy()
         config["min_workers"] = 0
@@ -777,6 +777,79 @@ def test_defining_remote_functions(shutdown_only):
         assert ray.get([id1, id2, id3, id4]) == [0, 1, "test", 2]
 
 
+def test_cached_submission_arguments(shutdown_only):
+    ray.init(num_cpus=2, resources={"Custom": 1})
+
+    @ray.remote(resources={"Custom": 1})
+    def f(x, y=1):
+        return x + y
+
+    # Overriding the resources of one call must not change the cached
+    # default resources of later calls.
+    assert ray.get(f.remote(1)) == 2
+    assert ray.get(f._remote(args=[1, 2], resources={"Custom": 0.5})) == 3
+    assert ray.get(f.remote(1, 3)) == 4
+    assert f._default_resources == {"Custom": 1, "CPU": 1}
+    with pytest.raises(Exception):
+        f.remote(1, 2, 3)
+
+    @ray.remote
+    class Actor(object):
+        def method(self, a, b=0):
+            return a + b
+
+    a = Actor.remote()
+    assert ray.get([a.method.remote(i) for i in range(10)]) == list(range(10))
+    assert ray.get(a.method.remote(1, b=2)) == 3
+    assert list(a._ray_function_descriptors.keys()) == ["method"]
+
+
+def test_map_api(shutdown_only):
+    ray.init(num_cpus=2)
+
+    @ray.remote
+    def f(x, y=0):
+        return x + y
+
+    assert ray.get(f.map([(i, ) for i in range(100)])) == list(range(100))
+    assert ray.get(f.map((i, 1) for i in range(10))) == list(range(1, 11))
+    assert f.map([]) == []
+
+    @ray.remote(num_return_vals=2)
+    def g(x):
+        return x, x
+
+    assert [ray.get(ids) for ids in g.map([(1, ), (2, )])] == [[1, 1], [2, 2]]
+
+    # A large argument can be shared by all tasks.
+    array = np.ones(10**6)
+
+    @ray.remote
+    def h(x, i):
+        return float(x.sum()) + i
+
+    assert ray.get(h.map(
+        [(array, i) for i in range(10)])) == [10**6 + i for i in range(10)]
+
+    @ray.remote
+    class Actor(object):
+        def __init__(self):
+            self.values = []
+
+        def append(self, value):
+            self.values.append(value)
+            return len(self.values)
+
+        def get_values(self):
+            return self.values
+
+    a = Actor.remote()
+    a.append.remote(-1)
+    assert ray.get(a.append.map([(i, ) for i in range(100)])) == list(
+        range(2, 102))
+    assert ray.get(a.get_values.remote()) == list(range(-1, 100))
+
+
 def test_get_multiple(shutdown_only):
     ray.init(num_cpus=1)
     object_ids = [ray.put(i) for i in range(10)]
@@ -890,6 +963,45 @@ def test_wait_iterables(shutdown_only):
     assert len(remaining_ids) == 3
 
 
+def test_completion_set(shutdown_only):
+    ray.init(num_cpus=2)
+
+    @ray.remote
+    def f(delay):
+        time.sleep(delay)
+        return delay
+
+    completion_set = ray.experimental.CompletionSet()
+    # Objects that are already available are reported too.
+    x = ray.put(0)
+    completion_set.add(x)
+    # Peeking does not remove the ready object IDs from the set.
+    assert completion_set.peek(timeout=None) == [x]
+    assert completion_set.peek() == [x]
+    assert completion_set.poll(timeout=None) == [x]
+
+    slow_id = f.remote(5)
+    fast_ids = [f.remote(0.1) for _ in range(3)]
+    completion_set.add([slow_id] + fast_ids)
+    # Adding an object ID twice has no effect.
+    completion_set.add(fast_ids[0])
+    assert len(completion_set) == 4
+
+    ready_ids = []
+    while len(ready_ids) < 3:
+        ready_ids.extend(completion_set.poll(timeout=None, num_returns=2))
+    assert set(ready_ids) == set(fast_ids)
+    assert slow_id in completion_set
+    start_time = time.time()
+    assert completion_set.poll(timeout=0.5) == []
+    assert time.time() - start_time >= 0.5
+
+    completion_set.remove(slow_id)
+    assert len(completion_set) == 0
+    assert completion_set.poll(timeout=None) == []
+    completion_set.close()
+
+
 def test_multiple_waits_and_gets(shutdown_only):
     # It is important to use three workers here, so that the three tasks
     # launched in this experiment can run at the same time.
@@ -1041,6 +1153,155 @@ def test_profiling_api(shutdown_only):
             break
 
 
+def test_auto_put_cache():
+    from ray.auto_put_cache import AutoPutCache
+
+    put_values = []
+
+    def put_function(value):
+        put_values.append(value)
+        return len(put_values)
+
+    cache = AutoPutCache(mode="identity", capacity=2)
+    array1 = np.zeros(10)
+    array2 = np.zeros(10)
+    assert cache.put(array1, put_function) == 1
+    assert cache.put(array1, put_function) == 1
+    assert cache.put(array2, put_function) == 2
+    # Values that don't support weak references are not cached.
+    assert cache.put([1], put_function) == 3
+    assert cache.put([1], put_function) == 4
+    assert cache.num_hits == 1
+    # The least recently used entry is evicted.
+    array3 = np.zeros(10)
+    assert cache.put(array3, put_function) == 5
+    assert cache.put(array1, put_function) == 6
+    assert cache.put(array3, put_function) == 5
+    assert len(cache) == 2
+
+    cache = AutoPutCache(mode="content", serialize=lambda x: x.tobytes())
+    assert cache.put(np.arange(10), put_function) == 7
+    assert cache.put(np.arange(10), put_function) == 7
+    assert cache.put(np.arange(1, 11), put_function) == 8
+
+    cache = AutoPutCache(mode="off")
+    assert cache.put(array1, put_function) == 9
+    assert cache.put(array1, put_function) == 10
+
+    # Values are cached per driver.
+    cache = AutoPutCache(mode="identity")
+    assert cache.put(array1, put_function, driver_id=1) == 11
+    assert cache.put(array1, put_function, driver_id=2) == 12
+    assert cache.put(array1, put_function, driver_id=1) == 11
+    # Objects that are not in the object store are put again.
+    assert cache.put(array1, put_function, 1, lambda object_id: False) == 13
+    assert cache.put(array1, put_function, 1, lambda object_id: True) == 13
+    # Freed objects are removed from the cache.
+    cache.remove([13])
+    assert cache.put(array1, put_function, driver_id=1) == 14
+
+    with pytest.raises(ValueError):
+        AutoPutCache(mode="unknown")
+
+
+def test_profile_event_buffer():
+    buffer = ray.profiling.ProfileEventBuffer(4)
+    event_type_id = buffer.intern_event_type("event")
+    assert buffer.intern_event_type("event") == event_type_id
+    assert buffer.intern_event_type("other_event") != event_type_id
+
+    for i in range(3):
+        buffer.append(event_type_id, i, i + 1)
+    assert buffer.drain() == [("event", i, i + 1, None) for i in range(3)]
+    assert buffer.drain() == []
+
+    # When the buffer overflows, only the newest events are kept.
+    for i in range(10):
+        buffer.append(event_type_id, i, i + 1, "{}")
+    assert buffer.drain() == [("event", i, i + 1, "{}") for i in range(6, 10)]
+    assert buffer.num_dropped == 6
+
+
+def test_profile_event_buffer_concurrent_drain():
+    buffer = ray.profiling.ProfileEventBuffer(2)
+    event_type_id = buffer.intern_event_type("event")
+    for i in range(2):
+        buffer.append(event_type_id, i, i, str(i))
+
+    writing = threading.Event()
+    resume = threading.Event()
+
+    class BlockingList(list):
+        def __setitem__(self, index, value):
+            # Pause the writer after it has written some of the fields.
+            writing.set()
+            resume.wait()
+            list.__setitem__(self, index, value)
+
+    buffer._extra_data = BlockingList(buffer._extra_data)
+    # This event wraps around the buffer and overwrites the first event.
+    thread = threading.Thread(
+        target=lambda: buffer.append(event_type_id, 2, 2, "2"))
+    thread.start()
+    writing.wait()
+    # Drain while the writer is in the middle of overwriting a slot. No event
+    # may mix the fields of two appends.
+    events = buffer.drain()
+    resume.set()
+    thread.join()
+    events += buffer.drain()
+
+    for _, start_time, end_time, extra_data in events:
+        assert start_time == end_time == int(extra_data)
+    assert [event[1] for event in events] == [1, 2]
+    assert buffer.num_dropped == 1
+
+
+def test_latency_histogram():
+    histogram = ray.profiling.LatencyHistogram()
+    for i in range(1, 101):
+        histogram.record(i / 1000.0)
+    other = ray.profiling.LatencyHistogram.from_dict(
+        json.loads(json.dumps(histogram.to_dict())))
+    histogram.merge(other)
+
+    summary = histogram.summary()
+    assert summary["count"] == 200
+    assert summary["min"] == 0.001
+    assert summary["max"] == 0.1
+    # Percentiles are accurate to within a factor of two.
+    assert 0.025 <= summary["p50"] <= 0.1
+    assert summary["p99"] == 0.1
+
+
+def test_task_latency_summary(shutdown_only):
+    ray.init(num_cpus=1)
+
+    @ray.remote
+    def f():
+        time.sleep(0.01)
+
+    ray.get([f.remote() for _ in range(10)])
+
+    # The latency histograms are flushed once every second.
+    timeout_seconds = 20
+    start_time = time.time()
+    while True:
+        if time.time() - start_time > timeout_seconds:
+            raise Exception("Timed out while waiting for the task latency "
+                            "summary.")
+        summary = ray.global_state.task_latency_summary()
+        function_names = [name for name in summary if name.endswith(".f")]
+        if (len(function_names) == 1
+                and summary[function_names[0]]["execute"]["count"] == 10):
+            break
+        time.sleep(0.1)
+
+    phases = summary[function_names[0]]
+    assert set(phases) == set(ray.profiling.TASK_PHASES)
+    assert phases["execute"]["p50"] >= 0.01
+
+
 @pytest.fixture()
 def ray_start_cluster():
     cluster = ray.test.cluster_utils.Cluster()
@@ -2175,6 +2436,342 @@ def test_load_balancing_with_dependencies(ray_start_cluster):
     attempt_to_load_balance(f, [x], 100, num_nodes, 25)
 
 
+def test_locality_aware_placement(ray_start_cluster):
+    # This test ensures that tasks are placed on the node that holds their
+    # large arguments when that node has resources available.
+    cluster = ray_start_cluster
+    # The driver's node has no CPUs, so its scheduling policy must choose
+    # between the other two nodes.
+    cluster.add_node(num_cpus=0)
+    for i in range(2):
+        cluster.add_node(num_cpus=1, resources={str(i): 1})
+    ray.init(redis_address=cluster.redis_address)
+
+    @ray.remote
+    def produce():
+        return np.zeros(10 * 1024 * 1024, dtype=np.uint8)
+
+    @ray.remote
+    def consume(x):
+        return x.nbytes
+
+    for i in range(2):
+        x = produce._remote(resources={str(i): 1})
+        ray.wait([x])
+        for _ in range(5):
+            assert ray.get(consume.remote(x)) == 10 * 1024 * 1024
+        # The argument was never copied to another node.
+        assert ray.global_state.object_table(x)["IsEviction"] == [False]
+
+
+def test_push_arguments_to_consumers(ray_start_cluster):
+    # This test ensures that tasks whose arguments are pushed to them by the
+    # node that creates the arguments get the correct values.
+    cluster = ray_start_cluster
+    internal_config = json.dumps({"push_arguments_to_consumers": 1})
+    cluster.add_node(
+        num_cpus=1,
+        resources={"producer": 1},
+        _internal_config=internal_config)
+    cluster.add_node(
+        num_cpus=1,
+        resources={"consumer": 1},
+        _internal_config=internal_config)
+    ray.init(redis_address=cluster.redis_address)
+
+    @ray.remote(resources={"producer": 1})
+    def produce(i):
+        time.sleep(0.1)
+        return np.full(1024 * 1024, i, dtype=np.uint8)
+
+    @ray.remote(resources={"consumer": 1})
+    def consume(x):
+        return int(x[0])
+
+    # The consumers are submitted to the producer's node, which forwards them
+    # while their arguments are still being created there.
+    argument_ids = [produce.remote(i) for i in range(10)]
+    object_ids = [consume.remote(argument_id) for argument_id in argument_ids]
+    assert ray.get(object_ids) == list(range(10))
+
+    # The producer's node must have started sending each argument to the
+    # consumer's node before the consumer's node asked for it, so the
+    # arguments were pushed ahead of time rather than pulled.
+    client_ids = {}
+    for client in ray.global_state.client_table():
+        for resource in ["producer", "consumer"]:
+            if resource in client["Resources"]:
+                client_ids[resource] = client["ClientID"]
+    producer_id, consumer_id = client_ids["producer"], client_ids["consumer"]
+
+    def first_event_times(event_type):
+        events = ray.global_state.profile_table().get(producer_id, [])
+        times = {}
+        for event in events:
+            if (event["component_type"] != "object_manager"
+                    or event["event_type"] != event_type):
+                continue
+            object_id, remote_client_id = event["extra_data"][:2]
+            if remote_client_id == consumer_id:
+                times[object_id] = min(event["start_time"],
+                                       times.get(object_id, float("inf")))
+        return times
+
+    # Wait for the profile events to be flushed to the GCS.
+    argument_hexes = [argument_id.hex() for argument_id in argument_ids]
+    start_time = time.time()
+    while time.time() - start_time < 10:
+        send_times = first_event_times("transfer_send")
+        if all(object_id in send_times for object_id in argument_hexes):
+            break
+        time.sleep(0.1)
+    pull_times = first_event_times("receive_pull_request")
+    for object_id in argument_hexes:
+        assert send_times[object_id] <= pull_times.get(object_id, float("inf"))
+
+
+def test_compressed_object_transfer(ray_start_cluster):
+    cluster = ray_start_cluster
+    internal_config = json.dumps({
+        "object_manager_compression_min_bytes": 0,
+        "object_manager_default_chunk_size": 1000
+    })
+    for i in range(2):
+        cluster.add_node(
+            num_cpus=1,
+            resources={str(i): 1},
+            _internal_config=internal_config)
+    ray.init(redis_address=cluster.redis_address)
+
+    @ray.remote(resources={"0": 1})
+    def produce(size):
+        # Sparse arrays are compressed, and random ones are sent as is.
+        sparse = np.zeros(size, dtype=np.uint8)
+        sparse[::100] = 1
+        return sparse, np.random.randint(256, size=size, dtype=np.uint8)
+
+    @ray.remote(resources={"1": 1})
+    def checksum(arrays):
+        return [int(array.sum()) for array in arrays]
+
+    for size in [0, 10, 1000, 12345, 10**6]:
+        arrays_id = produce.remote(size)
+        expected = [int(array.sum()) for array in ray.get(arrays_id)]
+        assert ray.get(checksum.remote(arrays_id)) == expected
+
+    # Objects that opt out of compression are sent as is.
+    arrays = [np.zeros(10**6, dtype=np.uint8), np.ones(10, dtype=np.uint8)]
+    arrays_id = ray.put(arrays, compress=False)
+    assert ray.get(arrays_id)[1].sum() == 10
+    assert ray.get(checksum.remote(arrays_id)) == [0, 10]
+
+
+def test_multi_source_pull(ray_start_cluster):
+    cluster = ray_start_cluster
+    internal_config = json.dumps({
+        "object_manager_max_pull_sources": 3,
+        "object_manager_default_chunk_size": 1000
+    })
+    for i in range(4):
+        cluster.add_node(
+            num_cpus=1,
+            resources={str(i): 1},
+            _internal_config=internal_config)
+    ray.init(redis_address=cluster.redis_address)
+
+    @ray.remote(resources={"0": 1})
+    def produce(size):
+        return np.random.randint(256, size=size, dtype=np.uint8)
+
+    @ray.remote
+    def checksum(array):
+        return int(array.sum())
+
+    for size in [0, 10, 12345, 10**6]:
+        array_id = produce.remote(size)
+        expected = int(ray.get(array_id).sum())
+        # Copy the object to more nodes, so that the last node pulls its
+        # chunks from several nodes at once.
+        for i in range(1, 4):
+            result = checksum._remote(args=[array_id], resources={str(i): 1})
+            assert ray.get(result) == expected
+
+
+def test_broadcast(ray_start_cluster):
+    cluster = ray_start_cluster
+    for i in range(5):
+        cluster.add_node(num_cpus=1, resources={str(i): 1})
+    ray.init(redis_address=cluster.redis_address)
+
+    client_ids = [
+        client["ClientID"] for client in ray.global_state.client_table()
+    ]
+    assert len(client_ids) == 5
+
+    @ray.remote
+    def checksum(array):
+        return int(array.sum())
+
+    for fanout in [1, 2]:
+        array = np.random.randint(256, size=10**6, dtype=np.uint8)
+        array_id = ray.put(array)
+        ready, remaining = ray.experimental.broadcast(array_id, fanout=fanout)
+        assert sorted(ready) == sorted(client_ids)
+        assert remaining == []
+        assert ray.global_state.object_locations(array_id) == set(client_ids)
+        results = [
+            checksum._remote(args=[array_id], resources={str(i): 1})
+            for i in range(5)
+        ]
+        assert ray.get(results) == 5 * [int(array.sum())]
+
+    # Broadcasting to a subset of the nodes.
+    array_id = ray.put(np.zeros(10**6, dtype=np.uint8))
+    ready, remaining = ray.experimental.broadcast(
+        array_id, client_ids=client_ids[1:3])
+    assert sorted(ready) == sorted(client_ids[1:3])
+    assert remaining == []
+
+
+def test_broadcast_dead_node(ray_start_cluster):
+    cluster = ray_start_cluster
+    config = json.dumps({"num_heartbeats_timeout": 10})
+    cluster.add_node(num_cpus=1, _internal_config=config)
+    node = cluster.add_node(num_cpus=1, _internal_config=config)
+    ray.init(redis_address=cluster.redis_address)
+
+    client_ids = [
+        client["ClientID"] for client in ray.global_state.client_table()
+    ]
+    cluster.remove_node(node)
+    while all(client["IsInsertion"]
+              for client in ray.global_state.client_table()):
+        time.sleep(0.1)
+
+    # The broadcast does not wait for the node that died.
+    array_id = ray.put(np.zeros(10**6, dtype=np.uint8))
+    ready, remaining = ray.experimental.broadcast(
+        array_id, client_ids=client_ids)
+    assert len(ready) == 1
+    assert remaining == []
+
+
+def test_object_spilling(shutdown_only):
+    # This test ensures that objects that were evicted from a full object
+    # store are restored from disk when they are needed again.
+    ray.init(
+        num_cpus=1,
+        object_store_memory=200 * 1024 * 1024,
+        _internal_config=json.dumps({
+            "object_spilling_threshold_percent": 10
+        }))
+
+    # Put more objects than fit in the object store. Objects that were put
+    # cannot be reconstructed, so without spilling, getting the first objects
+    # would fail after they are evicted.
+    object_ids = [
+        ray.put(np.full(10 * 1024 * 1024, i, dtype=np.uint8))
+        for i in range(40)
+    ]
+    for i in range(5):
+        value = ray.get(object_ids[i])
+        assert value[0] == i and value[-1] == i
+
+    stats = list(ray.global_state.object_spilling_stats().values())
+    assert len(stats) == 1
+    assert stats[0]["SpilledBytes"] > 0
+    assert stats[0]["RestoredBytes"] > 0
+
+
+def test_object_spilling_max_bytes(shutdown_only):
+    # This test ensures that objects whose spilled copies were deleted to stay
+    # within the disk budget are reconstructed when they are needed again.
+    ray.init(
+        num_cpus=1,
+        object_store_memory=200 * 1024 * 1024,
+        _internal_config=json.dumps({
+            "object_spilling_threshold_percent": 10,
+            "object_spilling_max_bytes": 50 * 1024 * 1024,
+            "initial_reconstruction_timeout_milliseconds": 200
+        }))
+
+    @ray.remote
+    def f(i):
+        return np.full(10 * 1024 * 1024, i, dtype=np.uint8)
+
+    object_ids = [f.remote(i) for i in range(40)]
+    ray.wait(object_ids, num_returns=len(object_ids))
+    for i in range(5):
+        value = ray.get(object_ids[i])
+        assert value[0] == i and value[-1] == i
+
+
+def test_get_iter(shutdown_only):
+    ray.init(num_cpus=2)
+
+    @ray.remote
+    def f(i, delay):
+        time.sleep(delay)
+        return i
+
+    slow_id = f.remote(0, 5)
+    fast_ids = [f.remote(i, 0) for i in range(1, 20)]
+    object_ids = [slow_id] + fast_ids + [fast_ids[0]]
+
+    # Values are yielded in order, including duplicates.
+    values = list(ray.get_iter(object_ids, ordered=True, prefetch=3))
+    assert values == ray.get(object_ids)
+
+    slow_id = f.remote(0, 5)
+    object_ids = [slow_id] + fast_ids + [fast_ids[0]]
+    values = list(ray.get_iter(object_ids, prefetch=5))
+    # The slow object does not delay the fast ones.
+    assert values[-1] == 0
+    assert sorted(values) == sorted(ray.get(object_ids))
+
+    @ray.remote
+    def g():
+        raise Exception("Test exception")
+
+    iterator = ray.get_iter([fast_ids[0], g.remote()], ordered=True)
+    assert next(iterator) == 1
+    with pytest.raises(Exception):
+        next(iterator)
+
+
+def test_object_cache(shutdown_only):
+    ray.init(num_cpus=1)
+    worker = ray.worker.global_worker
+    capacity_bytes = 10 * 1024 * 1024
+    worker.object_cache = ray.object_cache.ObjectCache(capacity_bytes)
+
+    x_id = ray.put({i: str(i) for i in range(1000)})
+    x = ray.get(x_id)
+    assert worker.object_cache.num_misses == 1
+    # The second get returns the cached value without deserializing it.
+    assert ray.get(x_id) is x
+    assert ray.get([x_id, x_id]) == [x, x]
+    assert worker.object_cache.num_hits == 3
+
+    # Objects that are larger than the cache are not cached.
+    y_id = ray.put(np.zeros(20 * 1024 * 1024, dtype=np.uint8))
+    ray.get(y_id)
+    assert len(worker.object_cache) == 1
+
+    # The least recently used objects are evicted.
+    z_ids = [
+        ray.put(np.zeros(3 * 1024 * 1024, dtype=np.uint8)) for _ in range(4)
+    ]
+    ray.get(z_ids)
+    assert len(worker.object_cache) == 3
+    assert worker.object_cache.size_bytes <= capacity_bytes
+    assert ray.get(x_id) is not x
+
+    # Freed objects are removed from the cache.
+    ray.internal.free(z_ids)
+    assert len(worker.object_cache) == 1
+
+
 def wait_for_num_tasks(num_tasks, timeout=10):
     start_time = time.time()
     while time.time() - start_time < timeout:
@@ -2395,6 +2992,50 @@ def test_initialized_local_mode(shutdown_only_with_initialization_check):
     assert ray.is_initialized()
 
 
+def test_startup_component_durations(shutdown_only):
+    ray.init(num_cpus=1, num_redis_shards=3)
+    durations = ray.services.component_durations
+    for component in [
+            ray.services.PROCESS_TYPE_REDIS_SERVER,
+            ray.services.PROCESS_TYPE_PLASMA_STORE,
+            ray.services.PROCESS_TYPE_RAYLET, "wait_for_sockets"
+    ]:
+        assert durations[component] >= 0
+    assert len(ray.global_state.redis_clients) == 3
+
+    # The object store and the raylet accept connections as soon as
+    # ray.init() returns.
+    assert ray.get(ray.put(1)) == 1
+
+    ray.shutdown()
+    assert ("stop_" + ray.services.PROCESS_TYPE_RAYLET) in durations
+
+
+def wait_for_num_workers(num_workers, timeout=10):
+    start_time = time.time()
+    while time.time() - start_time < timeout:
+        if len(ray.global_state.workers()) >= num_workers:
+            return
+        time.sleep(0.1)
+    raise Exception("Timed out while waiting for workers to start.")
+
+
+def test_prestarted_idle_workers(shutdown_only):
+    ray.init(num_cpus=1, _internal_config=json.dumps({"min_idle_workers": 3}))
+
+    # The raylet starts more workers than the number of CPUs.
+    wait_for_num_workers(3)
+
+    @ray.remote(max_calls=1)
+    def f():
+        return os.getpid()
+
+    # Workers that exit after max_calls are replaced.
+    pids = set(ray.get([f.remote() for _ in range(3)]))
+    assert len(pids) == 3
+    wait_for_num_workers(6)
+
+
 def test_wait_reconstruction(shutdown_only):
     ray.init(num_cpus=1, object_store_memory=10**8)
 